@@ -0,0 +1,42 @@
+"""
+📊 Benchmarks: BoundedCache get/set vs a plain dict.
+
+The workload reads 10,000 keys drawn from 20,000 possible ones, so
+about half the lookups miss and are filled in (the cache pattern).
+"""
+
+import random
+
+from harness import benchmark
+from Cache import BoundedCache, ThreadSafeBoundedCache
+
+KEYS = [random.Random(0).randrange(20_000) for _ in range(10_000)]
+
+
+def _workload(cache):
+    def run():
+        get = cache.get
+        for key in KEYS:
+            if get(key) is None:
+                cache[key] = key
+    return run
+
+
+@benchmark("get_or_set")
+def plain_dict():
+    return _workload({})
+
+
+@benchmark("get_or_set")
+def bounded_lru():
+    return _workload(BoundedCache(max_entries=5_000))
+
+
+@benchmark("get_or_set")
+def bounded_lru_ttl():
+    return _workload(BoundedCache(max_entries=5_000, ttl=60))
+
+
+@benchmark("get_or_set")
+def thread_safe_lru():
+    return _workload(ThreadSafeBoundedCache(max_entries=5_000))
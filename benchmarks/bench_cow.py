@@ -0,0 +1,94 @@
+"""
+📊 Benchmarks: CowList.deepcopy() vs copy.deepcopy on nested lists.
+
+Wide structures hold 10^3 … 10^6 elements in rows of 10; the deep one
+nests 10^3 levels (copy.deepcopy recurses once per level, so deeper
+structures exceed the C stack). Each structure is timed for the copy
+alone and for copy + one nested write (b[k][0] = 999).
+"""
+
+import copy
+import sys
+
+from harness import benchmark
+from CowList import CowList
+
+WIDE_SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+DEPTH = 10 ** 3
+
+
+def _wide(n):
+    return [list(range(i, i + 10)) for i in range(0, n, 10)]
+
+
+def _deep(depth):
+    root = node = [0]
+    for i in range(depth):
+        child = [i]
+        node.append(child)
+        node = child
+    return root
+
+
+def _write_deep(b):
+    node = b
+    for _ in range(DEPTH - 1):
+        node = node[1]
+    node[0] = 999
+
+
+def _register(size):
+    @benchmark("cow_wide", f"deepcopy_{size}")
+    def plain_copy():
+        data = _wide(size)
+        return lambda: copy.deepcopy(data)
+
+    @benchmark("cow_wide", f"cowlist_{size}")
+    def cow_copy():
+        data = CowList(_wide(size))
+        return data.deepcopy
+
+    @benchmark("cow_wide_write", f"deepcopy_{size}")
+    def plain_copy_write():
+        data = _wide(size)
+        k = len(data) // 2
+
+        def run():
+            b = copy.deepcopy(data)
+            b[k][0] = 999
+        return run
+
+    @benchmark("cow_wide_write", f"cowlist_{size}")
+    def cow_copy_write():
+        data = CowList(_wide(size))
+        k = len(data) // 2
+
+        def run():
+            b = data.deepcopy()
+            b[k][0] = 999
+        return run
+
+
+for _size in WIDE_SIZES:
+    _register(_size)
+
+
+@benchmark("cow_deep", f"deepcopy_{DEPTH}")
+def deep_plain():
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10 * DEPTH))
+    data = _deep(DEPTH)
+
+    def run():
+        b = copy.deepcopy(data)
+        _write_deep(b)
+    return run
+
+
+@benchmark("cow_deep", f"cowlist_{DEPTH}")
+def deep_cow():
+    data = CowList(_deep(DEPTH))
+
+    def run():
+        b = data.deepcopy()
+        _write_deep(b)
+    return run
@@ -0,0 +1,72 @@
+"""
+📊 Benchmarks: FrozenIndexedTuple vs the builtin tuple methods.
+
+The tuple holds N values with every value repeated 10 times. Each case
+asks ONE question about a value near the end (worst case for index);
+FrozenIndexedTuple cases are timed after the map is built, 'build' times
+building each map from scratch.
+"""
+
+from harness import benchmark
+from FrozenIndexedTuple import FrozenIndexedTuple
+
+SIZES = (10 ** 4, 10 ** 6)
+REPEATS = 10
+
+
+def _register(n):
+    data = tuple(i % (n // REPEATS) for i in range(n))
+    target = n // REPEATS - 1           # first seen near the end of the first tenth
+    last = data[-1]
+
+    def warm(query):
+        frozen = FrozenIndexedTuple(data)
+        query(frozen)
+        return frozen
+
+    @benchmark("count", f"tuple_{n}")
+    def tuple_count():
+        return lambda: data.count(target)
+
+    @benchmark("count", f"frozen_{n}")
+    def frozen_count():
+        frozen = warm(lambda t: t.count(target))
+        return lambda: frozen.count(target)
+
+    @benchmark("index", f"tuple_{n}")
+    def tuple_index():
+        return lambda: data.index(target)
+
+    @benchmark("index", f"frozen_{n}")
+    def frozen_index():
+        frozen = warm(lambda t: t.index(target))
+        return lambda: frozen.index(target)
+
+    @benchmark("contains_missing", f"tuple_{n}")
+    def tuple_contains():
+        return lambda: -1 in data
+
+    @benchmark("contains_missing", f"frozen_{n}")
+    def frozen_contains():
+        frozen = warm(lambda t: -1 in t)
+        return lambda: -1 in frozen
+
+    @benchmark("positions", f"tuple_{n}")
+    def tuple_positions():
+        return lambda: [i for i, x in enumerate(data) if x == last]
+
+    @benchmark("positions", f"frozen_{n}")
+    def frozen_positions():
+        frozen = warm(lambda t: t.positions(last))
+        return lambda: frozen.positions(last)
+
+    for kind, query in (("counts", lambda t: t.count(0)),
+                        ("first", lambda t: t.index(0)),
+                        ("positions", lambda t: t.positions(0))):
+        @benchmark("build", f"{kind}_{n}")
+        def build(query=query):
+            return lambda: query(FrozenIndexedTuple(data))
+
+
+for _n in SIZES:
+    _register(_n)
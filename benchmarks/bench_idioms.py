@@ -0,0 +1,238 @@
+# ============================================================
+# 📊 BENCHMARKS: IDIOMS DEMONSTRATED IN src/
+# ============================================================
+
+"""
+Times the idioms the tutorial modules teach, so claims such as
+"list comprehension is efficient compared to traditional loops"
+(ListComprehension.py) are backed by numbers.
+
+Every setup function builds its input once and returns the callable
+that is timed.
+"""
+
+import copy
+import operator
+from functools import reduce
+
+from harness import benchmark
+
+N = 10_000
+NUMBERS = list(range(N))
+
+
+# ============================================================
+# 🔁 Comprehension vs for + append   (ListComprehension.py, List.py)
+# ============================================================
+@benchmark("comprehension")
+def list_comprehension():
+    a = NUMBERS
+    return lambda: [val ** 2 for val in a]
+
+
+@benchmark("comprehension")
+def for_append():
+    a = NUMBERS
+
+    def loop():
+        res = []
+        for val in a:
+            res.append(val ** 2)
+        return res
+    return loop
+
+
+@benchmark("comprehension")
+def nested_flatten():
+    mat = [NUMBERS[i:i + 100] for i in range(0, N, 100)]
+    return lambda: [val for row in mat for val in row]
+
+
+@benchmark("comprehension")
+def nested_flatten_loop():
+    mat = [NUMBERS[i:i + 100] for i in range(0, N, 100)]
+
+    def loop():
+        res = []
+        for row in mat:
+            for val in row:
+                res.append(val)
+        return res
+    return loop
+
+
+# ============================================================
+# 🗺️ map / filter vs comprehension   (Lambda.py)
+# ============================================================
+@benchmark("map")
+def map_lambda():
+    numbers = NUMBERS
+    return lambda: list(map(lambda x: x ** 2, numbers))
+
+
+@benchmark("map")
+def map_comprehension():
+    numbers = NUMBERS
+    return lambda: [x ** 2 for x in numbers]
+
+
+@benchmark("filter")
+def filter_lambda():
+    numbers = NUMBERS
+    return lambda: list(filter(lambda x: x % 2 == 0, numbers))
+
+
+@benchmark("filter")
+def filter_comprehension():
+    numbers = NUMBERS
+    return lambda: [x for x in numbers if x % 2 == 0]
+
+
+# ============================================================
+# ➕ '+' vs operator.add vs sum()   (Add2No.py, Lambda.py)
+# ============================================================
+@benchmark("add")
+def plus_operator():
+    a, b = 10, 5
+    return lambda: a + b
+
+
+@benchmark("add")
+def operator_add():
+    a, b, add = 10, 5, operator.add
+    return lambda: add(a, b)
+
+
+@benchmark("add")
+def sum_pair():
+    pair = [10, 5]
+    return lambda: sum(pair)
+
+
+@benchmark("total")
+def builtin_sum():
+    numbers = NUMBERS
+    return lambda: sum(numbers)
+
+
+@benchmark("total")
+def reduce_lambda():
+    numbers = NUMBERS
+    return lambda: reduce(lambda x, y: x + y, numbers)
+
+
+@benchmark("total")
+def reduce_operator_add():
+    numbers = NUMBERS
+    return lambda: reduce(operator.add, numbers)
+
+
+@benchmark("total")
+def while_loop():
+    numbers = NUMBERS
+
+    def loop():
+        total = 0
+        i = 0
+        n = len(numbers)
+        while i < n:
+            total += numbers[i]
+            i += 1
+        return total
+    return loop
+
+
+# ============================================================
+# 📋 Copying a list   (List.py)
+# ============================================================
+@benchmark("copy")
+def slice_copy():
+    a = NUMBERS
+    return lambda: a[:]
+
+
+@benchmark("copy")
+def copy_method():
+    a = NUMBERS
+    return lambda: a.copy()
+
+
+@benchmark("copy")
+def list_constructor():
+    a = NUMBERS
+    return lambda: list(a)
+
+
+@benchmark("deepcopy")
+def deepcopy_flat():
+    a = NUMBERS[:1000]
+    return lambda: copy.deepcopy(a)
+
+
+@benchmark("deepcopy")
+def deepcopy_nested():
+    a = [[i, [i, i]] for i in range(1000)]
+    return lambda: copy.deepcopy(a)
+
+
+# ============================================================
+# 🔎 Membership   (List.py, Tuple.py, Operator.py)
+# ============================================================
+@benchmark("membership")
+def in_list():
+    a = NUMBERS
+    return lambda: (N - 1) in a
+
+
+@benchmark("membership")
+def in_tuple():
+    a = tuple(NUMBERS)
+    return lambda: (N - 1) in a
+
+
+@benchmark("membership")
+def in_set():
+    a = set(NUMBERS)
+    return lambda: (N - 1) in a
+
+
+# ============================================================
+# 🔗 Concatenation & repetition   (List.py, Tuple.py, VariableString.py)
+# ============================================================
+@benchmark("concat")
+def list_concat():
+    a, b = NUMBERS, NUMBERS
+    return lambda: a + b
+
+
+@benchmark("concat")
+def tuple_concat():
+    a = b = tuple(NUMBERS)
+    return lambda: a + b
+
+
+@benchmark("repeat")
+def list_repeat():
+    a = NUMBERS[:3]
+    return lambda: a * 3
+
+
+@benchmark("repeat")
+def string_repeat():
+    s = "Ha"
+    return lambda: s * 3
+
+
+# ============================================================
+# 📖 Dictionary lookups   (Dictionary.py)
+# ============================================================
+@benchmark("dict")
+def dict_get_default():
+    person = {"name": "Vinay", "age": 25, "city": "Delhi"}
+    return lambda: person.get("salary", 0)
+
+
+@benchmark("dict")
+def dict_subscript():
+    person = {"name": "Vinay", "age": 25, "city": "Delhi"}
+    return lambda: person["name"]
@@ -0,0 +1,77 @@
+"""
+📊 Benchmarks: Matrix vs the list-of-lists idioms of ListComprehension.py.
+
+Square N × N int matrices. "matrix" cases use NumPy when it is installed,
+"matrix_pure" cases force the array.array path. The defaults keep the
+run short; set MATRIX_SIZES for bigger ones (10000 needs ~4 GB of RAM
+for the nested lists):
+
+    MATRIX_SIZES=10000 python benchmarks/run.py matrix
+"""
+
+import os
+from functools import lru_cache
+
+from harness import benchmark
+from Matrix import Matrix
+
+SIZES = tuple(int(s) for s in os.environ.get("MATRIX_SIZES", "300,2000").split(","))
+
+
+@lru_cache(maxsize=1)
+def _nested(n):
+    return [list(range(i * n, (i + 1) * n)) for i in range(n)]
+
+
+@lru_cache(maxsize=1)
+def _matrix(n):
+    return Matrix(_nested(n))
+
+
+def _with_numpy(use, operation):
+    def run():
+        Matrix.use_numpy = use
+        try:
+            return operation()
+        finally:
+            Matrix.use_numpy = True
+    return run
+
+
+def _register(n):
+    @benchmark("flatten", f"nested_{n}")
+    def nested_flatten():
+        mat = _nested(n)
+        return lambda: [val for row in mat for val in row]
+
+    @benchmark("flatten", f"matrix_{n}")
+    def matrix_flatten():
+        return _matrix(n).flatten
+
+    @benchmark("transpose", f"nested_{n}")
+    def nested_transpose():
+        mat = _nested(n)
+        return lambda: list(zip(*mat))
+
+    cases = (("transpose", lambda m: m.transpose),
+             ("pow", lambda m: lambda: m ** 2),
+             ("mod", lambda m: lambda: m % 7))
+    for group, operation in cases:
+        for suffix, use in (("", True), ("_pure", False)):
+            def setup(operation=operation, use=use):
+                return _with_numpy(use, operation(_matrix(n)))
+            benchmark(group, f"matrix{suffix}_{n}")(setup)
+
+    @benchmark("pow", f"nested_{n}")
+    def nested_pow():
+        mat = _nested(n)
+        return lambda: [[v ** 2 for v in row] for row in mat]
+
+    @benchmark("mod", f"nested_{n}")
+    def nested_mod():
+        mat = _nested(n)
+        return lambda: [[v % 7 for v in row] for row in mat]
+
+
+for _n in SIZES:
+    _register(_n)
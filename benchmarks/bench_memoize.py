@@ -0,0 +1,68 @@
+"""
+📊 Benchmarks: @memoize vs functools.lru_cache vs no cache.
+
+One group per pure helper from the tutorials: add (Function.py),
+checkNumber (Lambda.py) and greet (TypeHint.py), plus 'slow', a helper
+that costs ~20 µs per call, where caching actually pays off. Every case
+makes 1,000 calls cycling over 100 distinct arguments, so after the
+first round every call is a hit.
+"""
+
+from functools import lru_cache
+
+from harness import benchmark
+from Memoize import memoize
+
+CALLS = 1_000
+KEYS = 100
+
+
+def add(a, b):
+    return a + b
+
+
+checkNumber = lambda x: "positive" if x > 0 else "negative" if x < 0 else "zero"
+
+
+def greet(name, age):
+    return f"Hello {name}, you are {age} years old."
+
+
+def slow(n):
+    return sum(i * i for i in range(n % 7 + 200))
+
+
+HELPERS = {
+    "add": (add, [(i, i + 1) for i in range(KEYS)]),
+    "checkNumber": (checkNumber, [(i - KEYS // 2,) for i in range(KEYS)]),
+    "greet": (greet, [(f"user{i}", 20 + i % 50) for i in range(KEYS)]),
+    "slow": (slow, [(i,) for i in range(KEYS)]),
+}
+
+VARIANTS = {
+    "plain": lambda f: f,
+    "lru_cache": lambda f: lru_cache(maxsize=1024)(f),
+    "memoize_dict": lambda f: memoize(maxsize=None)(f),
+    "memoize_lru": lambda f: memoize(f),
+    "memoize_lfu": lambda f: memoize(policy="lfu")(f),
+    "memoize_ttl": lambda f: memoize(policy="ttl", ttl=3600)(f),
+}
+
+
+def _register(group, variant):
+    function, arguments = HELPERS[group]
+    calls = (arguments * (CALLS // KEYS + 1))[:CALLS]
+
+    @benchmark(group, variant)
+    def setup():
+        cached = VARIANTS[variant](function)
+
+        def run():
+            for args in calls:
+                cached(*args)
+        return run
+
+
+for _group in HELPERS:
+    for _variant in VARIANTS:
+        _register(_group, _variant)
@@ -0,0 +1,75 @@
+"""
+📊 Benchmarks: PersistentVector vs copy-then-mutate versioning.
+
+Each timed call produces ONE new version of an N-element sequence
+while the old version stays valid, the way a history of lists is kept.
+"""
+
+from harness import benchmark
+from PersistentVector import PersistentVector
+
+SIZES = (10 ** 3, 10 ** 4, 10 ** 5)
+
+
+def _register(n):
+    mid = n // 2
+
+    @benchmark("version_append", f"list_copy_{n}")
+    def list_append():
+        base = list(range(n))
+
+        def run():
+            new = base.copy()
+            new.append(-1)
+        return run
+
+    @benchmark("version_append", f"pvector_{n}")
+    def pvector_append():
+        base = PersistentVector(range(n))
+        return lambda: base.append(-1)
+
+    @benchmark("version_set", f"list_copy_{n}")
+    def list_set():
+        base = list(range(n))
+
+        def run():
+            new = base.copy()
+            new[mid] = -1
+        return run
+
+    @benchmark("version_set", f"pvector_{n}")
+    def pvector_set():
+        base = PersistentVector(range(n))
+        return lambda: base.set(mid, -1)
+
+    @benchmark("version_insert", f"list_copy_{n}")
+    def list_insert():
+        base = list(range(n))
+
+        def run():
+            new = base.copy()
+            new.insert(mid, -1)
+        return run
+
+    @benchmark("version_insert", f"pvector_{n}")
+    def pvector_insert():
+        base = PersistentVector(range(n))
+        return lambda: base.insert(mid, -1)
+
+    @benchmark("version_pop", f"list_copy_{n}")
+    def list_pop():
+        base = list(range(n))
+
+        def run():
+            new = base.copy()
+            new.pop()
+        return run
+
+    @benchmark("version_pop", f"pvector_{n}")
+    def pvector_pop():
+        base = PersistentVector(range(n))
+        return base.pop
+
+
+for _n in SIZES:
+    _register(_n)
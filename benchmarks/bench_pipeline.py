@@ -0,0 +1,89 @@
+"""
+📊 Benchmarks: Pipeline vs the map / filter / reduce examples of Lambda.py.
+
+One group per example, run on N ints:
+
+    squared = list(map(lambda x: x**2, numbers))
+    even_numbers = list(filter(lambda x: x % 2 == 0, numbers))
+    sum_numbers = reduce(lambda x, y: x + y, numbers)
+    product_numbers = reduce(lambda x, y: x * y, numbers)
+
+plus 'chained', the three steps one after the other (squares of the
+evens, summed). "loop" cases force the fused loop, "numpy" cases let the
+pipeline vectorize, "numpy_array" feeds it an array.array (no list
+conversion). The product input cycles through 1 and -1 so the result
+stays a machine int; a growing big-int product always takes the loop.
+"""
+
+from array import array
+from functools import reduce
+
+from harness import benchmark
+from Pipeline import Pipeline
+
+SIZES = (5, 100_000)
+
+PIPELINES = {
+    "squared": Pipeline().map(lambda x: x**2),
+    "evens": Pipeline().filter(lambda x: x % 2 == 0),
+    "sum": Pipeline().reduce(lambda x, y: x + y),
+    "product": Pipeline().reduce(lambda x, y: x * y),
+    "chained": Pipeline().map(lambda x: x**2).filter(lambda x: x % 2 == 0)
+                         .reduce(lambda x, y: x + y),
+}
+
+BUILTINS = {
+    "squared": lambda numbers: list(map(lambda x: x**2, numbers)),
+    "evens": lambda numbers: list(filter(lambda x: x % 2 == 0, numbers)),
+    "sum": lambda numbers: reduce(lambda x, y: x + y, numbers),
+    "product": lambda numbers: reduce(lambda x, y: x * y, numbers),
+    "chained": lambda numbers: reduce(lambda x, y: x + y,
+                                      list(filter(lambda x: x % 2 == 0,
+                                                  list(map(lambda x: x**2, numbers))))),
+}
+
+
+def _numbers(group, n):
+    if n == 5:
+        return [1, 2, 3, 4, 5]              # exactly Lambda.py's list
+    if group == "product":
+        return [1 - 2 * (i % 2) for i in range(n)]
+    return list(range(n))
+
+
+def _with_numpy(use, pipeline, numbers):
+    def run():
+        Pipeline.use_numpy = use
+        try:
+            return pipeline(numbers)
+        finally:
+            Pipeline.use_numpy = True
+    return run
+
+
+def _register(group, n):
+    numbers = _numbers(group, n)
+    pipeline = PIPELINES[group]
+
+    @benchmark(group, f"builtins_{n}")
+    def builtins():
+        function = BUILTINS[group]
+        return lambda: function(numbers)
+
+    @benchmark(group, f"loop_{n}")
+    def loop():
+        return _with_numpy(False, pipeline, numbers)
+
+    @benchmark(group, f"numpy_{n}")
+    def numpy():
+        return _with_numpy(True, pipeline, numbers)
+
+    if n > 5:
+        @benchmark(group, f"numpy_array_{n}")
+        def numpy_array():
+            return _with_numpy(True, pipeline, array("q", numbers))
+
+
+for _group in PIPELINES:
+    for _n in SIZES:
+        _register(_group, _n)
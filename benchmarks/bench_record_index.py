@@ -0,0 +1,72 @@
+"""
+📊 Benchmarks: IndexedRecords queries vs scanning a list of dicts.
+
+Records look like Dictionary.py's person: name (unique), age (0-89)
+and city (1,000 distinct values). The default sizes keep the run
+short; set RECORD_INDEX_SIZES for the full 10M-record check (needs
+a few GB of RAM, list scans are skipped above 10^6):
+
+    RECORD_INDEX_SIZES=10000000 python benchmarks/run.py record_index
+"""
+
+import os
+from functools import lru_cache
+
+from harness import benchmark
+from RecordIndex import IndexedRecords, between
+
+SIZES = tuple(int(s) for s in os.environ.get("RECORD_INDEX_SIZES", "10000,100000,1000000").split(","))
+SCAN_LIMIT = 10 ** 6
+CITIES = 1_000
+
+
+def _person(i):
+    return {"name": f"user{i}", "age": i % 90, "city": f"city{i * 7 % CITIES}"}
+
+
+@lru_cache(maxsize=1)
+def _people(n):
+    return [_person(i) for i in range(n)]
+
+
+@lru_cache(maxsize=1)
+def _indexed(n):
+    return IndexedRecords(_people(n), hash_index=("name", "city"), sorted_index=("age",))
+
+
+def _register(n):
+    name = f"user{n // 2}"
+
+    if n <= SCAN_LIMIT:
+        @benchmark("find_name", f"list_scan_{n}")
+        def scan_name():
+            people = _people(n)
+            return lambda: [p for p in people if p["name"] == name]
+
+        @benchmark("find_city_age", f"list_scan_{n}")
+        def scan_city_age():
+            people = _people(n)
+            return lambda: [p for p in people if p["city"] == "city7" and 30 <= p["age"] <= 31]
+
+    @benchmark("find_name", f"indexed_{n}")
+    def indexed_name():
+        people = _indexed(n)
+        return lambda: people.find(name=name)
+
+    @benchmark("find_city_age", f"indexed_{n}")
+    def indexed_city_age():
+        people = _indexed(n)
+        return lambda: people.find(city="city7", age=between(30, 31))
+
+    @benchmark("update_age", f"indexed_{n}")
+    def indexed_update():
+        record = _indexed(n).find(name=name)[0]
+        ages = iter(range(10 ** 9))
+
+        def run():
+            record["age"] = next(ages) % 90
+        return run
+
+
+for _n in SIZES:
+    _register(_n)
@@ -0,0 +1,60 @@
+"""
+📊 Benchmarks: Rope vs eager list concatenation and repetition.
+
+'concat' joins 100 batches of N elements one after another (c = c + batch),
+'repeat' builds batch * 1000, 'index' reads one element from the result.
+"""
+
+from harness import benchmark
+from Rope import Rope
+
+SIZES = (10 ** 3, 10 ** 4, 10 ** 5)
+BATCHES = 100
+TIMES = 1_000
+
+
+def _register(n):
+    batch = list(range(n))
+
+    @benchmark("concat", f"list_{n}")
+    def list_concat():
+        def run():
+            c = []
+            for _ in range(BATCHES):
+                c = c + batch
+        return run
+
+    @benchmark("concat", f"rope_{n}")
+    def rope_concat():
+        def run():
+            c = Rope()
+            for _ in range(BATCHES):
+                c = c + batch
+        return run
+
+    @benchmark("repeat", f"list_{n}")
+    def list_repeat():
+        return lambda: batch * TIMES
+
+    @benchmark("repeat", f"rope_{n}")
+    def rope_repeat():
+        rope = Rope(batch)
+        return lambda: rope * TIMES
+
+    @benchmark("index", f"list_{n}")
+    def list_index():
+        c = batch * BATCHES
+        mid = len(c) // 2
+        return lambda: c[mid]
+
+    @benchmark("index", f"rope_{n}")
+    def rope_index():
+        c = Rope()
+        for _ in range(BATCHES):
+            c = c + batch
+        mid = len(c) // 2
+        return lambda: c[mid]
+
+
+for _n in SIZES:
+    _register(_n)
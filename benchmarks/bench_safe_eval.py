@@ -0,0 +1,64 @@
+"""
+📊 Benchmarks: eval() vs SafeExpression on UserInput.py-style formulas.
+
+Groups:
+    single  — one evaluation with bindings: eval(text) parses every call,
+              eval(code) reuses a compiled code object, SafeExpression
+              and safe_eval (cached per text) go through the whitelist
+    batch   — ROWS rows of bindings: eval(code) per row vs evaluate_many
+    compile — building a SafeExpression: cache hit vs cold parse + check
+"""
+
+from harness import benchmark
+from SafeEval import SafeExpression, _compile, safe_eval
+
+TEXT = "price * qty * (1 + tax) if qty > 0 else max(price - 1, 0)"
+BINDINGS = {"price": 12.5, "qty": 3, "tax": 0.2}
+ROWS = [{"price": i % 97, "qty": i % 5, "tax": 0.2} for i in range(10_000)]
+CODE = compile(TEXT, "<expression>", "eval")
+GLOBALS = {"__builtins__": {}, "max": max}
+
+
+@benchmark("single", "eval_text")
+def single_eval_text():
+    return lambda: eval(TEXT, GLOBALS, BINDINGS)
+
+
+@benchmark("single", "eval_code")
+def single_eval_code():
+    return lambda: eval(CODE, GLOBALS, BINDINGS)
+
+
+@benchmark("single", "safe_expression")
+def single_safe_expression():
+    expression = SafeExpression(TEXT)
+    return lambda: expression.evaluate(BINDINGS)
+
+
+@benchmark("single", "safe_eval")
+def single_safe_eval():
+    return lambda: safe_eval(TEXT, BINDINGS)
+
+
+@benchmark("batch", "eval_code_per_row")
+def batch_eval_code():
+    return lambda: [eval(CODE, GLOBALS, row) for row in ROWS]
+
+
+@benchmark("batch", "evaluate_many")
+def batch_evaluate_many():
+    expression = SafeExpression(TEXT)
+    return lambda: expression.evaluate_many(ROWS)
+
+
+@benchmark("compile", "cached")
+def compile_cached():
+    return lambda: SafeExpression(TEXT)
+
+
+@benchmark("compile", "cold")
+def compile_cold():
+    def run():
+        _compile.cache_clear()
+        return SafeExpression(TEXT)
+    return run
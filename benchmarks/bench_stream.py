@@ -0,0 +1,185 @@
+"""
+📊 Benchmarks: Stream vs the ListComprehension.py patterns.
+
+One group per row of the ListComprehension.py summary table. Each group
+compares the list comprehension, a chain of generator expressions (lazy,
+one generator per stage) and Stream (lazy, stages fused into one loop),
+with lambda stages and with inlined "x" expression stages.
+'pipeline' adds a 3-stage map → filter → map chain reduced by sum(),
+where nothing is materialized.
+"""
+
+from harness import benchmark
+from Stream import Stream
+
+N = 100_000
+A = list(range(N))
+MAT = [A[i:i + 100] for i in range(0, N, 100)]
+SIDE = 300                      # nested loop: SIDE × SIDE pairs
+
+
+# ============================================================
+# Transformation    [x**2 for x in a]
+# ============================================================
+@benchmark("transformation")
+def comprehension():
+    return lambda: [x ** 2 for x in A]
+
+
+@benchmark("transformation")
+def generator():
+    return lambda: list(x ** 2 for x in A)
+
+
+@benchmark("transformation")
+def stream():
+    return lambda: Stream(A).map(lambda x: x ** 2).to_list()
+
+
+@benchmark("transformation")
+def stream_expression():
+    return lambda: Stream(A).map("x ** 2").to_list()
+
+
+# ============================================================
+# With condition    [x for x in a if x%2==0]
+# ============================================================
+@benchmark("condition")
+def comprehension():
+    return lambda: [x for x in A if x % 2 == 0]
+
+
+@benchmark("condition")
+def generator():
+    return lambda: list(x for x in A if x % 2 == 0)
+
+
+@benchmark("condition")
+def stream():
+    return lambda: Stream(A).filter(lambda x: x % 2 == 0).to_list()
+
+
+@benchmark("condition")
+def stream_expression():
+    return lambda: Stream(A).filter("x % 2 == 0").to_list()
+
+
+# ============================================================
+# With if–else      [x**2 if x%2==0 else x for x in a]
+# ============================================================
+@benchmark("if_else")
+def comprehension():
+    return lambda: [x ** 2 if x % 2 == 0 else x for x in A]
+
+
+@benchmark("if_else")
+def generator():
+    return lambda: list(x ** 2 if x % 2 == 0 else x for x in A)
+
+
+@benchmark("if_else")
+def stream():
+    return lambda: Stream(A).map(lambda x: x ** 2 if x % 2 == 0 else x).to_list()
+
+
+@benchmark("if_else")
+def stream_expression():
+    return lambda: Stream(A).map("x ** 2 if x % 2 == 0 else x").to_list()
+
+
+# ============================================================
+# From range        [i for i in range(n)]
+# ============================================================
+@benchmark("range")
+def comprehension():
+    return lambda: [i for i in range(N)]
+
+
+@benchmark("range")
+def generator():
+    return lambda: list(i for i in range(N))
+
+
+@benchmark("range")
+def stream():
+    return lambda: Stream(range(N)).to_list()
+
+
+# ============================================================
+# Nested loop       [(i, j) for i in range(n) for j in range(n)]
+# ============================================================
+@benchmark("nested_loop")
+def comprehension():
+    return lambda: [(i, j) for i in range(SIDE) for j in range(SIDE)]
+
+
+@benchmark("nested_loop")
+def generator():
+    return lambda: list((i, j) for i in range(SIDE) for j in range(SIDE))
+
+
+@benchmark("nested_loop")
+def stream():
+    return lambda: Stream(range(SIDE)).flat_map(
+        lambda i: ((i, j) for j in range(SIDE))).to_list()
+
+
+@benchmark("nested_loop")
+def stream_expression():
+    return lambda: Stream(range(SIDE)).flat_map(
+        f"((x, j) for j in range({SIDE}))").to_list()
+
+
+# ============================================================
+# Flatten a matrix  [val for row in mat for val in row]
+# ============================================================
+@benchmark("flatten")
+def comprehension():
+    return lambda: [val for row in MAT for val in row]
+
+
+@benchmark("flatten")
+def generator():
+    return lambda: list(val for row in MAT for val in row)
+
+
+@benchmark("flatten")
+def stream():
+    return lambda: Stream(MAT).flat_map(lambda row: row).to_list()
+
+
+@benchmark("flatten")
+def stream_expression():
+    return lambda: Stream(MAT).flat_map("x").to_list()
+
+
+# ============================================================
+# Lazy pipeline     sum(x+1 for x in (x*3 for x in a) if x%2==0)
+# ============================================================
+@benchmark("pipeline")
+def comprehension():
+    def run():
+        tripled = [x * 3 for x in A]
+        evens = [x for x in tripled if x % 2 == 0]
+        return sum([x + 1 for x in evens])
+    return run
+
+
+@benchmark("pipeline")
+def generator():
+    def run():
+        tripled = (x * 3 for x in A)
+        evens = (x for x in tripled if x % 2 == 0)
+        return sum(x + 1 for x in evens)
+    return run
+
+
+@benchmark("pipeline")
+def stream():
+    return lambda: (Stream(A).map(lambda x: x * 3).filter(lambda x: x % 2 == 0)
+                    .map(lambda x: x + 1).sum())
+
+
+@benchmark("pipeline")
+def stream_expression():
+    return lambda: Stream(A).map("x * 3").filter("x % 2 == 0").map("x + 1").sum()
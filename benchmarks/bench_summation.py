@@ -0,0 +1,29 @@
+"""📊 Benchmarks: src/Summation.py against the sum()/reduce/while idioms."""
+
+import random
+
+from harness import benchmark
+from Summation import exact_sum, kahan_sum, pairwise_sum
+
+_rng = random.Random(42)
+VALUES = [_rng.uniform(-1, 1) * 10 ** _rng.randint(-8, 8) for _ in range(100_000)]
+
+
+@benchmark("summation")
+def builtin_sum():
+    return lambda: sum(VALUES)
+
+
+@benchmark("summation")
+def exact():
+    return lambda: exact_sum(VALUES)
+
+
+@benchmark("summation")
+def kahan():
+    return lambda: kahan_sum(VALUES)
+
+
+@benchmark("summation")
+def pairwise():
+    return lambda: pairwise_sum(VALUES)
@@ -0,0 +1,73 @@
+"""
+📊 Benchmarks: TupleCodec vs pickle and JSON for Tuple.py-style rows.
+
+10,000 rows shaped like ("Vinay", 28, "Developer") are encoded and
+decoded as a batch; 'pickle_per_row' pickles each tuple separately,
+the way rows are often sent one message at a time.
+"""
+
+import json
+import pickle
+
+from harness import benchmark
+from TupleCodec import TupleCodec
+
+ROWS = [(f"user{i}", 20 + i % 40, ("Developer", "Tester", "Manager")[i % 3])
+        for i in range(10_000)]
+CODEC = TupleCodec((str, int, str))
+
+
+@benchmark("encode")
+def pickle_per_row():
+    return lambda: [pickle.dumps(row) for row in ROWS]
+
+
+@benchmark("encode")
+def pickle_batch():
+    return lambda: pickle.dumps(ROWS)
+
+
+@benchmark("encode")
+def json_batch():
+    return lambda: json.dumps(ROWS)
+
+
+@benchmark("encode")
+def tuple_codec():
+    return lambda: CODEC.encode_many(ROWS)
+
+
+@benchmark("decode")
+def pickle_per_row_loads():
+    blobs = [pickle.dumps(row) for row in ROWS]
+    return lambda: [pickle.loads(blob) for blob in blobs]
+
+
+@benchmark("decode")
+def pickle_batch_loads():
+    blob = pickle.dumps(ROWS)
+    return lambda: pickle.loads(blob)
+
+
+@benchmark("decode")
+def json_batch_loads():
+    text = json.dumps(ROWS)
+    return lambda: json.loads(text)
+
+
+@benchmark("decode")
+def tuple_codec_decode():
+    buffer = CODEC.encode_many(ROWS)
+    return lambda: CODEC.decode_many(buffer)
+
+
+@benchmark("read_one_row")
+def pickle_batch_one_row():
+    blob = pickle.dumps(ROWS)
+    return lambda: pickle.loads(blob)[5_000]
+
+
+@benchmark("read_one_row")
+def tuple_codec_view():
+    buffer = CODEC.encode_many(ROWS)
+    return lambda: CODEC.view(buffer)[5_000]
@@ -0,0 +1,201 @@
+# ============================================================
+# 📊 BENCHMARK HARNESS
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+A tiny timing framework used by every benchmarks/bench_*.py file.
+
+1. @benchmark(group) registers a SETUP function. The setup runs once
+   (untimed) and returns the zero-argument callable to be timed.
+2. Each case is warmed up, calibrated so one repeat lasts at least
+   `min_time` seconds, then timed `repeat` times.
+3. Statistics (min / median / mean / stdev per call) are reported,
+   saved as JSON, and two JSON runs can be compared for regressions.
+============================================================
+"""
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from dataclasses import dataclass
+
+REGISTRY = []
+
+
+@dataclass
+class Case:
+    """One registered benchmark: group/name plus its setup function."""
+    group: str
+    name: str
+    setup: object
+
+    @property
+    def key(self):
+        return f"{self.group}/{self.name}"
+
+
+def benchmark(group, name=None):
+    """
+    Decorator that registers a setup function under 'group'.
+
+    Example:
+        @benchmark("copy")
+        def slice_copy():
+            data = list(range(10_000))
+            return lambda: data[:]
+    """
+    def register(setup):
+        REGISTRY.append(Case(group, name or setup.__name__, setup))
+        return setup
+    return register
+
+
+# ============================================================
+# ⏱️ MEASURING
+# ============================================================
+def calibrate(timer, min_time):
+    """Return the loop count that makes one repeat last >= min_time."""
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            return number
+        number *= 2
+
+
+def measure(fn, warmup=1, repeat=5, min_time=0.05):
+    """
+    ------------------------------------------------------------
+    ⏱️ Function: measure
+    ------------------------------------------------------------
+    Description:
+        Times 'fn' and returns per-call statistics in seconds.
+
+    Parameters:
+        fn: Zero-argument callable to time
+        warmup (int): Untimed calls before measuring
+        repeat (int): Number of timed repeats
+        min_time (float): Minimum seconds per repeat (calibrated)
+
+    Returns:
+        dict: min, median, mean, stdev, max, repeat, number
+    """
+    for _ in range(warmup):
+        fn()
+    timer = timeit.Timer(fn)
+    number = calibrate(timer, min_time)
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        runs = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "mean": statistics.fmean(runs),
+        "stdev": statistics.stdev(runs) if len(runs) > 1 else 0.0,
+        "max": max(runs),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def run(cases, warmup=1, repeat=5, min_time=0.05, pattern=None, out=sys.stdout):
+    """Measure every case whose key contains 'pattern'; return {key: stats}."""
+    results = {}
+    for case in cases:
+        if pattern and pattern not in case.key:
+            continue
+        results[case.key] = measure(case.setup(), warmup, repeat, min_time)
+        if out is not None:
+            print(format_row(case.key, results[case.key]), file=out, flush=True)
+    return results
+
+
+# ============================================================
+# 🧾 REPORTING
+# ============================================================
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:7.2f} {unit}"
+    return f"{seconds / 1e-9:7.1f} ns"
+
+
+def format_row(key, stats):
+    spread = 100 * stats["stdev"] / stats["median"] if stats["median"] else 0.0
+    return (f"{key:<48}{format_time(stats['median'])}  ±{spread:5.1f}%"
+            f"  (min {format_time(stats['min'])})")
+
+
+def summary(results):
+    """Per group, list each case relative to the fastest one."""
+    groups = {}
+    for key, stats in results.items():
+        group, name = key.split("/", 1)
+        groups.setdefault(group, []).append((stats["median"], name))
+    lines = []
+    for group, rows in groups.items():
+        rows.sort()
+        fastest = rows[0][0]
+        lines.append(f"[{group}]")
+        for median, name in rows:
+            lines.append(f"  {name:<40}{median / fastest:6.2f}x")
+    return "\n".join(lines)
+
+
+def save(path, results, **meta):
+    """Write the results plus interpreter metadata as JSON."""
+    payload = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            **meta,
+        },
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(old, new, threshold=0.10):
+    """
+    Compare two result dicts by median time.
+
+    Returns:
+        list[tuple[str, float, float, float, str]]:
+            (key, old median, new median, ratio, status) where status is
+            "REGRESSION", "faster", "new", "removed" or "".
+    """
+    rows = []
+    for key in sorted(set(old) | set(new)):
+        if key not in old:
+            rows.append((key, None, new[key]["median"], None, "new"))
+            continue
+        if key not in new:
+            rows.append((key, old[key]["median"], None, None, "removed"))
+            continue
+        before, after = old[key]["median"], new[key]["median"]
+        ratio = after / before if before else float("inf")
+        status = ""
+        if ratio > 1 + threshold:
+            status = "REGRESSION"
+        elif ratio < 1 - threshold:
+            status = "faster"
+        rows.append((key, before, after, ratio, status))
+    return rows
@@ -0,0 +1,162 @@
+# ============================================================
+# ⏱️ IMPORT-TIME REGRESSION CHECK  (python -X importtime)
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+Every module in src/ must be importable as a library:
+
+✅ no output while importing (demo code lives under __main__)
+✅ no input() prompts (stdin is closed during the check)
+✅ fast: cumulative import time below a budget
+✅ lazy: importing a package (src, Basic_Program) loads none of its
+   submodules until they are used
+
+Each module is imported in a fresh interpreter started with
+`-X importtime`; the cumulative time of the module itself is read
+from stderr. The best of several runs is kept to reduce noise.
+
+Usage:
+    python benchmarks/importtime.py                       → check budget
+    python benchmarks/importtime.py --save base.json      → record baseline
+    python benchmarks/importtime.py --baseline base.json  → compare
+
+Exit code 1 means at least one module failed the check.
+============================================================
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+
+
+# -X importtime does not log importlib.import_module() calls (which the
+# lazy packages use), so the loaded modules are read from sys.modules.
+_LOADED = "loaded modules:"
+_IMPORT = ("import {}, sys; "
+           "sys.stderr.write('\\n" + _LOADED + " ' + ' '.join(sys.modules) + '\\n')")
+
+
+def discover_modules():
+    """Return the import names of every module and package under src/."""
+    names = ["src"]
+    for entry in sorted(os.listdir(SRC)):
+        path = os.path.join(SRC, entry)
+        if entry.endswith(".py") and entry != "__init__.py":
+            names.append(entry[:-3])
+        elif os.path.isfile(os.path.join(path, "__init__.py")):
+            names.append(entry)
+            names.extend(
+                f"{entry}.{sub[:-3]}" for sub in sorted(os.listdir(path))
+                if sub.endswith(".py") and sub != "__init__.py"
+            )
+    return names
+
+
+def measure(module, runs=3, timeout=30):
+    """
+    Import 'module' in a fresh interpreter 'runs' times.
+
+    Returns:
+        dict: {"us": best cumulative microseconds or None,
+               "stdout": text printed while importing,
+               "error": last stderr line if the import failed,
+               "imports": every module name the import loaded}
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, SRC]),
+               PYTHONDONTWRITEBYTECODE="1")
+    best, stdout, error, imports = None, "", None, []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _IMPORT.format(module)],
+            stdin=subprocess.DEVNULL, capture_output=True, text=True,
+            cwd=ROOT, env=env, timeout=timeout,
+        )
+        stdout = proc.stdout
+        if proc.returncode != 0:
+            error = proc.stderr.strip().splitlines()[-1]
+            break
+        for line in proc.stderr.splitlines():
+            if line.startswith(_LOADED):
+                imports = line[len(_LOADED):].split()
+            if not line.startswith("import time:"):
+                continue
+            fields = [f.strip() for f in line[len("import time:"):].split("|")]
+            if fields[-1] == module:
+                us = int(fields[1])
+                best = us if best is None else min(best, us)
+    return {"us": best, "stdout": stdout, "error": error, "imports": imports}
+
+
+def eager_submodules(module, imports):
+    """Submodules of package 'module' that were loaded by importing it."""
+    return [name for name in imports if name.startswith(module + ".")]
+
+
+def check(results, budget_ms, baseline=None, tolerance=0.5, floor_ms=2.0):
+    """Return a list of human-readable failures."""
+    failures = []
+    for module, result in results.items():
+        if result["error"]:
+            failures.append(f"{module}: import failed ({result['error']})")
+            continue
+        if result["stdout"]:
+            failures.append(f"{module}: printed {len(result['stdout'])} chars on import")
+        eager = eager_submodules(module, result.get("imports", ()))
+        if eager:
+            failures.append(f"{module}: eagerly imports {', '.join(eager)}")
+        ms = (result["us"] or 0) / 1000
+        if ms > budget_ms:
+            failures.append(f"{module}: {ms:.1f} ms > budget {budget_ms} ms")
+        if baseline and module in baseline:
+            old = baseline[module] / 1000
+            if ms > old * (1 + tolerance) and ms - old > floor_ms:
+                failures.append(f"{module}: {ms:.1f} ms vs baseline {old:.1f} ms")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Check that every src/ module imports quietly, lazily and "
+                    "quickly (python -X importtime).")
+    parser.add_argument("modules", nargs="*", help="default: every src module")
+    parser.add_argument("--budget-ms", type=float, default=100.0)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--baseline", help="JSON file written by --save")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="allowed relative slowdown vs the baseline")
+    parser.add_argument("--save", help="write {module: microseconds} JSON")
+    args = parser.parse_args(argv)
+
+    modules = args.modules or discover_modules()
+    results = {m: measure(m, args.runs) for m in modules}
+
+    for module, result in results.items():
+        us = result["us"]
+        shown = f"{us / 1000:8.2f} ms" if us is not None else "     n/a"
+        print(f"{module:<28}{shown}")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({m: r["us"] for m, r in results.items()}, f, indent=2)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    failures = check(results, args.budget_ms, baseline, args.tolerance)
+    for failure in failures:
+        print("FAIL", failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
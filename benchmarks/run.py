@@ -0,0 +1,92 @@
+# ============================================================
+# 🚀 BENCHMARK RUNNER
+# ============================================================
+
+"""
+Run every benchmarks/bench_*.py file, or compare two saved runs.
+
+Usage:
+    python benchmarks/run.py                              → run all
+    python benchmarks/run.py -k copy                      → only keys containing "copy"
+    python benchmarks/run.py --json new.json              → save results
+    python benchmarks/run.py compare old.json new.json    → flag regressions
+"""
+
+import argparse
+import importlib
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SRC = os.path.join(os.path.dirname(HERE), "src")
+for path in (HERE, SRC):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import harness  # noqa: E402  (needs the paths above)
+
+
+def load_suites(names=None):
+    """Import bench_*.py modules so their @benchmark cases register."""
+    modules = sorted(f[:-3] for f in os.listdir(HERE)
+                     if f.startswith("bench_") and f.endswith(".py"))
+    for module in modules:
+        if not names or module in names or module[len("bench_"):] in names:
+            importlib.import_module(module)
+    return harness.REGISTRY
+
+
+def cmd_run(args):
+    cases = load_suites(args.suite)
+    results = harness.run(cases, args.warmup, args.repeat, args.min_time, args.k)
+    print()
+    print(harness.summary(results))
+    if args.json:
+        harness.save(args.json, results, warmup=args.warmup,
+                     repeat=args.repeat, min_time=args.min_time)
+        print(f"\nSaved {len(results)} results to {args.json}")
+    return 0
+
+
+def cmd_compare(args):
+    rows = harness.compare(harness.load(args.old), harness.load(args.new),
+                           args.threshold)
+    regressions = 0
+    for key, before, after, ratio, status in rows:
+        old_t = harness.format_time(before) if before is not None else "      -   "
+        new_t = harness.format_time(after) if after is not None else "      -   "
+        shown = f"{ratio:6.2f}x" if ratio is not None else "       "
+        print(f"{key:<48}{old_t}  →  {new_t}  {shown}  {status}")
+        regressions += status == "REGRESSION"
+    print(f"\n{regressions} regression(s) above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark suite for src/.")
+    sub = parser.add_subparsers(dest="command")
+
+    run = sub.add_parser("run", help="run benchmarks (default)")
+    compare = sub.add_parser("compare", help="compare two JSON result files")
+    compare.add_argument("old")
+    compare.add_argument("new")
+    compare.add_argument("--threshold", type=float, default=0.10,
+                         help="relative slowdown counted as a regression")
+
+    run.add_argument("suite", nargs="*", default=None,
+                     help="bench module names, e.g. idioms (default: all)")
+    run.add_argument("-k", help="only run keys containing this text")
+    run.add_argument("--warmup", type=int, default=1)
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--min-time", type=float, default=0.05)
+    run.add_argument("--json", help="write results to this JSON file")
+
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] not in (["run"], ["compare"], ["-h"], ["--help"]):
+        argv = ["run", *argv]
+    args = parser.parse_args(argv)
+    return cmd_compare(args) if args.command == "compare" else cmd_run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -35,9 +35,10 @@ class Car(Vehicle):
     def fuel(self):
         print("Car uses petrol")
 
-c = Car()   # ✅ Works, all abstract methods implemented
-c.move()    # Car drives
-c.fuel()    # Car uses petrol
+if __name__ == "__main__":
+    c = Car()   # ✅ Works, all abstract methods implemented
+    c.move()    # Car drives
+    c.fuel()    # Car uses petrol
 
 # ============================================================
 # 3️⃣ Key Points About Abstraction in Python
@@ -14,16 +14,25 @@ This program demonstrates **different ways to add two numbers** in Python:
 4. Using a lambda function
 5. Using `operator.add`
 6. Using `sum()`
+7. Adding whole columns of numbers at once (batch / vectorized)
 ============================================================
 """
 
+import array
+import itertools
+import operator
+import sys
+
+_BLOCK = 1 << 16    # sums converted per step when filling 'out'
+
 # ============================================================
 # 🧮 1️⃣ SIMPLE ADDITION USING '+' OPERATOR
 # ============================================================
-a = 2
-b = 3
-result = a + b
-print(result)   # Output: 5
+if __name__ == "__main__":
+    a = 2
+    b = 3
+    result = a + b
+    print(result)   # Output: 5
 
 """
 🧠 Explanation:
@@ -55,6 +64,15 @@ class Add2No:
         add(self)
             Returns the sum of 'a' and 'b'.
 
+        from_columns(cls, a, b)
+            Builds ONE object holding two aligned columns of numbers
+            (array.array, memoryview or NumPy arrays) instead of
+            millions of per-pair objects.
+
+        add_all(self, out=None)
+            Adds both columns element by element in a single call and
+            writes the result into a (optionally preallocated) buffer.
+
         __str__(self)
             Overrides the default string representation method so that
             printing the object directly shows the sum instead of the
@@ -85,8 +103,95 @@ class Add2No:
         Returns:
             int: The result of addition (a + b)
         """
+        if self._columns:
+            return self.add_all()
         return self.a + self.b
 
+    # --------------------------------------------------------
+    # 📦 Batch (column) mode
+    # --------------------------------------------------------
+    _columns = False
+
+    @classmethod
+    def from_columns(cls, a, b):
+        """
+        ------------------------------------------------------------
+        📦 Class Method: from_columns
+        ------------------------------------------------------------
+        Description:
+            Creates a single Add2No object that holds two aligned
+            columns instead of two numbers. No Python object is created
+            per pair, so a million pairs cost one object, not a million.
+
+        Parameters:
+            a: First column  (array.array, memoryview or NumPy array)
+            b: Second column (same length as 'a')
+
+        Raises:
+            ValueError: If the two columns do not have the same length.
+
+        Returns:
+            Add2No: An object in "column mode".
+        """
+        if len(a) != len(b):
+            raise ValueError(
+                f"columns must be aligned: len(a)={len(a)} != len(b)={len(b)}"
+            )
+        obj = cls(a, b)
+        obj._columns = True
+        return obj
+
+    def add_all(self, out=None):
+        """
+        ------------------------------------------------------------
+        ⚡ Method: add_all
+        ------------------------------------------------------------
+        Description:
+            Adds every pair a[i] + b[i] in one call.
+
+            - NumPy arrays  → one vectorized np.add(a, b, out=out)
+            - array.array / memoryview → one C-level map(operator.add)
+              pass; a preallocated 'out' is filled in place, block by
+              block, without building a full-size temporary
+
+        Parameters:
+            out: (Optional) preallocated output buffer with the same
+                 length as the columns (array.array, writable
+                 memoryview or NumPy array). A new buffer is created
+                 when omitted.
+
+        Raises:
+            ValueError: If 'out' has the wrong length.
+
+        Returns:
+            The output buffer holding all the sums.
+        """
+        a, b = self.a, self.b
+        n = len(a)
+        if out is not None and len(out) != n:
+            raise ValueError(f"output buffer has length {len(out)}, expected {n}")
+
+        # ⚡ Fast path: NumPy does the whole column in one vectorized call.
+        # NumPy arrays can only arrive if NumPy is already imported, so it
+        # is looked up in sys.modules instead of being imported here.
+        np = sys.modules.get("numpy")
+        if np is not None and (isinstance(a, np.ndarray) or isinstance(b, np.ndarray)):
+            return np.add(a, b, out=out)
+
+        typecode = _result_typecode(a, b, out)
+        sums = map(operator.add, a, b)
+        if out is None:
+            return array.array(typecode, sums)
+
+        # Fill 'out' in place, one block at a time: the only temporary is a
+        # _BLOCK-sized array, never a second copy of the whole column.
+        start = 0
+        while start < n:
+            block = array.array(typecode, itertools.islice(sums, _BLOCK))
+            out[start:start + len(block)] = block
+            start += len(block)
+        return out
+
     def __str__(self):
         """
         ------------------------------------------------------------
@@ -108,59 +213,116 @@ class Add2No:
             str: A formatted message showing the sum of a and b
         ------------------------------------------------------------
         """
+        if self._columns:
+            return f"Column sum of {len(self.a)} pairs"
         return f"The sum of {self.a} and {self.b} is {self.add()}"
 
+
+def _typecode(col):
+    """Return the array.array / memoryview element code of a column."""
+    return getattr(col, "typecode", None) or getattr(col, "format", "d")
+
+
+def _result_typecode(a, b, out=None):
+    """Pick the typecode for the sums: the output buffer's, else 'q' or 'd'."""
+    if out is not None:
+        return _typecode(out)
+    codes = [_typecode(a), _typecode(b)]
+    if all(code in "bBhHiIlLqQ" for code in codes):
+        return "q"
+    return "d"
+
 # ============================================================
 # 🚀 OBJECT CREATION AND METHOD CALL
 # ============================================================
-res = Add2No(5, 7)
+if __name__ == "__main__":
+    res = Add2No(5, 7)
 
-# Printing the object directly automatically calls __str__()
-print(res)    # Output: The sum of 5 and 7 is 12
+    # Printing the object directly automatically calls __str__()
+    print(res)    # Output: The sum of 5 and 7 is 12
 
-# ============================================================
-# 🧩 3️⃣ ADD TWO NUMBERS USING USER INPUT
-# ============================================================
-a = input("First number: ")
-b = input("Second number: ")
+    # ============================================================
+    # 🧩 3️⃣ ADD TWO NUMBERS USING USER INPUT
+    # ============================================================
+    import os
 
-# Convert input to float and add
-result = float(a) + float(b)
-print(int(result))
+    if sys.stdin.isatty():
+        a = input("First number: ")
+        b = input("Second number: ")
 
-# ============================================================
-# 🧩 4️⃣ ADD TWO NUMBERS USING LAMBDA FUNCTION
-# ============================================================
-res = lambda a, b: a + b
-print(res(10, 5))  # Output: 15
+        # Convert input to float and add
+        result = float(a) + float(b)
+        print(int(result))
+    else:
+        # 📥 Input is piped (e.g. `cat pairs.txt | python Add2No.py`):
+        # stream every pair in big blocks instead of one input() per value.
+        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        from BulkInput import add_pairs
+        sys.stdout.flush()
+        add_pairs(sys.stdin, sys.stdout)
 
 """
 🧠 Explanation:
-- `lambda a, b: a + b` creates an anonymous function to add two numbers.
-- Must call the lambda with values (e.g., res(10, 5)) to get the sum.
+- input() reads ONE value per call → fine for a person typing.
+- When numbers arrive through a pipe, BulkInput.add_pairs() reads large
+  binary blocks, parses numbers in batches and writes results in bulk.
 """
 
 # ============================================================
-# 🧩 5️⃣ ADD TWO NUMBERS USING operator.add
+# 🧩 4️⃣ ADD TWO NUMBERS USING LAMBDA FUNCTION
 # ============================================================
-import operator
-print(operator.add(10, 5))  # Output: 15
+res = lambda a, b: a + b
+if __name__ == "__main__":
+    print(res(10, 5))  # Output: 15
 
-"""
-🧠 Explanation:
-- Python's `operator` module provides built-in functions for arithmetic.
-- `operator.add(a, b)` is equivalent to `a + b`.
-"""
+    """
+    🧠 Explanation:
+    - `lambda a, b: a + b` creates an anonymous function to add two numbers.
+    - Must call the lambda with values (e.g., res(10, 5)) to get the sum.
+    """
 
-# ============================================================
-# 🧩 6️⃣ ADD TWO NUMBERS USING sum()
-# ============================================================
-print(sum([10, 5]))  # Output: 15
+    # ============================================================
+    # 🧩 5️⃣ ADD TWO NUMBERS USING operator.add
+    # ============================================================
+    import operator
+    print(operator.add(10, 5))  # Output: 15
+
+    """
+    🧠 Explanation:
+    - Python's `operator` module provides built-in functions for arithmetic.
+    - `operator.add(a, b)` is equivalent to `a + b`.
+    """
+
+    # ============================================================
+    # 🧩 6️⃣ ADD TWO NUMBERS USING sum()
+    # ============================================================
+    print(sum([10, 5]))  # Output: 15
+
+    """
+    🧠 Explanation:
+    - `sum()` can add multiple numbers in a list or iterable.
+    - Useful when adding more than two numbers.
+    """
+
+    # ============================================================
+    # 🧩 7️⃣ ADD MANY PAIRS AT ONCE (BATCH / VECTORIZED)
+    # ============================================================
+    # Instead of creating one Add2No object per pair, keep the numbers in two
+    # aligned columns and add them all in a single call.
+    xs = array.array('d', [1.5, 2.0, 3.25])
+    ys = array.array('d', [0.5, 4.0, 1.75])
+    out = array.array('d', bytes(8 * len(xs)))   # preallocated output buffer
+
+    batch = Add2No.from_columns(xs, ys)
+    batch.add_all(out)
+    print(out)    # Output: array('d', [2.0, 6.0, 5.0])
+    print(batch)  # Output: Column sum of 3 pairs
 
 """
 🧠 Explanation:
-- `sum()` can add multiple numbers in a list or iterable.
-- Useful when adding more than two numbers.
+- `from_columns()` stores the two columns → ONE object for all pairs.
+- `add_all()` adds every pair in one call (np.add when NumPy arrays are passed).
+- Passing `out` reuses an existing buffer, so no new memory is allocated per call.
 """
 
 # ============================================================
@@ -171,4 +333,5 @@ print(sum([10, 5]))  # Output: 15
 ✔ Class-based approach allows overriding `__str__()` to display human-readable results (like Java's toString()).
 ✔ Lambda functions provide a concise way to perform addition without defining a full function.
 ✔ The operator module and sum() are helpful for more functional programming or when dealing with iterables.
+✔ For millions of pairs, use Add2No.from_columns(...).add_all(out) instead of one object per pair.
 """
@@ -0,0 +1,18 @@
+"""📦 Basic programs, loaded lazily (see the parent package __init__)."""
+
+import importlib
+
+__all__ = ["Add2No"]
+
+
+def __getattr__(name):
+    """Import the submodule 'name' on first access and cache it."""
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
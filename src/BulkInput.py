@@ -0,0 +1,246 @@
+# ============================================================
+# 📥 TOPIC: STREAMING BULK INPUT (PIPES & BIG FILES)
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+UserInput.py and Add2No.py read numbers with:
+
+    float(input("First number: "))
+
+That is perfect for a human typing at a keyboard, but when a
+program pipes a million numbers into it:
+
+❌ input() reads one line (one value) per call
+❌ print() writes (and flushes) one result per call
+
+This module reads stdin (or a file) in large BINARY blocks, parses
+whitespace- or comma-separated numbers in batches and writes the
+results with buffered writes. Only one block and one batch are in
+memory at a time, so files larger than RAM work too.
+
+Command line:
+    python BulkInput.py add  [FILE]   → a + b for every pair of numbers
+    python BulkInput.py sum  [FILE]   → total of all numbers
+    (no FILE → read from stdin, e.g.  cat pairs.txt | python BulkInput.py add)
+============================================================
+"""
+
+import array
+import io
+import operator
+import re
+import sys
+
+DEFAULT_BLOCK_SIZE = 1 << 20     # 1 MiB read per system call
+DEFAULT_BATCH_SIZE = 1 << 16     # 65,536 numbers parsed per batch
+
+_SEPARATORS = re.compile(rb"[\s,]+")
+
+
+# ============================================================
+# 🧩 1️⃣ READING LARGE BINARY BLOCKS
+# ============================================================
+def binary_stream(source=None):
+    """
+    Return a binary file object for 'source'.
+
+    - None          → sys.stdin's underlying binary buffer
+    - str / path    → the file opened in 'rb' mode
+    - text stream   → its .buffer (if it has one); an in-memory text
+                      stream such as io.StringIO is returned unchanged
+    - binary stream → returned unchanged
+    """
+    if source is None:
+        source = sys.stdin
+    if _is_path(source):
+        return open(source, "rb")
+    return getattr(source, "buffer", source)
+
+
+def _is_path(source):
+    return isinstance(source, (str, bytes)) or hasattr(source, "__fspath__")
+
+
+def _is_text(stream):
+    """True for a text stream with no binary buffer (e.g. io.StringIO)."""
+    return isinstance(stream, io.TextIOBase)
+
+
+def read_blocks(stream, block_size=DEFAULT_BLOCK_SIZE):
+    """Yield raw byte blocks of at most 'block_size' bytes until EOF."""
+    read = stream.read
+    text = _is_text(stream)
+    while True:
+        block = read(block_size)
+        if not block:
+            return
+        yield block.encode() if text else block
+
+
+def iter_tokens(blocks):
+    """
+    Yield lists of number tokens (bytes) from an iterable of blocks.
+
+    A token cut in half at a block boundary is carried over and
+    joined with the start of the next block.
+    """
+    carry = b""
+    for block in blocks:
+        block = carry + block
+        # Everything after the last separator may be an incomplete token.
+        cut = max(block.rfind(b" "), block.rfind(b"\n"), block.rfind(b","),
+                  block.rfind(b"\t"), block.rfind(b"\r"))
+        carry = block[cut + 1:]
+        tokens = _SEPARATORS.split(block[:cut + 1])
+        tokens = [t for t in tokens if t]
+        if tokens:
+            yield tokens
+    if carry.strip(b" \t\r\n,"):
+        yield [carry.strip(b" \t\r\n,")]
+
+
+# ============================================================
+# 🧩 2️⃣ PARSING NUMBERS IN BATCHES
+# ============================================================
+def iter_number_batches(source=None, batch_size=DEFAULT_BATCH_SIZE,
+                        block_size=DEFAULT_BLOCK_SIZE, typecode="d"):
+    """
+    ------------------------------------------------------------
+    🔢 Function: iter_number_batches
+    ------------------------------------------------------------
+    Description:
+        Streams numbers from 'source' and yields them as compact
+        array.array batches of at most 'batch_size' values.
+
+    Parameters:
+        source: None (stdin), a path, or a text/binary file object
+        batch_size (int): Maximum numbers per yielded batch
+        block_size (int): Bytes read per call
+        typecode (str): 'd' for floats, 'q' for integers
+
+    Raises:
+        ValueError: If a token is not a valid number.
+
+    Yields:
+        array.array: The next batch of parsed numbers.
+    """
+    convert = float if typecode in "fd" else int
+    stream = binary_stream(source)
+    batch = array.array(typecode)
+    try:
+        for tokens in iter_tokens(read_blocks(stream, block_size)):
+            batch.extend(map(convert, tokens))
+            while len(batch) >= batch_size:
+                yield batch[:batch_size]
+                del batch[:batch_size]
+        if batch:
+            yield batch
+    finally:
+        if _is_path(source):
+            stream.close()     # only close files we opened ourselves
+
+
+def iter_pair_batches(source=None, batch_size=DEFAULT_BATCH_SIZE,
+                      block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Yield (first, second) column pairs from a stream of numbers
+    "a1 b1 a2 b2 ...". A pair split across two batches is kept
+    together.
+
+    Raises:
+        ValueError: If the input holds an odd count of numbers.
+    """
+    leftover = array.array("d")
+    for batch in iter_number_batches(source, batch_size, block_size):
+        if leftover:
+            batch = leftover + batch
+        even = len(batch) - len(batch) % 2
+        leftover = batch[even:]
+        if even:
+            yield batch[0:even:2], batch[1:even:2]
+    if leftover:
+        raise ValueError("odd number of values: the last number has no partner")
+
+
+# ============================================================
+# 🧩 3️⃣ BUFFERED OUTPUT
+# ============================================================
+def write_numbers(sink, numbers):
+    """Write one number per line with a single buffered write."""
+    if numbers:
+        lines = "\n".join(map(repr, numbers)) + "\n"
+        sink.write(lines if _is_text(sink) else lines.encode())
+
+
+def add_pairs(source=None, sink=None, batch_size=DEFAULT_BATCH_SIZE,
+              block_size=DEFAULT_BLOCK_SIZE):
+    """
+    ------------------------------------------------------------
+    ➕ Function: add_pairs
+    ------------------------------------------------------------
+    Description:
+        Bulk version of Add2No.py's user-input section: reads pairs
+        of numbers and writes a + b for every pair, one per line.
+
+    Parameters:
+        source: None (stdin), a path, or a file object
+        sink: Binary or text file object (default: sys.stdout)
+
+    Returns:
+        int: Number of pairs added.
+    """
+    out = binary_stream(sys.stdout if sink is None else sink)
+    count = 0
+    for first, second in iter_pair_batches(source, batch_size, block_size):
+        write_numbers(out, array.array("d", map(operator.add, first, second)))
+        count += len(first)
+    out.flush()
+    return count
+
+
+def sum_numbers(source=None, batch_size=DEFAULT_BATCH_SIZE,
+                block_size=DEFAULT_BLOCK_SIZE):
+    """Return the total of every number in 'source' (bounded memory)."""
+    return sum(sum(batch) for batch in
+               iter_number_batches(source, batch_size, block_size))
+
+
+# ============================================================
+# 🚀 COMMAND LINE
+# ============================================================
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Streaming bulk number input.")
+    parser.add_argument("command", choices=("add", "sum"))
+    parser.add_argument("file", nargs="?", help="input file (default: stdin)")
+    parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    if args.command == "add":
+        add_pairs(args.file, batch_size=args.batch_size, block_size=args.block_size)
+    else:
+        print(sum_numbers(args.file, args.batch_size, args.block_size))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Task                 | Interactive (input())        | Streaming (this module)              |
+|----------------------|------------------------------|--------------------------------------|
+| Read                 | One line per call            | 1 MiB binary block per call          |
+| Parse                | float() per prompt           | Batches of 65,536 numbers            |
+| Write                | print() per result           | One buffered write per batch         |
+| Memory               | Tiny                         | Bounded: one block + one batch       |
+
+✔ Use input() for humans, BulkInput for pipes and files.
+"""
@@ -0,0 +1,367 @@
+# ============================================================
+# 🧊 TOPIC: BOUNDED CACHE DICT  (LRU + TTL)
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+Dictionary.py teaches the "cache lookup" pattern:
+
+    person.get("salary", 0)     # value, or a default when missing
+
+A plain dict used as a cache never forgets anything: it grows until
+the process runs out of memory.
+
+BoundedCache is a dict with limits:
+
+✅ max_entries  → at most N keys
+✅ max_bytes    → approximate memory limit (sys.getsizeof per entry)
+✅ LRU          → when full, the Least Recently Used key is evicted
+✅ ttl          → entries expire after 'ttl' seconds
+✅ get / set are O(1); hits, misses and evictions are counted
+✅ ThreadSafeBoundedCache: same API behind a lock, for thread pools
+============================================================
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from functools import wraps
+
+_MISSING = object()
+
+
+class BoundedCache(MutableMapping):
+    """
+    ============================================================
+    💡 CLASS: BoundedCache
+    ------------------------------------------------------------
+    Description:
+        A dict-compatible cache that evicts the least recently used
+        entries when a limit is reached and drops expired entries.
+
+    Constructor:
+        BoundedCache(max_entries=None, max_bytes=None, ttl=None,
+                     sizeof=sys.getsizeof, clock=time.monotonic)
+            max_entries : maximum number of keys (None = unlimited)
+            max_bytes   : maximum sizeof(key) + sizeof(value) total
+            ttl         : seconds an entry stays valid (None = forever)
+
+    Methods:
+        get(key, default=None)   → counts a hit or a miss
+        peek(key, default=None)  → like get, but no counters, LRU kept
+        set(key, value, ttl=...) → like cache[key] = value, own ttl
+        purge_expired()          → drop every expired entry now
+        entries()                → (key, value, seconds left) snapshot
+        stats()                  → hits, misses, evictions, expirations
+        reset_stats()            → set those counters back to 0
+
+    Notes:
+        - Reading a key (get / [key]) marks it as recently used.
+        - `key in cache`, peek(), len(), iteration, keys() / values() /
+          items() do not change the LRU order or counters and skip
+          expired entries.
+        - set() drops expired entries from the LRU end, so entries that
+          are never read again do not pile up.
+    ============================================================
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, ttl=None,
+                 sizeof=sys.getsizeof, clock=time.monotonic):
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizeof = sizeof
+        self._clock = clock
+        self._data = OrderedDict()      # key → (value, expires_at, nbytes)
+        self._bytes = 0
+        self._timed = 0                 # entries that have an expiry time
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    # --------------------------------------------------------
+    # 📖 Reading
+    # --------------------------------------------------------
+    def _lookup(self, key):
+        """Value for key (refreshing its LRU position) or _MISSING."""
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[1] is not None and entry[1] <= self._clock():
+            self._discard(key)
+            self.expirations += 1
+            return _MISSING
+        self._data.move_to_end(key)
+        return entry[0]
+
+    def get(self, key, default=None):
+        value = self._lookup(key)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def __getitem__(self, key):
+        value = self._lookup(key)
+        if value is _MISSING:
+            self.misses += 1
+            raise KeyError(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key, default=None):
+        """Value for key without counting a use or refreshing its LRU position."""
+        entry = self._data.get(key)
+        if entry is None or (entry[1] is not None and entry[1] <= self._clock()):
+            return default
+        return entry[0]
+
+    def __contains__(self, key):
+        entry = self._data.get(key)
+        return entry is not None and (entry[1] is None or entry[1] > self._clock())
+
+    def _live(self):
+        """(key, value) for every unexpired entry, without counting a use."""
+        now = self._clock()
+        return [(key, value) for key, (value, expires, _) in self._data.items()
+                if expires is None or expires > now]
+
+    def __iter__(self):
+        return iter([key for key, _ in self._live()])
+
+    def items(self):
+        """Live (key, value) pairs; not counted as hits, LRU order kept."""
+        return self._live()
+
+    def values(self):
+        """Live values; not counted as hits, LRU order kept."""
+        return [value for _, value in self._live()]
+
+    def __len__(self):
+        """Number of live entries (expired ones are not counted)."""
+        if not self._timed:
+            return len(self._data)
+        now = self._clock()
+        return sum(1 for _, expires, _ in self._data.values()
+                   if expires is None or expires > now)
+
+    @property
+    def nbytes(self):
+        return self._bytes
+
+    # --------------------------------------------------------
+    # ✏️ Writing
+    # --------------------------------------------------------
+    def set(self, key, value, ttl=_MISSING):
+        """cache[key] = value, optionally with its own ttl (seconds)."""
+        ttl = self.ttl if ttl is _MISSING else ttl
+        expires = None if ttl is None else self._clock() + ttl
+        size = self._sizeof(key) + self._sizeof(value) if self.max_bytes else 0
+        if key in self._data:
+            self._discard(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.evictions += 1         # could never fit: not stored
+            return
+        self._data[key] = (value, expires, size)
+        self._bytes += size
+        if expires is not None:
+            self._timed += 1
+        if self._timed:
+            self._drop_expired()
+        self._evict()
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def __delitem__(self, key):
+        if key not in self._data:
+            raise KeyError(key)
+        self._discard(key)
+
+    def _discard(self, key):
+        _, expires, size = self._data.pop(key)
+        self._bytes -= size
+        if expires is not None:
+            self._timed -= 1
+
+    def _pop_oldest(self):
+        _, (_, expires, size) = self._data.popitem(last=False)
+        self._bytes -= size
+        if expires is not None:
+            self._timed -= 1
+
+    def _drop_expired(self):
+        """Remove expired entries from the least recently used end."""
+        data = self._data
+        now = self._clock()
+        while data:
+            expires = data[next(iter(data))][1]
+            if expires is None or expires > now:
+                break
+            self._pop_oldest()
+            self.expirations += 1
+
+    def _evict(self):
+        """Drop least recently used entries until both limits hold."""
+        data = self._data
+        while ((self.max_entries is not None and len(data) > self.max_entries)
+               or (self.max_bytes is not None and self._bytes > self.max_bytes)):
+            self._pop_oldest()
+            self.evictions += 1
+
+    def clear(self):
+        self._data.clear()
+        self._bytes = 0
+        self._timed = 0
+
+    def reset_stats(self):
+        """Set hits, misses, evictions and expirations back to 0."""
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def purge_expired(self):
+        """Remove every expired entry; returns how many were removed."""
+        now = self._clock()
+        expired = [key for key, (_, expires, _) in self._data.items()
+                   if expires is not None and expires <= now]
+        for key in expired:
+            self._discard(key)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def entries(self):
+        """
+        (key, value, seconds left or None) for every live entry, least
+        recently used first. Not counted as a use: for saving a cache.
+        """
+        now = self._clock()
+        return [(key, value, None if expires is None else expires - now)
+                for key, (value, expires, _) in self._data.items()
+                if expires is None or expires > now]
+
+    # --------------------------------------------------------
+    # 📊 Statistics
+    # --------------------------------------------------------
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def __repr__(self):
+        items = ", ".join(f"{k!r}: {v!r}" for k, v in self._live())
+        return f"{type(self).__name__}({{{items}}})"
+
+
+# ============================================================
+# 🔒 THREAD-SAFE VARIANT
+# ============================================================
+def _locked(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class ThreadSafeBoundedCache(BoundedCache):
+    """
+    ============================================================
+    💡 CLASS: ThreadSafeBoundedCache
+    ------------------------------------------------------------
+    Description:
+        BoundedCache whose operations run under one RLock, so it can
+        be shared by the workers of a ThreadPoolExecutor.
+
+    Notes:
+        - pop(), setdefault() and update() are atomic as well.
+        - The lock is reentrant, so the dict helpers (which call
+          __getitem__ / __setitem__) do not deadlock.
+    ============================================================
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._lock = threading.RLock()
+        super().__init__(*args, **kwargs)
+
+    get = _locked(BoundedCache.get)
+    peek = _locked(BoundedCache.peek)
+    __len__ = _locked(BoundedCache.__len__)
+    set = _locked(BoundedCache.set)
+    __getitem__ = _locked(BoundedCache.__getitem__)
+    __setitem__ = _locked(BoundedCache.__setitem__)
+    __delitem__ = _locked(BoundedCache.__delitem__)
+    __contains__ = _locked(BoundedCache.__contains__)
+    __iter__ = _locked(BoundedCache.__iter__)
+    items = _locked(BoundedCache.items)
+    values = _locked(BoundedCache.values)
+    pop = _locked(BoundedCache.pop)
+    popitem = _locked(BoundedCache.popitem)
+    setdefault = _locked(BoundedCache.setdefault)
+    update = _locked(BoundedCache.update)
+    clear = _locked(BoundedCache.clear)
+    reset_stats = _locked(BoundedCache.reset_stats)
+    purge_expired = _locked(BoundedCache.purge_expired)
+    entries = _locked(BoundedCache.entries)
+    stats = _locked(BoundedCache.stats)
+    __repr__ = _locked(BoundedCache.__repr__)
+
+
+if __name__ == "__main__":
+    # ✅ Same get(key, default) as a dict
+    cache = BoundedCache(max_entries=2)
+    cache["name"] = "Vinay"
+    cache["age"] = 25
+    print(cache.get("name"))          # Vinay  ('name' is now most recent)
+    cache["city"] = "Delhi"           # full → evicts 'age' (least recent)
+    print(cache.get("age", 0))        # 0
+    print(cache)                      # BoundedCache({'name': 'Vinay', 'city': 'Delhi'})
+    print(cache.stats())
+    # {'entries': 2, 'bytes': 0, 'hits': 1, 'misses': 1, 'hit_rate': 0.5, 'evictions': 1, 'expirations': 0}
+
+    # ⏳ TTL
+    sessions = BoundedCache(ttl=0.05)
+    sessions["token"] = "abc"
+    print(sessions.get("token"))      # abc
+    time.sleep(0.06)
+    print(sessions.get("token"))      # None (expired)
+
+    # 🔒 Shared by a thread pool
+    from concurrent.futures import ThreadPoolExecutor
+
+    shared = ThreadSafeBoundedCache(max_bytes=64 * 1024)
+
+    def square(n):
+        value = shared.get(n)
+        if value is None:
+            value = shared[n] = n * n
+        return value
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        total = sum(pool.map(square, [i % 100 for i in range(10_000)]))
+    print(total, shared.stats()["hits"] >= 9_000)   # 32835000 True
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Feature               | dict            | BoundedCache                    |
+|-----------------------|-----------------|---------------------------------|
+| get(key, default)     | ✅ O(1)         | ✅ O(1) + hit/miss counters     |
+| Size limit            | ❌ grows forever | max_entries and/or max_bytes    |
+| Eviction              | —               | Least Recently Used first       |
+| Expiry                | —               | ttl (seconds), per entry too    |
+| Thread pools          | ⚠️ GIL only     | ThreadSafeBoundedCache (RLock)  |
+"""
@@ -0,0 +1,310 @@
+# ============================================================
+# 🐄 TOPIC: COPY-ON-WRITE NESTED LISTS  (O(1) "deep copy")
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+List.py deep-copies nested lists with:
+
+    b = copy.deepcopy(a)     # visits and copies EVERY inner list
+    b[2][0] = 999
+
+For large nested configs copied per request, most copies are never
+written to, yet deepcopy pays for the whole structure every time.
+
+CowList copies lazily (copy-on-write):
+
+✅ b = a.deepcopy()   → O(1): both share the same inner lists
+✅ b[2][0] = 999      → copies ONLY the lists on the path to [2][0]
+                        (the outer list and a[2]); everything else
+                        stays shared
+✅ a is never affected, exactly like with copy.deepcopy
+============================================================
+"""
+
+from collections.abc import MutableSequence
+
+
+class _Node(list):
+    """
+    A list created by a CowList tree, stamped with the tree's epoch.
+
+    'origin' is the list it was first copied from (None if it is not a
+    copy). Every copy of a copy keeps the same origin, so views can tell
+    a later copy of their own list from an unrelated one.
+    """
+
+    __slots__ = ("epoch", "origin")
+
+    def __init__(self, items=()):
+        super().__init__(items)
+        self.origin = None
+
+
+def _origin(data):
+    origin = getattr(data, "origin", None)
+    return data if origin is None else origin
+
+
+class _Tree:
+    """
+    Ownership token shared by every view of one CowList tree.
+
+    The tree may change in place only the _Node lists stamped with its
+    current 'epoch'. All other lists may be shared with copies and are
+    copied before the first write. release() starts a new epoch, so
+    everything the tree stamped so far counts as shared, in O(1) and
+    without keeping any list alive.
+    """
+
+    __slots__ = ("epoch",)
+
+    def __init__(self):
+        self.epoch = object()
+
+    def release(self):
+        self.epoch = object()
+
+    def claim(self, items):
+        node = _Node(items)
+        node.epoch = self.epoch
+        return node
+
+    def owns(self, data):
+        return getattr(data, "epoch", None) is self.epoch
+
+
+def _raw(value):
+    """Return what is stored for 'value': CowLists are stored as raw lists."""
+    if isinstance(value, CowList):
+        value._tree.release()          # now shared: the source must copy on write
+        return value._follow()
+    return value
+
+
+def _deep_list(data):
+    return [_deep_list(x) if isinstance(x, list) else x for x in data]
+
+
+class CowList(MutableSequence):
+    """
+    ============================================================
+    💡 CLASS: CowList
+    ------------------------------------------------------------
+    Description:
+        A nested list whose deep copy is O(1). Inner lists are
+        cloned only when somebody writes to them.
+
+    Constructor:
+        CowList(data=())      copies the OUTER level of 'data'
+        CowList.wrap(data)    no copy at all; 'data' is never modified
+
+    Methods:
+        deepcopy()  → O(1) independent copy (also copy.deepcopy(obj))
+        to_list()   → plain nested lists (a real, full copy)
+
+    Notes:
+        - Reading an inner list returns a CowList view of it.
+        - Inner lists are never shared by identity: if the same list
+          object appears twice, writing through one slot does not
+          change the other (copy.deepcopy would keep them aliased).
+    ============================================================
+    """
+
+    __slots__ = ("_data", "_tree", "_parent", "_slot")
+
+    def __init__(self, data=()):
+        self._tree = _Tree()
+        self._data = self._tree.claim(_raw(x) for x in data)
+        self._parent = None
+        self._slot = None
+
+    @classmethod
+    def _view(cls, data, tree, parent=None, slot=None):
+        obj = cls.__new__(cls)
+        obj._data = data
+        obj._tree = tree
+        obj._parent = parent
+        obj._slot = slot
+        return obj
+
+    @classmethod
+    def _detached(cls, data):
+        """A new, independent tree around a fresh outer list 'data'."""
+        tree = _Tree()
+        return cls._view(tree.claim(data), tree)
+
+    @classmethod
+    def wrap(cls, data):
+        """Wrap an existing nested list without copying anything (O(1))."""
+        return cls._view(data, _Tree())
+
+    # --------------------------------------------------------
+    # 🐄 Copy-on-write machinery
+    # --------------------------------------------------------
+    def deepcopy(self):
+        """
+        Return an independent copy in O(1).
+
+        Both trees now share every list, so both forget what they
+        owned and copy before their next write.
+        """
+        self._tree.release()
+        return self._view(self._follow(), _Tree())
+
+    def __deepcopy__(self, memo):
+        return self.deepcopy()
+
+    copy = deepcopy
+    __copy__ = deepcopy
+
+    def _follow(self):
+        """
+        Catch up with writes made through other views of the same slot.
+
+        Another view may have copied this list into the parent already;
+        this view then switches to that copy, so all views of one slot
+        share one owned list. A slot that now holds an unrelated list
+        (it was assigned or removed) leaves this view on its own list,
+        like a plain list detached from its parent.
+        """
+        parent = self._parent
+        if parent is None:
+            return self._data
+        data = parent._follow()
+        old = self._data
+        slot = self._slot
+        if 0 <= slot < len(data) and data[slot] is old:
+            return old
+        origin = _origin(old)
+        if not (0 <= slot < len(data) and _origin(data[slot]) is origin):
+            slot = next((i for i, x in enumerate(data)
+                         if x is old or _origin(x) is origin), None)
+            if slot is None:
+                return old
+            self._slot = slot
+        self._data = data[slot]
+        return self._data
+
+    def _ensure_owned(self):
+        """Before a write: copy this level if it may be shared (path copying)."""
+        old = self._follow()
+        if self._tree.owns(old):
+            return
+        self._data = self._tree.claim(old)
+        self._data.origin = _origin(old)
+        if self._parent is not None:
+            self._parent._adopt(self._slot, old, self._data)
+
+    def _adopt(self, slot, old, new):
+        """Replace the child list 'old' (expected at 'slot') with 'new'."""
+        data = self._data
+        if not (0 <= slot < len(data) and data[slot] is old):
+            slot = next((i for i, x in enumerate(data) if x is old), None)
+            if slot is None:
+                return                 # child was removed: it lives on alone
+        self._ensure_owned()
+        self._data[slot] = new
+
+    # --------------------------------------------------------
+    # 📖 Reading
+    # --------------------------------------------------------
+    def __len__(self):
+        return len(self._follow())
+
+    def __getitem__(self, index):
+        data = self._follow()
+        if isinstance(index, slice):
+            self._tree.release()       # inner lists become shared with the slice
+            return self._detached(data[index])
+        item = data[index]
+        if isinstance(item, list):
+            slot = index if index >= 0 else index + len(data)
+            return self._view(item, self._tree, self, slot)
+        return item
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_list(self):
+        """Return the contents as plain nested lists (full copy)."""
+        return _deep_list(self._follow())
+
+    def __eq__(self, other):
+        if isinstance(other, CowList):
+            other = other._follow()
+        if isinstance(other, list):
+            return self._follow() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"CowList({self.to_list()!r})"
+
+    # --------------------------------------------------------
+    # ✏️ Writing (copy this level first if it is shared)
+    # --------------------------------------------------------
+    def __setitem__(self, index, value):
+        self._ensure_owned()
+        if isinstance(index, slice):
+            self._data[index] = [_raw(x) for x in value]
+        else:
+            self._data[index] = _raw(value)
+
+    def __delitem__(self, index):
+        self._ensure_owned()
+        del self._data[index]
+
+    def insert(self, index, value):
+        self._ensure_owned()
+        self._data.insert(index, _raw(value))
+
+    def append(self, value):
+        self._ensure_owned()
+        self._data.append(_raw(value))
+
+    def extend(self, values):
+        self._ensure_owned()
+        self._data.extend(_raw(x) for x in values)
+
+    def pop(self, index=-1):
+        self._ensure_owned()
+        item = self._data.pop(index)
+        return self._view(item, _Tree()) if isinstance(item, list) else item
+
+    def clear(self):
+        self._ensure_owned()
+        self._data.clear()
+
+
+if __name__ == "__main__":
+    import copy
+
+    a = CowList([1, 2, [3, 4]])
+    b = a.deepcopy()       # O(1): nothing is copied yet
+    b[2][0] = 999          # copies b's outer list and a[2] only
+
+    print("a =", a)   # CowList([1, 2, [3, 4]])
+    print("b =", b)   # CowList([1, 2, [999, 4]])
+
+    # Big config: 10,000 inner lists, but only one of them gets copied
+    config = CowList([[i, i + 1] for i in range(10_000)])
+    per_request = copy.deepcopy(config)     # also O(1)
+    per_request[42][1] = -1
+    print(config[42], per_request[42])      # CowList([42, 43]) CowList([42, -1])
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Step                 | copy.deepcopy(a)              | CowList.deepcopy()                 |
+|----------------------|-------------------------------|------------------------------------|
+| Making the copy      | O(total elements)             | O(1)                               |
+| First write b[i][j]  | O(1)                          | Copies the lists on the path only  |
+| Unwritten parts      | Duplicated in memory          | Shared between copies              |
+| Original affected?   | ❌ No                          | ❌ No                               |
+"""
@@ -16,10 +16,11 @@ class BankAccountPython:
     def getBalance(self):
         return self._balance
 
-acc_py = BankAccountPython(1000)
-print(acc_py.getBalance())  # ✅ 1000
-acc_py._balance = 5000       # ❌ Direct access still possible
-print(acc_py.getBalance())  # 5000
+if __name__ == "__main__":
+    acc_py = BankAccountPython(1000)
+    print(acc_py.getBalance())  # ✅ 1000
+    acc_py._balance = 5000       # ❌ Direct access still possible
+    print(acc_py.getBalance())  # 5000
 
 # 🔹 Java Example
 # Java enforces private variables, must use getter/setter.
@@ -83,12 +84,13 @@ class BankAccountProperty:
 
 # 🔹 Usage:
 
-acc = BankAccountProperty(1000)
+if __name__ == "__main__":
+    acc = BankAccountProperty(1000)
 
-print(acc.balance)    # ✅ Calls getter → 1000
-acc.balance = 2000    # ✅ Calls setter → updates value
-print(acc.balance)    # 2000
-acc.balance = -500    # ❌ Calls setter → prints "Invalid amount!"
+    print(acc.balance)    # ✅ Calls getter → 1000
+    acc.balance = 2000    # ✅ Calls setter → updates value
+    print(acc.balance)    # 2000
+    acc.balance = -500    # ❌ Calls setter → prints "Invalid amount!"
 
 # 🔹 Key Points:
 # - _balance: internal attribute, protected by convention
@@ -111,8 +113,9 @@ class BankAccount:
     def __init__(self, balance):
         self._balance = balance  # Protected by convention
 
-acc = BankAccount(1000)
-print(acc._balance)  # ❌ Direct access is possible, not recommended
+if __name__ == "__main__":
+    acc = BankAccount(1000)
+    print(acc._balance)  # ❌ Direct access is possible, not recommended
 
 
 # ============================================================
@@ -132,10 +135,11 @@ class BankAccountMethods:
     def getBalance(self):
         return self._balance
 
-acc1 = BankAccountMethods(1000)
-print(acc1.getBalance())  # ✅ 1000
-acc1.deposit(500)
-print(acc1.getBalance())  # ✅ 1500
+if __name__ == "__main__":
+    acc1 = BankAccountMethods(1000)
+    print(acc1.getBalance())  # ✅ 1000
+    acc1.deposit(500)
+    print(acc1.getBalance())  # ✅ 1500
 
 
 # ============================================================
@@ -161,11 +165,12 @@ class BankAccountProperty:
         else:
             print("Invalid amount!")
 
-acc2 = BankAccountProperty(1000)
-print(acc2.balance)  # Getter ✅ 1000
-acc2.balance = 2000  # Setter ✅
-print(acc2.balance)  # 2000
-acc2.balance = -500  # ❌ Invalid amount!
+if __name__ == "__main__":
+    acc2 = BankAccountProperty(1000)
+    print(acc2.balance)  # Getter ✅ 1000
+    acc2.balance = 2000  # Setter ✅
+    print(acc2.balance)  # 2000
+    acc2.balance = -500  # ❌ Invalid amount!
 
 
 # ============================================================
@@ -29,96 +29,97 @@
 class MyCustomError(Exception):
     pass
 
-try:
-    raise MyCustomError("This is a custom error")
-except MyCustomError as e:
-    print(e)
-
-# -----------------------------------------------
-# 4️⃣ Try and Except
-# -----------------------------------------------
-# Basic exception handling
-try:
-    x = 10 / 0   # Raises ZeroDivisionError
-except ZeroDivisionError:
-    print("Cannot divide by zero")
-
-# -----------------------------------------------
-# 5️⃣ Multiple Except Blocks
-# -----------------------------------------------
-try:
-    num = int("abc")  # Raises ValueError
-except ZeroDivisionError:
-    print("Cannot divide by zero")
-except ValueError:
-    print("Invalid conversion to integer")
-
-# -----------------------------------------------
-# 6️⃣ Catching Multiple Exceptions in Single Except
-# -----------------------------------------------
-# Similar to Java's multi-catch (catching multiple exceptions in one block)
-try:
-    x = int("abc") / 0
-except (ValueError, ZeroDivisionError) as e:
-    print("An error occurred:", e)
-
-# Equivalent Java:
-# try {
-#     int x = Integer.parseInt("abc") / 0;
-# } catch (NumberFormatException | ArithmeticException e) {
-#     System.out.println("An error occurred: " + e.getMessage());
-# }
-
-# -----------------------------------------------
-# 7️⃣ Catch All Exceptions
-# -----------------------------------------------
-try:
-    print(10 / 0)
-except Exception as e:
-    print("Error occurred:", e)
-
-# -----------------------------------------------
-# 8️⃣ Else Block
-# -----------------------------------------------
-# Executes if no exception occurs
-try:
-    result = 10 / 2
-except ZeroDivisionError:
-    print("Cannot divide by zero")
-else:
-    print("Result is", result)
-
-# -----------------------------------------------
-# 9️⃣ Finally Block
-# -----------------------------------------------
-# Executes **always**, whether exception occurs or not
-try:
-    file = open("test.txt", "r")
-except FileNotFoundError:
-    print("File not found")
-finally:
-    print("This block always executes")
-
-# -----------------------------------------------
-# 🔟 Raising Exceptions
-# -----------------------------------------------
-# You can raise exceptions manually using `raise`
-age = -5
-if age < 0:
-    raise ValueError("Age cannot be negative")
-
-# -----------------------------------------------
-# 1️⃣1️⃣ sys.exc_info() for Exception Details
-# -----------------------------------------------
-# Provides detailed info about the current exception
-import sys
-
-try:
-    x = 1 / 0
-except:
-    print("Exception type:", sys.exc_info()[0])   # Like Java e.getClass()
-    print("Exception message:", sys.exc_info()[1]) # Like Java e.getMessage()
-    print("Traceback object:", sys.exc_info()[2])  # Like Java e.printStackTrace()
+if __name__ == "__main__":
+    try:
+        raise MyCustomError("This is a custom error")
+    except MyCustomError as e:
+        print(e)
+
+    # -----------------------------------------------
+    # 4️⃣ Try and Except
+    # -----------------------------------------------
+    # Basic exception handling
+    try:
+        x = 10 / 0   # Raises ZeroDivisionError
+    except ZeroDivisionError:
+        print("Cannot divide by zero")
+
+    # -----------------------------------------------
+    # 5️⃣ Multiple Except Blocks
+    # -----------------------------------------------
+    try:
+        num = int("abc")  # Raises ValueError
+    except ZeroDivisionError:
+        print("Cannot divide by zero")
+    except ValueError:
+        print("Invalid conversion to integer")
+
+    # -----------------------------------------------
+    # 6️⃣ Catching Multiple Exceptions in Single Except
+    # -----------------------------------------------
+    # Similar to Java's multi-catch (catching multiple exceptions in one block)
+    try:
+        x = int("abc") / 0
+    except (ValueError, ZeroDivisionError) as e:
+        print("An error occurred:", e)
+
+    # Equivalent Java:
+    # try {
+    #     int x = Integer.parseInt("abc") / 0;
+    # } catch (NumberFormatException | ArithmeticException e) {
+    #     System.out.println("An error occurred: " + e.getMessage());
+    # }
+
+    # -----------------------------------------------
+    # 7️⃣ Catch All Exceptions
+    # -----------------------------------------------
+    try:
+        print(10 / 0)
+    except Exception as e:
+        print("Error occurred:", e)
+
+    # -----------------------------------------------
+    # 8️⃣ Else Block
+    # -----------------------------------------------
+    # Executes if no exception occurs
+    try:
+        result = 10 / 2
+    except ZeroDivisionError:
+        print("Cannot divide by zero")
+    else:
+        print("Result is", result)
+
+    # -----------------------------------------------
+    # 9️⃣ Finally Block
+    # -----------------------------------------------
+    # Executes **always**, whether exception occurs or not
+    try:
+        file = open("test.txt", "r")
+    except FileNotFoundError:
+        print("File not found")
+    finally:
+        print("This block always executes")
+
+    # -----------------------------------------------
+    # 🔟 Raising Exceptions
+    # -----------------------------------------------
+    # You can raise exceptions manually using `raise`
+    age = -5
+    if age < 0:
+        raise ValueError("Age cannot be negative")
+
+    # -----------------------------------------------
+    # 1️⃣1️⃣ sys.exc_info() for Exception Details
+    # -----------------------------------------------
+    # Provides detailed info about the current exception
+    import sys
+
+    try:
+        x = 1 / 0
+    except:
+        print("Exception type:", sys.exc_info()[0])   # Like Java e.getClass()
+        print("Exception message:", sys.exc_info()[1]) # Like Java e.getMessage()
+        print("Traceback object:", sys.exc_info()[2])  # Like Java e.printStackTrace()
 
 # -----------------------------------------------
 # 1️⃣2️⃣ Python vs Java Exception Comparison
@@ -0,0 +1,195 @@
+# ============================================================
+# 🧊 TOPIC: FROZEN INDEXED TUPLE  (O(1) count / index / in)
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+Tuple.py shows the two tuple methods:
+
+    t = (1, 2, 3, 2, 4)
+    t.count(2)      # 2  → scans the WHOLE tuple
+    t.index(3)      # 2  → scans until the first 3
+
+Each call is O(n). Asking a million-element tuple a thousand
+questions means a thousand full scans.
+
+A tuple never changes, so whatever we learn about it stays true.
+FrozenIndexedTuple IS a tuple (isinstance(t, tuple) is True) that,
+the first time it is asked, builds a map in one C-level pass:
+
+✅ count(x)          → value → count            (collections.Counter)
+✅ index(x), x in t  → value → first position   (dict built back to front)
+
+After that, every such question is a dict lookup, O(1).
+positions(x) ("every index of x") builds a third map the first
+time it is used, then answers in O(1) too.
+
+Unhashable values (e.g. lists inside the tuple) simply fall back to
+the ordinary tuple scans, so results are always the same as tuple's.
+============================================================
+"""
+
+import sys
+from bisect import bisect_left
+from collections import Counter
+
+
+def _first_positions(items):
+    # Back to front: an earlier position overwrites a later one.
+    return dict(zip(reversed(items), range(len(items) - 1, -1, -1)))
+
+
+def _all_positions(items):
+    positions = {}
+    for i, value in enumerate(items):
+        positions.setdefault(value, []).append(i)
+    return {value: tuple(found) for value, found in positions.items()}
+
+
+_BUILDERS = {"counts": Counter, "first": _first_positions, "positions": _all_positions}
+
+
+class FrozenIndexedTuple(tuple):
+    """
+    ============================================================
+    💡 CLASS: FrozenIndexedTuple
+    ------------------------------------------------------------
+    Description:
+        A tuple whose count / index / `in` are answered from
+        lazily built hash maps instead of linear scans.
+
+    Constructor:
+        FrozenIndexedTuple(iterable=())
+
+    Methods:
+        count(x)                     → O(1) after the first count
+        index(x, start=0, stop=...)  → O(1) (O(log k) with start/stop)
+        x in t                       → O(1)
+        positions(x)                 → tuple of every index of x
+
+    Notes:
+        - Each map is built by the first query that needs it:
+          count → value counts, index / in → first positions,
+          positions / index with start or stop → all positions.
+        - Equal values share one entry, exactly like tuple.count:
+          1, 1.0 and True are counted together.
+        - Slicing and + return plain tuples.
+    ============================================================
+    """
+
+    def __new__(cls, iterable=()):
+        self = super().__new__(cls, iterable)
+        self._maps = {}             # "counts" / "first" / "positions" → dict
+        self._unhashable = False    # True → every query scans like tuple
+        return self
+
+    # --------------------------------------------------------
+    # 🏗️ Lazy indexes
+    # --------------------------------------------------------
+    def _map(self, kind):
+        """The map called 'kind', built on first use; None if unhashable."""
+        found = self._maps.get(kind)
+        if found is None and not self._unhashable:
+            try:
+                found = self._maps[kind] = _BUILDERS[kind](self)
+            except TypeError:       # an element cannot be hashed
+                self._unhashable = True
+        return found
+
+    # --------------------------------------------------------
+    # 🔎 Queries
+    # --------------------------------------------------------
+    def count(self, value):
+        counts = self._map("counts")
+        if counts is not None:
+            try:
+                return counts[value]
+            except TypeError:       # unhashable query value
+                pass
+        return super().count(value)
+
+    def __contains__(self, value):
+        first = self._map("first")
+        if first is not None:
+            try:
+                return value in first
+            except TypeError:
+                pass
+        return super().__contains__(value)
+
+    def index(self, value, start=0, stop=sys.maxsize):
+        whole = start == 0 and stop >= len(self)
+        table = self._map("first" if whole else "positions")
+        if table is not None:
+            try:
+                found = table.get(value)
+            except TypeError:
+                pass
+            else:
+                if found is not None and whole:
+                    return found
+                if found is not None:
+                    start, stop, _ = slice(start, stop).indices(len(self))
+                    i = bisect_left(found, start)
+                    if i < len(found) and found[i] < stop:
+                        return found[i]
+                raise ValueError("tuple.index(x): x not in tuple")
+        return super().index(value, start, stop)
+
+    def positions(self, value):
+        """Every index at which value occurs (empty tuple if none)."""
+        positions = self._map("positions")
+        if positions is not None:
+            try:
+                return positions.get(value, ())
+            except TypeError:
+                pass
+        return tuple(i for i, item in enumerate(self) if item is value or item == value)
+
+    # --------------------------------------------------------
+    # 📦 Still a tuple
+    # --------------------------------------------------------
+    def __reduce__(self):
+        # pickle / copy only the elements, never the built maps
+        return type(self), (tuple(self),)
+
+    def __repr__(self):
+        return f"FrozenIndexedTuple({tuple.__repr__(self)})"
+
+
+if __name__ == "__main__":
+    t = FrozenIndexedTuple((1, 2, 3, 2, 4))
+    print(t.count(2))           # 2   (first count builds the counts map)
+    print(t.index(3))           # 2
+    print(t.positions(2))       # (1, 3)
+    print(t.index(2, 2))        # 3   (start=2 → binary search in positions)
+    print(5 in t)               # False
+    print(isinstance(t, tuple), t == (1, 2, 3, 2, 4))   # True True
+
+    # ⏱️ 100 questions to a 1,000,000-element tuple
+    import time
+
+    data = tuple(i % 50_000 for i in range(1_000_000))
+    frozen = FrozenIndexedTuple(data)
+    for name, seq in (("tuple", data), ("FrozenIndexedTuple", frozen)):
+        start = time.perf_counter()
+        for x in range(0, 50_000, 500):
+            seq.count(x)
+        print(f"{name:<20}{time.perf_counter() - start:.3f} s")
+    # tuple               ~1.4 s
+    # FrozenIndexedTuple  ~0.07 s (almost all of it the one-time build)
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Operation       | tuple              | FrozenIndexedTuple                    |
+|-----------------|--------------------|---------------------------------------|
+| t.count(x)      | O(n) every call    | O(1) after one O(n) build             |
+| t.index(x)      | O(position of x)   | O(1) (start/stop: O(log k))           |
+| x in t          | O(n) worst case    | O(1)                                  |
+| all positions   | Loop yourself      | positions(x), built on first use      |
+| Unhashable data | ✅                 | ✅ falls back to the tuple scans      |
+"""
@@ -19,28 +19,34 @@
 def greet():
     print("Hello, World!")
 
-greet()
+if __name__ == "__main__":
+    greet()
 
 # Example 2: Function with parameters
 def add(a, b):
     return a + b
 
-result = add(10, 20)
-print("Sum:", result)
+if __name__ == "__main__":
+    result = add(10, 20)
+    print("Sum:", result)
+    # add() is pure: same arguments → same result. Memoize.py's @memoize
+    # caches such results (LRU / LFU / TTL); worth it for costly functions.
 
 # Example 3: Function with default parameters
 def greet_person(name="Guest"):
     print(f"Hello, {name}!")
 
-greet_person("Vinay")
-greet_person()  # Uses default value
+if __name__ == "__main__":
+    greet_person("Vinay")
+    greet_person()  # Uses default value
 
 # Example 4: Function with variable number of arguments (*args, **kwargs)
 def show_details(*args, **kwargs):
     print("Positional arguments:", args)
     print("Keyword arguments:", kwargs)
 
-show_details(1, 2, 3, name="Vinay", age=25)
+if __name__ == "__main__":
+    show_details(1, 2, 3, name="Vinay", age=25)
 
 # ============================================================
 # 🔹 Key Points about Functions
@@ -60,11 +66,13 @@ show_details(1, 2, 3, name="Vinay", age=25)
 # lambda arguments: expression
 
 square = lambda x: x**2
-print("Square:", square(5))
+if __name__ == "__main__":
+    print("Square:", square(5))
 
 # Lambda with multiple arguments
 add_two = lambda a, b: a + b
-print("Add:", add_two(10, 15))
+if __name__ == "__main__":
+    print("Add:", add_two(10, 15))
 
 # ============================================================
 # 3️⃣ Comparison with Java
@@ -0,0 +1,289 @@
+# ============================================================
+# 🔎 TOPIC: AUTO-INDEXED MEMBERSHIP  (fast `x in seq`)
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+List.py, Tuple.py and Operator.py check membership with:
+
+    2 in a          "apple" in fruits
+
+On a list or tuple, `in` is a LINEAR scan: 100,000 elements means up
+to 100,000 comparisons per check. Called in a loop, that adds up.
+
+IndexedSequence wraps a list or tuple and watches how often `in` is
+used. After `threshold` queries it builds an index once:
+
+✅ hashable values   → hash index (value → count), O(1) per query
+✅ orderable values  → sorted index + binary search, O(log n)
+                       (numbers, str, bytes, and lists / tuples of them;
+                       NOT sets: for sets `<` means "subset of")
+✅ anything else     → stays a plain scan (still correct)
+
+Changes made THROUGH the wrapper (append, insert, pop, remove, x[i] = v)
+update the index incrementally. `stats` shows how the index is used.
+============================================================
+"""
+
+from bisect import bisect_left, insort
+from collections import Counter
+from collections.abc import MutableSequence
+
+HASH = "hash"
+SORTED = "sorted"
+NONE = "none"
+
+_ORDERED = {int, bool, float, str, bytes}
+
+
+def _ordered(value):
+    """True if `<` on 'value' is a real total order, so bisect is exact."""
+    kind = type(value)
+    if kind in _ORDERED:
+        return value == value   # NaN is not ordered
+    if kind is list or kind is tuple:
+        return all(map(_ordered, value))
+    return False
+
+
+class IndexedSequence(MutableSequence):
+    """
+    ============================================================
+    💡 CLASS: IndexedSequence
+    ------------------------------------------------------------
+    Description:
+        A list/tuple wrapper whose `in` checks switch from a linear
+        scan to a lazily built hash or sorted index.
+
+    Constructor:
+        IndexedSequence(data=(), threshold=8)
+            data      : a list or tuple (wrapped, NOT copied); any
+                        other iterable is copied into a list
+            threshold : number of `in` queries before indexing
+
+    Notes:
+        - Tuple-backed wrappers are read-only (TypeError on writes).
+        - If the wrapped list is changed directly (not through the
+          wrapper), call invalidate() so the index is rebuilt.
+        - count(x) is also answered from the hash index.
+    ============================================================
+    """
+
+    def __init__(self, data=(), threshold=8):
+        self._data = data if isinstance(data, (list, tuple)) else list(data)
+        self.threshold = threshold
+        self._kind = None           # None = not built yet
+        self._index = None
+        self._queries = 0
+        self._index_hits = 0
+        self._scans = 0
+        self._builds = 0
+        self._invalidations = 0
+
+    # --------------------------------------------------------
+    # 🏗️ Building / dropping the index
+    # --------------------------------------------------------
+    def _build(self):
+        self._builds += 1
+        try:
+            self._index = Counter(self._data)
+            self._kind = HASH
+            return
+        except TypeError:
+            pass                    # unhashable values: try sorting
+        if all(map(_ordered, self._data)):
+            try:
+                self._index = sorted(self._data)
+                self._kind = SORTED
+                return
+            except TypeError:
+                pass                # e.g. [1] next to ["a"]
+        self._index = None
+        self._kind = NONE           # sets, mixed, unorderable: scan forever
+
+    def invalidate(self):
+        """Drop the index; it is rebuilt after `threshold` more queries."""
+        if self._kind is not None:
+            self._invalidations += 1
+        self._kind = None
+        self._index = None
+        self._queries = 0
+
+    @property
+    def stats(self):
+        """Query statistics: how often the index answered vs a scan."""
+        return {
+            "kind": self._kind,
+            "queries": self._index_hits + self._scans,
+            "index_hits": self._index_hits,
+            "scans": self._scans,
+            "builds": self._builds,
+            "invalidations": self._invalidations,
+        }
+
+    # --------------------------------------------------------
+    # 🔎 Membership
+    # --------------------------------------------------------
+    def __contains__(self, value):
+        kind = self._kind
+        if kind is None:
+            self._queries += 1
+            if self._queries >= self.threshold:
+                self._build()
+                kind = self._kind
+        if kind == HASH:
+            try:
+                found = value in self._index
+            except TypeError:       # unhashable query value
+                pass
+            else:
+                self._index_hits += 1
+                return found
+        elif kind == SORTED and _ordered(value):
+            index = self._index
+            try:
+                i = bisect_left(index, value)
+            except TypeError:       # value not comparable with the elements
+                pass
+            else:
+                self._index_hits += 1
+                return i < len(index) and index[i] == value
+        self._scans += 1
+        return value in self._data
+
+    def count(self, value):
+        if self._kind == HASH:
+            try:
+                return self._index[value]
+            except TypeError:
+                pass
+        return self._data.count(value)
+
+    # --------------------------------------------------------
+    # 📖 Reading
+    # --------------------------------------------------------
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        return self._data[index]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def index(self, value, start=0, stop=None):
+        return self._data.index(value, start, len(self._data) if stop is None else stop)
+
+    def __repr__(self):
+        return f"IndexedSequence({self._data!r})"
+
+    def __eq__(self, other):
+        if isinstance(other, IndexedSequence):
+            other = other._data
+        return self._data == other
+
+    __hash__ = None
+
+    # --------------------------------------------------------
+    # ✏️ Writing: keep the index in sync
+    # --------------------------------------------------------
+    def _writable(self):
+        if isinstance(self._data, tuple):
+            raise TypeError("IndexedSequence over a tuple is read-only")
+        return self._data
+
+    def _index_add(self, value):
+        if self._kind == HASH:
+            try:
+                self._index[value] += 1
+            except TypeError:
+                self.invalidate()
+        elif self._kind == SORTED:
+            if not _ordered(value):
+                self.invalidate()
+                return
+            try:
+                insort(self._index, value)
+            except TypeError:
+                self.invalidate()
+
+    def _index_remove(self, value):
+        if self._kind == HASH:
+            counts = self._index
+            counts[value] -= 1
+            if counts[value] <= 0:
+                del counts[value]
+        elif self._kind == SORTED:
+            index = self._index
+            del index[bisect_left(index, value)]
+
+    def __setitem__(self, index, value):
+        data = self._writable()
+        if isinstance(index, slice):
+            data[index] = value
+            self.invalidate()
+            return
+        old = data[index]
+        data[index] = value
+        if self._kind in (HASH, SORTED):
+            self._index_remove(old)
+            self._index_add(value)
+
+    def __delitem__(self, index):
+        data = self._writable()
+        if isinstance(index, slice):
+            del data[index]
+            self.invalidate()
+            return
+        old = data[index]
+        del data[index]
+        if self._kind in (HASH, SORTED):
+            self._index_remove(old)
+
+    def insert(self, index, value):
+        self._writable().insert(index, value)
+        self._index_add(value)
+
+    def append(self, value):
+        self._writable().append(value)
+        self._index_add(value)
+
+    def clear(self):
+        self._writable().clear()
+        if self._kind == HASH:
+            self._index.clear()
+        elif self._kind == SORTED:
+            self._index = []
+
+
+if __name__ == "__main__":
+    fruits = IndexedSequence(["apple", "banana", "cherry"], threshold=2)
+    print("apple" in fruits)     # True  (scan)
+    print("mango" in fruits)     # False (threshold reached → hash index built)
+    fruits.append("mango")       # index updated, not rebuilt
+    print("mango" in fruits)     # True  (answered by the index)
+    print(fruits.stats)
+    # {'kind': 'hash', 'queries': 3, 'index_hits': 2, 'scans': 1, 'builds': 1, 'invalidations': 0}
+
+    # Big tuple: 100,000 membership checks
+    big = IndexedSequence(tuple(range(100_000)))
+    hits = sum(1 for x in range(0, 200_000, 2) if x in big)
+    print(hits, big.stats["index_hits"])   # 50000 99993
+
+    # Unhashable values (lists) fall back to a sorted index
+    pairs = IndexedSequence([[3, 4], [1, 2]], threshold=1)
+    print([1, 2] in pairs, pairs.stats["kind"])   # True sorted
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Check              | list / tuple   | set             | IndexedSequence                 |
+|--------------------|----------------|-----------------|---------------------------------|
+| x in seq           | O(n) scan      | O(1)            | O(n) first, then O(1) / O(log n) |
+| Keeps order & dups | ✅ Yes          | ❌ No            | ✅ Yes                           |
+| Index on mutation  | —              | —               | Updated incrementally           |
+| Extra memory       | None           | Whole set       | Index built only when used      |
+"""
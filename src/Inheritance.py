@@ -26,9 +26,10 @@ class Car(Vehicle):
     def showModel(self):
         print(f"Car Model: {self.model}")
 
-c = Car("Toyota", "Corolla")
-c.showBrand()  # From Vehicle
-c.showModel()  # From Car
+if __name__ == "__main__":
+    c = Car("Toyota", "Corolla")
+    c.showBrand()  # From Vehicle
+    c.showModel()  # From Car
 
 
 # ============================================================
@@ -49,10 +50,11 @@ class SportsCar(Engine, Body):
     def features(self):
         print("Sports features activated")
 
-s = SportsCar()
-s.start()       # From Engine
-s.color()       # From Body
-s.features()    # From SportsCar
+if __name__ == "__main__":
+    s = SportsCar()
+    s.start()       # From Engine
+    s.color()       # From Body
+    s.features()    # From SportsCar
 
 
 # ============================================================
@@ -73,10 +75,11 @@ class Dog(Mammal):
     def bark(self):
         print("Barking")
 
-d = Dog()
-d.eat()   # From Animal
-d.walk()  # From Mammal
-d.bark()  # From Dog
+if __name__ == "__main__":
+    d = Dog()
+    d.eat()   # From Animal
+    d.walk()  # From Mammal
+    d.bark()  # From Dog
 
 
 # ============================================================
@@ -97,10 +100,11 @@ class Circle(Shape):
     def area(self):
         print("Circle area")
 
-r = Rectangle()
-c = Circle()
-r.area()  # Rectangle area
-c.area()  # Circle area
+if __name__ == "__main__":
+    r = Rectangle()
+    c = Circle()
+    r.area()  # Rectangle area
+    c.area()  # Circle area
 
 
 # ============================================================
@@ -125,24 +129,25 @@ class D(B, C):
     def d_method(self):
         print("D method")
 
-d = D()
-d.a_method()  # From A
-d.b_method()  # From B
-d.c_method()  # From C
-d.d_method()  # From D
+if __name__ == "__main__":
+    d = D()
+    d.a_method()  # From A
+    d.b_method()  # From B
+    d.c_method()  # From C
+    d.d_method()  # From D
 
 
-# ============================================================
-# 🔹 Key Points About Python Inheritance
-# ============================================================
+    # ============================================================
+    # 🔹 Key Points About Python Inheritance
+    # ============================================================
 
-# 1. Python supports multiple inheritance, unlike Java (Java allows only single inheritance for classes, multiple via interfaces)
-# 2. Python uses Method Resolution Order (MRO) to determine which parent method to call in multiple inheritance
-# 3. super() can be used to call parent constructor/method
-# 4. Private attributes (__var) in parent are name-mangled; child cannot access directly
+    # 1. Python supports multiple inheritance, unlike Java (Java allows only single inheritance for classes, multiple via interfaces)
+    # 2. Python uses Method Resolution Order (MRO) to determine which parent method to call in multiple inheritance
+    # 3. super() can be used to call parent constructor/method
+    # 4. Private attributes (__var) in parent are name-mangled; child cannot access directly
 
-# Example MRO:
-print(D.mro())  # Shows method resolution order for class D
+    # Example MRO:
+    print(D.mro())  # Shows method resolution order for class D
 
 
 # ============================================================
@@ -172,9 +177,10 @@ class C(A):
 class D(B, C):
     pass
 
-d = D()
-d.show()          # ✅ Output: B show method
-print(D.mro())    # Shows method resolution order
+if __name__ == "__main__":
+    d = D()
+    d.show()          # ✅ Output: B show method
+    print(D.mro())    # Shows method resolution order
 
 # Output:
 # [<class '__main__.D'>, <class '__main__.B'>, <class '__main__.C'>, <class '__main__.A'>, <class 'object'>]
@@ -192,9 +198,10 @@ print(D.mro())    # Shows method resolution order
 class D2(C, B):
     pass
 
-d2 = D2()
-d2.show()         # ✅ Output: C show method
-print(D2.mro())
+if __name__ == "__main__":
+    d2 = D2()
+    d2.show()         # ✅ Output: C show method
+    print(D2.mro())
 
 # 🔹 Key Points:
 # - MRO ensures consistent method lookup in multiple inheritance
@@ -0,0 +1,222 @@
+# ============================================================
+# 🪶 TOPIC: TUPLE INTERNING  (flyweight pool)
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+Tuple.py builds the same tuple twice:
+
+    t1 = (10, 20, 30)
+    t3 = 10, 20, 30
+    t1 == t3        # True  → equal
+    t1 is t3        # may be False → two separate objects
+
+A program that reads a million records usually holds a million
+tuples, even when only a few thousand of them are different.
+Tuples are immutable, so equal tuples can safely share ONE object.
+This is the "flyweight" pattern, and it is what sys.intern() does
+for strings.
+
+InternPool does it for tuples:
+
+✅ pool.intern(row)       → the canonical (first seen) equal tuple
+✅ pool.intern_many(rows) → bulk version for ingest pipelines; the
+   unbounded pool runs the lookups in C (map + dict.setdefault)
+✅ pool.stats()           → hits, misses and the bytes saved by
+   dropping duplicates
+✅ max_entries            → bounded pool with LRU eviction, reusing
+   BoundedCache from Cache.py
+
+⚠️ Tuples cannot be weakly referenced, so a pool cannot notice
+   when nobody uses a canonical tuple any more. Either bound it
+   (max_entries) or clear() it when a batch is done.
+============================================================
+"""
+
+import sys
+from itertools import chain, compress, repeat
+from operator import is_not
+
+try:
+    from .Cache import BoundedCache
+except ImportError:
+    from Cache import BoundedCache
+
+
+def _same_types(rows, canonical):
+    """
+    (1, 2) == (1.0, 2.0) == (True, 2) and they hash alike, but
+    interning must not hand back a float tuple for an int tuple.
+    Compares the tuple types and the element types of equal rows
+    (all rows at once, so a whole batch is checked in C).
+    """
+    return (list(map(type, rows)) == list(map(type, canonical)) and
+            list(map(type, chain.from_iterable(rows)))
+            == list(map(type, chain.from_iterable(canonical))))
+
+
+def _peek(table, row):
+    """table.get(row) that does not count as a use of a BoundedCache."""
+    return table.peek(row) if isinstance(table, BoundedCache) else table.get(row)
+
+
+def _typed_key(row):
+    return type(row), tuple(map(type, row)), row
+
+
+_TUPLE = sys.getsizeof(())                  # empty tuple
+_SLOT = sys.getsizeof((None,)) - _TUPLE     # + one pointer per element
+
+
+def _footprint(rows, canonical):
+    """Bytes freed when 'rows' are replaced by their 'canonical' tuples."""
+    dropped = list(compress(rows, map(is_not, rows, canonical)))
+    mine, kept = chain.from_iterable(rows), chain.from_iterable(canonical)
+    separate = compress(chain.from_iterable(rows), map(is_not, mine, kept))
+    return (_TUPLE * len(dropped) + _SLOT * sum(map(len, dropped))
+            + sum(map(sys.getsizeof, separate)))
+
+
+class InternPool:
+    """
+    ============================================================
+    💡 CLASS: InternPool
+    ------------------------------------------------------------
+    Description:
+        Maps every tuple to one canonical, equal instance.
+
+    Constructor:
+        InternPool(max_entries=None)
+            max_entries : None → keep every distinct tuple
+                          N    → keep the N most recently used
+
+    Methods:
+        intern(row)        → canonical tuple
+        intern_many(rows)  → list of canonical tuples
+        stats()            → entries, hits, misses, evictions,
+                             bytes_saved
+        clear()            → forget every canonical tuple
+
+    Notes:
+        - Rows must be hashable (no lists inside).
+        - Element types are compared one level deep: (1, 2) and
+          (1.0, 2.0) stay separate, nested tuples are compared by ==.
+        - bytes_saved counts each dropped tuple plus those of its
+          elements that were separate objects (sys.getsizeof).
+          Extra attributes of tuple subclasses are not counted.
+    ============================================================
+    """
+
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries
+        self._table = self._new_table()     # row → canonical row
+        # rows equal to a canonical of other types, e.g. (1.0, 2.0) vs (1, 2):
+        self._typed = self._new_table()     # (type, element types, row) → canonical
+        self.hits = self.misses = self.bytes_saved = 0
+
+    def _new_table(self):
+        return {} if self.max_entries is None else BoundedCache(self.max_entries)
+
+    # --------------------------------------------------------
+    # 🪶 Interning
+    # --------------------------------------------------------
+    def intern(self, row):
+        if not isinstance(row, tuple):
+            raise TypeError(f"can only intern tuples, not {type(row).__name__}")
+        canonical = self._table.setdefault(row, row)
+        if canonical is not row and not _same_types((row,), (canonical,)):
+            canonical = self._typed.setdefault(_typed_key(row), row)
+        if canonical is row:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.bytes_saved += _footprint((row,), (canonical,))
+        return canonical
+
+    def intern_many(self, rows):
+        """Intern every row; returns the canonical tuples in order."""
+        rows = rows if isinstance(rows, list) else list(rows)
+        if not all(map(isinstance, rows, repeat(tuple))):
+            raise TypeError("can only intern tuples")
+        canonical = list(map(self._table.setdefault, rows, rows))
+        if not _same_types(rows, canonical):
+            # Rare: some rows only equal their canonical across types.
+            for i, (row, found) in enumerate(zip(rows, canonical)):
+                if found is not row and not _same_types((row,), (found,)):
+                    canonical[i] = self._typed.setdefault(_typed_key(row), row)
+        replaced = sum(map(is_not, rows, canonical))
+        self.hits += replaced
+        self.misses += len(rows) - replaced
+        self.bytes_saved += _footprint(rows, canonical)
+        return canonical
+
+    # --------------------------------------------------------
+    # 📊 Pool state
+    # --------------------------------------------------------
+    def __len__(self):
+        return len(self._table) + len(self._typed)
+
+    def __contains__(self, row):
+        try:
+            canonical = _peek(self._table, row)
+        except TypeError:
+            return False
+        if canonical is None:
+            return False
+        return _same_types((row,), (canonical,)) or _typed_key(row) in self._typed
+
+    def clear(self):
+        self._table.clear()
+        self._typed.clear()
+
+    def stats(self):
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": getattr(self._table, "evictions", 0)
+                         + getattr(self._typed, "evictions", 0),
+            "bytes_saved": self.bytes_saved,
+        }
+
+    def __repr__(self):
+        limit = "" if self.max_entries is None else f", max_entries={self.max_entries}"
+        return f"InternPool({len(self)} tuples{limit})"
+
+
+if __name__ == "__main__":
+    pool = InternPool()
+
+    t1 = (10, 20, 30)
+    t3 = tuple([10, 20, 30])          # equal, but a separate object
+    print(t1 is t3)                                 # False
+    print(pool.intern(t1) is pool.intern(t3))       # True
+    print(pool.intern((10.0, 20, 30)) is t1)        # False (float ≠ int here)
+
+    # 📥 Ingest: 100,000 person records, only 300 different ones
+    rows = [(f"user{i % 100}", 20 + i % 3, "Developer") for i in range(100_000)]
+    rows = pool.intern_many(rows)
+    print(len({id(row) for row in rows}))           # 300
+    print(pool.stats())
+    # {'entries': 302, 'hits': 99701, 'misses': 302, 'evictions': 0, 'bytes_saved': 11854394}
+    # (every duplicate frees a 64-byte tuple plus its own "userN" string)
+
+    # 🔁 Bounded pool: only the most recently used tuples are kept
+    recent = InternPool(max_entries=2)
+    recent.intern_many([(1, 2), (3, 4), (5, 6)])    # (1, 2) is evicted
+    print((1, 2) in recent, recent.stats()["evictions"])   # False 1
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Feature              | Plain tuples          | InternPool                       |
+|----------------------|-----------------------|----------------------------------|
+| Equal tuples         | One object each       | One shared canonical object      |
+| Memory for N copies  | N × size              | 1 × size (+ one pool entry)      |
+| Type safety          | —                     | (1, 2) and (1.0, 2.0) kept apart |
+| Bulk ingest          | —                     | intern_many() (C-level lookups)  |
+| Releasing entries    | Garbage collector     | max_entries (LRU) or clear()     |
+"""
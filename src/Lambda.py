@@ -27,59 +27,71 @@ lambda arguments: expression
 # ============================================================
 # ⚙️ EXAMPLE 1: BASIC LAMBDA FUNCTION
 # ============================================================
-s1 = 'Vinay'
 s2 = lambda func: func.upper()
-print(s1)        # Output: Vinay
-print(s2(s1))    # Output: VINAY
 
-# ============================================================
-# ⚡ EXAMPLE 2: USING MAP() WITH LAMBDA
-# ============================================================
-# map(func, iterable) → applies func to each element
-numbers = [1, 2, 3, 4, 5]
-
-# Square each number using lambda
-squared = list(map(lambda x: x**2, numbers))
-print(squared)   # Output: [1, 4, 9, 16, 25]
-
-# ============================================================
-# ⚡ EXAMPLE 3: USING FILTER() WITH LAMBDA
-# ============================================================
-# filter(func, iterable) → keeps elements where func returns True
-even_numbers = list(filter(lambda x: x % 2 == 0, numbers))
-print(even_numbers)  # Output: [2, 4]
-
-# ============================================================
-# ⚡ EXAMPLE 4: USING REDUCE() WITH LAMBDA
-# ============================================================
-# reduce(func, iterable) → applies func cumulatively to elements
-from functools import reduce
-
-# Sum all numbers
-sum_numbers = reduce(lambda x, y: x + y, numbers)
-print(sum_numbers)  # Output: 15
-
-# Multiply all numbers
-product_numbers = reduce(lambda x, y: x * y, numbers)
-print(product_numbers)  # Output: 120
+if __name__ == "__main__":
+    s1 = 'Vinay'
+    print(s1)        # Output: Vinay
+    print(s2(s1))    # Output: VINAY
+
+    # ============================================================
+    # ⚡ EXAMPLE 2: USING MAP() WITH LAMBDA
+    # ============================================================
+    # map(func, iterable) → applies func to each element
+    numbers = [1, 2, 3, 4, 5]
+
+    # Square each number using lambda
+    squared = list(map(lambda x: x**2, numbers))
+    print(squared)   # Output: [1, 4, 9, 16, 25]
+    # map() runs on one core. For heavy functions over big inputs,
+    # Parallel.py has parallel_map / parallel_filter (process pool).
+
+    # ============================================================
+    # ⚡ EXAMPLE 3: USING FILTER() WITH LAMBDA
+    # ============================================================
+    # filter(func, iterable) → keeps elements where func returns True
+    even_numbers = list(filter(lambda x: x % 2 == 0, numbers))
+    print(even_numbers)  # Output: [2, 4]
+
+    # ============================================================
+    # ⚡ EXAMPLE 4: USING REDUCE() WITH LAMBDA
+    # ============================================================
+    # reduce(func, iterable) → applies func cumulatively to elements
+    from functools import reduce
+
+    # Sum all numbers
+    sum_numbers = reduce(lambda x, y: x + y, numbers)
+    print(sum_numbers)  # Output: 15
+
+    # Multiply all numbers
+    product_numbers = reduce(lambda x, y: x * y, numbers)
+    print(product_numbers)  # Output: 120
+    # Each step above walks the data and builds a list for the next one.
+    # Pipeline.py records map/filter/reduce and runs them as one loop.
+    # reduce() folds strictly left to right; parallel_reduce (Parallel.py)
+    # combines chunks as a balanced tree, far faster for big-int products.
 
 # ============================================================
 # ⚙️ EXAMPLE 5: LAMBDA WITH CONDITIONAL EXPRESSIONS
 # ============================================================
 checkNumber = lambda x: "positive" if x > 0 else "negative" if x < 0 else "zero"
-print(checkNumber(5))    # Output: positive
-print(checkNumber(-5))   # Output: negative
-print(checkNumber(0))    # Output: zero
+if __name__ == "__main__":
+    print(checkNumber(5))    # Output: positive
+    print(checkNumber(-5))   # Output: negative
+    print(checkNumber(0))    # Output: zero
+    # A pure lambda can be cached too: memoize(policy="lfu")(checkNumber)
+    # (Memoize.py) remembers the answers for the most frequent inputs.
 
 checkEvenOrOdd = lambda x: "even" if x % 2 == 0 else "odd"
-print(checkEvenOrOdd(5))  # Output: odd
+if __name__ == "__main__":
+    print(checkEvenOrOdd(5))  # Output: odd
 
-# ============================================================
-# ⚙️ EXAMPLE 6: LAMBDA WITH LIST COMPREHENSION
-# ============================================================
-funcs = [lambda args=x: args*10 for x in range(1, 5)]
-for f in funcs:
-    print(f())  # Output: 10, 20, 30, 40
+    # ============================================================
+    # ⚙️ EXAMPLE 6: LAMBDA WITH LIST COMPREHENSION
+    # ============================================================
+    funcs = [lambda args=x: args*10 for x in range(1, 5)]
+    for f in funcs:
+        print(f())  # Output: 10, 20, 30, 40
 
 # ============================================================
 # ⚡ USING MULTIPLE STATEMENTS
@@ -93,7 +105,8 @@ def double_and_print(x):
     print(x)
     return x * 2
 
-print(double_and_print(5))  # Output: prints 5 and returns 10
+if __name__ == "__main__":
+    print(double_and_print(5))  # Output: prints 5 and returns 10
 
 # ============================================================
 # ⚖️ LAMBDA VS NORMAL FUNCTION
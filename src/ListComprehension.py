@@ -31,89 +31,97 @@ existing iterable (like a list, tuple, or range).
 # ============================================================
 # ⚙️ EXAMPLE 1: Basic List Comprehension (Square each element)
 # ============================================================
-a = [2, 3, 4, 5]
-
-# Using list comprehension
-res = [val ** 2 for val in a]   # '**' = exponentiation operator
-print(res)                      # Output: [4, 9, 16, 25]
-
-"""
-🧾 Explanation:
-val * 2   → Multiply val by 2
-val ** 2  → Square val (val to the power of 2)
-val ** 3  → Cube val (val to the power of 3)
-"""
-
-# ============================================================
-# 🔁 EXAMPLE 2: For Loop vs. List Comprehension
-# ============================================================
-
-# --- Traditional For Loop ---
-a = [2, 3, 4, 5, 6]
-res = []
-for val in a:
-    res.append(val ** 2)
-print(res)    # Output: [4, 9, 16, 25, 36]
-
-"""
-🧠 Explanation:
-res = []           → Creates an empty list to store results
-for val in a:      → Loops through each number in list 'a'
-res.append(val**2) → Squares the current number and adds to 'res'
-"""
-
-# --- Using List Comprehension ---
-a = [2, 3]
-res = [ele ** 2 for ele in a]
-print(res)    # Output: [4, 9]
-
-
-# ============================================================
-# ⚖️ EXAMPLE 3: Conditional Statement in List Comprehension
-# ============================================================
-a = [2, 3, 4, 5, 6]
-res = [val for val in a if val % 2 == 0]
-print(res)    # Output: [2, 4, 6]
-
-"""
-🧠 Explanation:
-Only even numbers (val % 2 == 0) are added to the new list.
-
-Equivalent to:
-res = []
-for val in a:
-    if val % 2 == 0:
-        res.append(val)
-"""
-
-# ============================================================
-# 🔢 EXAMPLE 4: Creating a List from a Range
-# ============================================================
-print([i for i in range(10)])   # Output: [0,1,2,3,4,5,6,7,8,9]
-
-
-# ============================================================
-# 🔄 EXAMPLE 5: Nested Loops inside List Comprehension
-# ============================================================
-print([(i, j) for i in range(3) for j in range(3)])
-# Output: [(0,0), (0,1), (0,2), (1,0), (1,1), (1,2), (2,0), (2,1), (2,2)]
-
-"""
-🧠 Equivalent Normal Loops:
-for i in range(3):
-    for j in range(3):
-        print((i, j))
-"""
-
-# ============================================================
-# 🧾 EXAMPLE 6: Flattening a 2D List (Matrix)
-# ============================================================
-mat = [[1, 2, 3],
-       [4, 5, 6],
-       [7, 8, 9]]
-
-res = [val for row in mat for val in row]
-print(res)   # Output: [1, 2, 3, 4, 5, 6, 7, 8, 9]
+if __name__ == "__main__":
+    a = [2, 3, 4, 5]
+
+    # Using list comprehension
+    res = [val ** 2 for val in a]   # '**' = exponentiation operator
+    print(res)                      # Output: [4, 9, 16, 25]
+    # Runs on one CPU core; Parallel.py spreads the same work over all cores.
+
+    """
+    🧾 Explanation:
+    val * 2   → Multiply val by 2
+    val ** 2  → Square val (val to the power of 2)
+    val ** 3  → Cube val (val to the power of 3)
+    """
+
+    # ============================================================
+    # 🔁 EXAMPLE 2: For Loop vs. List Comprehension
+    # ============================================================
+
+    # --- Traditional For Loop ---
+    a = [2, 3, 4, 5, 6]
+    res = []
+    for val in a:
+        res.append(val ** 2)
+    print(res)    # Output: [4, 9, 16, 25, 36]
+
+    """
+    🧠 Explanation:
+    res = []           → Creates an empty list to store results
+    for val in a:      → Loops through each number in list 'a'
+    res.append(val**2) → Squares the current number and adds to 'res'
+    """
+
+    # --- Using List Comprehension ---
+    a = [2, 3]
+    res = [ele ** 2 for ele in a]
+    print(res)    # Output: [4, 9]
+
+
+    # ============================================================
+    # ⚖️ EXAMPLE 3: Conditional Statement in List Comprehension
+    # ============================================================
+    a = [2, 3, 4, 5, 6]
+    res = [val for val in a if val % 2 == 0]
+    print(res)    # Output: [2, 4, 6]
+
+    """
+    🧠 Explanation:
+    Only even numbers (val % 2 == 0) are added to the new list.
+
+    Equivalent to:
+    res = []
+    for val in a:
+        if val % 2 == 0:
+            res.append(val)
+    """
+
+    # ============================================================
+    # 🔢 EXAMPLE 4: Creating a List from a Range
+    # ============================================================
+    print([i for i in range(10)])   # Output: [0,1,2,3,4,5,6,7,8,9]
+
+
+    # ============================================================
+    # 🔄 EXAMPLE 5: Nested Loops inside List Comprehension
+    # ============================================================
+    print([(i, j) for i in range(3) for j in range(3)])
+    # Output: [(0,0), (0,1), (0,2), (1,0), (1,1), (1,2), (2,0), (2,1), (2,2)]
+
+    """
+    🧠 Equivalent Normal Loops:
+    for i in range(3):
+        for j in range(3):
+            print((i, j))
+    """
+
+    # ============================================================
+    # 🧾 EXAMPLE 6: Flattening a 2D List (Matrix)
+    # ============================================================
+    mat = [[1, 2, 3],
+           [4, 5, 6],
+           [7, 8, 9]]
+
+    res = [val for row in mat for val in row]
+    print(res)   # Output: [1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+    # Every example above builds the whole list in memory. For inputs
+    # larger than memory, Stream.py runs the same patterns lazily:
+    # Stream(mat).flat_map("x").to_list()
+    # For big numeric matrices, Matrix.py keeps all values in one buffer:
+    # Matrix(mat).flatten() is a view of it (no copy at all).
 
 """
 🧠 Step-by-Step:
@@ -0,0 +1,337 @@
+# ============================================================
+# 🔲 TOPIC: DENSE MATRIX  (one contiguous buffer)
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+ListComprehension.py stores a matrix as a list of lists:
+
+    mat = [[1, 2, 3],
+           [4, 5, 6],
+           [7, 8, 9]]
+    res = [val for row in mat for val in row]      # flatten
+
+Every number is a separate Python object (28+ bytes) reached
+through two levels of pointers, and flattening copies all of them.
+For a 10,000 × 10,000 matrix that is ~3.5 GB and a full copy.
+
+Matrix keeps all values in ONE array.array buffer (8 bytes each,
+row after row) plus a shape:
+
+✅ flatten()         → a memoryview of the buffer: zero copies
+✅ reshape(r, c)     → a new Matrix sharing the SAME buffer
+✅ transpose()       → cache-blocked: rows are copied in bands so
+                       the values being read stay in the CPU cache
+✅ m ** 2, m % 3     → elementwise, one C-level pass (no per-row
+                       Python loop)
+✅ NumPy fast path   → if NumPy is installed, big matrices use it
+                       (on the same buffer, still without copying)
+============================================================
+"""
+
+from array import array
+from itertools import chain, repeat
+from operator import mod
+
+_BAND = 1024            # rows copied together by transpose()
+_NUMPY_MIN = 4096       # below this many values NumPy is not worth it
+_NUMPY = None           # the numpy module, False if missing (checked once)
+_DTYPES = {"q": "<i8", "d": "<f8"}      # array typecode → NumPy dtype
+
+
+def _numpy():
+    global _NUMPY
+    if _NUMPY is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _NUMPY = numpy
+    return _NUMPY if Matrix.use_numpy else False
+
+
+class Matrix:
+    """
+    ============================================================
+    💡 CLASS: Matrix
+    ------------------------------------------------------------
+    Description:
+        A rows × cols matrix of ints ("q") or floats ("d") stored
+        row-major in one contiguous array.array.
+
+    Constructor:
+        Matrix(rows)                      → from nested lists
+        Matrix.from_flat(values, r, c)    → wrap / copy a flat sequence
+        Matrix.zeros(r, c, typecode="q")
+
+    Methods:
+        m[i]           → row i as a memoryview (no copy)
+        m[i, j]        → one value (also assignable)
+        flatten()      → memoryview over all values (no copy)
+        reshape(r, c)  → Matrix sharing the buffer
+        transpose()    → new Matrix (also: m.T)
+        m ** k, m % k  → elementwise (k: number or same-shape Matrix)
+        map(f)         → elementwise f(value)
+        tolist()       → nested lists again
+
+    Notes:
+        - Set Matrix.use_numpy = False to time the pure-Python path.
+        - int matrices stay int: a result that does not fit in 64
+          bits raises OverflowError instead of wrapping around.
+    ============================================================
+    """
+
+    use_numpy = True
+
+    def __init__(self, rows=()):
+        rows = rows if isinstance(rows, list) else list(rows)
+        widths = set(map(len, rows))
+        if len(widths) > 1:
+            raise ValueError("all rows must have the same length")
+        cols = widths.pop() if widths else 0
+        self._data = _pack(chain.from_iterable(rows))
+        self.shape = (len(rows), cols)
+
+    @classmethod
+    def _wrap(cls, data, rows, cols):
+        matrix = cls.__new__(cls)
+        matrix._data = data
+        matrix.shape = (rows, cols)
+        return matrix
+
+    @classmethod
+    def from_flat(cls, values, rows, cols):
+        """An array.array with the right length is wrapped, not copied."""
+        data = values if isinstance(values, array) and values.typecode in "qd" else _pack(values)
+        if len(data) != rows * cols:
+            raise ValueError(f"{len(data)} values cannot fill a {rows}×{cols} matrix")
+        return cls._wrap(data, rows, cols)
+
+    @classmethod
+    def zeros(cls, rows, cols, typecode="q"):
+        return cls._wrap(array(typecode, [0]) * (rows * cols), rows, cols)
+
+    @property
+    def typecode(self):
+        return self._data.typecode
+
+    # --------------------------------------------------------
+    # 📖 Element access
+    # --------------------------------------------------------
+    def __len__(self):
+        return self.shape[0]
+
+    def _offset(self, i, j):
+        rows, cols = self.shape
+        if i < 0:
+            i += rows
+        if j < 0:
+            j += cols
+        if not (0 <= i < rows and 0 <= j < cols):
+            raise IndexError("Matrix index out of range")
+        return i * cols + j
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            return self._data[self._offset(*index)]
+        rows, cols = self.shape
+        i = index + rows if index < 0 else index
+        if not 0 <= i < rows:
+            raise IndexError("Matrix row index out of range")
+        return memoryview(self._data)[i * cols:(i + 1) * cols]
+
+    def __setitem__(self, index, value):
+        if not isinstance(index, tuple):
+            raise TypeError("assign single values with m[i, j] = value")
+        self._data[self._offset(*index)] = value
+
+    def __iter__(self):
+        view, (rows, cols) = memoryview(self._data), self.shape
+        return (view[i * cols:(i + 1) * cols] for i in range(rows))
+
+    def tolist(self):
+        flat, (rows, cols) = self._data.tolist(), self.shape
+        return [flat[i * cols:(i + 1) * cols] for i in range(rows)]
+
+    def __eq__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.shape == other.shape and self._data == other._data
+
+    def __repr__(self):
+        rows, cols = self.shape
+        if rows * cols <= 100:
+            return f"Matrix({self.tolist()})"
+        return f"Matrix(<{rows}×{cols} {self.typecode}>)"
+
+    # --------------------------------------------------------
+    # 🔀 Shape changes
+    # --------------------------------------------------------
+    def flatten(self):
+        """All values as one flat memoryview (changes write through)."""
+        return memoryview(self._data)
+
+    def reshape(self, rows, cols):
+        if rows * cols != len(self._data):
+            raise ValueError(f"cannot reshape {self.shape} into ({rows}, {cols})")
+        return Matrix._wrap(self._data, rows, cols)
+
+    def transpose(self):
+        rows, cols = self.shape
+        data, typecode = self._data, self.typecode
+        out = array(typecode, [0]) * len(data)
+        np = _numpy()
+        if np and len(data) >= _NUMPY_MIN:
+            source = np.frombuffer(data, _DTYPES[typecode]).reshape(rows, cols)
+            np.frombuffer(out, _DTYPES[typecode]).reshape(cols, rows)[:] = source.T
+            return Matrix._wrap(out, cols, rows)
+        # Column j of a band of rows is a strided slice (copied in C);
+        # reading one band at a time keeps those rows in the cache.
+        for top in range(0, rows, _BAND):
+            bottom = min(top + _BAND, rows)
+            height = bottom - top
+            for j in range(cols):
+                start = j * rows + top
+                out[start:start + height] = data[top * cols + j:bottom * cols:cols]
+        return Matrix._wrap(out, cols, rows)
+
+    T = property(transpose)
+
+    # --------------------------------------------------------
+    # ⚡ Elementwise operations
+    # --------------------------------------------------------
+    def _operands(self, other):
+        if isinstance(other, Matrix):
+            if other.shape != self.shape:
+                raise ValueError(f"shapes {self.shape} and {other.shape} differ")
+            return other._data, "d" in (self.typecode, other.typecode)
+        if not isinstance(other, (int, float)):
+            raise TypeError(f"unsupported operand type: {type(other).__name__}")
+        return repeat(other), self.typecode == "d" or isinstance(other, float)
+
+    def _elementwise(self, op, other):
+        values, is_float = self._operands(other)
+        if not is_float:
+            try:
+                return Matrix._wrap(array("q", map(op, self._data, values)), *self.shape)
+            except TypeError:       # e.g. 2 ** -1 is a float: redo as floats
+                pass
+            except OverflowError:
+                raise OverflowError("result does not fit in a 64-bit int matrix; "
+                                    "use a float matrix") from None
+        values, _ = self._operands(other)
+        return Matrix._wrap(array("d", map(op, self._data, values)), *self.shape)
+
+    def __pow__(self, other):
+        fast = self._numpy_pow(other)
+        return fast if fast is not None else self._elementwise(pow, other)
+
+    def __mod__(self, other):
+        fast = self._numpy_mod(other)
+        return fast if fast is not None else self._elementwise(mod, other)
+
+    def map(self, function):
+        """Elementwise function(value); the result type follows the values."""
+        return Matrix._wrap(_pack(map(function, self._data)), *self.shape)
+
+    # --------------------------------------------------------
+    # 🚀 NumPy fast paths (None → use the pure-Python path)
+    # --------------------------------------------------------
+    def _numpy_arrays(self, other):
+        np = _numpy()
+        if not np or len(self._data) < _NUMPY_MIN:
+            return None
+        x = np.frombuffer(self._data, _DTYPES[self.typecode])
+        if isinstance(other, Matrix):
+            if other.shape != self.shape:
+                return None         # the pure path raises the error
+            return np, x, np.frombuffer(other._data, _DTYPES[other.typecode])
+        if isinstance(other, float) or (isinstance(other, int) and not isinstance(other, bool)
+                                        and -2**63 <= other < 2**63):
+            return np, x, other
+        return None                 # e.g. an int NumPy cannot convert to int64
+
+    def _numpy_pow(self, other):
+        arrays = self._numpy_arrays(other)
+        if arrays is None or isinstance(other, Matrix):
+            return None
+        np, x, k = arrays
+        if self.typecode == "q" and isinstance(k, int):
+            # NumPy wraps around on overflow: only use it when the
+            # biggest |value| ** k surely fits in 63 bits.
+            if k < 0 or int(np.abs(x).max()).bit_length() * k > 63:
+                return None         # float result / overflow: pure path decides
+            return self._numpy_result(np.power(x, k))
+        if not float(k).is_integer() and x.min() < 0:
+            return None             # complex results: pure path raises
+        with np.errstate(over="ignore", divide="ignore"):
+            result = np.power(x, k, dtype=np.float64)
+        if np.isinf(result).any() and np.isfinite(x).all():
+            return None             # overflow, 0 ** -k: pure path raises like float ** k
+        return self._numpy_result(result)
+
+    def _numpy_mod(self, other):
+        arrays = self._numpy_arrays(other)
+        if arrays is None:
+            return None
+        np, x, y = arrays
+        if (y == 0) if not isinstance(y, np.ndarray) else not y.all():
+            return None             # pure path raises ZeroDivisionError
+        return self._numpy_result(np.mod(x, y))
+
+    def _numpy_result(self, values):
+        typecode = "d" if values.dtype.kind == "f" else "q"
+        out = array(typecode, [0]) * len(values)
+        _numpy().frombuffer(out, _DTYPES[typecode])[:] = values
+        return Matrix._wrap(out, *self.shape)
+
+
+def _pack(values):
+    """array('q') when every value is an int, else array('d')."""
+    values = values if isinstance(values, (list, tuple)) else list(values)
+    try:
+        return array("q", values)
+    except TypeError:
+        return array("d", values)
+
+
+if __name__ == "__main__":
+    mat = Matrix([[1, 2, 3],
+                  [4, 5, 6],
+                  [7, 8, 9]])
+
+    flat = mat.flatten()                # no copy: a view of the buffer
+    print(flat.tolist())                # [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    print(mat.reshape(1, 9))            # Matrix([[1, 2, 3, 4, 5, 6, 7, 8, 9]])
+    print(mat.T)                        # Matrix([[1, 4, 7], [2, 5, 8], [3, 6, 9]])
+    print(mat ** 2)                     # Matrix([[1, 4, 9], [16, 25, 36], [49, 64, 81]])
+    print(mat % 2)                      # Matrix([[1, 0, 1], [0, 1, 0], [1, 0, 1]])
+
+    flat[0] = 100                       # the view writes through
+    print(mat[0, 0], mat[1].tolist())   # 100 [4, 5, 6]
+
+    # 📏 Memory for 1,000 × 1,000 ints
+    import sys
+
+    nested = [list(range(i * 1000, (i + 1) * 1000)) for i in range(1000)]
+    big = Matrix(nested)
+    as_lists = sys.getsizeof(nested) + sum(map(sys.getsizeof, nested)) \
+        + sum(sys.getsizeof(v) for row in nested for v in row)
+    print(f"nested lists: {as_lists / 1e6:.0f} MB")                 # ~36 MB
+    print(f"Matrix      : {big.flatten().nbytes / 1e6:.0f} MB")     # 8 MB
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Operation      | List of lists                         | Matrix                             |
+|----------------|---------------------------------------|------------------------------------|
+| Storage        | One object per value + row lists      | One buffer, 8 bytes per value      |
+| Flatten        | [v for row in mat for v in row] (copy)| flatten() → memoryview, no copy    |
+| Reshape        | Rebuild the lists                     | reshape(r, c), shares the buffer   |
+| Transpose      | list(zip(*mat))                       | transpose(), cache-blocked bands   |
+| Square / mod   | [[v ** 2 for v in row] for row in mat]| m ** 2, m % 2 (C-level pass)       |
+| NumPy          | —                                     | Used automatically when installed  |
+"""
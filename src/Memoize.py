@@ -0,0 +1,519 @@
+# ============================================================
+# 🧠 TOPIC: MEMOIZATION  (LRU / LFU / TTL, single flight, on disk)
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+A PURE function always returns the same result for the same
+arguments (Function.py's add, Lambda.py's checkNumber, TypeHint.py's
+greet). So the result can be remembered instead of recomputed:
+that is MEMOIZATION. functools.lru_cache does the basic version.
+
+@memoize adds what a long-running service needs:
+
+✅ EVICTION    → policy="lru"  forget the Least Recently Used result
+                 policy="lfu"  forget the Least Frequently Used one
+                 policy="ttl"  results expire after ttl seconds
+✅ CHEAP KEYS  → one int / str argument IS the key; otherwise the
+                 args tuple itself is the key (types appended when
+                 typed), with no wrapper object per call
+✅ TYPED       → add(1, 2) and add(1.0, 2) are cached separately
+                 (3 vs 3.0), unless typed=False
+✅ STATS       → hits, misses and hit rate per function, and
+                 memoize_stats() for every memoized function
+✅ SINGLE FLIGHT → threads asking for the same missing key at the
+                 same time wait for ONE call instead of all
+                 computing it
+✅ PERSIST     → persist="file.pickle" loads the cache at start-up
+                 and saves it at exit (or on cache_save())
+
+⚠️ A cache hit still costs ~0.3-1 µs of Python. Memoize functions
+   that cost more than that; a one-line add() runs faster uncached.
+============================================================
+"""
+
+import atexit
+import os
+import pickle
+import threading
+import time
+import warnings
+import weakref
+from functools import update_wrapper
+
+try:
+    from .Cache import BoundedCache
+except ImportError:
+    from Cache import BoundedCache
+
+POLICIES = ("lru", "lfu", "ttl")
+
+_MISSING = object()
+_FAST_TYPES = {int, str}    # a single argument of these types is its own key
+_MEMOIZED = weakref.WeakSet()
+
+
+# ============================================================
+# 🔑 Keys
+# ============================================================
+class _KWARGS:
+    """Separates positional from keyword arguments in a key (a class: pickles by name)."""
+
+
+def _make_key(args, kwargs, typed):
+    """
+    The args tuple itself when possible (no new object, and a tuple
+    of str reuses the strings' cached hashes); the types are added
+    only when typed. The fast positional cases are inlined in the
+    wrapper; this is the general one.
+    """
+    key = args
+    if kwargs:
+        key += (_KWARGS,) + tuple(kwargs.items())
+    if typed:
+        key += tuple(map(type, args)) + tuple(map(type, kwargs.values()))
+    return key
+
+
+# ============================================================
+# 📉 LFU cache
+# ============================================================
+class LFUCache:
+    """
+    ============================================================
+    💡 CLASS: LFUCache
+    ------------------------------------------------------------
+    Description:
+        A bounded cache that, when full, evicts the key used the
+        FEWEST times (the least recently used among equals).
+        get and set are O(1): keys are kept in one bucket per use
+        count.
+
+    Constructor:
+        LFUCache(max_entries)
+
+    Methods:
+        get(key, default=None)  → value, counts one use
+        set(key, value, uses=1) → store (uses: restore a saved count)
+        entries()               → (key, value, uses) snapshot
+        stats()                 → entries, hits, misses, evictions
+        reset_stats()           → set those counters back to 0
+    ============================================================
+    """
+
+    def __init__(self, max_entries):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._values = {}       # key → value
+        self._uses = {}         # key → use count
+        self._buckets = {}      # use count → {key: None}, oldest first
+        self._fewest = 0        # smallest use count present
+        self.hits = self.misses = self.evictions = 0
+
+    def _move(self, key, uses, new_uses):
+        bucket = self._buckets[uses]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[uses]
+            if self._fewest == uses:
+                self._fewest = new_uses
+        self._uses[key] = new_uses
+        self._buckets.setdefault(new_uses, {})[key] = None
+
+    def get(self, key, default=None):
+        value = self._values.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        uses = self._uses[key]
+        self._move(key, uses, uses + 1)
+        return value
+
+    def set(self, key, value, uses=1):
+        if key in self._values:
+            self._values[key] = value
+            old = self._uses[key]
+            self._move(key, old, old + 1)
+            return
+        if len(self._values) >= self.max_entries:
+            bucket = self._buckets[self._fewest]
+            victim = next(iter(bucket))
+            del bucket[victim]
+            if not bucket:
+                del self._buckets[self._fewest]
+            del self._values[victim], self._uses[victim]
+            self.evictions += 1
+        empty = not self._values
+        self._values[key] = value
+        self._uses[key] = uses
+        self._buckets.setdefault(uses, {})[key] = None
+        if empty or uses <= self._fewest:
+            self._fewest = uses             # a new key (uses=1) is always the fewest
+        elif self._fewest not in self._buckets:
+            self._fewest = min(self._buckets)   # only when restoring saved counts
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def clear(self):
+        self._values.clear()
+        self._uses.clear()
+        self._buckets.clear()
+        self._fewest = 0
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+
+    def entries(self):
+        return [(key, value, self._uses[key]) for key, value in self._values.items()]
+
+    def stats(self):
+        return {"entries": len(self), "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions}
+
+    def __repr__(self):
+        return f"LFUCache({len(self)}/{self.max_entries} entries)"
+
+
+# ============================================================
+# 💾 Persistence
+# ============================================================
+def _save(path, name, cache, lock, policy):
+    with lock:
+        extra = cache.entries() if hasattr(cache, "entries") else \
+            [(key, value, None) for key, value in cache.items()]
+    data = {"function": name, "policy": policy, "saved_at": time.time(), "entries": extra}
+    temporary = f"{path}.tmp{os.getpid()}"
+    with open(temporary, "wb") as file:
+        pickle.dump(data, file, pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary, path)         # readers never see half a file
+
+
+def _restored(data, policy):
+    """
+    (key, value, uses or seconds left) for each saved entry still
+    valid, converted to 'policy': use counts are dropped, or start
+    at 1 when the file was saved under another policy. Malformed
+    entries are skipped.
+    """
+    saved_policy, entries, saved_at = data.get("policy"), data.get("entries"), data.get("saved_at")
+    if (saved_policy not in POLICIES or not isinstance(entries, list)
+            or type(saved_at) not in (int, float)):
+        raise ValueError("unknown cache file layout")
+    elapsed = time.time() - saved_at
+    for entry in entries:
+        if not (isinstance(entry, tuple) and len(entry) == 3):
+            continue
+        key, value, more = entry
+        if saved_policy == "lfu":
+            if type(more) is not int or more < 1:
+                continue
+            left = None
+        else:
+            if more is not None and (type(more) not in (int, float) or more <= elapsed):
+                continue                    # malformed or expired
+            left = None if more is None else more - elapsed
+        if policy == "lfu":
+            yield key, value, more if saved_policy == "lfu" else 1
+        else:
+            yield key, value, left
+
+
+def _load(path, name, cache, policy):
+    """Fill 'cache' from 'path'; a missing, foreign or damaged file is ignored."""
+    try:
+        with open(path, "rb") as file:
+            data = pickle.load(file)
+    except FileNotFoundError:
+        return
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as error:
+        warnings.warn(f"memoize: ignoring unreadable cache file {path!r}: {error}")
+        return
+    if not isinstance(data, dict) or data.get("function") != name:
+        warnings.warn(f"memoize: {path!r} holds another function's cache; ignored")
+        return
+    try:
+        entries = list(_restored(data, policy))
+    except ValueError as error:
+        warnings.warn(f"memoize: ignoring cache file {path!r}: {error}")
+        return
+    for key, value, more in entries:
+        try:
+            if policy == "lfu":
+                cache.set(key, value, uses=more)
+            elif more is None or isinstance(cache, dict):
+                cache[key] = value
+            else:
+                cache.set(key, value, ttl=more)
+        except TypeError:               # an unhashable key: skip it
+            continue
+
+
+# ============================================================
+# 🎀 The decorator
+# ============================================================
+def memoize(function=None, *, maxsize=1024, policy="lru", ttl=None, typed=True, persist=None):
+    """
+    ------------------------------------------------------------
+    🧠 Function: memoize
+    ------------------------------------------------------------
+    Description:
+        Decorator caching a pure function's results by argument.
+        Use it bare (@memoize) or with options (@memoize(...));
+        like lru_cache, @memoize(128) means maxsize=128.
+
+        The wrapped function gets:
+            cache_stats() → hits, misses, hit_rate, coalesced,
+                            entries, evictions
+            cache_clear() → forget every result (and the counters)
+            cache_save()  → write the persist file now
+
+    Parameters:
+        maxsize (int): Most results kept (None → unbounded dict;
+                       not allowed with "lfu")
+        policy (str): "lru", "lfu" or "ttl"
+        ttl (float): Seconds a result stays valid (policy="ttl" only)
+        typed (bool): Cache arguments of different types separately
+        persist (str): Pickle file loaded now and saved at exit.
+                       Only point it at files you wrote yourself:
+                       loading a pickle can run code. A file saved
+                       under another policy is converted.
+
+    Raises:
+        TypeError: The first argument is neither a function nor
+                   an int maxsize.
+        ValueError: Unknown policy, bad maxsize, or ttl given
+                    without policy="ttl" (or missing with it).
+
+    Returns:
+        The memoizing wrapper (or a decorator when called with
+        options only).
+
+    Notes:
+        - Arguments must be hashable.
+        - Exceptions are not cached: the next call tries again.
+          Threads waiting on a failed single-flight call receive
+          the same exception.
+    """
+    if isinstance(function, int) and not isinstance(function, bool):
+        function, maxsize = None, function         # @memoize(128), like lru_cache
+    elif function is not None and not callable(function):
+        raise TypeError(f"memoize() expects a function or an int maxsize, "
+                        f"not {type(function).__name__}")
+    if policy not in POLICIES:
+        raise ValueError(f"policy must be one of {POLICIES}, got {policy!r}")
+    if (policy == "ttl") != (ttl is not None):
+        raise ValueError("ttl= is required by, and only used with, policy='ttl'")
+    if maxsize is not None and maxsize <= 0:
+        raise ValueError("maxsize must be positive or None")
+    if maxsize is None and policy == "lfu":
+        raise ValueError("policy='lfu' needs a maxsize")
+
+    def decorate(function):
+        return _memoized(function, maxsize, policy, ttl, typed, persist)
+    return decorate if function is None else decorate(function)
+
+
+class _Flight:
+    """One in-progress call; 'done' stays locked until it finishes."""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Lock()
+        self.done.acquire()
+        self.value = self.error = None
+
+
+def _memoized(function, maxsize, policy, ttl, typed, persist):
+    if maxsize is None and policy == "lru":
+        cache = {}
+    elif policy == "lfu":
+        cache = LFUCache(maxsize)
+    else:
+        cache = BoundedCache(max_entries=maxsize, ttl=ttl)
+    lookup, store = cache.get, (cache.__setitem__ if isinstance(cache, dict) else cache.set)
+    # A plain dict can be read without the lock (one atomic get);
+    # LRU / LFU / TTL reads reorder the cache, so they take it.
+    lockless = isinstance(cache, dict)
+    lock = threading.Lock()
+    flights = {}                        # key → _Flight of the call computing it
+    counts = [0, 0, 0]                  # hits, misses, coalesced
+    name = f"{function.__module__}.{function.__qualname__}"
+
+    def wrapper(*args, **kwargs):
+        if kwargs:
+            key = _make_key(args, kwargs, typed)
+        elif len(args) == 1 and type(args[0]) in _FAST_TYPES:
+            key = args[0]               # an int never equals a str: no types needed
+        elif typed:
+            key = args + tuple(map(type, args))
+        else:
+            key = args
+        if lockless:
+            value = lookup(key, _MISSING)
+            if value is not _MISSING:
+                counts[0] += 1
+                return value
+        with lock:
+            value = lookup(key, _MISSING)
+            if value is not _MISSING:
+                counts[0] += 1
+                return value
+            flight = flights.get(key)
+            leader = flight is None
+            if leader:
+                counts[1] += 1
+                flight = flights[key] = _Flight()
+            else:
+                counts[2] += 1
+        if not leader:
+            # Someone else is computing this key: wait for that call.
+            flight.done.acquire()
+            flight.done.release()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        try:
+            value = function(*args, **kwargs)
+        except BaseException as error:
+            flight.error = error
+            raise
+        else:
+            flight.value = value
+            with lock:
+                store(key, value)
+            return value
+        finally:
+            with lock:
+                del flights[key]
+            flight.done.release()
+
+    def cache_stats():
+        with lock:
+            stats = dict(zip(("hits", "misses", "coalesced"), counts))
+            stats["entries"] = len(cache)
+            stats["evictions"] = getattr(cache, "evictions", 0)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def cache_clear():
+        with lock:
+            cache.clear()
+            if not isinstance(cache, dict):
+                cache.reset_stats()
+            counts[:] = [0, 0, 0]
+
+    def cache_save():
+        if persist is None:
+            raise ValueError(f"{name} was memoized without persist=")
+        _save(persist, name, cache, lock, policy)
+
+    update_wrapper(wrapper, function)
+    wrapper.cache_stats = cache_stats
+    wrapper.cache_clear = cache_clear
+    wrapper.cache_save = cache_save
+    if persist is not None:
+        _load(persist, name, cache, policy)
+        atexit.register(_save_at_exit, weakref.ref(wrapper))
+    _MEMOIZED.add(wrapper)
+    return wrapper
+
+
+def _save_at_exit(reference):
+    wrapper = reference()
+    if wrapper is None:
+        return
+    try:
+        wrapper.cache_save()
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as error:
+        warnings.warn(f"memoize: could not save {wrapper.__qualname__}: {error}")
+
+
+def memoize_stats():
+    """{"module.function": cache_stats()} for every live memoized function."""
+    report = {}
+    for wrapper in list(_MEMOIZED):
+        name = f"{wrapper.__module__}.{wrapper.__qualname__}"
+        while name in report:           # e.g. several lambdas
+            name += "'"
+        report[name] = wrapper.cache_stats()
+    return report
+
+
+if __name__ == "__main__":
+    # 🧮 Function.py / TypeHint.py: add
+    @memoize
+    def add(a, b):
+        return a + b
+
+    print(add(10, 20), add(10, 20), add(10.0, 20))     # 30 30 30.0 (typed)
+    print(add.cache_stats())
+    # {'hits': 1, 'misses': 2, 'coalesced': 0, 'entries': 2, 'evictions': 0, 'hit_rate': 0.333...}
+
+    # ➕ Lambda.py: checkNumber, bounded LFU
+    checkNumber = memoize(maxsize=2, policy="lfu")(
+        lambda x: "positive" if x > 0 else "negative" if x < 0 else "zero")
+    for x in (5, 5, 5, -5, 0):          # 0 evicts -5 (used once) and keeps 5
+        checkNumber(x)
+    print(checkNumber(5), checkNumber.cache_stats()["evictions"])   # positive 1
+
+    # ⏳ TTL: TypeHint.py's greet
+    @memoize(policy="ttl", ttl=0.05)
+    def greet(name, age):
+        return f"Hello {name}, you are {age} years old."
+
+    greet("Vinay", 25)
+    time.sleep(0.06)
+    greet("Vinay", 25)                  # expired → computed again
+    print(greet.cache_stats()["misses"])                  # 2
+
+    # 🛫 Single flight: 8 threads miss the same key at once → ONE call
+    from concurrent.futures import ThreadPoolExecutor
+
+    calls = []
+
+    @memoize
+    def slow_square(n):
+        calls.append(n)
+        time.sleep(0.1)
+        return n * n
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        print(set(pool.map(slow_square, [7] * 8)), len(calls))      # {49} 1
+
+    # 💾 Persisted between runs
+    import tempfile
+
+    path = os.path.join(tempfile.gettempdir(), "memoize_demo.pickle")
+
+    @memoize(persist=path)
+    def cube(n):
+        return n ** 3
+
+    print(cube(3), cube.cache_stats()["hits"])   # 27 0 first run, 27 1 on later runs
+
+    print(sorted(memoize_stats()))
+    # ['__main__.<lambda>', '__main__.add', '__main__.cube', '__main__.greet', '__main__.slow_square']
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Feature                | functools.lru_cache        | @memoize                                  |
+|------------------------|----------------------------|-------------------------------------------|
+| Eviction               | LRU                        | LRU, LFU or TTL                           |
+| Typed keys             | typed=False by default     | typed=True by default                     |
+| Stats                  | cache_info()               | cache_stats() + memoize_stats() for all   |
+| Same key, many threads | Every thread computes it   | One call; the others wait for its result  |
+| Between runs           | Lost                       | persist="file.pickle"                     |
+| Hit cost               | ~0.1 µs (C)                | ~0.3-1 µs (Python)                        |
+"""
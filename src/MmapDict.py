@@ -0,0 +1,491 @@
+# ============================================================
+# 💾 TOPIC: MEMORY-MAPPED PERSISTENT DICTIONARY
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+Dictionary.py keeps records in process memory:
+
+    person = {"name": "Vinay", "age": 25, "city": "Delhi"}
+
+When the process restarts, every record must be loaded and rebuilt
+again, which for millions of records takes minutes.
+
+MmapDict keeps the records on disk and maps the files into memory
+with `mmap`. Opening it reads NOTHING up front; the OS pages in only
+the parts that are touched.
+
+    people.data   → append-only log of (key, fixed-layout record)
+    people.index  → hash table: key hash → offset of the latest record
+
+✅ same API as a dict: get, [key], update, pop, items, keys, del ...
+✅ cold start = open + mmap two files (no parsing)
+✅ view(key) reads single fields straight from the mapped file
+   (zero-copy: only the 8 bytes of "age" are decoded for view["age"])
+✅ overwritten / deleted records are garbage until compact()
+============================================================
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import Mapping, MutableMapping
+from hashlib import blake2b
+
+# Field name → struct format. "Ns" fields hold UTF-8 text up to N bytes.
+PERSON_LAYOUT = {"name": "32s", "age": "q", "city": "24s"}
+
+_DATA_MAGIC = b"MMDATA2\0"
+_INDEX_MAGIC = b"MMINDEX2"
+_DATA_HEADER = struct.Struct("<8sQ240s")        # magic, generation, layout text
+_INDEX_HEADER = struct.Struct("<8sQQQQQ")       # magic, generation, capacity, count, used, data_end
+_SLOT = struct.Struct("<QQ")                    # key hash, record offset
+_RECORD = struct.Struct("<BH")                  # flag, key length
+
+_LIVE, _DELETED = 1, 2                          # record flags (0 = end of data)
+_EMPTY, _REMOVED = 0, 2 ** 64 - 1               # slot offsets
+_MAX_LOAD = 0.7
+
+
+def _hash(key_bytes):
+    """A stable 64-bit hash (Python's hash() of str changes per process)."""
+    return int.from_bytes(blake2b(key_bytes, digest_size=8).digest(), "little")
+
+
+def _layout_text(layout):
+    return ";".join(f"{name}={fmt}" for name, fmt in layout.items())
+
+
+class _Layout:
+    """Packs a record dict into fixed-size bytes and back."""
+
+    def __init__(self, layout):
+        self.names = tuple(layout)
+        self.text = _layout_text(layout).encode()
+        if len(self.text) > _DATA_HEADER.size - 16:
+            raise ValueError("layout description is too long")
+        self.struct = struct.Struct("<" + "".join(layout.values()))
+        self.size = self.struct.size
+        self.fields = {}                # name → (Struct of one field, offset, is_text)
+        offset = 0
+        for name, fmt in layout.items():
+            field = struct.Struct("<" + fmt)
+            self.fields[name] = (field, offset, fmt.endswith("s"))
+            offset += field.size
+
+    def pack(self, record):
+        missing = [name for name in self.names if name not in record]
+        if missing or len(record) != len(self.names):
+            raise ValueError(f"record must have exactly the fields {list(self.names)}")
+        values = []
+        for name in self.names:
+            value = record[name]
+            field, _, is_text = self.fields[name]
+            if is_text:
+                value = value.encode()
+                if len(value) > field.size:
+                    raise ValueError(f"{name!r} is longer than {field.size} bytes")
+            values.append(value)
+        return self.struct.pack(*values)
+
+    def decode(self, name, raw):
+        return raw.rstrip(b"\0").decode() if self.fields[name][2] else raw
+
+    def unpack_from(self, buffer, offset):
+        values = self.struct.unpack_from(buffer, offset)
+        return {name: self.decode(name, value) for name, value in zip(self.names, values)}
+
+
+# ============================================================
+# 🔍 ZERO-COPY RECORD VIEW
+# ============================================================
+class RecordView(Mapping):
+    """
+    Read-only view of one stored record. Fields are decoded from the
+    mapped file only when they are accessed.
+    """
+
+    __slots__ = ("_layout", "_buffer", "_offset")
+
+    def __init__(self, layout, buffer, offset):
+        self._layout = layout
+        self._buffer = buffer
+        self._offset = offset
+
+    def __getitem__(self, name):
+        try:
+            field, offset, _ = self._layout.fields[name]
+        except KeyError:
+            raise KeyError(name) from None
+        raw = field.unpack_from(self._buffer, self._offset + offset)[0]
+        return self._layout.decode(name, raw)
+
+    def __iter__(self):
+        return iter(self._layout.names)
+
+    def __len__(self):
+        return len(self._layout.names)
+
+    def __repr__(self):
+        return f"RecordView({dict(self)!r})"
+
+
+# ============================================================
+# 💾 THE DICTIONARY
+# ============================================================
+class MmapDict(MutableMapping):
+    """
+    ============================================================
+    💡 CLASS: MmapDict
+    ------------------------------------------------------------
+    Description:
+        A persistent dict of str keys → fixed-layout records, stored
+        in '<path>.data' and '<path>.index' and accessed through mmap.
+
+    Constructor:
+        MmapDict(path, layout=PERSON_LAYOUT, capacity=1024)
+            layout   : {field: struct format}, e.g. {"age": "q"}
+            capacity : initial number of hash slots (grows as needed)
+
+    Methods:
+        d[key] / get / items ...  → records as plain dicts
+        view(key)   → RecordView reading fields lazily from the map
+        raw(key)    → memoryview of the record bytes (no copy)
+        compact()   → rewrite the files without garbage
+        flush() / close() / `with MmapDict(...) as d:`
+
+    Notes:
+        - Iteration order is the order in which keys were LAST written.
+        - One writing process at a time (no file locking).
+    ============================================================
+    """
+
+    def __init__(self, path, layout=PERSON_LAYOUT, capacity=1024):
+        self.path = os.fspath(path)
+        self._layout = _Layout(layout)
+        self._record_size = self._layout.size
+        data_path, index_path = self.path + ".data", self.path + ".index"
+        if not os.path.exists(data_path):
+            self._create(data_path, index_path, capacity)
+        self._data_file = open(data_path, "r+b")
+        self._dmap = mmap.mmap(self._data_file.fileno(), 0)
+        magic, self._generation, text = _DATA_HEADER.unpack_from(self._dmap)
+        if magic != _DATA_MAGIC:
+            raise ValueError(f"{data_path} is not an MmapDict data file")
+        text = text.rstrip(b"\0")
+        if text != self._layout.text:
+            raise ValueError(f"{data_path} was written with layout {text.decode()!r}")
+        if not os.path.exists(index_path):
+            self._rebuild_index(capacity)
+        self._open_index()
+        if self._index_generation != self._generation:
+            # compact() stopped between replacing the data file and the
+            # index: the index describes the old data file, so redo it.
+            self._close_index()
+            self._rebuild_index(capacity)
+            self._open_index()
+
+    def _create(self, data_path, index_path, capacity):
+        with open(data_path, "wb") as f:
+            f.write(_DATA_HEADER.pack(_DATA_MAGIC, 0, self._layout.text))
+            f.truncate(max(mmap.PAGESIZE, 64 * 1024))
+        self._write_index(index_path, 0, capacity, [], _DATA_HEADER.size)
+
+    @staticmethod
+    def _write_index(index_path, generation, capacity, slots, data_end):
+        """Write a fresh index file holding the (hash, offset) 'slots'."""
+        table = bytearray(capacity * _SLOT.size)
+        for h, offset in slots:
+            i = h % capacity
+            while _SLOT.unpack_from(table, i * _SLOT.size)[1] != _EMPTY:
+                i = (i + 1) % capacity
+            _SLOT.pack_into(table, i * _SLOT.size, h, offset)
+        tmp = index_path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, generation, capacity,
+                                       len(slots), len(slots), data_end))
+            f.write(table)
+        os.replace(tmp, index_path)
+
+    def _open_index(self):
+        self._index_file = open(self.path + ".index", "r+b")
+        self._imap = mmap.mmap(self._index_file.fileno(), 0)
+        (magic, self._index_generation, self._capacity, self._count, self._used,
+         self._end) = _INDEX_HEADER.unpack_from(self._imap)
+        if magic != _INDEX_MAGIC:
+            raise ValueError(f"{self.path}.index is not an MmapDict index file")
+
+    def _save_header(self):
+        _INDEX_HEADER.pack_into(self._imap, 0, _INDEX_MAGIC, self._generation,
+                                self._capacity, self._count, self._used, self._end)
+
+    # --------------------------------------------------------
+    # 🔎 Hash table
+    # --------------------------------------------------------
+    def _key_at(self, offset):
+        _, length = _RECORD.unpack_from(self._dmap, offset)
+        start = offset + _RECORD.size
+        return self._dmap[start:start + length]
+
+    def _find(self, key_bytes):
+        """Return (slot number, record offset, hash); offset is None if missing."""
+        h = _hash(key_bytes)
+        imap, capacity = self._imap, self._capacity
+        i = h % capacity
+        free = None
+        while True:
+            slot_hash, offset = _SLOT.unpack_from(imap, _INDEX_HEADER.size + i * _SLOT.size)
+            if offset == _EMPTY:
+                return (i if free is None else free), None, h
+            if offset == _REMOVED:
+                if free is None:
+                    free = i
+            elif slot_hash == h and self._key_at(offset) == key_bytes:
+                return i, offset, h
+            i = (i + 1) % capacity
+
+    def _set_slot(self, i, h, offset):
+        _SLOT.pack_into(self._imap, _INDEX_HEADER.size + i * _SLOT.size, h, offset)
+
+    def _live_slots(self):
+        imap = self._imap
+        for i in range(self._capacity):
+            h, offset = _SLOT.unpack_from(imap, _INDEX_HEADER.size + i * _SLOT.size)
+            if offset not in (_EMPTY, _REMOVED):
+                yield h, offset
+
+    def _grow_index(self):
+        slots = list(self._live_slots())
+        self._close_index()
+        self._write_index(self.path + ".index", self._generation, self._capacity * 2,
+                          slots, self._end)
+        self._open_index()
+
+    def _rebuild_index(self, capacity):
+        """Recreate a missing index by replaying the data file."""
+        latest = {}
+        offset = _DATA_HEADER.size
+        for flag, key, value_at in self._scan(offset, len(self._dmap)):
+            if flag == _LIVE:
+                latest[key] = value_at - _RECORD.size - len(key)
+            else:
+                latest.pop(key, None)
+            offset = value_at + (self._record_size if flag == _LIVE else 0)
+        while len(latest) > capacity * _MAX_LOAD:
+            capacity *= 2
+        slots = [(_hash(key), at) for key, at in latest.items()]
+        self._write_index(self.path + ".index", self._generation, capacity, slots, offset)
+
+    def _scan(self, start, end):
+        """Yield (flag, key bytes, offset of the value) for every record."""
+        dmap, offset = self._dmap, start
+        while offset + _RECORD.size <= end:
+            flag, length = _RECORD.unpack_from(dmap, offset)
+            if flag not in (_LIVE, _DELETED):
+                return
+            key_at = offset + _RECORD.size
+            value_at = key_at + length
+            yield flag, dmap[key_at:value_at], value_at
+            offset = value_at + (self._record_size if flag == _LIVE else 0)
+
+    # --------------------------------------------------------
+    # ✍️ Appending to the data file
+    # --------------------------------------------------------
+    def _append(self, flag, key_bytes, value=b""):
+        chunk = _RECORD.pack(flag, len(key_bytes)) + key_bytes + value
+        offset, end = self._end, self._end + len(chunk)
+        if end > len(self._dmap):
+            # Map a bigger file. The old map is not closed: memoryviews
+            # returned by raw() may still point into it.
+            self._data_file.truncate(max(end, 2 * len(self._dmap)))
+            self._dmap = mmap.mmap(self._data_file.fileno(), 0)
+        self._dmap[offset:end] = chunk
+        self._end = end
+        return offset
+
+    @staticmethod
+    def _encode_key(key):
+        if not isinstance(key, str):
+            raise TypeError(f"MmapDict keys must be str, not {type(key).__name__}")
+        key_bytes = key.encode()
+        if len(key_bytes) > 0xFFFF:
+            raise ValueError("key is longer than 65535 bytes")
+        return key_bytes
+
+    # --------------------------------------------------------
+    # 📖 Mapping API
+    # --------------------------------------------------------
+    def _value_offset(self, key):
+        key_bytes = self._encode_key(key)
+        _, offset, _ = self._find(key_bytes)
+        if offset is None:
+            raise KeyError(key)
+        return offset + _RECORD.size + len(key_bytes)
+
+    def __getitem__(self, key):
+        return self._layout.unpack_from(self._dmap, self._value_offset(key))
+
+    def view(self, key):
+        """Lazy, read-only view of the record (fields decoded on access)."""
+        return RecordView(self._layout, self._dmap, self._value_offset(key))
+
+    def raw(self, key):
+        """memoryview of the packed record bytes (zero-copy)."""
+        start = self._value_offset(key)
+        return memoryview(self._dmap)[start:start + self._record_size]
+
+    def __setitem__(self, key, record):
+        key_bytes = self._encode_key(key)
+        value = self._layout.pack(record)
+        i, old, h = self._find(key_bytes)
+        offset = self._append(_LIVE, key_bytes, value)
+        if old is None:
+            if _SLOT.unpack_from(self._imap, _INDEX_HEADER.size + i * _SLOT.size)[1] == _EMPTY:
+                self._used += 1
+            self._count += 1
+        self._set_slot(i, h, offset)
+        self._save_header()
+        if self._used > self._capacity * _MAX_LOAD:
+            self._grow_index()
+
+    def __delitem__(self, key):
+        key_bytes = self._encode_key(key)
+        i, offset, h = self._find(key_bytes)
+        if offset is None:
+            raise KeyError(key)
+        self._append(_DELETED, key_bytes)
+        self._set_slot(i, h, _REMOVED)
+        self._count -= 1
+        self._save_header()
+
+    def __contains__(self, key):
+        return isinstance(key, str) and self._find(self._encode_key(key))[1] is not None
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        """Keys in the order they were last written."""
+        current = {offset for _, offset in self._live_slots()}
+        for flag, key, value_at in self._scan(_DATA_HEADER.size, self._end):
+            if flag == _LIVE and value_at - _RECORD.size - len(key) in current:
+                yield key.decode()
+
+    # --------------------------------------------------------
+    # 🧹 Compaction and lifetime
+    # --------------------------------------------------------
+    @property
+    def garbage_bytes(self):
+        """Bytes of the data file used by overwritten or deleted records."""
+        live = self._count * (_RECORD.size + self._record_size)
+        live += sum(len(self._key_at(offset)) for _, offset in self._live_slots())
+        return self._end - _DATA_HEADER.size - live
+
+    def compact(self):
+        """
+        Rewrite both files with only the live records.
+
+        The new files carry the next generation number. A crash after
+        the data file is replaced but before the index is leaves the
+        old index behind; its generation no longer matches, so the next
+        open rebuilds it from the data file instead of trusting it.
+        """
+        items = [(key.encode(), self.raw(key).tobytes()) for key in self]
+        capacity = self._capacity
+        while len(items) > capacity * _MAX_LOAD:
+            capacity *= 2
+        generation = self._generation + 1
+        tmp = self.path + ".data.tmp"
+        slots, offset = [], _DATA_HEADER.size
+        with open(tmp, "wb") as f:
+            f.write(_DATA_HEADER.pack(_DATA_MAGIC, generation, self._layout.text))
+            for key_bytes, value in items:
+                f.write(_RECORD.pack(_LIVE, len(key_bytes)) + key_bytes + value)
+                slots.append((_hash(key_bytes), offset))
+                offset += _RECORD.size + len(key_bytes) + len(value)
+            f.truncate(max(offset, mmap.PAGESIZE))
+        self.close()
+        os.replace(tmp, self.path + ".data")
+        self._generation = generation
+        self._write_index(self.path + ".index", generation, capacity, slots, offset)
+        self._data_file = open(self.path + ".data", "r+b")
+        self._dmap = mmap.mmap(self._data_file.fileno(), 0)
+        self._open_index()
+
+    def flush(self):
+        """Write changed pages to disk now (the OS also does it later)."""
+        self._dmap.flush()
+        self._imap.flush()
+
+    def _close_index(self):
+        self._imap.flush()
+        self._imap.close()
+        self._index_file.close()
+
+    def close(self):
+        self.flush()
+        self._close_index()
+        self._data_file.close()
+        try:
+            self._dmap.close()
+        except BufferError:
+            pass                        # raw() views still use it: freed with them
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        return f"MmapDict({self.path!r}, {len(self)} records)"
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, "people")
+
+    with MmapDict(path) as people:
+        people["vinay"] = {"name": "Vinay", "age": 25, "city": "Delhi"}
+        people["asha"] = {"name": "Asha", "age": 31, "city": "Mumbai"}
+        people.update({"vinay": {"name": "Vinay", "age": 26, "city": "Mumbai"}})
+        print(people.get("vinay"))      # {'name': 'Vinay', 'age': 26, 'city': 'Mumbai'}
+        print(people.get("ravi", 0))    # 0
+        print(people.pop("asha")["city"])   # Mumbai
+        print(list(people.items()))
+        # [('vinay', {'name': 'Vinay', 'age': 26, 'city': 'Mumbai'})]
+
+    # 🔁 "Restart": reopening only maps the files
+    with MmapDict(path) as people:
+        print(people.view("vinay")["age"])  # 26 (only this field is decoded)
+        print(people.garbage_bytes > 0)     # True (old 'vinay', deleted 'asha')
+        people.compact()
+        print(people.garbage_bytes)         # 0
+
+    # ⏱️ 100,000 records: reopen time vs rebuilding the dict
+    with MmapDict(path, capacity=1 << 18) as people:
+        for i in range(100_000):
+            people[f"user{i}"] = {"name": f"user{i}", "age": i % 90, "city": "Pune"}
+    start = time.perf_counter()
+    with MmapDict(path) as people:
+        record = people["user99999"]
+        elapsed = time.perf_counter() - start
+    print(f"reopen + first lookup: {elapsed * 1000:.2f} ms", record["age"])  # ~0.1 ms 9
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Feature              | dict                      | MmapDict                              |
+|----------------------|---------------------------|---------------------------------------|
+| Survives a restart   | ❌ No                     | ✅ Yes (two files)                    |
+| Cold start           | Rebuild every record      | Open + mmap: O(1)                     |
+| d[key]               | O(1)                      | O(1): hash slot → offset → unpack     |
+| Value layout         | Any Python object         | Fixed struct layout (PERSON_LAYOUT)   |
+| Update / delete      | In place                  | Append + index update; compact() later |
+"""
@@ -10,8 +10,9 @@ class Car:
         self.brand = brand
         self.model = model
 
-my_car = Car("Toyota", "Corolla")
-print(my_car.brand, my_car.model)  # Output: Toyota Corolla
+if __name__ == "__main__":
+    my_car = Car("Toyota", "Corolla")
+    print(my_car.brand, my_car.model)  # Output: Toyota Corolla
 
 
 # ============================================================
@@ -23,14 +24,16 @@ class Car:
     def displayInfo(self):
         print(f"Car: {self.brand} {self.model}")
 
-my_car.displayInfo()  # Call directly
+if __name__ == "__main__":
+    my_car.displayInfo()  # Call directly
 
 
 # Value-returning method
 def getBrand(self):
     return self.brand
 
-print(my_car.getBrand())
+if __name__ == "__main__":
+    print(my_car.getBrand())
 
 
 # ============================================================
@@ -56,10 +59,11 @@ class BankAccount:
     def getBalance(self):
         return self._balance
 
-acc = BankAccount(1000)
-print(acc.getBalance())  # 1000
-acc.deposit(2000)
-print(acc.getBalance())  # 3000
+if __name__ == "__main__":
+    acc = BankAccount(1000)
+    print(acc.getBalance())  # 1000
+    acc.deposit(2000)
+    print(acc.getBalance())  # 3000
 
 
 # ============================================================
@@ -81,24 +85,25 @@ class BankAccount:
         else:
             print("Invalid amount")
 
-acc = BankAccount(1000)
-print(acc.balance)   # Getter
-acc.balance = 5000   # Setter
-print(acc.balance)
+if __name__ == "__main__":
+    acc = BankAccount(1000)
+    print(acc.balance)   # Getter
+    acc.balance = 5000   # Setter
+    print(acc.balance)
 
 
-# ============================================================
-# 🖋️ STRING FORMATTING
-# ============================================================
+    # ============================================================
+    # 🖋️ STRING FORMATTING
+    # ============================================================
 
-# f-string (Python 3.6+)
-print(f"Car: {my_car.brand} {my_car.model}")
+    # f-string (Python 3.6+)
+    print(f"Car: {my_car.brand} {my_car.model}")
 
-# Concatenation
-print("Car: " + my_car.brand + " " + my_car.model)
+    # Concatenation
+    print("Car: " + my_car.brand + " " + my_car.model)
 
-# str.format()
-print("Car: {} {}".format(my_car.brand, my_car.model))
+    # str.format()
+    print("Car: {} {}".format(my_car.brand, my_car.model))
 
 
 # ============================================================
@@ -0,0 +1,487 @@
+# ============================================================
+# 🚀 TOPIC: PARALLEL MAP, FILTER & REDUCE  (process pool + shared memory)
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+ListComprehension.py and Lambda.py transform lists on ONE core:
+
+    [val ** 2 for val in a]
+    list(map(lambda x: x**2, numbers))
+    list(filter(lambda x: x % 2 == 0, numbers))
+
+parallel_map / parallel_filter give the same results (same order)
+using every core:
+
+✅ ADAPTIVE CHUNKS → the function is timed on the first items; the
+   rest is cut into chunks of ~20 ms of work each (big enough to
+   hide the cost of sending a task, small enough to balance load).
+   Work too small to pay for a pool simply runs in this process.
+✅ PROCESS POOL    → real parallelism for pure-Python functions
+   (threads would be serialized by the GIL).
+✅ SHARED MEMORY   → when the results are ints, floats or bools,
+   workers write them as raw 8-byte (or 1-byte) values into one
+   shared buffer instead of pickling every result back; an
+   array.array input is shared the same way (one buffer copy).
+✅ THREAD FALLBACK → a lambda or a local function cannot be
+   pickled, so it cannot be sent to a process; a thread pool runs
+   it instead (helps when the function waits on I/O or releases
+   the GIL, and always gives the right answer).
+
+parallel_reduce(op, iterable) replaces reduce(op, iterable) for an
+associative op: chunks are reduced on the workers, and the partial
+results are combined as a balanced tree, ((a·b)·(c·d))·..., instead
+of one long left-to-right fold. For a product of big ints that alone
+is ~9x faster: multiplying two similar-sized numbers is much cheaper
+than growing one huge number a little at a time.
+============================================================
+"""
+
+import operator
+import os
+import pickle
+import struct
+import time
+from array import array
+from itertools import compress
+from numbers import Number
+
+BACKENDS = ("auto", "process", "thread", "serial")
+
+_SAMPLE_TIME = 0.01     # seconds spent timing the first items
+_SAMPLE_MAX = 256       # ... or at most this many items
+_TASK_TIME = 0.02       # target seconds of work per chunk
+_MIN_PARALLEL = 0.1     # less total work than this → stay serial
+_TASKS_PER_WORKER = 4   # enough chunks for load balancing
+_TYPECODES = {int: "q", float: "d", bool: "?"}
+_MISSING = object()
+
+
+# ============================================================
+# 🧩 Helpers
+# ============================================================
+def _cpu_count():
+    """CPUs this process may run on (respects taskset / containers)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _picklable(function):
+    try:
+        pickle.dumps(function)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+def _sample(function, items):
+    """Run function on the first items until _SAMPLE_TIME has passed."""
+    results = []
+    start = time.perf_counter()
+    for item in items[:_SAMPLE_MAX]:
+        results.append(function(item))
+        if time.perf_counter() - start >= _SAMPLE_TIME:
+            break
+    return results, (time.perf_counter() - start) / max(len(results), 1)
+
+
+def _typecode(results):
+    """Array typecode that can hold every result, or None."""
+    kinds = set(map(type, results))
+    if len(kinds) != 1:
+        return None
+    return _TYPECODES.get(kinds.pop())
+
+
+def _chunk_size(per_item, count, workers):
+    """~_TASK_TIME of work per chunk, but at least _TASKS_PER_WORKER chunks each."""
+    by_time = int(_TASK_TIME / per_item) if per_item else count
+    by_balance = -(-count // (workers * _TASKS_PER_WORKER))
+    return max(1, min(by_time, by_balance))
+
+
+def _check(workers, chunk_size, backend):
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}")
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if workers is not None and workers <= 0:
+        raise ValueError("workers must be positive")
+
+
+def _pack(typecode, values):
+    # bools are stored as one byte each (array has no "?" type)
+    packed = bytes(values) if typecode == "?" else array(typecode, values)
+    return memoryview(packed).cast("B")
+
+
+def _map_chunk(function, chunk, inputs, outputs, start, stop):
+    """
+    Worker: map items[start:stop]. The chunk arrives either pickled
+    ('chunk') or as (shared name, typecode) of the packed inputs.
+    Numeric results are written into the shared 'outputs' buffer
+    (returns None); anything else is returned as a list.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    if chunk is None:
+        name, typecode = inputs
+        shared = SharedMemory(name)
+        try:
+            values = shared.buf.cast(typecode)
+            chunk = values[start:stop].tolist()
+            values.release()
+        finally:
+            shared.close()
+    results = list(map(function, chunk))
+    if outputs is None or _typecode(results) != outputs[1]:
+        return results
+    name, typecode = outputs
+    try:
+        raw = _pack(typecode, results)
+    except OverflowError:           # an int does not fit in 8 bytes
+        return results
+    shared = SharedMemory(name)
+    try:
+        offset = start * struct.calcsize(typecode)
+        shared.buf[offset:offset + len(raw)] = raw
+    finally:
+        shared.close()
+    return None
+
+
+def _shared(typecode, count):
+    from multiprocessing.shared_memory import SharedMemory
+    return SharedMemory(create=True, size=max(count * struct.calcsize(typecode), 1))
+
+
+def _run_chunks(function, items, chunk_size, workers, backend, out_type):
+    """Map every chunk on a pool; returns one list per chunk (in order)."""
+    starts = range(0, len(items), chunk_size)
+    stops = [min(start + chunk_size, len(items)) for start in starts]
+    if backend == "thread":
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            chunks = map(items.__getitem__, map(slice, starts, stops))
+            return list(pool.map(list, map(map, [function] * len(stops), chunks)))
+
+    from concurrent.futures import ProcessPoolExecutor    # lazy: heavy import
+
+    segments = []
+    try:
+        inputs = outputs = None
+        if isinstance(items, array) and items.typecode != "u":
+            # Already packed: ONE buffer copy instead of pickling every chunk.
+            raw = memoryview(items).cast("B")
+            segments.append(_shared("B", len(raw)))
+            segments[-1].buf[:len(raw)] = raw
+            inputs = (segments[-1].name, items.typecode)
+            chunks = [None] * len(stops)
+        else:
+            chunks = [items[start:stop] for start, stop in zip(starts, stops)]
+        if out_type is not None:
+            segments.append(_shared(out_type, len(items)))
+            outputs = (segments[-1].name, out_type)
+
+        tasks = len(stops)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            returned = list(pool.map(_map_chunk, [function] * tasks, chunks,
+                                     [inputs] * tasks, [outputs] * tasks, starts, stops))
+        if outputs is None:
+            return returned
+        values = segments[-1].buf.cast(out_type)
+        try:
+            return [values[start:stop].tolist() if result is None else result
+                    for start, stop, result in zip(starts, stops, returned)]
+        finally:
+            values.release()
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+
+# ============================================================
+# ⚡ parallel_map
+# ============================================================
+def parallel_map(function, iterable, workers=None, chunk_size=None, backend="auto"):
+    """
+    ------------------------------------------------------------
+    ⚡ Function: parallel_map
+    ------------------------------------------------------------
+    Description:
+        list(map(function, iterable)), computed on several cores.
+        Results are always returned in input order.
+
+        The first items are mapped here while timing the function;
+        that estimate decides whether a pool is worth starting and
+        how many items go into each chunk.
+
+    Parameters:
+        function: One-argument function. Module-level functions run
+                  on processes; lambdas / local functions on threads.
+        iterable: The inputs (materialized into a list first). An
+                  array.array is shared with the workers as one raw
+                  buffer instead of being pickled.
+        workers (int): Pool size (default: CPUs available)
+        chunk_size (int): Items per task (default: adaptive)
+        backend (str): "auto", "process", "thread" or "serial"
+
+    Raises:
+        ValueError: For an unknown backend or a non-positive
+                    chunk_size / workers.
+        Any exception raised by 'function' is re-raised here.
+
+    Returns:
+        list: function(item) for every item.
+    """
+    _check(workers, chunk_size, backend)
+    items = iterable if isinstance(iterable, (list, tuple, array)) else list(iterable)
+    workers = workers or _cpu_count()
+
+    head, per_item = _sample(function, items)
+    rest = items[len(head):]
+    if backend == "auto":
+        if workers == 1 or per_item * len(rest) < _MIN_PARALLEL:
+            backend = "serial"
+        else:
+            backend = "process" if _picklable(function) else "thread"
+    elif backend == "process" and not _picklable(function):
+        backend = "thread"
+    if backend == "serial" or not rest:
+        head.extend(map(function, rest))
+        return head
+
+    if chunk_size is None:
+        chunk_size = _chunk_size(per_item, len(rest), workers)
+    typecode = _typecode(head) if backend == "process" else None
+    for part in _run_chunks(function, rest, chunk_size, workers, backend, typecode):
+        head.extend(part)
+    return head
+
+
+# ============================================================
+# 🔎 parallel_filter
+# ============================================================
+def parallel_filter(predicate, iterable, workers=None, chunk_size=None, backend="auto"):
+    """
+    ------------------------------------------------------------
+    🔎 Function: parallel_filter
+    ------------------------------------------------------------
+    Description:
+        list(filter(predicate, iterable)) on several cores. The
+        predicate runs through parallel_map (bool results travel
+        back as one byte each in shared memory), then the kept
+        items are selected here, in order.
+
+    Parameters:
+        Same as parallel_map; predicate=None keeps truthy items.
+
+    Returns:
+        list: The items for which predicate(item) is true.
+    """
+    items = iterable if isinstance(iterable, (list, tuple)) else list(iterable)
+    if predicate is None:
+        return list(filter(None, items))
+    flags = parallel_map(predicate, items, workers, chunk_size, backend)
+    return list(compress(items, flags))
+
+
+# ============================================================
+# 🌳 parallel_reduce
+# ============================================================
+def _tree_reduce(op, items):
+    """
+    Combine neighbours pairwise, level by level: ((a·b)·(c·d))·...
+    Same order as reduce() (only the grouping changes), and operands
+    stay of similar size: big-int products get much cheaper.
+    """
+    items = list(items)
+    while len(items) > 1:
+        paired = list(map(op, items[0::2], items[1::2]))    # one C-level pass
+        if len(items) % 2:
+            paired.append(items[-1])
+        items = paired
+    return items[0]
+
+
+def _sum(items):
+    # sum() is fastest for numbers; anything else (lists, str) goes
+    # through the tree so it never becomes quadratic.
+    if isinstance(items[0], Number):
+        return sum(items[1:], items[0])
+    return _tree_reduce(operator.add, items)
+
+
+_FAST_REDUCE = {operator.add: _sum, operator.mul: None, min: min, max: max}
+
+
+def _known_op(op):
+    """(lambda x, y: x + y) → operator.add, like Pipeline.py (picklable, fast)."""
+    if op in _FAST_REDUCE or getattr(op, "__name__", None) != "<lambda>":
+        return op
+    try:
+        from .Pipeline import _reducer
+    except ImportError:
+        from Pipeline import _reducer
+    found = {"add": operator.add, "mul": operator.mul, "min": min, "max": max}
+    return found.get(_reducer(op), op)
+
+
+def _reduce_chunk(op, chunk):
+    """Worker: reduce one non-empty chunk."""
+    fast = _FAST_REDUCE.get(op)
+    return fast(chunk) if fast is not None else _tree_reduce(op, chunk)
+
+
+def parallel_reduce(op, iterable, identity=_MISSING, associative=True,
+                    workers=None, chunk_size=None, backend="auto"):
+    """
+    ------------------------------------------------------------
+    🌳 Function: parallel_reduce
+    ------------------------------------------------------------
+    Description:
+        reduce(op, iterable) for an ASSOCIATIVE op, computed as a
+        balanced tree: the input is cut into chunks, each chunk is
+        reduced (on worker processes when that pays off), and the
+        partial results are combined pairwise.
+
+        Fast paths: operator.add (sum), min and max run in C per
+        chunk; operator.mul and every other op use the pairwise
+        tree. (lambda x, y: x + y) / (lambda x, y: x * y) are
+        recognized as operator.add / operator.mul.
+
+        Floats are only associative up to rounding, so float sums
+        and products may differ from reduce() in the last bits.
+
+    Parameters:
+        op: Two-argument function with op(op(a, b), c) == op(a, op(b, c)).
+            The left-to-right order of the items is kept, so op
+            does not have to be commutative.
+        iterable: The items (materialized into a list first).
+        identity: Returned for an empty input; otherwise combined
+                  once in front, like reduce()'s initial value.
+        associative (bool): False → plain sequential reduce().
+        workers, chunk_size, backend: As in parallel_map.
+
+    Raises:
+        TypeError: Empty input and no identity.
+        ValueError: As in parallel_map.
+
+    Returns:
+        The reduced value.
+    """
+    from functools import reduce
+
+    _check(workers, chunk_size, backend)
+    items = iterable if isinstance(iterable, (list, tuple, array, range)) else list(iterable)
+    if not associative:
+        return reduce(op, items) if identity is _MISSING else reduce(op, items, identity)
+    if not items:
+        if identity is _MISSING:
+            raise TypeError("parallel_reduce() of empty iterable with no identity")
+        return identity
+    op = _known_op(op)
+    workers = workers or _cpu_count()
+
+    # Reduce the first items here, timing them.
+    start = time.perf_counter()
+    head = items[:_SAMPLE_MAX]
+    partials = [_reduce_chunk(op, head)]
+    per_item = (time.perf_counter() - start) / len(head)
+    rest = items[len(head):]
+    if backend == "auto":
+        if workers == 1 or per_item * len(rest) < _MIN_PARALLEL:
+            backend = "serial"
+        else:
+            backend = "process" if _picklable(op) else "thread"
+    elif backend == "process" and not _picklable(op):
+        backend = "thread"
+
+    if rest:
+        if chunk_size is None:
+            chunk_size = _chunk_size(per_item, len(rest), workers)
+        if backend == "serial":
+            # One chunk: the tree inside it already balances the operands.
+            partials.append(_reduce_chunk(op, rest))
+        else:
+            if backend == "thread":
+                from concurrent.futures import ThreadPoolExecutor as Executor
+            else:
+                from concurrent.futures import ProcessPoolExecutor as Executor
+            chunks = [rest[i:i + chunk_size] for i in range(0, len(rest), chunk_size)]
+            with Executor(max_workers=workers) as pool:
+                partials += pool.map(_reduce_chunk, [op] * len(chunks), chunks)
+    result = _tree_reduce(op, partials)
+    return result if identity is _MISSING else op(identity, result)
+
+
+def _square(x):
+    return x ** 2
+
+
+def _is_even(x):
+    return x % 2 == 0
+
+
+def _slow_square(x):
+    """A CPU-heavy function: worth sending to other processes."""
+    total = 0
+    for _ in range(2_000):
+        total += x
+    return total * x // 2_000
+
+
+if __name__ == "__main__":
+    numbers = [1, 2, 3, 4, 5]
+
+    # Same answers as map / filter, in the same order
+    print(parallel_map(_square, numbers))                     # [1, 4, 9, 16, 25]
+    print(parallel_filter(_is_even, numbers))                 # [2, 4]
+
+    # A lambda cannot be pickled → threads (same result)
+    print(parallel_map(lambda x: x ** 2, numbers, backend="process"))   # [1, 4, 9, 16, 25]
+
+    # ⏱️ Heavy work: processes + shared memory for the int results
+    big = list(range(2_000))
+    for backend in ("serial", "process"):
+        start = time.perf_counter()
+        result = parallel_map(_slow_square, big, backend=backend)
+        print(f"{backend:<8}{time.perf_counter() - start:.2f} s", result == list(map(_square, big)))
+    # serial  ~0.2 s True
+    # process ~0.2 s / number of cores (+ pool start-up) True
+
+    # 🌳 Tree reduce: the product of 1..50,000 (a 700,000-bit int)
+    from functools import reduce
+    from operator import add, mul
+
+    print(parallel_reduce(add, numbers), parallel_reduce(mul, numbers))   # 15 120
+    print(parallel_reduce(mul, [], identity=1))                         # 1
+    start = time.perf_counter()
+    sequential = reduce(lambda x, y: x * y, range(1, 50_001))
+    print(f"reduce          {time.perf_counter() - start:.2f} s")      # ~1.1 s
+    start = time.perf_counter()
+    tree = parallel_reduce(lambda x, y: x * y, range(1, 50_001))
+    print(f"parallel_reduce {time.perf_counter() - start:.2f} s", tree == sequential)
+    # parallel_reduce ~0.12 s True
+    # (similar-sized operands: even one core is ~9x faster, and more
+    #  cores multiply the chunks in parallel)
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Feature            | map / filter / comprehension | parallel_map / parallel_filter          |
+|--------------------|------------------------------|-----------------------------------------|
+| Cores used         | 1                            | All available (process pool)            |
+| Result order       | Input order                  | Input order                             |
+| Chunking           | —                            | Adaptive (~20 ms of work per task)      |
+| Numeric results    | —                            | Returned through shared memory          |
+| Lambdas            | ✅                           | ✅ (thread pool: cannot be pickled)      |
+| Small inputs       | Fast                         | Runs serially (no pool start-up cost)   |
+| reduce             | Sequential fold              | parallel_reduce: balanced tree of chunks|
+"""
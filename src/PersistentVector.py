@@ -0,0 +1,392 @@
+# ============================================================
+# 🕰️ TOPIC: PERSISTENT (IMMUTABLE, VERSIONED) VECTOR
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+List.py changes lists IN PLACE:
+
+    numbers.append(5)   numbers.insert(2, 99)   numbers.pop(2) ...
+
+To keep the history of a list you must copy it before every change,
+which costs O(n) time and memory per version.
+
+A PersistentVector never changes. Every "change" returns a NEW vector
+that shares almost all of its memory with the old one:
+
+✅ append / pop      → near O(1)   (a 32-slot tail buffer)
+✅ set / insert / pop(i) → O(log n) (a 32-way tree, path copying)
+✅ snapshots are free: just keep a reference to the old vector
+✅ same method names as list: append, insert, remove, pop, clear ...
+   (they RETURN the new version instead of returning None)
+============================================================
+"""
+
+from bisect import bisect_right
+from itertools import accumulate, islice
+
+B = 32                  # children per tree node / items per leaf
+
+
+# ============================================================
+# 🌳 TREE NODES
+# ============================================================
+# A leaf is a plain tuple of up to B items. A branch holds child
+# nodes plus their cumulative sizes, so index lookups use bisect.
+# Every leaf sits at the same depth ('height'), like in a B-tree.
+class _Branch:
+    __slots__ = ("children", "cum")
+
+    def __init__(self, children):
+        self.children = children
+        self.cum = tuple(accumulate(map(_size, children)))
+
+
+def _size(node):
+    return node.cum[-1] if type(node) is _Branch else len(node)
+
+
+def _width(node):
+    return len(node.children) if type(node) is _Branch else len(node)
+
+
+def _locate(node, i):
+    """Child index holding position i, and the offset of that child."""
+    k = bisect_right(node.cum, i)
+    if k == len(node.cum):          # i == size: append to the last child
+        k -= 1
+    return k, (node.cum[k - 1] if k else 0)
+
+
+def _split(items, make):
+    if len(items) <= B:
+        return (make(items),)
+    m = len(items) // 2
+    return make(items[:m]), make(items[m:])
+
+
+def _get(node, height, i):
+    while height:
+        k = bisect_right(node.cum, i)
+        if k:
+            i -= node.cum[k - 1]
+        node = node.children[k]
+        height -= 1
+    return node[i]
+
+
+def _set(node, height, i, value):
+    if not height:
+        return node[:i] + (value,) + node[i + 1:]
+    k, off = _locate(node, i)
+    children = node.children
+    child = _set(children[k], height - 1, i - off, value)
+    branch = _Branch.__new__(_Branch)
+    branch.children = children[:k] + (child,) + children[k + 1:]
+    branch.cum = node.cum          # sizes did not change
+    return branch
+
+
+def _insert(node, height, i, value):
+    """Insert value at i; returns one node, or two after a split."""
+    if not height:
+        return _split(node[:i] + (value,) + node[i:], tuple)
+    k, off = _locate(node, i)
+    children = node.children
+    parts = _insert(children[k], height - 1, i - off, value)
+    return _split(children[:k] + parts + children[k + 1:], _Branch)
+
+
+def _push_leaf(node, height, leaf):
+    """Attach a full leaf at the right edge; returns one or two nodes."""
+    if not height:
+        return node, leaf
+    children = node.children
+    parts = _push_leaf(children[-1], height - 1, leaf)
+    return _split(children[:-1] + parts, _Branch)
+
+
+def _merge(a, b):
+    if type(a) is _Branch:
+        return _Branch(a.children + b.children)
+    return a + b
+
+
+def _delete(node, height, i):
+    """Remove position i; returns the new node or None when empty."""
+    if not height:
+        leaf = node[:i] + node[i + 1:]
+        return leaf or None
+    k, off = _locate(node, i)
+    children = node.children
+    child = _delete(children[k], height - 1, i - off)
+    if child is None:
+        children = children[:k] + children[k + 1:]
+    else:
+        children = children[:k] + (child,) + children[k + 1:]
+        # Keep nodes reasonably full: merge a small child into a neighbour.
+        if _width(child) < B // 2 and len(children) > 1:
+            j = k - 1 if k else k + 1
+            lo, hi = min(j, k), max(j, k)
+            if _width(children[lo]) + _width(children[hi]) <= B:
+                merged = _merge(children[lo], children[hi])
+                children = children[:lo] + (merged,) + children[hi + 1:]
+    return _Branch(children) if children else None
+
+
+def _pop_leaf(node, height):
+    """Detach the right-most leaf; returns (new node or None, leaf)."""
+    if not height:
+        return None, node
+    children = node.children
+    child, leaf = _pop_leaf(children[-1], height - 1)
+    children = children[:-1] + ((child,) if child is not None else ())
+    return (_Branch(children) if children else None), leaf
+
+
+def _iter_node(node, height):
+    if not height:
+        yield from node
+    else:
+        for child in node.children:
+            yield from _iter_node(child, height - 1)
+
+
+def _build(items):
+    """Build a tree bottom-up from a tuple whose length is a multiple of B."""
+    level = [items[i:i + B] for i in range(0, len(items), B)]
+    height = 0
+    if not level:
+        return None, 0
+    while len(level) > 1:
+        level = [_Branch(tuple(level[i:i + B])) for i in range(0, len(level), B)]
+        height += 1
+    return level[0], height
+
+
+# ============================================================
+# 🧩 THE VECTOR
+# ============================================================
+class PersistentVector:
+    """
+    ============================================================
+    💡 CLASS: PersistentVector
+    ------------------------------------------------------------
+    Description:
+        An immutable sequence. Methods that would modify a list
+        return a new PersistentVector instead; the old one stays
+        valid and unchanged (a free snapshot).
+
+    Constructor:
+        PersistentVector(iterable=())
+
+    List-like methods (all return a NEW vector):
+        append(x), extend(xs), insert(i, x), remove(x),
+        pop(i=-1), clear(), set(i, x)
+
+    Read methods:
+        v[i], v[a:b], len(v), x in v, iteration, index(x), count(x)
+    ============================================================
+    """
+
+    __slots__ = ("_root", "_height", "_size", "_tail")
+
+    def __init__(self, iterable=()):
+        items = tuple(iterable)
+        cut = max(0, (len(items) - 1) // B * B)   # tail keeps 1..B items
+        self._root, self._height = _build(items[:cut])
+        self._size = cut
+        self._tail = items[cut:]
+
+    @classmethod
+    def _make(cls, root, height, size, tail):
+        obj = cls.__new__(cls)
+        obj._root, obj._height, obj._size, obj._tail = root, height, size, tail
+        return obj
+
+    def _with_tail(self, tail):
+        return self._make(self._root, self._height, self._size, tail)
+
+    def _index(self, i):
+        n = self._size + len(self._tail)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("PersistentVector index out of range")
+        return i
+
+    def _pushed(self, leaf, tail):
+        """New vector with 'leaf' appended to the tree and a new tail."""
+        if self._root is None:
+            root, height = leaf, 0
+        else:
+            parts = _push_leaf(self._root, self._height, leaf)
+            root, height = parts[0], self._height
+            if len(parts) == 2:
+                root, height = _Branch(parts), height + 1
+        return self._make(root, height, self._size + len(leaf), tail)
+
+    # --------------------------------------------------------
+    # 📖 Reading
+    # --------------------------------------------------------
+    def __len__(self):
+        return self._size + len(self._tail)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PersistentVector(islice(self, *index.indices(len(self)))
+                                    if index.step in (None, 1)
+                                    else list(self)[index])
+        i = self._index(index)
+        if i >= self._size:
+            return self._tail[i - self._size]
+        return _get(self._root, self._height, i)
+
+    def __iter__(self):
+        if self._root is not None:
+            yield from _iter_node(self._root, self._height)
+        yield from self._tail
+
+    def __contains__(self, value):
+        return any(x is value or x == value for x in self)
+
+    def index(self, value):
+        for i, x in enumerate(self):
+            if x is value or x == value:
+                return i
+        raise ValueError(f"{value!r} is not in PersistentVector")
+
+    def count(self, value):
+        return sum(1 for x in self if x is value or x == value)
+
+    def __eq__(self, other):
+        if isinstance(other, (PersistentVector, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return f"PersistentVector({list(self)!r})"
+
+    def tolist(self):
+        return list(self)
+
+    # --------------------------------------------------------
+    # ✏️ "Changing" (every method returns a new vector)
+    # --------------------------------------------------------
+    def append(self, value):
+        """Add at the end: O(1) until the 32-slot tail fills up."""
+        if len(self._tail) < B:
+            return self._with_tail(self._tail + (value,))
+        return self._pushed(self._tail, (value,))
+
+    def extend(self, values):
+        vec = self
+        for value in values:
+            vec = vec.append(value)
+        return vec
+
+    def __add__(self, other):
+        return self.extend(other)
+
+    def set(self, index, value):
+        """Replace the element at index: O(log n)."""
+        i = self._index(index)
+        if i >= self._size:
+            j = i - self._size
+            return self._with_tail(self._tail[:j] + (value,) + self._tail[j + 1:])
+        root = _set(self._root, self._height, i, value)
+        return self._make(root, self._height, self._size, self._tail)
+
+    def insert(self, index, value):
+        """Insert before index (clamped like list.insert): O(log n)."""
+        n = len(self)
+        i = max(0, min(n, index + n if index < 0 else index))
+        if i >= self._size:
+            j = i - self._size
+            tail = self._tail[:j] + (value,) + self._tail[j:]
+            if len(tail) <= B:
+                return self._with_tail(tail)
+            return self._pushed(tail[:B], tail[B:])
+        parts = _insert(self._root, self._height, i, value)
+        root, height = parts[0], self._height
+        if len(parts) == 2:
+            root, height = _Branch(parts), height + 1
+        return self._make(root, height, self._size + 1, self._tail)
+
+    def pop(self, index=-1):
+        """Remove the element at index (default: last) and return the new vector."""
+        i = self._index(index)
+        if i >= self._size:
+            j = i - self._size
+            tail = self._tail[:j] + self._tail[j + 1:]
+            if tail or self._root is None:
+                return self._with_tail(tail)
+            # Tail is empty: move the tree's last leaf into the tail.
+            root, leaf = _pop_leaf(self._root, self._height)
+            return self._shrunk(root, self._size - len(leaf), leaf)
+        root = _delete(self._root, self._height, i)
+        return self._shrunk(root, self._size - 1, self._tail)
+
+    def _shrunk(self, root, size, tail):
+        """New vector after a removal: drop single-child root levels."""
+        height = self._height
+        while type(root) is _Branch and len(root.children) == 1:
+            root, height = root.children[0], height - 1
+        if root is None:
+            height = 0
+        return self._make(root, height, size, tail)
+
+    def remove(self, value):
+        """Remove the first occurrence of value (ValueError if missing)."""
+        return self.pop(self.index(value))
+
+    def clear(self):
+        return EMPTY
+
+
+EMPTY = PersistentVector()
+
+
+if __name__ == "__main__":
+    v1 = PersistentVector([1, 2, 3, 4])
+    v2 = v1.set(1, 20)          # like numbers[1] = 20
+    v3 = v2.append(5)
+    v4 = v3.insert(2, 99)
+    v5 = v4.remove(20)
+    v6 = v5.pop(2)
+    v7 = v6.clear()
+
+    for name, v in [("v1", v1), ("v2", v2), ("v3", v3), ("v4", v4),
+                    ("v5", v5), ("v6", v6), ("v7", v7)]:
+        print(name, v.tolist())
+    # v1 [1, 2, 3, 4]          ← every old version is still intact
+    # v2 [1, 20, 3, 4]
+    # v3 [1, 20, 3, 4, 5]
+    # v4 [1, 20, 99, 3, 4, 5]
+    # v5 [1, 99, 3, 4, 5]
+    # v6 [1, 99, 4, 5]
+    # v7 []
+
+    # 10,000 versions of a 10,000 element list share most of their memory
+    history = [PersistentVector(range(10_000))]
+    for i in range(10_000):
+        history.append(history[-1].set(i, -i))
+    print(history[0][5], history[-1][5])    # 5 -5
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Operation        | list + copy per version | PersistentVector          |
+|------------------|-------------------------|---------------------------|
+| append / pop     | O(n) (copy) + O(1)      | ~O(1)                     |
+| set(i, x)        | O(n) (copy) + O(1)      | O(log n)                  |
+| insert / pop(i)  | O(n)                    | O(log n)                  |
+| keep old version | O(n) memory             | O(log n) extra memory     |
+| read v[i]        | O(1)                    | O(log n), 32-way tree     |
+"""
@@ -24,8 +24,9 @@ class Person:
         print(f"Hello, my name is {self.name} and I am {self.age} years old.")
 
 # Creating an object of Person
-p = Person("Vinay", 25)
-p.greet()
+if __name__ == "__main__":
+    p = Person("Vinay", 25)
+    p.greet()
 
 # ============================================================
 # 🔹 Key Points about Classes
@@ -56,11 +57,12 @@ class Employee:
         print(f"Employee Name: {self.name}, ID: {self.emp_id}")
 
 # Creating objects
-e1 = Employee("Alice", 101)
-e2 = Employee("Bob", 102)
+if __name__ == "__main__":
+    e1 = Employee("Alice", 101)
+    e2 = Employee("Bob", 102)
 
-e1.display()
-e2.display()
+    e1.display()
+    e2.display()
 
 # ============================================================
 # 🔹 Default Constructor
@@ -70,7 +72,8 @@ e2.display()
 class Car:
     pass
 
-c = Car()  # Works fine even without defining __init__()
+if __name__ == "__main__":
+    c = Car()  # Works fine even without defining __init__()
 
 # ============================================================
 # 🔹 Constructor Overloading (Using Default Arguments)
@@ -81,11 +84,12 @@ class Person2:
         self.name = name
         self.age = age
 
-p1 = Person2("Vinay", 25)  # Uses provided values
-p2 = Person2()              # Uses default values
+if __name__ == "__main__":
+    p1 = Person2("Vinay", 25)  # Uses provided values
+    p2 = Person2()              # Uses default values
 
-print(p1.name, p1.age)  # Vinay 25
-print(p2.name, p2.age)  # None 0
+    print(p1.name, p1.age)  # Vinay 25
+    print(p2.name, p2.age)  # None 0
 
 # ============================================================
 # 🔹 Calling Parent Constructor (Inheritance)
@@ -100,7 +104,8 @@ class Child(Parent):
         super().__init__()  # Calls parent constructor
         print("Child constructor")
 
-c = Child()
+if __name__ == "__main__":
+    c = Child()
 
 # Output:
 # Parent constructor
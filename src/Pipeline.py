@@ -0,0 +1,517 @@
+# ============================================================
+# 🏭 TOPIC: FUSED MAP / FILTER / REDUCE PIPELINES
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+Lambda.py chains the three classic higher-order functions:
+
+    squared = list(map(lambda x: x**2, numbers))
+    even_numbers = list(filter(lambda x: x % 2 == 0, numbers))
+    sum_numbers = reduce(lambda x, y: x + y, numbers)
+
+Each step walks the data again, calls a lambda per element, and
+builds a full intermediate list for the next step.
+
+A Pipeline RECORDS the steps first and runs them later, as one:
+
+    p = Pipeline().map(lambda x: x**2).filter(lambda x: x % 2 == 0) \\
+                  .reduce(lambda x, y: x + y)
+    p(numbers)                          # → 20
+
+✅ FUSED      → all stages become ONE loop (Stream.py codegen),
+                no intermediate lists
+✅ LOWERED    → a lambda that only does arithmetic on its argument
+                (x**2, x % 2 == 0, abs(x - 3) * 2, ...) is read back
+                from its source and pasted into the loop as code:
+                no function call per element. (lambda x, y: x + y)
+                becomes operator.add.
+✅ VECTORIZED → if NumPy is installed, the input is big and numeric
+                and EVERY stage was lowered, the whole pipeline runs
+                as array operations:
+
+        x = x ** 2;  x = x[x % 2 == 0];  x.sum()
+
+   An array.array or a range is read as it is. A list must be
+   converted first (and the results converted back), which costs
+   about as much as two fused stages, so lists are vectorized only
+   for pipelines of 3 or more stages.
+
+   Python semantics are kept: any int overflow, division by zero,
+   float overflow or NaN makes the pipeline re-run on the plain
+   path, which gives (or raises) exactly what map/filter/reduce do.
+============================================================
+"""
+
+import ast
+import inspect
+import linecache
+import operator
+from array import array
+
+try:
+    from .Stream import _MISSING, Stream, _check_expression
+except ImportError:
+    from Stream import _MISSING, Stream, _check_expression
+
+_VECTOR_MIN = 2048      # fewer elements: NumPy's per-call overhead wins
+_LIST_STAGES = 3        # converting a list costs about two stages' worth
+_INT_LIMIT = 2.0 ** 62  # |int result| below this cannot have wrapped around
+_EXACT_FLOAT = 2 ** 53  # ints above this are not exact as floats
+_NUMPY = None           # the numpy module, False if missing (checked once)
+_LOWERED = {}           # code object → lowered expression (or None)
+_FILES = {}             # file name → (source, line → lambdas in it)
+
+_BINARY = {ast.Add: "add", ast.Sub: "subtract", ast.Mult: "multiply",
+           ast.Div: "true_divide", ast.FloorDiv: "floor_divide",
+           ast.Mod: "mod", ast.Pow: "power"}
+_COMPARE = {ast.Eq: "equal", ast.NotEq: "not_equal", ast.Lt: "less",
+            ast.LtE: "less_equal", ast.Gt: "greater", ast.GtE: "greater_equal"}
+_CAN_WRAP = ("add", "subtract", "multiply", "power", "negative", "absolute")  # int64 overflow
+_REDUCERS = {operator.add: "add", operator.mul: "mul", min: "min", max: "max"}
+_REDUCE_OPS = {ast.Add: operator.add, ast.Mult: operator.mul}
+
+
+def _numpy():
+    global _NUMPY
+    if _NUMPY is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _NUMPY = numpy
+    return _NUMPY if Pipeline.use_numpy else False
+
+
+# ============================================================
+# 🔍 Lowering lambdas to expressions
+# ============================================================
+class _Fallback(Exception):
+    """The vectorized run cannot match Python exactly: use the loop."""
+
+
+def _arithmetic(tree, names):
+    """True if 'tree' only does arithmetic / comparisons on 'names'."""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            if node.id not in names and node.id != "abs":
+                return False
+        elif isinstance(node, ast.Constant):
+            if type(node.value) not in (int, float):
+                return False
+        elif isinstance(node, ast.Call):
+            if not (isinstance(node.func, ast.Name) and node.func.id == "abs"
+                    and len(node.args) == 1 and not node.keywords):
+                return False
+        elif isinstance(node, ast.BinOp):
+            if type(node.op) not in _BINARY:
+                return False
+        elif isinstance(node, ast.UnaryOp):
+            if not isinstance(node.op, (ast.USub, ast.UAdd, ast.Not)):
+                return False
+        elif isinstance(node, ast.Compare):
+            if not all(type(op) in _COMPARE for op in node.ops):
+                return False
+        elif not isinstance(node, (ast.Expression, ast.IfExp, ast.Load,
+                                   ast.operator, ast.unaryop, ast.cmpop)):
+            return False
+    return True
+
+
+def _lambdas(filename):
+    """line number → ast.Lambda nodes of a source file (parsed once)."""
+    source = "".join(linecache.getlines(filename))
+    if _FILES.get(filename, (None,))[0] != source:
+        found = {}
+        try:
+            tree = ast.parse(source) if source else None
+        except SyntaxError:
+            tree = None
+        for node in ast.walk(tree) if tree is not None else ():
+            if isinstance(node, ast.Lambda):
+                found.setdefault(node.lineno, []).append(node)
+        _FILES[filename] = (source, found)
+    return _FILES[filename][1]
+
+
+def _source_lambda(function):
+    """The ast.Lambda that 'function' was compiled from, or None."""
+    code = function.__code__
+    # The whole file is parsed: a lambda on the continuation line of
+    # a longer statement is not valid code on its own.
+    for node in _lambdas(code.co_filename).get(code.co_firstlineno, ()):
+        compiled = compile(ast.Expression(node), code.co_filename, "eval")
+        candidate = next(c for c in compiled.co_consts if inspect.iscode(c))
+        if (candidate.co_code == code.co_code and candidate.co_consts == code.co_consts
+                and candidate.co_names == code.co_names):
+            return node
+    return None
+
+
+def _lower(function, arity):
+    """
+    The lambda's body as an expression string over x (arity 1) or
+    (acc, x) (arity 2), or None if it is not plain arithmetic.
+    """
+    code = getattr(function, "__code__", None)
+    if code is None or function.__name__ != "<lambda>" or function.__closure__:
+        return None
+    if code not in _LOWERED:
+        node = _source_lambda(function)
+        args = node.args if node is not None else None
+        expression = None
+        if (args is not None and len(args.args) == arity and not args.defaults
+                and not (args.vararg or args.kwarg or args.kwonlyargs or args.posonlyargs)):
+            names = [arg.arg for arg in args.args]
+            body = ast.Expression(node.body)
+            if _arithmetic(body, names) and "abs" not in names:
+                rename = dict(zip(names, ("x",) if arity == 1 else ("acc", "x")))
+                for name in ast.walk(body):
+                    if isinstance(name, ast.Name) and name.id in rename:
+                        name.id = rename[name.id]
+                expression = ast.unparse(body.body)
+        _LOWERED[code] = expression
+    return _LOWERED[code]
+
+
+def _reducer(function):
+    """"add" / "mul" / "min" / "max" for a known reducing function, else None."""
+    if function in _REDUCERS:
+        return _REDUCERS[function]
+    expression = _lower(function, 2)
+    if expression is None:
+        return None
+    tree = ast.parse(expression, mode="eval").body
+    if (isinstance(tree, ast.BinOp) and type(tree.op) in _REDUCE_OPS
+            and isinstance(tree.left, ast.Name) and tree.left.id == "acc"
+            and isinstance(tree.right, ast.Name) and tree.right.id == "x"):
+        return _REDUCERS[_REDUCE_OPS[type(tree.op)]]
+    return None
+
+
+# ============================================================
+# 🚀 Vectorized evaluation (NumPy)
+# ============================================================
+def _checked(np, name, *operands):
+    """np.<name>(*operands), refusing int64 results that may have wrapped."""
+    # NumPy does logic on bools (True + True is True); Python counts them as ints.
+    operands = [o.astype(np.int64) if o.dtype.kind == "b" else o for o in operands]
+    if name == "true_divide":
+        for operand in operands:
+            if operand.dtype.kind in "iu" and operand.size and np.abs(operand).max() > _EXACT_FLOAT:
+                raise _Fallback     # Python divides big ints exactly, NumPy does not
+    result = getattr(np, name)(*operands)
+    if result.dtype.kind in "iu" and name in _CAN_WRAP:
+        shadow = getattr(np, name)(*(o.astype(np.float64) for o in operands))
+        if not (np.abs(shadow) < _INT_LIMIT).all():
+            raise _Fallback
+    return result
+
+
+def _evaluate(np, node, x):
+    """Evaluate a lowered expression node with x bound to an array."""
+    if isinstance(node, ast.Name):
+        return x
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, int) and abs(node.value) >= _INT_LIMIT:
+            raise _Fallback
+        return np.asarray(node.value)
+    if isinstance(node, ast.BinOp):
+        left, right = _evaluate(np, node.left, x), _evaluate(np, node.right, x)
+        return _checked(np, _BINARY[type(node.op)], left, right)
+    if isinstance(node, ast.UnaryOp):
+        value = _evaluate(np, node.operand, x)
+        if isinstance(node.op, ast.Not):
+            return np.logical_not(value)
+        return _checked(np, "negative", value) if isinstance(node.op, ast.USub) else value
+    if isinstance(node, ast.Compare):
+        left, result = _evaluate(np, node.left, x), None
+        for op, right in zip(node.ops, node.comparators):
+            right = _evaluate(np, right, x)
+            test = getattr(np, _COMPARE[type(op)])(left, right)
+            result = test if result is None else result & test
+            left = right
+        return result
+    if isinstance(node, ast.IfExp):
+        body, orelse = _evaluate(np, node.body, x), _evaluate(np, node.orelse, x)
+        if body.dtype.kind != orelse.dtype.kind:
+            raise _Fallback         # Python would mix int and float elements
+        return np.where(_evaluate(np, node.test, x) != 0, body, orelse)
+    if isinstance(node, ast.Call):              # abs(...)
+        return _checked(np, "absolute", _evaluate(np, node.args[0], x))
+    return _evaluate(np, node.body, x)          # ast.Expression
+
+
+def _as_array(np, items):
+    """items as an int64 / float64 array, or None if not one numeric type."""
+    if isinstance(items, array):
+        if items.typecode not in "bBhHiIlLqfd":
+            return None             # "Q" may not fit in int64, "u" is text
+        return np.asarray(items).astype(np.float64 if items.typecode in "fd" else np.int64)
+    if isinstance(items, range):
+        try:
+            return np.arange(items.start, items.stop, items.step, dtype=np.int64)
+        except OverflowError:
+            return None
+    # One type only: NumPy would turn True into 1 and mix ints into floats.
+    kinds = set(map(type, items))
+    if kinds == {int}:
+        try:
+            return np.fromiter(items, np.int64, len(items))
+        except OverflowError:
+            return None
+    if kinds == {float}:
+        return np.fromiter(items, np.float64, len(items))
+    return None
+
+
+def _vector_reduce(np, kind, values, initial):
+    if initial is not _MISSING:
+        if type(initial) not in (int, float) or abs(initial) >= _INT_LIMIT:
+            raise _Fallback
+        if not len(values):
+            return initial          # reduce() hands back 'initial' untouched
+    elif len(values) == 1:
+        return values[0].item()     # ... and a lone value (True stays a bool)
+    if values.dtype.kind == "f" and np.isnan(values).any():
+        raise _Fallback             # min / max with NaN depend on the order
+    if kind in ("min", "max"):
+        # argmin / argmax find the FIRST extreme, as min() / max() keep the
+        # first of equal values; 'initial' is compared in Python so an int
+        # stays an int next to float values.
+        best = values[values.argmin() if kind == "min" else values.argmax()].item()
+        if initial is _MISSING or (best < initial if kind == "min" else best > initial):
+            return best
+        return initial
+    if initial is not _MISSING:
+        values = np.concatenate((np.asarray([initial]), values))
+    if values.dtype.kind in "iub":
+        bound = np.abs(values.astype(np.float64))
+        total = bound.sum() if kind == "add" else bound.prod()
+        if not total < _INT_LIMIT:
+            raise _Fallback         # the exact result needs Python's big ints
+        values = values.astype(np.int64)
+        return int(values.sum() if kind == "add" else values.prod())
+    # cumsum / cumprod add up strictly left to right, like reduce
+    # (sum() / prod() use pairwise order and round differently).
+    running = np.cumsum(values) if kind == "add" else np.cumprod(values)
+    return running[-1].item()
+
+
+class Pipeline:
+    """
+    ============================================================
+    💡 CLASS: Pipeline
+    ------------------------------------------------------------
+    Description:
+        A reusable recipe of map / filter stages and an optional
+        final reduce, compiled into one loop (or into NumPy array
+        operations) and run on any number of inputs.
+
+    Constructor:
+        Pipeline()
+
+    Stages (each returns a NEW Pipeline):
+        map(f)                   → f(x) for every x
+        filter(f)                → keep x when f(x) is true
+        reduce(f[, initial])     → fold the results (must be last)
+
+        f is a function / lambda, or an expression string in x
+        like Stream's ("x ** 2").
+
+    Running:
+        pipeline(iterable)  → a list, or the reduced value
+        explain()           → how each stage will run
+
+    Notes:
+        - Lambdas are lowered only if their source is available
+          and they use nothing but their argument, numbers,
+          arithmetic, comparisons, if/else and abs().
+        - Set Pipeline.use_numpy = False to time the plain loop.
+    ============================================================
+    """
+
+    use_numpy = True
+
+    __slots__ = ("_stages", "_reduce", "_stream", "_vector")
+
+    def __init__(self, _stages=(), _reduce=None):
+        self._stages = _stages      # (kind, function or expression text, lowered text)
+        self._reduce = _reduce      # (function, initial, "add" / "mul" / ... or None)
+        self._stream = None         # the fused loop as a Stream, built on first call
+        self._vector = (all(lowered is not None for _, _, lowered in _stages)
+                        and (_reduce is None or _reduce[2] is not None))
+
+    def _then(self, kind, function):
+        if self._reduce is not None:
+            raise ValueError("reduce() must be the last stage")
+        if isinstance(function, str):
+            text = lowered = _check_expression(function)
+            if not _arithmetic(ast.parse(lowered, mode="eval"), ("x",)):
+                lowered = None      # inlined in the loop, but not vectorizable
+            stage = (kind, text, lowered)
+        elif callable(function):
+            stage = (kind, function, _lower(function, 1))
+        else:
+            raise TypeError(f"{kind}() needs a function or an expression string")
+        return Pipeline(self._stages + (stage,))
+
+    # --------------------------------------------------------
+    # 🔗 Stages
+    # --------------------------------------------------------
+    def map(self, function):
+        return self._then("map", function)
+
+    def filter(self, predicate):
+        return self._then("filter", predicate)
+
+    def reduce(self, function, initial=_MISSING):
+        if self._reduce is not None:
+            raise ValueError("a Pipeline has only one reduce()")
+        return Pipeline(self._stages, (function, initial, _reducer(function)))
+
+    # --------------------------------------------------------
+    # ▶️ Running
+    # --------------------------------------------------------
+    def _worth_vectorizing(self, items):
+        if not self._vector or len(items) < _VECTOR_MIN:
+            return False
+        if isinstance(items, (range, array)):
+            return True             # read by NumPy without a conversion
+        return len(self._stages) + (self._reduce is not None) >= _LIST_STAGES
+
+    def __call__(self, iterable):
+        items = iterable if isinstance(iterable, (list, tuple, range, array)) else list(iterable)
+        if self._worth_vectorizing(items):
+            np = _numpy()
+            if np:
+                try:
+                    return self._run_vectorized(np, items)
+                except _Fallback:
+                    pass
+        return self._run_fused(items)
+
+    def _run_vectorized(self, np, items):
+        values = _as_array(np, items)
+        if values is None:
+            raise _Fallback
+        try:
+            with np.errstate(all="raise"):
+                for kind, _, lowered in self._stages:
+                    result = _evaluate(np, ast.parse(lowered, mode="eval"), values)
+                    # a constant stage (lambda x: 1) gives one value for all
+                    result = np.broadcast_to(result, values.shape)
+                    values = result.copy() if kind == "map" else values[result != 0]
+                if self._reduce is None:
+                    return values.tolist()
+                _, initial, kind = self._reduce
+                if not len(values) and initial is _MISSING:
+                    raise _Fallback         # the loop raises reduce()'s TypeError
+                return _vector_reduce(np, kind, values, initial)
+        except (FloatingPointError, OverflowError, TypeError, ValueError):
+            raise _Fallback from None       # e.g. 1 // 0, 2 ** -1 or -True
+
+    def _run_fused(self, items):
+        if self._stream is None:
+            stream = Stream(())
+            for kind, function, lowered in self._stages:
+                stream = getattr(stream, kind)(function if lowered is None else lowered)
+            self._stream = stream
+        stream = self._stream.over(items)
+        if self._reduce is None:
+            return stream.to_list()
+        function, initial, kind = self._reduce
+        fast = {"add": operator.add, "mul": operator.mul}.get(kind, function)
+        try:
+            return stream.reduce(fast, initial)
+        except TypeError as error:
+            if initial is _MISSING and "empty stream" in str(error):
+                raise TypeError("reduce() of empty iterable with no initial value") from None
+            raise
+
+    def explain(self):
+        """One line per stage: how it will run."""
+        lines = []
+        for kind, function, lowered in self._stages:
+            how = f"inlined {lowered!r}" if lowered else (
+                f"inlined {function!r}" if isinstance(function, str) else "function call")
+            lines.append(f"{kind:<7}{how}")
+        if self._reduce is not None:
+            kind = self._reduce[2]
+            known = {"add": "operator.add", "mul": "operator.mul"}.get(kind, kind)
+            lines.append(f"reduce {known or 'function call'}")
+        vector = "yes" if self._vector else "no"
+        lines.append(f"NumPy  {vector} (for {_VECTOR_MIN}+ ints or floats)")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        text = "".join(f".{kind}({lowered!r})" if lowered else f".{kind}(...)"
+                       for kind, _, lowered in self._stages)
+        if self._reduce is not None:
+            text += ".reduce(...)"
+        return f"Pipeline(){text}"
+
+
+if __name__ == "__main__":
+    from functools import reduce
+
+    numbers = [1, 2, 3, 4, 5]
+
+    # The four Lambda.py examples, each as a pipeline
+    squared = Pipeline().map(lambda x: x**2)
+    even_numbers = Pipeline().filter(lambda x: x % 2 == 0)
+    sum_numbers = Pipeline().reduce(lambda x, y: x + y)
+    product_numbers = Pipeline().reduce(lambda x, y: x * y)
+    print(squared(numbers), even_numbers(numbers))              # [1, 4, 9, 16, 25] [2, 4]
+    print(sum_numbers(numbers), product_numbers(numbers))       # 15 120
+
+    # 🔗 Chained: one loop, no intermediate lists
+    even_square_sum = (Pipeline().map(lambda x: x**2)
+                       .filter(lambda x: x % 2 == 0)
+                       .reduce(lambda x, y: x + y))
+    print(even_square_sum(numbers))                             # 20
+    print(even_square_sum.explain())
+    # map    inlined 'x ** 2'
+    # filter inlined 'x % 2 == 0'
+    # reduce operator.add
+    # NumPy  yes (for 2048+ ints or floats)
+
+    # ⏱️ One million numbers: chained map / filter / reduce vs the pipeline
+    import time
+
+    big = list(range(1_000_000))
+    start = time.perf_counter()
+    squares = list(map(lambda x: x**2, big))
+    evens = list(filter(lambda x: x % 2 == 0, squares))
+    expected = reduce(lambda x, y: x + y, evens)
+    print(f"map/filter/reduce     {time.perf_counter() - start:.3f} s")
+    for label, use_numpy, data in (("Pipeline (loop)", False, big),
+                                   ("Pipeline (NumPy)", True, big),
+                                   ("Pipeline (range)", True, range(1_000_000))):
+        Pipeline.use_numpy = use_numpy
+        start = time.perf_counter()
+        assert even_square_sum(data) == expected
+        print(f"{label:<22}{time.perf_counter() - start:.3f} s")
+    # map/filter/reduce     ~0.25 s
+    # Pipeline (loop)       ~0.1 s    (one loop, lambdas inlined)
+    # Pipeline (NumPy)      ~0.09 s   (list → array conversion included)
+    # Pipeline (range)      ~0.03 s   (no conversion at all)
+
+    # Python semantics win: 10 ** 30 does not fit in NumPy's int64,
+    # so this runs on the loop and gives the exact big-int result.
+    print(Pipeline().map(lambda x: x ** 30).reduce(lambda x, y: x + y)(range(3000)) % 1000)  # 500
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Feature               | map / filter / reduce            | Pipeline                                    |
+|-----------------------|----------------------------------|---------------------------------------------|
+| Intermediate lists    | One per step (list(map(...)))    | None (one fused loop)                       |
+| Arithmetic lambdas    | One call per element             | Inlined as code (x ** 2, x % 2 == 0)        |
+| Big numeric inputs    | Python loop                      | NumPy array operations (when installed)     |
+| Results               | Exact Python semantics           | Identical (falls back on overflow / errors) |
+| Reuse                 | Rebuild the chain each time      | Build once, call on any input               |
+"""
@@ -23,11 +23,12 @@ class Cat:
 def make_sound(animal):
     animal.speak()  # Works for any object with 'speak' method
 
-d = Dog()
-c = Cat()
+if __name__ == "__main__":
+    d = Dog()
+    c = Cat()
 
-make_sound(d)  # Bark
-make_sound(c)  # Meow
+    make_sound(d)  # Bark
+    make_sound(c)  # Meow
 
 # 🔹 Explanation:
 # - Python does not care about the type of object.
@@ -50,25 +51,26 @@ class Bike(Vehicle):
     def move(self):
         print("Bike rides")
 
-vehicles = [Car(), Bike(), Vehicle()]
+if __name__ == "__main__":
+    vehicles = [Car(), Bike(), Vehicle()]
 
-for v in vehicles:
-    v.move()  # Calls the correct overridden method based on object type
+    for v in vehicles:
+        v.move()  # Calls the correct overridden method based on object type
 
-# Output:
-# Car drives
-# Bike rides
-# Vehicle moves
+    # Output:
+    # Car drives
+    # Bike rides
+    # Vehicle moves
 
 
-# ============================================================
-# 3️⃣ Polymorphism with Operators (Operator Overloading)
+    # ============================================================
+    # 3️⃣ Polymorphism with Operators (Operator Overloading)
 
-# Python allows the same operator to behave differently based on operand types
+    # Python allows the same operator to behave differently based on operand types
 
-print(5 + 10)       # 15 → integers addition
-print("Hi " + "You") # Hi You → string concatenation
-print([1,2] + [3,4]) # [1,2,3,4] → list concatenation
+    print(5 + 10)       # 15 → integers addition
+    print("Hi " + "You") # Hi You → string concatenation
+    print([1,2] + [3,4]) # [1,2,3,4] → list concatenation
 
 
 # ============================================================
@@ -0,0 +1,405 @@
+# ============================================================
+# 🗂️ TOPIC: SECONDARY INDEXES OVER DICT RECORDS
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+Dictionary.py describes one person as a dict:
+
+    person = {"name": "Vinay", "age": 25, "city": "Delhi"}
+
+With a list of such dicts, "all people in Mumbai aged 30-40" is a
+full scan: every record is checked, every time.
+
+IndexedRecords keeps the records AND indexes on chosen fields, like
+a database table:
+
+✅ hash index   (exact field)  → {value: set of record ids}
+✅ sorted index (range field)  → the same, plus the values in order,
+                                 so between(30, 40) is a binary search
+✅ find(city="Mumbai", age=between(30, 40)) starts from the smallest
+   index result and intersects / filters the others
+✅ records are returned as Record proxies: rec["age"] = 26,
+   rec.update(...), rec.pop("city"), del rec["age"] all keep the
+   indexes in sync
+============================================================
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import MutableMapping
+
+
+class between:
+    """
+    Range condition for find(): lo <= value <= hi.
+    Leave a side as None for an open range, e.g. between(lo=18).
+    """
+
+    __slots__ = ("lo", "hi")
+
+    def __init__(self, lo=None, hi=None):
+        self.lo = lo
+        self.hi = hi
+
+    def __contains__(self, value):
+        lo = value if self.lo is None else self.lo
+        hi = value if self.hi is None else self.hi
+        try:
+            return lo <= value <= hi
+        except TypeError:           # unorderable, e.g. None
+            return False
+
+    def __repr__(self):
+        return f"between({self.lo!r}, {self.hi!r})"
+
+
+def _test(condition):
+    """value → bool check for one find() condition."""
+    if isinstance(condition, between):
+        return condition.__contains__
+    return lambda value: value == condition
+
+
+# ============================================================
+# 📇 INDEXES
+# ============================================================
+class _HashIndex:
+    """value → set of record ids (exact matches in O(1))."""
+
+    __slots__ = ("ids",)
+
+    def __init__(self):
+        self.ids = {}
+
+    def add(self, value, rid):
+        bucket = self.ids.get(value)
+        if bucket is None:
+            self.ids[value] = {rid}
+        else:
+            bucket.add(rid)
+
+    def remove(self, value, rid):
+        bucket = self.ids[value]
+        bucket.discard(rid)
+        if not bucket:
+            del self.ids[value]
+        return not bucket           # True when 'value' is gone
+
+    def equal(self, value):
+        return self.ids.get(value, frozenset())
+
+
+class _SortedIndex(_HashIndex):
+    """
+    A hash index that also keeps its distinct values sorted. Values
+    that cannot be ordered with the others (None, a str among ints,
+    NaN) are kept in 'others' and checked one by one by range().
+    """
+
+    __slots__ = ("keys", "others")
+
+    def __init__(self):
+        super().__init__()
+        self.keys = []
+        self.others = set()
+
+    def add(self, value, rid):
+        new = value not in self.ids
+        super().add(value, rid)
+        if new:
+            try:
+                if value <= value:  # None & co. raise TypeError, NaN is False
+                    insort(self.keys, value)
+                    return
+            except TypeError:
+                pass
+            self.others.add(value)
+
+    def remove(self, value, rid):
+        if not super().remove(value, rid):
+            return False
+        if value in self.others:
+            self.others.discard(value)
+            return True
+        keys = self.keys
+        try:
+            i = bisect_left(keys, value)
+        except TypeError:           # odd mixes (tuples of mixed types): search
+            i = next(i for i, key in enumerate(keys) if key is value or key == value)
+        if i < len(keys) and keys[i] == value:
+            del keys[i]
+        return True
+
+    def range(self, condition):
+        """The id sets of every value inside the between() condition."""
+        keys = self.keys
+        try:
+            lo = 0 if condition.lo is None else bisect_left(keys, condition.lo)
+            hi = len(keys) if condition.hi is None else bisect_right(keys, condition.hi)
+            inside = keys[lo:hi]
+        except TypeError:           # a bound of another type: same answer as a scan
+            inside = [key for key in keys if key in condition]
+        inside += [value for value in self.others if value in condition]
+        return [self.ids[key] for key in inside]
+
+
+# ============================================================
+# 🧾 RECORD PROXY
+# ============================================================
+class Record(MutableMapping):
+    """
+    ============================================================
+    💡 CLASS: Record
+    ------------------------------------------------------------
+    Description:
+        A dict-like handle to one stored record. Every change goes
+        through the collection, so its indexes stay correct.
+
+    Attributes:
+        id : the record id inside its IndexedRecords
+
+    Methods:
+        everything a dict has: get, keys, items, update, pop,
+        setdefault, del rec[key] ...  plus to_dict()
+    ============================================================
+    """
+
+    __slots__ = ("_owner", "id")
+
+    def __init__(self, owner, rid):
+        self._owner = owner
+        self.id = rid
+
+    @property
+    def _data(self):
+        return self._owner._records[self.id]
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __setitem__(self, key, value):
+        self._owner._set_field(self.id, key, value)
+
+    def __delitem__(self, key):
+        self._owner._del_field(self.id, key)
+
+    def to_dict(self):
+        return dict(self._data)
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            other = other._data
+        return self._data == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Record({self._data!r})"
+
+
+# ============================================================
+# 🗂️ THE COLLECTION
+# ============================================================
+class IndexedRecords:
+    """
+    ============================================================
+    💡 CLASS: IndexedRecords
+    ------------------------------------------------------------
+    Description:
+        A collection of dict records with hash and sorted indexes
+        declared up front.
+
+    Constructor:
+        IndexedRecords(records=(), hash_index=(), sorted_index=())
+            hash_index   : fields queried by exact value, e.g. ("city",)
+            sorted_index : fields queried by range,       e.g. ("age",)
+
+    Methods:
+        add(record) → Record        extend(records)
+        find(**conditions) → list of Records (in insertion order)
+        count(**conditions) → int
+        remove(record or id)        del people[id]    people[id]
+
+    Conditions:
+        city="Mumbai"               exact value (any field)
+        age=between(30, 40)         inclusive range
+        Fields without an index are checked record by record.
+    ============================================================
+    """
+
+    def __init__(self, records=(), hash_index=(), sorted_index=()):
+        self._indexes = {field: _HashIndex() for field in hash_index}
+        self._indexes.update((field, _SortedIndex()) for field in sorted_index)
+        self._records = {}
+        self._next_id = 0
+        self.extend(records)
+
+    # --------------------------------------------------------
+    # ➕ Adding and removing records
+    # --------------------------------------------------------
+    def _check_hashable(self, record):
+        for field in self._indexes:
+            if field in record:
+                hash(record[field])     # TypeError before anything changes
+
+    def add(self, record):
+        """Store a copy of the dict 'record' and index it."""
+        record = dict(record)
+        self._check_hashable(record)
+        rid = self._next_id
+        self._next_id += 1
+        self._records[rid] = record
+        for field, index in self._indexes.items():
+            if field in record:
+                index.add(record[field], rid)
+        return Record(self, rid)
+
+    def extend(self, records):
+        for record in records:
+            self.add(record)
+
+    def _id(self, record):
+        return record.id if isinstance(record, Record) else record
+
+    def remove(self, record):
+        """Remove a record (Record proxy or id); returns its dict."""
+        rid = self._id(record)
+        data = self._records.pop(rid)
+        for field, index in self._indexes.items():
+            if field in data:
+                index.remove(data[field], rid)
+        return data
+
+    def __delitem__(self, rid):
+        self.remove(rid)
+
+    def __getitem__(self, rid):
+        if rid not in self._records:
+            raise KeyError(rid)
+        return Record(self, rid)
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        for rid in self._records:
+            yield Record(self, rid)
+
+    # --------------------------------------------------------
+    # ✏️ Field changes made through Record proxies
+    # --------------------------------------------------------
+    def _set_field(self, rid, key, value):
+        data = self._records[rid]
+        index = self._indexes.get(key)
+        if index is not None:
+            hash(value)
+            if key in data:
+                index.remove(data[key], rid)
+            index.add(value, rid)
+        data[key] = value
+
+    def _del_field(self, rid, key):
+        data = self._records[rid]
+        value = data.pop(key)
+        index = self._indexes.get(key)
+        if index is not None:
+            index.remove(value, rid)
+
+    # --------------------------------------------------------
+    # 🔎 Queries
+    # --------------------------------------------------------
+    def _query(self, conditions):
+        """Ids of the records matching every condition."""
+        plans, unindexed = [], []
+        for field, condition in conditions.items():
+            index = self._indexes.get(field)
+            if isinstance(condition, between):
+                if isinstance(index, _SortedIndex):
+                    sets = index.range(condition)
+                    plans.append((sum(map(len, sets)), sets, field, condition))
+                    continue
+            elif index is not None:
+                ids = index.equal(condition)
+                plans.append((len(ids), [ids], field, condition))
+                continue
+            unindexed.append((field, condition))
+
+        if not plans:
+            candidates = self._records.keys()     # no index helps: scan
+        else:
+            plans.sort(key=lambda plan: plan[0])    # smallest result first
+            _, sets, _, _ = plans[0]
+            candidates = sets[0] if len(sets) == 1 else set().union(*sets)
+            for size, sets, field, condition in plans[1:]:
+                if not candidates:
+                    return set()
+                if len(sets) == 1:
+                    candidates = candidates & sets[0]       # O(smaller set)
+                elif len(candidates) <= size:
+                    unindexed.append((field, condition))    # cheaper to check
+                else:
+                    candidates = candidates & set().union(*sets)
+
+        records = self._records
+        for field, condition in unindexed:      # one pass per condition
+            test = _test(condition)
+            candidates = {rid for rid in candidates
+                          if field in (data := records[rid]) and test(data[field])}
+        return candidates
+
+    def find(self, **conditions):
+        """Records matching ALL conditions, in insertion order."""
+        return [Record(self, rid) for rid in sorted(self._query(conditions))]
+
+    def count(self, **conditions):
+        return len(self._query(conditions))
+
+    def __repr__(self):
+        return f"IndexedRecords({len(self)} records, indexes={list(self._indexes)})"
+
+
+if __name__ == "__main__":
+    people = IndexedRecords(
+        [
+            {"name": "Vinay", "age": 25, "city": "Delhi"},
+            {"name": "Asha", "age": 31, "city": "Mumbai"},
+            {"name": "Ravi", "age": 38, "city": "Mumbai"},
+            {"name": "Meera", "age": 45, "city": "Mumbai"},
+        ],
+        hash_index=("city",),
+        sorted_index=("age",),
+    )
+
+    print([p["name"] for p in people.find(city="Mumbai")])
+    # ['Asha', 'Ravi', 'Meera']
+    print([p["name"] for p in people.find(city="Mumbai", age=between(30, 40))])
+    # ['Asha', 'Ravi']
+
+    vinay = people.find(name="Vinay")[0]      # 'name' has no index: scanned
+    vinay.update({"city": "Mumbai", "age": 32})
+    print(people.count(city="Mumbai", age=between(30, 40)))   # 3
+
+    vinay.pop("city")                         # index updated
+    print(people.count(city="Mumbai"))        # 3
+    del people[vinay.id]
+    print(len(people), people.count(age=between(lo=30)))      # 3 3
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Query                        | list of dicts | IndexedRecords                          |
+|------------------------------|---------------|-----------------------------------------|
+| city == "Mumbai"             | O(n) scan     | O(1) lookup + O(matches)                |
+| 30 <= age <= 40              | O(n) scan     | O(log distinct ages) + O(matches)       |
+| both together                | O(n) scan     | smallest result, intersected with rest  |
+| rec["age"] = 26 / pop / del  | O(1)          | O(1) hash, O(distinct values) sorted    |
+"""
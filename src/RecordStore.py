@@ -0,0 +1,326 @@
+# ============================================================
+# 🗄️ TOPIC: COLUMNAR RECORD STORE  (struct of arrays)
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+Dictionary.py stores a person as a dict:
+
+    person = {"name": "Vinay", "age": 25, "city": "Delhi"}
+
+A list of 10 million such dicts means 10 million hash tables, 10
+million boxed ints and (often) 10 million copies of "Delhi".
+
+A RecordStore keeps ONE column per field instead of one dict per row:
+
+    name → list of str
+    age  → array('q')            8 bytes per row, no int objects
+    city → dictionary-encoded:   ["Delhi", "Mumbai", ...] + 1-byte codes
+
+✅ store[i] returns a Row view that behaves like the dict:
+   row.get("age"), row.keys(), row.items(), row.update(age=26) ...
+✅ typically 5-10x less memory than a list of dicts
+============================================================
+"""
+
+import array
+import sys
+from collections.abc import Mapping
+
+CATEGORY = "category"      # field kind for dictionary-encoded strings
+
+PERSON_FIELDS = {"name": str, "age": int, "city": CATEGORY}
+
+
+# ============================================================
+# 📦 COLUMNS
+# ============================================================
+class _NumberColumn:
+    """int / float values in one array.array buffer."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, typecode):
+        self.values = array.array(typecode)
+
+    def append(self, value):
+        self.values.append(value)
+
+    def pop(self):
+        self.values.pop()
+
+    def get(self, i):
+        return self.values[i]
+
+    def set(self, i, value):
+        self.values[i] = value
+
+    def nbytes(self):
+        return sys.getsizeof(self.values)
+
+
+class _ObjectColumn:
+    """Any other value (e.g. mostly-unique strings) in a plain list."""
+
+    __slots__ = ("values",)
+
+    def __init__(self):
+        self.values = []
+
+    def append(self, value):
+        self.values.append(value)
+
+    def pop(self):
+        self.values.pop()
+
+    def get(self, i):
+        return self.values[i]
+
+    def set(self, i, value):
+        self.values[i] = value
+
+    def nbytes(self):
+        return sys.getsizeof(self.values) + sum(map(sys.getsizeof, self.values))
+
+
+class _CategoryColumn:
+    """
+    Dictionary-encoded values: each distinct value is stored once and
+    rows keep a small integer code. Codes start at 1 byte ('B') and
+    widen to 'H' / 'I' when there are more distinct values.
+    """
+
+    __slots__ = ("codes", "categories", "lookup")
+
+    _WIDER = {"B": "H", "H": "I"}
+
+    def __init__(self):
+        self.codes = array.array("B")
+        self.categories = []        # code → value
+        self.lookup = {}            # value → code
+
+    def _encode(self, value):
+        code = self.lookup.get(value)
+        if code is None:
+            code = len(self.categories)
+            if code >= 1 << (8 * self.codes.itemsize):
+                self.codes = array.array(self._WIDER[self.codes.typecode], self.codes)
+            self.categories.append(value)
+            self.lookup[value] = code
+        return code
+
+    def append(self, value):
+        code = self._encode(value)      # may replace self.codes with a wider array
+        self.codes.append(code)
+
+    def pop(self):
+        self.codes.pop()
+
+    def get(self, i):
+        return self.categories[self.codes[i]]
+
+    def set(self, i, value):
+        self.codes[i] = self._encode(value)
+
+    def nbytes(self):
+        return (sys.getsizeof(self.codes) + sys.getsizeof(self.categories)
+                + sys.getsizeof(self.lookup) + sum(map(sys.getsizeof, self.categories)))
+
+
+def _make_column(kind):
+    if kind is int:
+        return _NumberColumn("q")
+    if kind is float:
+        return _NumberColumn("d")
+    if kind == CATEGORY:
+        return _CategoryColumn()
+    return _ObjectColumn()
+
+
+# ============================================================
+# 🧾 ROW VIEW
+# ============================================================
+class Row(Mapping):
+    """
+    ============================================================
+    💡 CLASS: Row
+    ------------------------------------------------------------
+    Description:
+        A dict-like view of one record. Reading and writing goes
+        straight to the store's columns; nothing is copied.
+
+    Methods (same as dict):
+        row["age"], row.get(key, default), keys(), values(), items(),
+        row["age"] = 26, update(other, **kwargs), to_dict()
+
+    Notes:
+        - The set of keys is fixed by the store: new keys raise
+          KeyError and keys cannot be deleted.
+    ============================================================
+    """
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key):
+        return self._store._column(key).get(self._index)
+
+    def __iter__(self):
+        return iter(self._store.fields)
+
+    def __len__(self):
+        return len(self._store.fields)
+
+    def __contains__(self, key):
+        return key in self._store._columns
+
+    def __setitem__(self, key, value):
+        self._store._column(key).set(self._index, value)
+
+    def update(self, other=(), **kwargs):
+        pairs = other.items() if isinstance(other, Mapping) else other
+        for key, value in pairs:
+            self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"Row({self.to_dict()!r})"
+
+
+# ============================================================
+# 🗄️ THE STORE
+# ============================================================
+class RecordStore:
+    """
+    ============================================================
+    💡 CLASS: RecordStore
+    ------------------------------------------------------------
+    Description:
+        A table of records with the same fields, stored column by
+        column (struct of arrays) instead of one dict per record.
+
+    Constructor:
+        RecordStore(fields=PERSON_FIELDS)
+            fields : {name: kind}, kind is int, float, str,
+                     CATEGORY (dictionary-encoded) or object
+
+    Methods:
+        append(record) → row number      extend(records)
+        store[i]       → Row view         column(name) → list of values
+        memory_usage() → approximate bytes used by all columns
+    ============================================================
+    """
+
+    def __init__(self, fields=None):
+        fields = fields or PERSON_FIELDS
+        self.fields = tuple(fields)
+        self.kinds = dict(fields)
+        self._columns = {name: _make_column(kind) for name, kind in self.kinds.items()}
+        self._size = 0
+
+    def _column(self, name):
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise KeyError(f"RecordStore has no field {name!r}") from None
+
+    def append(self, record):
+        """Add a record (a dict with exactly the store's fields)."""
+        missing = [name for name in self.fields if name not in record]
+        if missing or len(record) != len(self.fields):
+            extra = [key for key in record if key not in self._columns]
+            raise ValueError(f"record fields do not match: missing {missing}, unknown {extra}")
+        added = []
+        try:
+            for name in self.fields:
+                self._columns[name].append(record[name])
+                added.append(name)
+        except (TypeError, OverflowError):
+            for name in added:      # keep the columns the same length
+                self._columns[name].pop()
+            raise
+        self._size += 1
+        return self._size - 1
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("RecordStore index out of range")
+        return Row(self, index)
+
+    def __iter__(self):
+        for i in range(self._size):
+            yield Row(self, i)
+
+    def column(self, name):
+        """All values of one field, in row order."""
+        col = self._column(name)
+        if isinstance(col, _CategoryColumn):
+            return list(map(col.categories.__getitem__, col.codes))
+        return list(col.values)
+
+    def memory_usage(self):
+        """Approximate bytes used by the columns (values included)."""
+        return sum(col.nbytes() for col in self._columns.values())
+
+    def __repr__(self):
+        return f"RecordStore({len(self)} rows, fields={list(self.fields)})"
+
+
+if __name__ == "__main__":
+    people = RecordStore()          # fields: name, age, city
+    people.append({"name": "Vinay", "age": 25, "city": "Delhi"})
+    people.append({"name": "Asha", "age": 31, "city": "Mumbai"})
+
+    person = people[0]
+    print(person.get("name"))       # Vinay
+    print(person.get("salary", 0))  # 0 (default value)
+    print(list(person.keys()))      # ['name', 'age', 'city']
+    print(list(person.items()))     # [('name', 'Vinay'), ('age', 25), ('city', 'Delhi')]
+    person.update({"city": "Mumbai", "age": 26})
+    print(person)                   # Row({'name': 'Vinay', 'age': 26, 'city': 'Mumbai'})
+
+    try:
+        person["salary"] = 1000
+    except KeyError as e:
+        print("❌", e)              # ❌ "RecordStore has no field 'salary'"
+
+    # 📏 Memory: 1,000,000 dicts vs one RecordStore
+    n = 1_000_000
+    cities = ["Delhi", "Mumbai", "Pune", "Chennai"]
+    dicts = [{"name": f"user{i}", "age": i % 90, "city": cities[i % 4]} for i in range(n)]
+    dict_bytes = sys.getsizeof(dicts) + sum(
+        sys.getsizeof(d) + sys.getsizeof(d["name"]) + sys.getsizeof(d["age"]) for d in dicts)
+    store = RecordStore()
+    store.extend(dicts)
+    print(f"list of dicts : {dict_bytes / n:.0f} bytes per record")            # ~300
+    print(f"RecordStore   : {store.memory_usage() / n:.0f} bytes per record")  # ~70
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Per record          | dict                          | RecordStore                  |
+|---------------------|-------------------------------|------------------------------|
+| Hash table          | One per record (~180 bytes)   | None (one column per field)  |
+| age (int)           | Pointer + int object          | 8 bytes in array('q')        |
+| city (repeated str) | Pointer (+ string if unique)  | 1-byte code                  |
+| Access              | person["age"]                 | store[i]["age"] (a Row view) |
+"""
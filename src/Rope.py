@@ -0,0 +1,284 @@
+# ============================================================
+# 🧵 TOPIC: ROPE  —  LAZY CONCATENATION & REPETITION
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+List.py, Tuple.py and VariableString.py join and repeat sequences:
+
+    c = a + b       d = a * 3       laugh = "Ha" * 3
+
+Each of these builds a NEW object and copies every element into it.
+Concatenating big batches again and again copies the same data over
+and over, and a multi-GB result must fit in memory at once.
+
+A Rope only remembers its pieces ("chunks") and never copies them:
+
+✅ a + b        → O(chunks): the chunk lists are joined, not the data
+✅ a * 3        → O(1): one chunk that says "repeat this 3 times"
+✅ rope[i]      → O(log chunks): binary search over chunk offsets
+✅ for x in rope → streams the elements, nothing is materialized
+✅ rope[a:b]    → another Rope (zero-copy SliceViews at the edges)
+============================================================
+"""
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import accumulate, chain, islice
+
+try:
+    from .SliceView import SliceView
+except ImportError:
+    from SliceView import SliceView
+
+
+class Rope(Sequence):
+    """
+    ============================================================
+    💡 CLASS: Rope
+    ------------------------------------------------------------
+    Description:
+        An immutable sequence made of chunks. Each chunk is a
+        (base, times) pair: the sequence 'base' repeated 'times'.
+
+    Constructor:
+        Rope(*parts)
+            parts : lists, tuples, strings, arrays, other Ropes ...
+                    (kept by reference, NOT copied)
+
+    Methods:
+        chunks()      → the leaf sequences in order (streaming)
+        tolist()      → copy everything into a list
+        to_str()      → "".join(...) for a rope of strings
+
+    Notes:
+        - A Rope sees later changes to a list it was built from,
+          but the list must not change its LENGTH (offsets would
+          no longer match).
+        - x in rope / rope.count(x) look at each chunk only once,
+          however many times it is repeated.
+    ============================================================
+    """
+
+    __slots__ = ("_pieces", "_offsets")
+
+    def __init__(self, *parts):
+        self._set_pieces(_pieces_of(part) for part in parts)
+
+    def _set_pieces(self, groups):
+        pieces = tuple(p for p in chain.from_iterable(groups) if len(p[0]) and p[1] > 0)
+        self._pieces = pieces
+        self._offsets = tuple(accumulate(len(base) * times for base, times in pieces))
+
+    @classmethod
+    def _from_pieces(cls, pieces):
+        obj = cls.__new__(cls)
+        obj._set_pieces((pieces,))
+        return obj
+
+    # --------------------------------------------------------
+    # ➕ Concatenation and ✖️ repetition (no element is copied)
+    # --------------------------------------------------------
+    def __add__(self, other):
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return self._from_pieces(self._pieces + _pieces_of(other))
+
+    def __radd__(self, other):
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return self._from_pieces(_pieces_of(other) + self._pieces)
+
+    def __mul__(self, times):
+        if not isinstance(times, int):
+            return NotImplemented
+        if times <= 0:
+            return self._from_pieces(())
+        if len(self._pieces) == 1:                  # (base, t) * n → (base, t * n)
+            base, t = self._pieces[0]
+            return self._from_pieces(((base, t * times),))
+        return self._from_pieces(((self, times),))  # nest: O(1)
+
+    __rmul__ = __mul__
+
+    # --------------------------------------------------------
+    # 📖 Reading
+    # --------------------------------------------------------
+    def __len__(self):
+        return self._offsets[-1] if self._offsets else 0
+
+    def _locate(self, i):
+        """Chunk number holding position i, and that chunk's offset."""
+        k = bisect_right(self._offsets, i)
+        return k, (self._offsets[k - 1] if k else 0)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return self._from_pieces(((SliceView(self, index), 1),))
+            return self._from_pieces(tuple(self._slice(start, stop)))
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("Rope index out of range")
+        k, off = self._locate(index)
+        base, _ = self._pieces[k]
+        return base[(index - off) % len(base)]
+
+    def _slice(self, start, stop):
+        """Yield the (base, times) pieces covering positions start..stop."""
+        if start >= stop:
+            return
+        k, off = self._locate(start)
+        pieces = self._pieces
+        while k < len(pieces) and off < stop:
+            base, times = pieces[k]
+            n = len(base)
+            lo, hi = max(start - off, 0), min(stop - off, n * times)
+            first, last = lo // n, (hi - 1) // n    # repetitions touched
+            if first == last:
+                yield _sub(base, lo - first * n, hi - first * n), 1
+            else:
+                yield _sub(base, lo - first * n, n), 1
+                if last - first > 1:
+                    yield base, last - first - 1
+                yield _sub(base, 0, hi - last * n), 1
+            off += n * times
+            k += 1
+
+    def __iter__(self):
+        for base, times in self._pieces:
+            if times == 1:
+                yield from base
+            else:
+                for _ in range(times):
+                    yield from base
+
+    def chunks(self):
+        """Yield the leaf sequences in order (nested Ropes are expanded)."""
+        for base, times in self._pieces:
+            for _ in range(times):
+                if isinstance(base, Rope):
+                    yield from base.chunks()
+                else:
+                    yield base
+
+    def __contains__(self, value):
+        return any(_piece_contains(base, value) for base, _ in self._pieces)
+
+    def count(self, value):
+        return sum(_piece_count(base, value) * times for base, times in self._pieces)
+
+    def __eq__(self, other):
+        """
+        Element-wise, like list == list. A rope of text equals only
+        text (a str or another rope of text), never a list of
+        characters, just as "ab" != ["a", "b"].
+        """
+        if not isinstance(other, Sequence) or isinstance(other, bytes):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        if not len(self):
+            return True
+        if _is_text(self) != _is_text(other):
+            return False
+        if isinstance(other, str):
+            return self.to_str() == other
+        return all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    # --------------------------------------------------------
+    # 📦 Copying on request only
+    # --------------------------------------------------------
+    def tolist(self):
+        return list(self)
+
+    def to_str(self):
+        """Join a rope of strings into one str (this DOES copy)."""
+        return "".join(c if isinstance(c, str) else "".join(c) for c in self.chunks())
+
+    def __repr__(self):
+        items = ", ".join(map(repr, islice(self, 20)))
+        if len(self) > 20:
+            items += ", ..."
+        return f"Rope([{items}], len={len(self)})"
+
+
+def _pieces_of(part):
+    if isinstance(part, Rope):
+        return part._pieces
+    return ((part, 1),)
+
+
+def _is_text(seq):
+    """True if every element of 'seq' comes from a str."""
+    if isinstance(seq, str):
+        return True
+    if isinstance(seq, SliceView):
+        return _is_text(seq.base)
+    if isinstance(seq, Rope):
+        return all(_is_text(base) for base, _ in seq._pieces)
+    return False
+
+
+def _sub(base, start, stop):
+    """base[start:stop] without copying the elements."""
+    if start == 0 and stop == len(base):
+        return base
+    if isinstance(base, Rope):
+        return base[start:stop]
+    return SliceView(base, slice(start, stop))
+
+
+def _piece_contains(base, value):
+    if isinstance(base, str):          # 'in' on str means substring, not element
+        return isinstance(value, str) and len(value) == 1 and value in base
+    return value in base
+
+
+def _piece_count(base, value):
+    if isinstance(base, str):
+        return base.count(value) if isinstance(value, str) and len(value) == 1 else 0
+    if hasattr(base, "count"):
+        return base.count(value)
+    return sum(1 for x in base if x is value or x == value)
+
+
+if __name__ == "__main__":
+    a = [1, 2, 3]
+    b = [4, 5, 6]
+
+    c = Rope(a) + b             # like a + b, but no element is copied
+    d = Rope(a) * 3             # like a * 3, one chunk repeated 3 times
+    print(c)                    # Rope([1, 2, 3, 4, 5, 6], len=6)
+    print(d[7], len(d))         # 2 9
+    print(d[2:5].tolist())      # [3, 1, 2]
+
+    laugh = Rope("Ha") * 3
+    print(laugh.to_str())       # HaHaHa
+
+    # A "huge" sequence: 10 million copies of a 1,000-element batch,
+    # i.e. 10 billion elements, built in O(1) and never materialized.
+    batch = list(range(1_000))
+    huge = Rope(batch) * 10_000_000 + [-1]
+    print(len(huge), huge[-1], huge[123_456_789])   # 10000000001 -1 789
+    print(sum(islice(huge, 5_000)))                 # 2497500 (streamed)
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Operation          | list / tuple / str      | Rope                          |
+|--------------------|-------------------------|-------------------------------|
+| a + b              | O(len a + len b) copy   | O(chunks), no copy            |
+| a * n              | O(n · len a) copy       | O(1)                          |
+| x[i]               | O(1)                    | O(log chunks)                 |
+| iteration          | O(n)                    | O(n), streaming               |
+| x[a:b]             | copies b - a elements   | O(chunks), views at the edges |
+"""
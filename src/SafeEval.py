@@ -0,0 +1,354 @@
+# ============================================================
+# 🛡️ TOPIC: SAFE EXPRESSION EVALUATION  (instead of eval(input()))
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+UserInput.py reads an expression and runs it:
+
+    num = eval(input("Enter a number or expression: "))
+
+That is convenient, but eval() runs ANY Python expression:
+
+    __import__("os").remove("data.txt")     # deletes a file
+    ().__class__.__base__.__subclasses__()  # reaches every class
+
+and it parses the text again on every call.
+
+SafeExpression parses the text ONCE, checks every node of its syntax
+tree against a whitelist and compiles it to Python code:
+
+✅ ALLOWED     → numbers, strings, True/False/None, names,
+                 + - * / // % **, comparisons, and / or / not,
+                 x if c else y, tuples / lists (for `in`), and calls
+                 to whitelisted functions (abs, min, max, sqrt, ...)
+❌ REJECTED    → attributes (x.y), subscripts (x[0]), lambdas,
+                 comprehensions, f-strings, names starting with "_",
+                 calls to anything not whitelisted
+✅ CACHED      → the compiled code is cached by expression text, so
+                 the same formula typed twice is parsed once
+✅ FAST        → names become the arguments of a generated function
+                 (local variables, not dict lookups);
+                 evaluate_many() runs one list comprehension over all
+                 the rows
+✅ BOUNDED     → a ** b with a huge result, "ab" * 10**9, long
+                 list / str concatenations and "%0999999999d" % 1
+                 raise OverflowError;
+                 sum() adds numbers only (sum of lists is quadratic)
+============================================================
+"""
+
+import ast
+import math
+import numbers
+import re
+from copy import deepcopy
+from operator import itemgetter
+
+try:
+    from .Memoize import memoize
+except ImportError:
+    from Memoize import memoize
+
+MAX_LENGTH = 10_000         # characters in one expression
+_MAX_POWER_BITS = 10_000    # 10 ** 3000 is fine, 9 ** 9 ** 9 is not
+_MAX_ITEMS = 10_000         # longest str / list built by * or +
+
+_ALLOWED = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp,
+    ast.Call, ast.keyword, ast.Name, ast.Load, ast.Constant, ast.Tuple, ast.List,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.UAdd, ast.USub, ast.Not, ast.And, ast.Or,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.In, ast.NotIn,
+)
+_SEQUENCES = (str, bytes, list, tuple)
+# One "%" conversion: (width, precision, type); "*" takes the size from the arguments
+_FORMAT_SPEC = re.compile(r"%(\([^)]*\))?[-#0 +]*(\*|\d*)(?:\.(\*|\d*))?[hlL]?(.)", re.DOTALL)
+
+
+# ============================================================
+# 🧮 Guarded operators
+# ============================================================
+def _power(base, exponent):
+    if (isinstance(base, int) and isinstance(exponent, int) and exponent > 0
+            and abs(base) > 1 and base.bit_length() * exponent > _MAX_POWER_BITS):
+        raise OverflowError(f"{base} ** {exponent} is too large")
+    return base ** exponent         # 0, 1 and -1 stay small for any exponent
+
+
+def _multiply(left, right):
+    for sequence, count in ((left, right), (right, left)):
+        if (isinstance(sequence, _SEQUENCES) and isinstance(count, int)
+                and len(sequence) * count > _MAX_ITEMS):
+            raise OverflowError(f"repeating a {type(sequence).__name__} {count} times is too large")
+    return left * right
+
+
+def _add(left, right):
+    if (isinstance(left, _SEQUENCES) and isinstance(right, _SEQUENCES)
+            and len(left) + len(right) > _MAX_ITEMS):
+        raise OverflowError(f"joining {len(left)} + {len(right)} items is too large")
+    return left + right
+
+
+def _modulo(left, right):
+    """'%0999999999d' % 1 is one short string asking for a 1 GB result."""
+    if isinstance(left, (str, bytes)):
+        text = left.decode("latin-1") if isinstance(left, bytes) else left
+        arguments = iter(right if isinstance(right, tuple) else (right,))
+        for key, width, precision, kind in _FORMAT_SPEC.findall(text):
+            for size in (width, precision):
+                if size == "*":
+                    size = next(arguments, 0)
+                elif size:
+                    size = int(size) if len(size) <= len(str(_MAX_ITEMS)) else _MAX_ITEMS + 1
+                if isinstance(size, int) and abs(size) > _MAX_ITEMS:
+                    raise OverflowError(f"a %-format width or precision of {size} is too large")
+            if kind != "%" and not key:
+                next(arguments, None)
+    return left % right
+
+
+def _sum(values, /):
+    """sum() of numbers only, no start=: sum(lists, []) copies quadratically."""
+    values = values if isinstance(values, (list, tuple)) else list(values)
+    for value in values:
+        if not isinstance(value, numbers.Number):
+            raise TypeError(f"sum() adds numbers only, not {type(value).__name__}")
+    return sum(values)
+
+
+FUNCTIONS = {
+    "abs": abs, "bool": bool, "ceil": math.ceil, "exp": math.exp, "float": float,
+    "floor": math.floor, "int": int, "len": len, "log": math.log, "max": max,
+    "min": min, "round": round, "sqrt": math.sqrt, "sum": _sum,
+}
+
+
+class _Guard(ast.NodeTransformer):
+    """
+    a ** b → _power(a, b), a * b → _multiply(a, b), a + b → _add(a, b),
+    a % b → _modulo(a, b). Every node, not only literal ones: a name can
+    hold "ab" and another one 10**9.
+    """
+
+    _HELPERS = {ast.Pow: "_power", ast.Mult: "_multiply", ast.Add: "_add", ast.Mod: "_modulo"}
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        helper = self._HELPERS.get(type(node.op))
+        if helper is None:
+            return node
+        call = ast.Call(ast.Name(helper, ast.Load()), [node.left, node.right], [])
+        return ast.copy_location(call, node)
+
+
+# ============================================================
+# 🔍 Checking and compiling (cached by text)
+# ============================================================
+def _check(tree, text, functions):
+    """Raise ValueError for the first node that is not whitelisted."""
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED):
+            raise ValueError(f"{type(node).__name__} is not allowed in an expression: {text!r}")
+        if isinstance(node, ast.Name) and node.id.startswith("_"):
+            raise ValueError(f"names may not start with '_': {node.id!r}")
+        if isinstance(node, ast.keyword) and node.arg is None:
+            raise ValueError(f"**arguments are not allowed: {text!r}")
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name):
+                raise ValueError(f"{type(node.func).__name__} is not allowed in an "
+                                 f"expression: {text!r}")
+            if node.func.id not in functions:
+                raise ValueError(f"calling {node.func.id!r} is not allowed; allowed: "
+                                 f"{', '.join(sorted(functions))}")
+
+
+@memoize(maxsize=1024)
+def _compile(text, functions):
+    """
+    (code, names) for 'text': evaluating the code gives two functions,
+    one for a single set of bindings and one for a batch of rows.
+    'functions' are the whitelisted names (part of the cache key).
+    """
+    if len(text) > MAX_LENGTH:
+        raise ValueError(f"expression longer than {MAX_LENGTH} characters")
+    tree = ast.parse(text.strip(), "<expression>", "eval")
+    _check(tree, text, functions)
+    names = sorted({node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+                   - set(functions))
+    body = _Guard().visit(tree).body
+
+    def arguments(*args):
+        return ast.arguments(posonlyargs=[], args=[ast.arg(a) for a in args], vararg=None,
+                             kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[])
+
+    # lambda a, b: <expr>
+    single = ast.Lambda(arguments(*names), body)
+    # lambda _rows: [<expr> for a, b in _map(_pick, _rows)]
+    if not names:
+        target, rows = ast.Name("_row", ast.Store()), ast.Name("_rows", ast.Load())
+    else:
+        target = ast.Tuple([ast.Name(n, ast.Store()) for n in names], ast.Store()) \
+            if len(names) > 1 else ast.Name(names[0], ast.Store())
+        rows = ast.Call(ast.Name("_map", ast.Load()),
+                        [ast.Name("_pick", ast.Load()), ast.Name("_rows", ast.Load())], [])
+    loop = ast.comprehension(target, rows, [], 0)
+    batch = ast.Lambda(arguments("_rows"), ast.ListComp(deepcopy(body), [loop]))
+    module = ast.fix_missing_locations(ast.Expression(ast.Tuple([single, batch], ast.Load())))
+    return compile(module, "<expression>", "eval"), tuple(names)
+
+
+class SafeExpression:
+    """
+    ============================================================
+    💡 CLASS: SafeExpression
+    ------------------------------------------------------------
+    Description:
+        A checked, compiled expression over named variables.
+
+    Constructor:
+        SafeExpression(text, functions=FUNCTIONS)
+            text      : e.g. "price * qty * (1 + tax)"
+            functions : name → function the text may call
+
+    Methods:
+        evaluate(bindings=None, **names) → the value
+        evaluate_many(rows)              → [value for every row dict]
+        names                            → variables the text reads
+
+    Raises:
+        SyntaxError: The text is not a Python expression.
+        ValueError:  It uses something that is not whitelisted.
+        NameError:   A variable has no binding (at evaluation).
+    ============================================================
+    """
+
+    __slots__ = ("text", "names", "_single", "_batch")
+
+    def __init__(self, text, functions=FUNCTIONS):
+        for name in functions:
+            if not name.isidentifier() or name.startswith("_"):
+                raise ValueError(f"invalid function name {name!r}")
+        code, self.names = _compile(text, tuple(sorted(functions)))
+        # No builtins at all: only the whitelisted functions exist.
+        namespace = {"__builtins__": {}, "_power": _power, "_multiply": _multiply,
+                     "_add": _add, "_modulo": _modulo, "_map": map,
+                     "_pick": itemgetter(*self.names) if self.names else None}
+        namespace.update(functions)
+        self.text = text
+        self._single, self._batch = eval(code, namespace)
+
+    def _missing(self, row):
+        for name in self.names:
+            if name not in row:
+                return NameError(f"name {name!r} is not defined")
+        return None
+
+    def evaluate(self, bindings=None, **names):
+        if names:
+            bindings = {**bindings, **names} if bindings else names
+        bindings = bindings or {}
+        try:
+            values = [bindings[name] for name in self.names]
+        except KeyError:
+            raise self._missing(bindings) from None
+        return self._single(*values)
+
+    def evaluate_many(self, rows):
+        """One value per row (a dict of bindings), in a single comprehension."""
+        rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+        try:
+            return self._batch(rows)
+        except KeyError:
+            for row in rows:
+                error = self._missing(row)
+                if error is not None:
+                    raise error from None
+            raise               # a KeyError from a whitelisted function
+
+    def __repr__(self):
+        return f"SafeExpression({self.text!r})"
+
+
+@memoize(maxsize=1024)
+def _default_expression(text):
+    """safe_eval's SafeExpression per text (default FUNCTIONS)."""
+    return SafeExpression(text)
+
+
+def safe_eval(text, bindings=None, functions=FUNCTIONS):
+    """
+    ------------------------------------------------------------
+    🛡️ Function: safe_eval
+    ------------------------------------------------------------
+    Description:
+        A drop-in for eval(text) on untrusted text: same result for
+        arithmetic / comparison expressions, ValueError for anything
+        else. The checked expression is cached by text, so a
+        repeated input skips parsing.
+
+    Parameters:
+        text (str): The expression, e.g. input() from a user
+        bindings (dict): Variables the expression may read
+        functions (dict): Functions it may call (default: FUNCTIONS)
+
+    Raises:
+        SyntaxError / ValueError / NameError: As SafeExpression.
+
+    Returns:
+        The value of the expression.
+    """
+    if functions is FUNCTIONS:
+        return _default_expression(text).evaluate(bindings)
+    return SafeExpression(text, functions).evaluate(bindings)
+
+
+if __name__ == "__main__":
+    print(safe_eval("5 + 10"))                         # 15
+    print(safe_eval('"hjghj"'))                        # hjghj
+    print(safe_eval("sqrt(x ** 2 + y ** 2)", {"x": 3, "y": 4}))    # 5.0
+
+    for attack in ('__import__("os").remove("data.txt")',
+                   "().__class__.__base__.__subclasses__()",
+                   "9 ** 9 ** 9"):
+        try:
+            safe_eval(attack)
+        except (ValueError, OverflowError) as error:
+            print(type(error).__name__, "-", str(error)[:50])
+    # ValueError - Attribute is not allowed in an expression: '__impo
+    # ValueError - Attribute is not allowed in an expression: '().__c
+    # OverflowError - 9 ** 387420489 is too large
+
+    # 🔁 One formula, many rows
+    total = SafeExpression("price * qty * (1 + tax) if qty > 0 else 0")
+    print(total.names)                                 # ('price', 'qty', 'tax')
+    print(total.evaluate(price=10, qty=3, tax=0.5))    # 45.0
+    rows = [{"price": 10, "qty": q, "tax": 0.5} for q in range(4)]
+    print(total.evaluate_many(rows))                   # [0, 15.0, 30.0, 45.0]
+
+    # ⏱️ 100,000 rows: eval() per row vs evaluate_many()
+    import time
+
+    rows = [{"price": i % 97, "qty": i % 5, "tax": 0.2} for i in range(100_000)]
+    start = time.perf_counter()
+    slow = [eval(total.text, {}, row) for row in rows]
+    print(f"eval() per row   {time.perf_counter() - start:.2f} s")     # ~2 s
+    start = time.perf_counter()
+    fast = total.evaluate_many(rows)
+    print(f"evaluate_many()  {time.perf_counter() - start:.3f} s", fast == slow)   # ~0.03 s True
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Feature              | eval(text)                        | SafeExpression / safe_eval          |
+|----------------------|-----------------------------------|-------------------------------------|
+| What can run         | Any Python expression             | Whitelisted syntax and functions    |
+| Parsing              | Every call                        | Once per text (cached)              |
+| Variables            | Dict lookups (eval's locals)      | Arguments of a generated function   |
+| Many rows            | One eval() per row                | evaluate_many(): one comprehension  |
+| 9 ** 9 ** 9          | Hangs                             | OverflowError                       |
+"""
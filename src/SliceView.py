@@ -0,0 +1,201 @@
+# ============================================================
+# 🪟 TOPIC: ZERO-COPY SLICE VIEWS
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+List.py explains that slicing "returns a NEW list":
+
+    numbers[1:4]     → copies 3 elements
+    numbers[::2]     → copies every 2nd element
+    numbers[::-1]    → copies the whole list (reversed)
+
+For big buffers sliced thousands of times per second, those copies
+dominate. A SliceView only REMEMBERS which elements it covers:
+
+✅ array.array / bytes / bytearray → backed by a memoryview slice
+✅ list / tuple / str / any sequence → backed by a range of indexes
+✅ slicing a view gives another view (still no copy)
+✅ data is copied only when you call .materialize() or .tolist()
+============================================================
+"""
+
+from collections.abc import Sequence
+
+
+def _range_to_slice(rng):
+    """range(start, stop, step) → the slice that selects the same indexes."""
+    if not rng:
+        return slice(0, 0)      # range(4, -1, -1)[5:] would become [4::-1]
+    stop = rng.stop if rng.stop >= 0 else None
+    return slice(rng.start, stop, rng.step)
+
+
+class SliceView(Sequence):
+    """
+    ============================================================
+    💡 CLASS: SliceView
+    ------------------------------------------------------------
+    Description:
+        A read-only window over part of a sequence, without copying.
+
+    Constructor:
+        SliceView(base, index=slice(None))
+            base  : the sequence or buffer being viewed
+            index : a slice object, e.g. slice(1, 4) or slice(None, None, -1)
+
+    Notes:
+        - A view over a list sees later changes made to that list.
+        - While a memoryview-backed view exists, array.array / bytearray
+          cannot change size (Python raises BufferError).
+    ============================================================
+    """
+
+    __slots__ = ("_base", "_range", "_view")
+
+    def __init__(self, base, index=slice(None)):
+        if isinstance(base, SliceView):
+            self._copy_from(base[index])
+            return
+        self._base = base
+        try:
+            view = memoryview(base)
+        except TypeError:
+            self._view = None
+            self._range = range(len(base))[index]
+        else:
+            self._view = view[index]
+            self._range = None
+
+    def _copy_from(self, other):
+        self._base, self._range, self._view = other._base, other._range, other._view
+
+    @classmethod
+    def _make(cls, base, rng, view):
+        obj = cls.__new__(cls)
+        obj._base, obj._range, obj._view = base, rng, view
+        return obj
+
+    # --------------------------------------------------------
+    # 📖 Reading
+    # --------------------------------------------------------
+    def __len__(self):
+        return len(self._view) if self._view is not None else len(self._range)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if self._view is not None:
+                return self._make(self._base, None, self._view[index])
+            return self._make(self._base, self._range[index], None)
+        if self._view is not None:
+            return self._view[index]
+        return self._base[self._range[index]]
+
+    def __iter__(self):
+        if self._view is not None:
+            return iter(self._view)
+        return map(self._base.__getitem__, self._range)
+
+    def __eq__(self, other):
+        if isinstance(other, (SliceView, Sequence)) and not isinstance(other, (str, bytes)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    @property
+    def base(self):
+        return self._base
+
+    # --------------------------------------------------------
+    # 📦 Copying on request only
+    # --------------------------------------------------------
+    def tolist(self):
+        """Copy the viewed elements into a new list."""
+        if self._view is not None:
+            return self._view.tolist()
+        return list(self.materialize())
+
+    def materialize(self):
+        """
+        Copy the viewed elements into a NEW object of the base type
+        (list → list, tuple → tuple, array → array, bytes → bytes ...).
+        """
+        base = self._base
+        if self._view is None:
+            return base[_range_to_slice(self._range)]
+        if isinstance(base, (bytes, bytearray)):
+            return type(base)(self._view.tobytes())
+        if hasattr(base, "typecode"):
+            result = type(base)(base.typecode)
+            result.frombytes(self._view.tobytes())
+            return result
+        return self._view.tolist()
+
+    def release(self):
+        """Release the memoryview so the base buffer can be resized again."""
+        if self._view is not None:
+            self._view.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def __repr__(self):
+        return f"SliceView({self.tolist()!r})"
+
+
+# ============================================================
+# 🪟 SLIDING WINDOWS
+# ============================================================
+def windows(base, size, step=1):
+    """
+    Yield zero-copy SliceViews of length 'size' moving by 'step'.
+
+    Example:
+        for w in windows(samples, 1024, 512):
+            process(w)              # no list/array is copied
+    """
+    if size <= 0 or step <= 0:
+        raise ValueError("size and step must be positive")
+    whole = SliceView(base)
+    for start in range(0, len(whole) - size + 1, step):
+        yield whole[start:start + size]
+
+
+if __name__ == "__main__":
+    import array
+
+    numbers = [10, 20, 30, 40, 50, 60, 70]
+
+    middle = SliceView(numbers, slice(1, 4))
+    print(list(middle))                  # [20, 30, 40]  (no copy made)
+    print(SliceView(numbers)[::2])       # SliceView([10, 30, 50, 70])
+    print(SliceView(numbers)[::-1][1])   # 60
+    print(middle.materialize())          # [20, 30, 40]  (copy on request)
+
+    # Views of views stay views
+    print(SliceView(numbers)[1:][::2][1:])   # SliceView([40, 60])
+
+    # Buffers (array.array) use memoryview → no copy at all
+    samples = array.array('d', range(10))
+    for w in windows(samples, size=4, step=3):
+        print(sum(w))                    # 6.0, 18.0, 30.0
+    print(SliceView(samples, slice(None, None, -3)).materialize())
+    # array('d', [9.0, 6.0, 3.0, 0.0])
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Operation          | numbers[a:b:c]        | SliceView(numbers, slice(a, b, c)) |
+|--------------------|-----------------------|------------------------------------|
+| Memory             | Copies the elements   | O(1): a range or a memoryview      |
+| Slicing again      | Copies again          | Another view (no copy)             |
+| Sees base changes  | ❌ No (it's a copy)    | ✅ Yes                              |
+| Get a real copy    | —                     | .materialize() / .tolist()         |
+"""
@@ -0,0 +1,326 @@
+# ============================================================
+# 🌊 TOPIC: LAZY STREAMS  (fused map / filter / flat_map)
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+Every pattern in ListComprehension.py builds a FULL list:
+
+    [val ** 2 for val in a]              [val for row in mat for val in row]
+
+If the input is bigger than memory, the list never fits. Java
+answers this with its Stream API; Stream is the Python version:
+
+    Stream(a).map(lambda v: v ** 2).filter(lambda v: v % 2 == 0).to_list()
+
+✅ LAZY        → map / filter / flat_map / take only record a stage;
+                 nothing runs until a TERMINAL operation (to_list,
+                 sum, count, reduce, first, for_each, iteration)
+✅ ONE AT A TIME → elements flow through the whole pipeline one by
+                 one, so memory stays constant (unless you to_list())
+✅ FUSED       → all stages become ONE generated Python loop:
+
+        for x0 in source:
+            x1 = f0(x0)                 # .map(f0)
+            if f1(x1):                  # .filter(f1)
+                for x2 in f2(x1):       # .flat_map(f2)
+                    total += x2         # .sum()
+
+   instead of one generator per stage passing values along.
+   Generated loops are cached per pipeline SHAPE, so building
+   streams in a loop does not recompile anything.
+✅ INLINED     → a stage can also be an expression in x:
+
+        Stream(a).map("x ** 2").filter("x % 2 == 0")
+
+   is pasted into the loop as `x = (x ** 2)` / `if (x % 2 == 0):`,
+   so there is no function call per element at all: as fast as
+   the list comprehension, without building the list.
+============================================================
+"""
+
+import ast
+import builtins
+from collections import OrderedDict
+
+_MISSING = object()
+_MAX_NESTING = 15   # CPython allows 20 nested loops (and 100 indents) per function
+_NESTING = ("filter", "flat_map")
+
+# --------------------------------------------------------
+# 🧩 Code generation
+# --------------------------------------------------------
+# Terminal "sinks": (setup lines, statement per element, result expression)
+_SINKS = {
+    "iter":     ((), "yield x", ""),
+    "list":     (("out = []", "append = out.append", "extend = out.extend"),
+                 "append(x)", "out"),
+    "sum":      (("total = start",), "total += x", "total"),
+    "count":    (("n = 0",), "n += 1", "n"),
+    "reduce":   (("acc = start",),
+                 "acc = x if acc is MISSING else function(acc, x)", "acc"),
+    "first":    ((), "return x", "default"),
+    "for_each": ((), "action(x)", "None"),
+}
+
+_COMPILED = OrderedDict()   # (stage kinds, sink) → generated function, LRU order
+_MAX_COMPILED = 256
+
+
+def _name(kind):
+    """'map' for both a function stage ("map") and an expression one (("map", "x*2"))."""
+    return kind[0] if isinstance(kind, tuple) else kind
+
+
+def _check_expression(text):
+    """
+    An expression stage may only read x and builtins (it is inlined as
+    code). Returns the expression re-generated from its syntax tree, so
+    comments and line breaks in 'text' cannot leak into the loop.
+    """
+    tree = ast.parse(text.strip(), "<stream>", "eval")
+    if any(isinstance(node, ast.NamedExpr) for node in ast.walk(tree)):
+        # ':=' would assign to the generated loop's own variables (n, total ...)
+        raise SyntaxError(f"expression stage {text!r} may not use ':='; use a lambda instead")
+    stored = {node.id for node in ast.walk(tree)
+              if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load)}
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Name) and node.id not in stored and node.id != "x"
+                and not hasattr(builtins, node.id)):
+            raise NameError(f"expression stage {text!r} may only use x and builtins, "
+                            f"not {node.id!r}; use a lambda instead")
+    return ast.unparse(tree)
+
+
+def _compile(kinds, sink):
+    """Generate (once per shape) a function running 'kinds' into 'sink'."""
+    key = (kinds, sink)
+    function = _COMPILED.get(key)
+    if function is not None:
+        _COMPILED.move_to_end(key)
+        return function
+    setup, statement, result = _SINKS[sink]
+    stop = f"return {result}"
+    # Each stage is f{i}(x) for a function, or the inlined text of an
+    # expression stage, e.g. .map("x ** 2") → x = (x ** 2).
+    calls = [f"({kind[1]})" if isinstance(kind, tuple) else f"f{i}(x)"
+             for i, kind in enumerate(kinds)]
+    kinds = list(map(_name, kinds))
+    lines = ["def run(source, stages, start, function, action, default):"]
+    lines += ["    " + line for line in setup]
+    lines += [f"    f{i} = stages[{i}]" for i in range(len(kinds))]
+    for i, kind in enumerate(kinds):
+        if kind == "take":
+            lines.append(f"    k{i} = 0")
+            lines.append(f"    if f{i} <= 0: {stop}")
+    if sink == "list" and "take" not in kinds and kinds[-1:] != ["flat_map"]:
+        # A real list comprehension (no append() call per element);
+        # "for x in [...]" is compiled to a plain assignment.
+        clauses = {"map": "for x in [{}]", "filter": "if {}", "flat_map": "for x in {}"}
+        loop = " ".join(clauses[kind].format(call) for kind, call in zip(kinds, calls))
+        lines.append(f"    return [x for x in source {loop}]")
+        return _define(key, lines)
+    lines.append("    for x in source:")
+    if sink == "list" and kinds[-1:] == ["flat_map"]:
+        # last stage flattens straight into the list: out.extend(...) in C
+        kinds, statement = kinds[:-1], f"extend({calls[-1]})"
+    after = []                      # take checks, run after the inner stages
+    indent = 2
+    for i, kind in enumerate(kinds):
+        pad = "    " * indent
+        if kind == "map":
+            lines.append(f"{pad}x = {calls[i]}")
+        elif kind == "filter":
+            lines.append(f"{pad}if {calls[i]}:")
+            indent += 1
+        elif kind == "flat_map":
+            # rebinding x is safe: later stages only see the inner items
+            lines.append(f"{pad}for x in {calls[i]}:")
+            indent += 1
+        elif kind == "take":
+            lines.append(f"{pad}k{i} += 1")
+            after.append(f"{pad}if k{i} >= f{i}: {stop}")
+    lines.append("    " * indent + statement)
+    lines += reversed(after)
+    lines.append(f"    {stop}")
+    return _define(key, lines)
+
+
+def _define(key, lines):
+    namespace = {"MISSING": _MISSING}
+    exec("\n".join(lines), namespace)
+    function = _COMPILED[key] = namespace["run"]
+    if len(_COMPILED) > _MAX_COMPILED:
+        _COMPILED.popitem(last=False)   # least recently used shape
+    return function
+
+
+class Stream:
+    """
+    ============================================================
+    💡 CLASS: Stream
+    ------------------------------------------------------------
+    Description:
+        A lazy, composable pipeline over any iterable. Stages
+        are fused into a single generated loop when a terminal
+        operation runs.
+
+    Constructor:
+        Stream(source)      → any iterable (list, range, file, generator)
+        stream.over(other)  → the same stages over another source
+
+    Stages (lazy, each returns a NEW Stream):
+        map(f)              → f(x) for every x
+        filter(f)           → keep x when f(x) is true
+        flat_map(f)         → every item of f(x) (nested loops, flattening)
+        take(n)             → stop after n elements
+
+        f is a function, or an expression string using only x and
+        builtins ("x ** 2"), which is inlined into the loop
+        (no ":=": it would assign to the loop's own variables).
+
+    Terminals (run the pipeline):
+        to_list()  sum(start=0)  count()  reduce(f[, initial])
+        first(default=None)  for_each(action)  iter(stream)
+
+    Notes:
+        - The source is consumed once; a Stream over a list or range
+          can run again, one over a generator cannot.
+        - take(n) stops reading the source as soon as n elements
+          have passed that stage.
+        - Expression strings are run as code, like a lambda: write
+          them yourself, never build them from user input.
+    ============================================================
+    """
+
+    __slots__ = ("_source", "_kinds", "_stages")
+
+    def __init__(self, source, _kinds=(), _stages=()):
+        self._source = source
+        self._kinds = _kinds
+        self._stages = _stages
+
+    def _then(self, kind, stage):
+        if isinstance(stage, str):
+            kind = (kind, _check_expression(stage))     # errors now, not at the terminal
+        return Stream(self._source, self._kinds + (kind,), self._stages + (stage,))
+
+    # --------------------------------------------------------
+    # 🔗 Lazy stages
+    # --------------------------------------------------------
+    def map(self, function):
+        return self._then("map", function)
+
+    def filter(self, predicate):
+        return self._then("filter", predicate)
+
+    def flat_map(self, function):
+        return self._then("flat_map", function)
+
+    def take(self, n):
+        return self._then("take", n)
+
+    def over(self, source):
+        """The same stages over another source (build once, run on many)."""
+        return Stream(source, self._kinds, self._stages)
+
+    # --------------------------------------------------------
+    # 🏁 Terminal operations
+    # --------------------------------------------------------
+    def _run(self, sink, start=0, function=None, action=None, default=None):
+        source, kinds, stages = self._source, self._kinds, self._stages
+        if not kinds and sink in ("list", "sum"):
+            return list(source) if sink == "list" else sum(source, start)
+        # Nested too deep for one function: run the front part as a
+        # (fused) iterator and fuse the rest on top of it.
+        while True:
+            nested = [i for i, kind in enumerate(kinds) if _name(kind) in _NESTING]
+            if len(nested) < _MAX_NESTING:
+                break
+            cut = nested[_MAX_NESTING - 1]
+            source = _compile(kinds[:cut], "iter")(source, stages[:cut], 0, None, None, None)
+            kinds, stages = kinds[cut:], stages[cut:]
+        return _compile(kinds, sink)(source, stages, start, function, action, default)
+
+    def __iter__(self):
+        return self._run("iter")
+
+    def to_list(self):
+        return self._run("list")
+
+    def sum(self, start=0):
+        return self._run("sum", start=start)
+
+    def count(self):
+        return self._run("count")
+
+    def reduce(self, function, initial=_MISSING):
+        result = self._run("reduce", start=initial, function=function)
+        if result is _MISSING:
+            raise TypeError("reduce() of empty stream with no initial value")
+        return result
+
+    def first(self, default=None):
+        return self._run("first", default=default)
+
+    def for_each(self, action):
+        self._run("for_each", action=action)
+
+    def __repr__(self):
+        stages = "".join(f".{kind[0]}({kind[1]!r})" if isinstance(kind, tuple)
+                         else f".{kind}(...)" for kind in self._kinds)
+        return f"Stream({type(self._source).__name__}){stages}"
+
+
+if __name__ == "__main__":
+    # 1️⃣ Basic transformation        [val ** 2 for val in a]
+    a = [2, 3, 4, 5]
+    print(Stream(a).map(lambda val: val ** 2).to_list())        # [4, 9, 16, 25]
+    print(Stream(a).map("x ** 2").to_list())    # same, inlined: no call per element
+
+    # 2️⃣ With condition              [val for val in a if val % 2 == 0]
+    a = [2, 3, 4, 5, 6]
+    print(Stream(a).filter(lambda val: val % 2 == 0).to_list())  # [2, 4, 6]
+
+    # 3️⃣ With if–else                [x**2 if x%2==0 else x for x in a]
+    print(Stream(a).map(lambda x: x ** 2 if x % 2 == 0 else x).to_list())
+    # [4, 3, 16, 5, 36]
+
+    # 4️⃣ From range                  [i for i in range(10)]
+    print(Stream(range(10)).to_list())          # [0, 1, 2, ..., 9]
+
+    # 5️⃣ Nested loop                 [(i, j) for i in range(3) for j in range(3)]
+    print(Stream(range(3)).flat_map(lambda i: ((i, j) for j in range(3))).to_list())
+    # [(0, 0), (0, 1), (0, 2), (1, 0), ..., (2, 2)]
+
+    # 6️⃣ Flatten a matrix            [val for row in mat for val in row]
+    mat = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    print(Stream(mat).flat_map(lambda row: row).to_list())      # [1, 2, ..., 9]
+
+    # ♾️ Bigger than memory: nothing is stored, one element at a time
+    from itertools import count
+
+    even_squares = Stream(count()).map(lambda v: v ** 2).filter(lambda v: v % 2 == 0)
+    print(even_squares.take(5).to_list())       # [0, 4, 16, 36, 64]
+    print(Stream(range(10_000_000)).filter(lambda v: v % 3 == 0).count())   # 3333334
+    # count() is an iterator: the stream above goes on from where take(5) stopped
+    print(even_squares.take(2).to_list())       # [100, 144]
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Use Case            | List comprehension                      | Stream (lazy, fused)                              |
+|---------------------|-----------------------------------------|---------------------------------------------------|
+| Transformation      | [x**2 for x in a]                       | Stream(a).map(lambda x: x**2) or .map("x**2")     |
+| With condition      | [x for x in a if x%2==0]                | Stream(a).filter(lambda x: x%2==0)                |
+| With if–else        | [x**2 if x%2==0 else x for x in a]      | Stream(a).map(lambda x: x**2 if x%2==0 else x)    |
+| From range          | [i for i in range(10)]                  | Stream(range(10))                                 |
+| Nested loop         | [(i,j) for i in ... for j in ...]       | Stream(r).flat_map(lambda i: ((i,j) for j in r))  |
+| Flatten a matrix    | [val for row in mat for val in row]     | Stream(mat).flat_map(lambda row: row)             |
+| Memory              | Whole list                              | One element (until to_list())                     |
+| Result              | list, right away                        | Only on a terminal: to_list / sum / count / ...   |
+| Speed               | Fastest (expression inlined)            | Same with "x" expressions; lambdas add a call     |
+"""
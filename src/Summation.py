@@ -0,0 +1,280 @@
+# ============================================================
+# 🧮 TOPIC: ACCURATE & PARALLEL SUMMATION IN PYTHON
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+The other modules add numbers by folding them left to right:
+
+    sum([10, 5])                          → Add2No.py
+    reduce(lambda x, y: x + y, numbers)   → Lambda.py
+    while i <= n: sum += i                → WhileLoop.py
+
+That is fine for small integers, but for long lists of floats:
+
+❌ Every '+' rounds, so the error grows with the number of values.
+❌ Only ONE CPU core does the work.
+
+This module offers three more accurate modes and a parallel driver:
+
+1. exact_sum()    → correctly rounded result (like math.fsum)
+2. kahan_sum()    → compensated (Kahan–Neumaier) running sum
+3. pairwise_sum() → adds in a balanced tree, error grows ~log(n)
+4. parallel_sum() → splits big inputs into chunks across processes
+============================================================
+"""
+
+import math
+import os
+from itertools import chain, islice
+
+MODES = ("exact", "kahan", "pairwise")
+
+# ============================================================
+# 🧩 1️⃣ EXACT SUMMATION (math.fsum)
+# ============================================================
+def exact_sum(values):
+    """
+    ------------------------------------------------------------
+    🎯 Function: exact_sum
+    ------------------------------------------------------------
+    Description:
+        Returns the correctly rounded sum of the values. Internally
+        math.fsum keeps every lost low-order bit, so the answer is
+        as if the sum was done with infinite precision.
+
+    Returns:
+        float: The exact (correctly rounded) sum.
+    """
+    return math.fsum(values)
+
+
+def _exact_terms(values):
+    """
+    Return a short list of floats whose exact sum equals sum(values).
+
+    fsum() rounds once at the end; the rounding error of that step is
+    itself recovered with another fsum() pass, and so on until nothing
+    is left. Combining these terms from every chunk with one final fsum()
+    keeps a chunked (parallel) sum exact.
+    """
+    values = values if isinstance(values, (list, tuple)) else list(values)
+    terms = []
+    while True:
+        total = math.fsum(chain(values, (-t for t in terms)))
+        if total == 0.0:
+            return terms
+        terms.append(total)
+        if not math.isfinite(total):
+            return terms
+
+
+# ============================================================
+# 🧩 2️⃣ KAHAN (COMPENSATED) SUMMATION
+# ============================================================
+def kahan_sum(values):
+    """
+    ------------------------------------------------------------
+    🧷 Function: kahan_sum
+    ------------------------------------------------------------
+    Description:
+        Kahan–Neumaier summation. A second variable 'comp' collects
+        the low-order bits that each '+' would otherwise throw away
+        and adds them back at the end.
+
+    Returns:
+        float: The compensated sum.
+    """
+    total = 0.0
+    comp = 0.0
+    for x in values:
+        t = total + x
+        if abs(total) >= abs(x):
+            comp += (total - t) + x
+        else:
+            comp += (x - t) + total
+        total = t
+    return total + comp
+
+
+# ============================================================
+# 🧩 3️⃣ PAIRWISE (TREE) SUMMATION
+# ============================================================
+def pairwise_sum(values, block=128):
+    """
+    ------------------------------------------------------------
+    🌳 Function: pairwise_sum
+    ------------------------------------------------------------
+    Description:
+        Adds small blocks with the builtin sum(), then adds the block
+        results pair by pair (like a balanced tree). The rounding
+        error grows with log(n) instead of n.
+
+    Parameters:
+        values: Numbers to add (any iterable)
+        block (int): Size of the leaf blocks summed directly
+
+    Returns:
+        The pairwise sum (0.0 for an empty input).
+    """
+    it = iter(values)
+    level = []
+    while True:
+        chunk = list(islice(it, block))
+        if not chunk:
+            break
+        level.append(sum(chunk))
+    if not level:
+        return 0.0
+    while len(level) > 1:
+        pairs = [level[i] + level[i + 1] for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            pairs.append(level[-1])
+        level = pairs
+    return level[0]
+
+
+# ============================================================
+# 🧩 4️⃣ CHUNK-PARALLEL SUMMATION
+# ============================================================
+def _chunk_partial(mode, chunk):
+    """Worker: reduce one chunk to its partial result(s)."""
+    if mode == "exact":
+        return _exact_terms(chunk)
+    if mode == "kahan":
+        return [kahan_sum(chunk)]
+    return [pairwise_sum(chunk)]
+
+
+def _combine(mode, partials):
+    if mode == "exact":
+        return math.fsum(partials)
+    if mode == "kahan":
+        return kahan_sum(partials)
+    return pairwise_sum(partials)
+
+
+def parallel_sum(values, mode="exact", chunk_size=1_000_000, workers=None):
+    """
+    ------------------------------------------------------------
+    ⚡ Function: parallel_sum
+    ------------------------------------------------------------
+    Description:
+        Splits 'values' into chunks of 'chunk_size', reduces every
+        chunk on a worker process and combines the partial results
+        with the same mode. Inputs that fit in one chunk are summed
+        in the current process (no pool start-up cost).
+
+        In "exact" mode each chunk returns the terms of its exact sum,
+        so the final answer is still correctly rounded.
+
+    Parameters:
+        values: Numbers to add (a list/tuple/array is sliced directly,
+                other iterables are materialized first)
+        mode (str): "exact", "kahan" or "pairwise"
+        chunk_size (int): Number of values per worker task
+        workers (int): Number of processes (default: os.cpu_count())
+
+    Raises:
+        ValueError: For an unknown mode or a non-positive chunk_size.
+
+    Returns:
+        float: The sum of all values.
+    """
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}, got {mode!r}")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if not hasattr(values, "__getitem__") or not hasattr(values, "__len__"):
+        values = list(values)
+
+    n = len(values)
+    if n <= chunk_size:
+        return _combine(mode, _chunk_partial(mode, values))
+
+    from concurrent.futures import ProcessPoolExecutor   # lazy: heavy import
+
+    chunks = [values[i:i + chunk_size] for i in range(0, n, chunk_size)]
+    workers = min(workers or os.cpu_count() or 1, len(chunks))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_chunk_partial, [mode] * len(chunks), chunks)
+        partials = [p for part in results for p in part]
+    return _combine(mode, partials)
+
+
+# ============================================================
+# 📊 BENCHMARK AGAINST THE EXISTING IDIOMS
+# ============================================================
+def benchmark(n=1_000_000, repeat=3):
+    """
+    Time and compare the error of the three existing idioms
+    (sum(), reduce(lambda ...), while-loop) with this module.
+
+    Returns:
+        list[tuple[str, float, float]]: (name, best seconds, abs error)
+    """
+    import random
+    import timeit
+    from fractions import Fraction
+    from functools import reduce
+
+    rng = random.Random(42)
+    values = [rng.uniform(-1, 1) * 10 ** rng.randint(-8, 8) for _ in range(n)]
+    truth = float(sum(map(Fraction, values)))
+
+    def while_loop():
+        total = 0
+        i = 0
+        while i < n:
+            total += values[i]
+            i += 1
+        return total
+
+    candidates = [
+        ("sum()", lambda: sum(values)),
+        ("reduce(lambda)", lambda: reduce(lambda x, y: x + y, values)),
+        ("while loop", while_loop),
+        ("exact_sum", lambda: exact_sum(values)),
+        ("kahan_sum", lambda: kahan_sum(values)),
+        ("pairwise_sum", lambda: pairwise_sum(values)),
+        ("parallel_sum", lambda: parallel_sum(values, chunk_size=max(1, n // 4))),
+    ]
+    rows = []
+    for name, fn in candidates:
+        seconds = min(timeit.repeat(fn, number=1, repeat=repeat))
+        rows.append((name, seconds, abs(fn() - truth)))
+    return rows
+
+
+if __name__ == "__main__":
+    numbers = [0.1] * 10
+
+    print(sum(numbers))           # Output: 0.9999999999999999
+    print(exact_sum(numbers))     # Output: 1.0
+    print(kahan_sum(numbers))     # Output: 1.0
+    print(pairwise_sum(numbers))  # Output: 0.9999999999999999 (one block)
+
+    big = [0.1] * 3_000_000
+    print(parallel_sum(big, chunk_size=1_000_000))  # Output: 300000.0
+
+    print(f"{'Idiom':<16}{'Best (s)':>10}{'Abs error':>14}")
+    for name, seconds, error in benchmark(200_000):
+        print(f"{name:<16}{seconds:>10.4f}{error:>14.3e}")
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Function       | Accuracy                    | Speed             | Cores |
+|----------------|-----------------------------|-------------------|-------|
+| sum()          | Error grows with n          | Fastest (C loop)  | 1     |
+| exact_sum()    | Correctly rounded           | Fast (C loop)     | 1     |
+| kahan_sum()    | Almost exact                | Slow (Python loop)| 1     |
+| pairwise_sum() | Error grows with log(n)     | Fast (C blocks)   | 1     |
+| parallel_sum() | Same as the chosen mode     | Scales with cores | many  |
+
+✔ Use exact_sum() for money/ledger totals made of floats.
+✔ Use parallel_sum() only for really big inputs (process start-up costs time).
+"""
@@ -0,0 +1,298 @@
+# ============================================================
+# 📦 TOPIC: PACKED BINARY TUPLES  (schema + struct)
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+Tuple.py uses fixed-shape tuples as records:
+
+    person = ("Vinay", 28, "Developer")
+
+Sending many of them to another process with pickle (one call per
+tuple) repeats the type information in every message and costs a
+Python call per row.
+
+Because every row has the SAME shape, a schema can describe it once:
+
+    codec = TupleCodec((str, int, str))
+
+✅ encode_many(rows) → ONE contiguous bytes buffer:
+       [header][column 0][column 1]...[string heap]
+   each column is one struct-packed block (e.g. 8 bytes per age);
+   strings go to a heap and their column keeps (offset, length)
+   pairs; a column of repeated values ("Developer", "Tester") stores
+   each distinct string once, a column of distinct names is stored
+   NUL-separated so it decodes with ONE str.split()
+✅ decode_many(buffer) → list of tuples; whole columns are unpacked
+   by single struct calls instead of one call per row
+✅ PackedTuples(codec, buffer) reads row i / field j straight from a
+   memoryview, without decoding the rest of the buffer
+============================================================
+"""
+
+import struct
+from collections.abc import Sequence
+from itertools import accumulate, repeat
+from operator import add
+
+PERSON_SCHEMA = (str, int, str)        # ("Vinay", 28, "Developer")
+
+_HEADER = struct.Struct("<4sQ")        # magic, row count (+ one mode byte per field)
+_MAGIC = b"TPK2"
+_FORMATS = {int: "q", float: "d", bool: "?"}
+_SCALARS = "bBhHiIlLqQefd?"            # one-letter formats that hold ONE value
+_TEXT = (str, bytes)
+_REF = "I"                             # heap offsets and lengths (4 bytes each)
+
+# How a str / bytes column is laid out in the heap:
+_JOINED = 1     # every value in row order, each followed by NUL → one split()
+_DISTINCT = 2   # each distinct value once (columns like "Developer", "Tester")
+_SAMPLE = 64    # rows looked at to guess whether a column repeats itself
+
+
+def _unpack_column(fmt, count, view, offset):
+    return struct.unpack_from(f"<{count}{fmt}", view, offset)
+
+
+def _pack_refs(count, offsets, lengths):
+    return (struct.pack(f"<{count}{_REF}", *offsets),
+            struct.pack(f"<{count}{_REF}", *lengths))
+
+
+class TupleCodec:
+    """
+    ============================================================
+    💡 CLASS: TupleCodec
+    ------------------------------------------------------------
+    Description:
+        Packs tuples that all follow one schema into a single
+        buffer, and unpacks them again.
+
+    Constructor:
+        TupleCodec(schema=PERSON_SCHEMA)
+            schema : one entry per field: int, float, bool, str,
+                     bytes, or a one-letter numeric struct format
+                     ("i", "H", "f" ...: one of bBhHiIlLqQefd?)
+
+    Methods:
+        encode_many(rows) → bytes      decode_many(buffer) → list
+        encode(row)       → bytes      decode(buffer)      → tuple
+        view(buffer)      → PackedTuples (lazy, in-place reads)
+
+    Notes:
+        - str values are UTF-8; a buffer can hold up to 4 GiB of text.
+    ============================================================
+    """
+
+    def __init__(self, schema=PERSON_SCHEMA):
+        self.schema = tuple(schema)
+        self._formats = []                  # struct format of each column
+        for kind in self.schema:
+            fmt = _REF if kind in _TEXT else _FORMATS.get(kind, kind)
+            if not (isinstance(fmt, str) and len(fmt) == 1 and fmt in _SCALARS):
+                raise TypeError(f"unsupported field type {kind!r}")
+            self._formats.append(fmt)
+        # str / bytes fields take two columns: heap offsets and lengths
+        self._widths = [struct.calcsize(fmt) * (2 if kind in _TEXT else 1)
+                        for kind, fmt in zip(self.schema, self._formats)]
+        self.row_size = sum(self._widths)
+
+    def _layout(self, count):
+        """Start of every column block, and of the heap, for 'count' rows."""
+        starts = list(accumulate((count * width for width in self._widths),
+                                 initial=_HEADER.size + len(self.schema)))
+        return starts[:-1], starts[-1]
+
+    # --------------------------------------------------------
+    # 📤 Encoding (column by column: zip / map / struct run in C)
+    # --------------------------------------------------------
+    def encode_many(self, rows):
+        """Pack every row into one bytes object."""
+        rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+        width, count = len(self.schema), len(rows)
+        if rows and set(map(len, rows)) != {width}:
+            raise ValueError(f"every row must have {width} fields")
+        columns = zip(*rows) if rows else [()] * width
+        parts, heap, size, modes = [], [], 0, bytearray(width)
+        for i, (kind, fmt, column) in enumerate(zip(self.schema, self._formats, columns)):
+            if kind not in _TEXT:
+                parts.append(struct.pack(f"<{count}{fmt}", *column))
+                continue
+            encode, sep = (str.encode if kind is str else bytes), b"\0"
+            sample = column[:_SAMPLE]
+            if len(set(sample)) * 2 > len(sample):
+                # Mostly distinct: store in row order, NUL-separated, so
+                # decode_many() can split the whole column in one call.
+                data = list(map(encode, column))
+                lengths = list(map(len, data))
+                joined = sep.join(data) + sep
+                if joined.count(sep) == count:          # no NUL inside a value
+                    modes[i] = _JOINED
+                    offsets = list(accumulate(map(add, lengths, repeat(1)), initial=size))
+                    size = offsets.pop()
+                    heap.append(joined)
+                    parts += _pack_refs(count, offsets, lengths)
+                    continue
+            modes[i] = _DISTINCT
+            distinct = dict.fromkeys(column)
+            data = list(map(encode, distinct))
+            lengths = list(map(len, data))
+            offsets = list(accumulate(lengths, initial=size))
+            size = offsets.pop()
+            heap += data
+            offset_of = dict(zip(distinct, offsets))
+            length_of = dict(zip(distinct, lengths))
+            parts += _pack_refs(count, map(offset_of.__getitem__, column),
+                                map(length_of.__getitem__, column))
+        return b"".join([_HEADER.pack(_MAGIC, count), modes] + parts + heap)
+
+    def encode(self, row):
+        return self.encode_many((row,))
+
+    # --------------------------------------------------------
+    # 📥 Decoding
+    # --------------------------------------------------------
+    def _header(self, view):
+        magic, count = _HEADER.unpack_from(view)
+        if magic != _MAGIC:
+            raise ValueError("not a TupleCodec buffer")
+        starts, heap_start = self._layout(count)
+        if len(view) < heap_start:
+            raise ValueError("buffer is shorter than its row count says")
+        modes = view[_HEADER.size:_HEADER.size + len(self.schema)].tobytes()
+        return count, starts, heap_start, modes
+
+    def decode_many(self, buffer):
+        """Unpack every row of a buffer made by encode_many()."""
+        view = memoryview(buffer).cast("B")
+        count, starts, heap_start, modes = self._header(view)
+        if not count:
+            return []
+        heap = view[heap_start:]
+        columns = []
+        for kind, fmt, start, mode in zip(self.schema, self._formats, starts, modes):
+            if kind not in _TEXT:
+                columns.append(_unpack_column(fmt, count, view, start))
+                continue
+            offsets = _unpack_column(_REF, count, view, start)
+            lengths = _unpack_column(_REF, count, view, start + count * struct.calcsize(_REF))
+            if mode == _JOINED:
+                part = heap[offsets[0]:offsets[-1] + lengths[-1]].tobytes()
+                values = part.decode().split("\0") if kind is str else part.split(b"\0")
+            else:
+                refs = list(zip(offsets, lengths))
+                cast = (lambda raw: str(raw, "utf-8")) if kind is str else bytes
+                decoded = {ref: cast(heap[ref[0]:ref[0] + ref[1]]) for ref in dict.fromkeys(refs)}
+                values = map(decoded.__getitem__, refs)
+            columns.append(values)
+        return list(zip(*columns))
+
+    def decode(self, buffer):
+        return self.decode_many(buffer)[0]
+
+    def view(self, buffer):
+        return PackedTuples(self, buffer)
+
+
+class PackedTuples(Sequence):
+    """
+    ============================================================
+    💡 CLASS: PackedTuples
+    ------------------------------------------------------------
+    Description:
+        A read-only sequence over an encoded buffer. Rows and
+        single fields are unpacked from the memoryview on access.
+
+    Methods:
+        rows[i]         → tuple (only row i is decoded)
+        field(i, j)     → field j of row i
+        column(j)       → iterator over field j of every row
+    ============================================================
+    """
+
+    def __init__(self, codec, buffer):
+        self._codec = codec
+        self._view = memoryview(buffer).cast("B")
+        self._count, self._starts, heap_start, _ = codec._header(self._view)
+        self._heap = self._view[heap_start:]
+        self._fields = [struct.Struct("<" + fmt) for fmt in codec._formats]
+
+    def __len__(self):
+        return self._count
+
+    def _index(self, i):
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("PackedTuples index out of range")
+        return i
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        i = self._index(index)
+        return tuple(self._field(i, j) for j in range(len(self._fields)))
+
+    def _field(self, i, j):
+        field = self._fields[j]
+        start = self._starts[j]
+        value = field.unpack_from(self._view, start + i * field.size)[0]
+        kind = self._codec.schema[j]
+        if kind not in _TEXT:
+            return value
+        lengths = start + self._count * field.size
+        length = field.unpack_from(self._view, lengths + i * field.size)[0]
+        raw = self._heap[value:value + length]
+        return str(raw, "utf-8") if kind is str else bytes(raw)
+
+    def field(self, i, j):
+        return self._field(self._index(i), j)
+
+    def column(self, j):
+        for i in range(self._count):
+            yield self._field(i, j)
+
+    def __repr__(self):
+        return f"PackedTuples({self._count} rows, schema={self._codec.schema})"
+
+
+if __name__ == "__main__":
+    import json
+    import pickle
+
+    person = ("Vinay", 28, "Developer")
+    codec = TupleCodec((str, int, str))
+
+    packed = codec.encode(person)
+    print(codec.decode(packed))        # ('Vinay', 28, 'Developer')
+
+    rows = [(f"user{i}", 20 + i % 40, "Developer" if i % 2 else "Tester")
+            for i in range(100_000)]
+    buffer = codec.encode_many(rows)
+    print(codec.decode_many(buffer) == rows)    # True
+
+    # 📖 In-place reads: only the touched row / field is decoded
+    table = codec.view(buffer)
+    print(table[99_999])               # ('user99999', 59, 'Developer')
+    print(table.field(5, 1))           # 25
+
+    # 📏 Size compared with pickle (one call per row) and JSON
+    per_row_pickle = sum(len(pickle.dumps(row)) for row in rows)
+    as_json = len(json.dumps(rows).encode())
+    print(f"pickle per row : {per_row_pickle / len(rows):.1f} bytes/row")   # ~38
+    print(f"json           : {as_json / len(rows):.1f} bytes/row")          # ~30
+    print(f"TupleCodec     : {len(buffer) / len(rows):.1f} bytes/row")      # ~34
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Feature               | pickle (per row)     | JSON            | TupleCodec                    |
+|-----------------------|----------------------|-----------------|-------------------------------|
+| Schema stored         | In every message     | Implicit        | Once, in the codec            |
+| Repeated strings      | Memoized per message | Every time      | Once per column (string heap) |
+| Read one row / field  | Unpickle it          | Parse all       | O(1) from a memoryview        |
+| Output                | Many small bytes     | One str         | One contiguous buffer         |
+"""
@@ -16,8 +16,9 @@
 def greet(name: str, age: int) -> str:
     return f"Hello {name}, you are {age} years old."
 
-message = greet("Vinay", 25)
-print(message)   # Output: Hello Vinay, you are 25 years old.
+if __name__ == "__main__":
+    message = greet("Vinay", 25)
+    print(message)   # Output: Hello Vinay, you are 25 years old.
 
 
 # ------------------------------------------------------------
@@ -31,8 +32,9 @@ from typing import List, Dict, Optional, Union
 def process_scores(scores: List[int]) -> Dict[str, int]:
     return {"max": max(scores), "min": min(scores)}
 
-result = process_scores([45, 67, 89])
-print(result)   # Output: {'max': 89, 'min': 45}
+if __name__ == "__main__":
+    result = process_scores([45, 67, 89])
+    print(result)   # Output: {'max': 89, 'min': 45}
 
 
 # Example 2: Optional Type (Nullable value, like Java Optional)
@@ -41,15 +43,17 @@ def find_user(id: int) -> Optional[str]:
         return "Vinay"
     return None
 
-print(find_user(1))   # Output: Vinay
-print(find_user(2))   # Output: None
+if __name__ == "__main__":
+    print(find_user(1))   # Output: Vinay
+    print(find_user(2))   # Output: None
 
 
 # Example 3: Union Type (Multiple allowed types)
 def add(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
     return a + b
 
-print(add(10, 5.5))   # Output: 15.5
+if __name__ == "__main__":
+    print(add(10, 5.5))   # Output: 15.5
 
 
 # Python 3.10+ allows shorter syntax using '|'
@@ -64,7 +68,8 @@ def add_v2(a: int | float, b: int | float) -> int | float:
 def show_type(value: int):
     print(value)
 
-show_type("Hello")    # ✅ Works fine, though logically wrong
+if __name__ == "__main__":
+    show_type("Hello")    # ✅ Works fine, though logically wrong
 # (It will NOT throw an error — type hints are ignored at runtime)
 
 
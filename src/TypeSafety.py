@@ -8,24 +8,25 @@
 # multiple elements. Unlike Java’s ArrayList or arrays, Python lists
 # are *heterogeneous* — meaning they can store mixed data types.
 
-list_ex = [1, 2, 3, "Vinay", True]
-print(list_ex)
-# Output: [1, 2, 3, 'Vinay', True]
+if __name__ == "__main__":
+    list_ex = [1, 2, 3, "Vinay", True]
+    print(list_ex)
+    # Output: [1, 2, 3, 'Vinay', True]
 
-# This runs perfectly because Python is *dynamically typed*.
-# That means it checks types at runtime, not at compile time.
+    # This runs perfectly because Python is *dynamically typed*.
+    # That means it checks types at runtime, not at compile time.
 
 
-# ⚠️ 2. POTENTIAL ISSUE WITH MIXED TYPES
-# ------------------------------------------------------------
-# The flexibility of storing different data types can lead to
-# runtime errors or incorrect results if data types get mixed up
-# unintentionally.
+    # ⚠️ 2. POTENTIAL ISSUE WITH MIXED TYPES
+    # ------------------------------------------------------------
+    # The flexibility of storing different data types can lead to
+    # runtime errors or incorrect results if data types get mixed up
+    # unintentionally.
 
-numbers = [1, 2, "3", 4]   # "3" is a string instead of an integer
-total = 0
-for n in numbers:
-    total += n             # ❌ Will fail at runtime
+    numbers = [1, 2, "3", 4]   # "3" is a string instead of an integer
+    total = 0
+    for n in numbers:
+        total += n             # ❌ Will fail at runtime
 
 # Output:
 # TypeError: unsupported operand type(s) for +=: 'int' and 'str'
@@ -62,7 +63,8 @@ def calculate_sum_safe(numbers):
             raise TypeError(f"Invalid element {n} of type {type(n)}")
     return sum(numbers)
 
-print(calculate_sum_safe([1, 2, 3]))      # ✅ Works fine
+if __name__ == "__main__":
+    print(calculate_sum_safe([1, 2, 3]))      # ✅ Works fine
 # print(calculate_sum_safe([1, "2", 3]))  # ❌ Raises TypeError
 
 
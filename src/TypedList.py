@@ -0,0 +1,293 @@
+# ============================================================
+# 🧱 TOPIC: TYPED, ARRAY-BACKED LIST  —  TypedList[int]
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+List.py shows two separate ideas:
+
+    numbers: List[int] = [1, 2, 3]      → type hint, NOT enforced
+    arr = array.array('i', [1, 2, 3])   → compact, but no type hint
+
+A normal list stores one pointer (8 bytes) per element PLUS a full
+int object (~28 bytes) per element. TypedList joins both ideas:
+
+✅ TypedList[int] picks the array.array typecode from the type hint
+✅ values are stored unboxed: 8 bytes per int ('q'), 4 with typecode='i'
+✅ wrong-typed values are rejected on write (like Java's List<Integer>)
+✅ append, insert, slicing, iteration — everything a list can do
+============================================================
+"""
+
+import array
+from collections.abc import MutableSequence
+
+# Type hint → (default array typecode, allowed typecodes)
+_TYPECODES = {
+    int: ("q", "bBhHiIlLqQ"),
+    float: ("d", "fd"),
+    bool: ("B", "bB"),
+}
+
+
+def _check_int(value):
+    if type(value) is int or (isinstance(value, int) and not isinstance(value, bool)):
+        return value
+    raise TypeError(f"TypedList[int] accepts int, not {type(value).__name__}")
+
+
+def _check_float(value):
+    if type(value) is float:
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    raise TypeError(f"TypedList[float] accepts float or int, not {type(value).__name__}")
+
+
+def _check_bool(value):
+    if isinstance(value, bool):
+        return value
+    raise TypeError(f"TypedList[bool] accepts bool, not {type(value).__name__}")
+
+
+_CHECKS = {int: _check_int, float: _check_float, bool: _check_bool}
+
+
+def _rebuild(item_type, typecode, raw):
+    """Pickle helper: recreate a TypedList from its raw bytes."""
+    data = array.array(typecode)
+    data.frombytes(raw)
+    return TypedList[item_type]._from_array(data)
+
+
+class TypedList(MutableSequence):
+    """
+    ============================================================
+    💡 CLASS: TypedList[T]
+    ------------------------------------------------------------
+    Description:
+        A list that only accepts values of type T and keeps them in
+        one contiguous array.array buffer.
+
+        Supported T: int, float, bool
+
+    Usage:
+        nums = TypedList[int]([1, 2, 3])          # 8 bytes / element
+        small = TypedList[int]([1, 2], typecode="i")   # 4 bytes / element
+        nums.append("hello")                      # ❌ TypeError
+
+    Notes:
+        - Slicing returns a new TypedList of the same type.
+        - memoryview(nums.array) gives zero-copy access to the buffer.
+    ============================================================
+    """
+
+    item_type = None
+    _specialized = {}
+
+    __slots__ = ("_data",)
+
+    def __class_getitem__(cls, item_type):
+        """TypedList[int] → a cached subclass bound to 'int'."""
+        if item_type not in _TYPECODES:
+            names = ", ".join(t.__name__ for t in _TYPECODES)
+            raise TypeError(f"TypedList supports {names}, not {item_type!r}")
+        try:
+            return cls._specialized[item_type]
+        except KeyError:
+            sub = type(f"TypedList[{item_type.__name__}]", (cls,),
+                       {"item_type": item_type, "__slots__": ()})
+            cls._specialized[item_type] = sub
+            return sub
+
+    def __init__(self, values=(), typecode=None):
+        if self.item_type is None:
+            raise TypeError("use TypedList[int], TypedList[float] or TypedList[bool]")
+        default, allowed = _TYPECODES[self.item_type]
+        typecode = typecode or default
+        if typecode not in allowed:
+            raise ValueError(
+                f"typecode {typecode!r} cannot hold {self.item_type.__name__} "
+                f"(allowed: {', '.join(allowed)})"
+            )
+        self._data = array.array(typecode)
+        self.extend(values)
+
+    @classmethod
+    def _from_array(cls, data):
+        obj = cls.__new__(cls)
+        obj._data = data
+        return obj
+
+    # --------------------------------------------------------
+    # 📏 Size & buffer
+    # --------------------------------------------------------
+    @property
+    def typecode(self):
+        return self._data.typecode
+
+    @property
+    def itemsize(self):
+        """Bytes used per element."""
+        return self._data.itemsize
+
+    @property
+    def nbytes(self):
+        """Bytes used by the element buffer."""
+        return self._data.itemsize * len(self._data)
+
+    @property
+    def array(self):
+        """The underlying array.array (shared, not copied)."""
+        return self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    # --------------------------------------------------------
+    # 📖 Reading
+    # --------------------------------------------------------
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_array(self._data[index])
+        value = self._data[index]
+        return bool(value) if self.item_type is bool else value
+
+    def __iter__(self):
+        if self.item_type is bool:
+            return map(bool, self._data)
+        return iter(self._data)
+
+    def __contains__(self, value):
+        return value in self._data
+
+    def index(self, value, start=0, stop=None):
+        return self._data.index(value, start, len(self._data) if stop is None else stop)
+
+    def count(self, value):
+        return self._data.count(value)
+
+    # --------------------------------------------------------
+    # ✏️ Writing (every value is type-checked)
+    # --------------------------------------------------------
+    def _check(self, value):
+        return _CHECKS[self.item_type](value)
+
+    def _trusted(self, values):
+        """
+        'values' as an array that can be copied without checking each
+        element, or None. The typecode alone is not enough: a
+        TypedList[int] and a TypedList[bool] can both use 'B', and a raw
+        array holds ints, never bools.
+        """
+        if isinstance(values, TypedList):
+            if values.item_type is self.item_type and values.typecode == self.typecode:
+                return values._data
+        elif (isinstance(values, array.array) and values.typecode == self.typecode
+                and self.item_type is not bool):
+            return values
+        return None
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            trusted = self._trusted(value)
+            if trusted is not None:
+                self._data[index] = trusted
+            else:
+                self._data[index] = array.array(self.typecode, map(self._check, value))
+        else:
+            self._data[index] = self._check(value)
+
+    def __delitem__(self, index):
+        del self._data[index]
+
+    def insert(self, index, value):
+        self._data.insert(index, self._check(value))
+
+    def append(self, value):
+        self._data.append(self._check(value))
+
+    def extend(self, values):
+        trusted = self._trusted(values)
+        if trusted is not None:
+            self._data.extend(trusted)      # same type and layout: no per-element check
+        else:
+            self._data.extend(map(self._check, values))
+
+    def pop(self, index=-1):
+        value = self._data.pop(index)
+        return bool(value) if self.item_type is bool else value
+
+    def clear(self):
+        del self._data[:]
+
+    def reverse(self):
+        self._data.reverse()
+
+    # --------------------------------------------------------
+    # ⚖️ Comparison, copying, printing
+    # --------------------------------------------------------
+    def __eq__(self, other):
+        if isinstance(other, TypedList):
+            return self.item_type is other.item_type and self._data == other._data
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __add__(self, other):
+        result = self.copy()
+        result.extend(other)
+        return result
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def copy(self):
+        return self._from_array(array.array(self.typecode, self._data))
+
+    __copy__ = copy
+
+    def __reduce__(self):
+        return _rebuild, (self.item_type, self.typecode, self._data.tobytes())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+if __name__ == "__main__":
+    import sys
+
+    # ✅ Only ints are accepted
+    numbers = TypedList[int]([1, 2, 3])
+    numbers.append(4)
+    numbers.insert(0, 0)
+    print(numbers)          # Output: TypedList[int]([0, 1, 2, 3, 4])
+    print(numbers[1:4])     # Output: TypedList[int]([1, 2, 3])
+
+    try:
+        numbers.append("hello")
+    except TypeError as e:
+        print("❌", e)      # Output: ❌ TypedList[int] accepts int, not str
+
+    # 📏 Memory: list of boxed ints vs TypedList
+    n = 1_000_000
+    plain = list(range(n))
+    boxed = sys.getsizeof(plain) + sum(sys.getsizeof(x) for x in plain)
+    compact = TypedList[int](range(n), typecode="i")
+    print(f"list[int]      : {boxed / n:.1f} bytes per element")      # ~36
+    print(f"TypedList[int] : {compact.nbytes / n:.1f} bytes per element")  # 4.0
+
+# ============================================================
+# ✅ SUMMARY
+# ============================================================
+"""
+| Feature                  | list (List[int] hint) | array.array('q') | TypedList[int]      |
+|--------------------------|-----------------------|------------------|---------------------|
+| Type checked on write    | ❌ No                 | ⚠️ Partly        | ✅ Yes (TypeError)  |
+| Bytes per int element    | ~36 (8 + 28)          | 8                | 8 (4 with 'i')      |
+| Type hint                | ✅ Yes                | ❌ No            | ✅ Yes              |
+| Slicing / iteration      | ✅                    | ✅               | ✅                  |
+"""
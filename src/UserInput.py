@@ -6,89 +6,121 @@
 # 1️⃣ Basic Input
 # -----------------------------------------------
 # input() always returns data as a string.
-name = input("Enter your name: ")
-print("Hello,", name)
-
-# Example:
-# Enter your name: Vinay
-# Output: Hello, Vinay
-
-
-# -----------------------------------------------
-# 2️⃣ Type Conversion (Casting)
-# -----------------------------------------------
-# Convert string input to integer or float explicitly
-age = int(input("Enter your age: "))
-height = float(input("Enter your height in meters: "))
-print("Age:", age, "Height:", height)
-
-# Example:
-# Enter your age: 25
-# Enter your height in meters: 1.75
-# Output: Age: 25 Height: 1.75
-
-
-# -----------------------------------------------
-# 3️⃣ Evaluating Expressions with eval()
-# -----------------------------------------------
-# eval() automatically detects and evaluates valid Python expressions.
-num = eval(input("Enter a number or expression: "))
-print("Result:", num)
-
-# Example:
-# Enter a number or expression: 5 + 10
-# Output: Result: 15
-
-# ⚠️ Important Note:
-# eval() only works with VALID Python expressions.
-# For example:
-# Enter a number or expression: hjghj
-# → NameError: name 'hjghj' is not defined
-#
-# Because Python assumes 'hjghj' is a variable name, not text.
-# To make it valid, wrap it in quotes:
-# Enter a number or expression: "hjghj"
-# Output: hjghj
-#
-# 💡 If you want to accept any random text safely,
-# simply use input() instead of eval().
-
-
-# -----------------------------------------------
-# 4️⃣ Multiple Inputs in One Line using .split()
-# -----------------------------------------------
-# .split() splits a string into a list based on spaces (default) or a custom delimiter.
-
-# Example 1: Space-separated input
-data = input("Enter three numbers separated by space: ").split()
-print("List of inputs:", data)
-
-# Convert all to integers
-nums = [int(x) for x in data]
-print("Numbers as integers:", nums)
-print("Sum of numbers:", sum(nums))
-
-# Example:
-# Enter three numbers separated by space: 10 20 30
-# Output:
-# List of inputs: ['10', '20', '30']
-# Numbers as integers: [10, 20, 30]
-# Sum of numbers: 60
-
-# Example 2: Comma-separated input
-names = input("Enter names separated by commas: ").split(",")
-print("Names list:", names)
-
-# Example:
-# Enter names separated by commas: Alice,Bob,Charlie
-# Output: Names list: ['Alice', 'Bob', 'Charlie']
+if __name__ == "__main__":
+    name = input("Enter your name: ")
+    print("Hello,", name)
+
+    # Example:
+    # Enter your name: Vinay
+    # Output: Hello, Vinay
+
+
+    # -----------------------------------------------
+    # 2️⃣ Type Conversion (Casting)
+    # -----------------------------------------------
+    # Convert string input to integer or float explicitly
+    age = int(input("Enter your age: "))
+    height = float(input("Enter your height in meters: "))
+    print("Age:", age, "Height:", height)
+
+    # Example:
+    # Enter your age: 25
+    # Enter your height in meters: 1.75
+    # Output: Age: 25 Height: 1.75
+
+
+    # -----------------------------------------------
+    # 3️⃣ Evaluating Expressions with eval()
+    # -----------------------------------------------
+    # eval() automatically detects and evaluates valid Python expressions,
+    # but ANY expression, e.g. __import__("os").remove("data.txt").
+    # safe_eval() (SafeEval.py) allows only arithmetic, comparisons and a
+    # few math functions, and caches the parsed expression.
+    from SafeEval import safe_eval
+    num = safe_eval(input("Enter a number or expression: "))
+    print("Result:", num)
+
+    # Example:
+    # Enter a number or expression: 5 + 10
+    # Output: Result: 15
+
+    # ⚠️ Important Note:
+    # eval() only works with VALID Python expressions.
+    # For example:
+    # Enter a number or expression: hjghj
+    # → NameError: name 'hjghj' is not defined
+    #
+    # Because Python assumes 'hjghj' is a variable name, not text.
+    # To make it valid, wrap it in quotes:
+    # Enter a number or expression: "hjghj"
+    # Output: hjghj
+    #
+    # 💡 If you want to accept any random text safely,
+    # simply use input() instead of eval().
+    # Enter a number or expression: __import__("os")
+    # → ValueError: calling '__import__' is not allowed (safe_eval)
+
+
+    # -----------------------------------------------
+    # 4️⃣ Multiple Inputs in One Line using .split()
+    # -----------------------------------------------
+    # .split() splits a string into a list based on spaces (default) or a custom delimiter.
+
+    # Example 1: Space-separated input
+    data = input("Enter three numbers separated by space: ").split()
+    print("List of inputs:", data)
+
+    # Convert all to integers
+    nums = [int(x) for x in data]
+    print("Numbers as integers:", nums)
+    print("Sum of numbers:", sum(nums))
+
+    # Example:
+    # Enter three numbers separated by space: 10 20 30
+    # Output:
+    # List of inputs: ['10', '20', '30']
+    # Numbers as integers: [10, 20, 30]
+    # Sum of numbers: 60
+
+    # Example 2: Comma-separated input
+    names = input("Enter names separated by commas: ").split(",")
+    print("Names list:", names)
+
+    # Example:
+    # Enter names separated by commas: Alice,Bob,Charlie
+    # Output: Names list: ['Alice', 'Bob', 'Charlie']
+
+
+    # -----------------------------------------------
+    # 5️⃣ Bulk Input from a Pipe or File
+    # -----------------------------------------------
+    # input() reads ONE line per call. For thousands or millions of numbers
+    # (e.g. `cat numbers.txt | python UserInput.py`) use BulkInput.py instead:
+    # it reads big binary blocks and parses the numbers in batches.
+    import io
+    from BulkInput import iter_number_batches, sum_numbers
+
+    piped = io.BytesIO(b"10 20 30\n40,50,60\n")   # stands in for sys.stdin
+    for batch in iter_number_batches(piped, batch_size=4):
+        print("Batch:", list(batch))
+    # Output:
+    # Batch: [10.0, 20.0, 30.0, 40.0]
+    # Batch: [50.0, 60.0]
+
+    print("Sum:", sum_numbers(io.BytesIO(b"10 20 30")))   # Output: Sum: 60.0
+
+# Command line (reads stdin when no file is given):
+# > python BulkInput.py sum numbers.txt
+# > cat pairs.txt | python BulkInput.py add
 
 
 # -----------------------------------------------
-# 5️⃣ Summary Notes
+# 6️⃣ Summary Notes
 # -----------------------------------------------
 # 🔹 input() → Always returns string.
 # 🔹 int(), float(), bool() → Used for explicit type conversion.
 # 🔹 eval() → Executes valid Python expressions (not random text).
+# 🔹 safe_eval() → Same results for arithmetic, rejects everything else.
 # 🔹 .split() → Splits input string into list items.
 # 🔹 Prefer plain input() for general user input to avoid eval() risks.
+# 🔹 BulkInput.py → Streams large piped/file input in blocks and batches.
@@ -15,85 +15,86 @@
 # -----------------------------------------------
 # 2️⃣ Simple While Loop Example
 # -----------------------------------------------
-i = 1
-while i <= 5:
-    print("Iteration:", i)
-    i += 1  # Increment to avoid infinite loop
+if __name__ == "__main__":
+    i = 1
+    while i <= 5:
+        print("Iteration:", i)
+        i += 1  # Increment to avoid infinite loop
 
-# -----------------------------------------------
-# 3️⃣ While Loop with Else
-# -----------------------------------------------
-# Python allows an optional else block that executes **only if the loop ends normally** (not by break)
-i = 1
-while i <= 3:
-    print(i)
-    i += 1
-else:
-    print("Loop finished")  # Executes because loop ended normally
+    # -----------------------------------------------
+    # 3️⃣ While Loop with Else
+    # -----------------------------------------------
+    # Python allows an optional else block that executes **only if the loop ends normally** (not by break)
+    i = 1
+    while i <= 3:
+        print(i)
+        i += 1
+    else:
+        print("Loop finished")  # Executes because loop ended normally
 
-# If loop is terminated by break, else is skipped
-i = 1
-while i <= 3:
-    print(i)
-    if i == 2:
-        break
-    i += 1
-else:
-    print("Loop finished")  # Will NOT execute
+    # If loop is terminated by break, else is skipped
+    i = 1
+    while i <= 3:
+        print(i)
+        if i == 2:
+            break
+        i += 1
+    else:
+        print("Loop finished")  # Will NOT execute
 
-# -----------------------------------------------
-# 4️⃣ Infinite While Loop
-# -----------------------------------------------
-count = 0
-while True:
-    print("Infinite loop iteration:", count)
-    count += 1
-    if count >= 3:
-        break
+    # -----------------------------------------------
+    # 4️⃣ Infinite While Loop
+    # -----------------------------------------------
+    count = 0
+    while True:
+        print("Infinite loop iteration:", count)
+        count += 1
+        if count >= 3:
+            break
 
-# -----------------------------------------------
-# 5️⃣ Using Continue in While Loop
-# -----------------------------------------------
-i = 0
-while i < 5:
-    i += 1
-    if i == 3:
-        continue
-    print(i)
+    # -----------------------------------------------
+    # 5️⃣ Using Continue in While Loop
+    # -----------------------------------------------
+    i = 0
+    while i < 5:
+        i += 1
+        if i == 3:
+            continue
+        print(i)
 
-# -----------------------------------------------
-# 6️⃣ Nested While Loop
-# -----------------------------------------------
-i = 1
-while i <= 3:
-    j = 1
-    while j <= 2:
-        print(f"i={i}, j={j}")
-        j += 1
-    i += 1
+    # -----------------------------------------------
+    # 6️⃣ Nested While Loop
+    # -----------------------------------------------
+    i = 1
+    while i <= 3:
+        j = 1
+        while j <= 2:
+            print(f"i={i}, j={j}")
+            j += 1
+        i += 1
 
-# -----------------------------------------------
-# 7️⃣ Practical Example: Sum of Numbers
-# -----------------------------------------------
-n = 5
-sum = 0
-i = 1
-while i <= n:
-    sum += i
-    i += 1
-print("Sum =", sum)  # Output: Sum = 15
+    # -----------------------------------------------
+    # 7️⃣ Practical Example: Sum of Numbers
+    # -----------------------------------------------
+    n = 5
+    sum = 0
+    i = 1
+    while i <= n:
+        sum += i
+        i += 1
+    print("Sum =", sum)  # Output: Sum = 15
 
-# -----------------------------------------------
-# 8️⃣ Python vs Java: While-Else
-# -----------------------------------------------
-# Python allows `else` with while, Java does NOT.
-# Python else executes only if the loop ends naturally (without break)
-i = 1
-while i <= 2:
-    print(i)
-    i += 1
-else:
-    print("Loop finished")  # Executes
+    # -----------------------------------------------
+    # 8️⃣ Python vs Java: While-Else
+    # -----------------------------------------------
+    # Python allows `else` with while, Java does NOT.
+    # Python else executes only if the loop ends naturally (without break)
+    i = 1
+    while i <= 2:
+        print(i)
+        i += 1
+    else:
+        print("Loop finished")  # Executes
 
 # In Java, to mimic else behavior, you must use a flag:
 # boolean completed = true;
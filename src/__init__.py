@@ -0,0 +1,81 @@
+# ============================================================
+# 📦 PACKAGE: Python notes as an importable library
+# ============================================================
+
+"""
+============================================================
+📘 INTRODUCTION
+------------------------------------------------------------
+Every module in this folder is both:
+
+✅ a runnable tutorial  →  python Encapsulation.py  (prints the demo)
+✅ an importable library →  from Encapsulation import BankAccountProperty
+                            (no prints, no input() prompts)
+
+Submodules are loaded LAZILY: `import src` imports nothing else, and
+`src.Encapsulation` imports only Encapsulation.py, the first time it
+is used (PEP 562 module __getattr__).
+============================================================
+"""
+
+import importlib
+
+__all__ = [
+    "Abstraction",
+    "Basic_Program",
+    "BulkInput",
+    "Cache",
+    "CowList",
+    "DJANGOSetup",
+    "Dictionary",
+    "Encapsulation",
+    "Exception",
+    "FrozenIndexedTuple",
+    "Function",
+    "IfStatement",
+    "IndexedSequence",
+    "Inheritance",
+    "InternPool",
+    "Lambda",
+    "List",
+    "ListComprehension",
+    "Matrix",
+    "Memoize",
+    "MmapDict",
+    "OOPS",
+    "Operator",
+    "Parallel",
+    "PersistentVector",
+    "PersonClass",
+    "Pipeline",
+    "Polymorphism",
+    "RecordIndex",
+    "RecordStore",
+    "Rope",
+    "SafeEval",
+    "SliceView",
+    "Stream",
+    "Summation",
+    "Tuple",
+    "TupleCodec",
+    "TypeHint",
+    "TypeSafety",
+    "TypedList",
+    "UserInput",
+    "VariableString",
+    "WhileLoop",
+    "WorkingWithFile",
+]
+
+
+def __getattr__(name):
+    """Import the submodule 'name' on first access and cache it."""
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
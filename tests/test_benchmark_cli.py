@@ -0,0 +1,17 @@
+import os
+import sys
+
+BENCHMARKS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks")
+sys.path.insert(0, BENCHMARKS)
+
+import run  # noqa: E402
+
+
+def test_positional_suites_reach_run(monkeypatch):
+    seen = {}
+    monkeypatch.setattr(run, "cmd_run", lambda args: seen.update(vars(args)) or 0)
+    assert run.main(["summation", "idioms", "-k", "copy", "--repeat", "2"]) == 0
+    assert seen["suite"] == ["summation", "idioms"]
+    assert seen["k"] == "copy" and seen["repeat"] == 2
+    run.main(["run", "summation"])
+    assert seen["suite"] == ["summation"]
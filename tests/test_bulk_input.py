@@ -0,0 +1,22 @@
+import io
+
+from BulkInput import add_pairs, sum_numbers
+
+
+def test_add_pairs_to_text_sink():
+    sink = io.StringIO()
+    assert add_pairs(io.BytesIO(b"1 2\n3.5 4\n"), sink) == 2
+    assert sink.getvalue() == "3.0\n7.5\n"
+
+
+def test_add_pairs_to_binary_sink():
+    sink = io.BytesIO()
+    add_pairs(io.BytesIO(b"1 2 3 4"), sink, batch_size=1)
+    assert sink.getvalue() == b"3.0\n7.0\n"
+
+
+def test_text_source():
+    sink = io.StringIO()
+    assert add_pairs(io.StringIO("10, 5\n-1 1\n"), sink, block_size=3) == 2
+    assert sink.getvalue() == "15.0\n0.0\n"
+    assert sum_numbers(io.StringIO("1 2 3\n4")) == 10
@@ -0,0 +1,91 @@
+import pytest
+
+from Cache import BoundedCache, ThreadSafeBoundedCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.parametrize("cls", [BoundedCache, ThreadSafeBoundedCache])
+def test_iteration_after_ttl_skips_expired_entries(cls):
+    clock = Clock()
+    cache = cls(ttl=10, clock=clock)
+    cache["a"] = 1
+    cache.set("b", 2, ttl=100)
+    cache.set("c", 3, ttl=None)
+    clock.now = 50
+    assert list(cache) == ["b", "c"]
+    assert list(cache.keys()) == ["b", "c"]
+    assert cache.items() == [("b", 2), ("c", 3)]
+    assert cache.values() == [2, 3]
+    assert cache.stats()["hits"] == 0
+    assert dict(cache) == {"b": 2, "c": 3}
+    clock.now = 200
+    assert dict(cache) == {"c": 3}
+
+
+def test_items_and_values_do_not_count_or_reorder():
+    cache = BoundedCache(max_entries=2)
+    cache["a"], cache["b"] = 1, 2
+    assert cache.items() == [("a", 1), ("b", 2)]
+    assert cache.values() == [1, 2]
+    assert list(cache) == ["a", "b"]
+    stats = cache.stats()
+    assert stats["hits"] == stats["misses"] == 0
+    cache["c"] = 3                  # "a" is still least recently used
+    assert "a" not in cache and "b" in cache
+
+
+@pytest.mark.parametrize("cls", [BoundedCache, ThreadSafeBoundedCache])
+def test_len_counts_live_entries_only(cls):
+    clock = Clock()
+    cache = cls(ttl=10, clock=clock)
+    cache["a"] = 1
+    cache.set("b", 2, ttl=100)
+    cache.set("c", 3, ttl=None)
+    clock.now = 50
+    assert len(cache) == len(list(cache)) == 2
+    assert cache.stats()["entries"] == 2
+    del cache["b"]
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_set_drops_entries_that_are_never_read_again():
+    clock = Clock()
+    cache = BoundedCache(ttl=10, clock=clock)       # no max_entries
+    for i in range(1000):
+        clock.now = i
+        cache[i] = i
+        assert len(cache._data) <= 11
+    assert cache.expirations == 990
+    assert list(cache) == list(range(990, 1000))
+
+
+def test_peek_has_no_side_effects():
+    clock = Clock()
+    cache = BoundedCache(max_entries=2, ttl=10, clock=clock)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.peek("a") == 1 and cache.peek("zzz", 0) == 0
+    cache["c"] = 3                  # "a" is still the least recently used
+    assert list(cache) == ["b", "c"]
+    clock.now = 20
+    assert cache.peek("b") is None
+    assert (cache.hits, cache.misses, cache.expirations) == (0, 0, 0)
+
+
+def test_intern_pool_contains_keeps_lru_order():
+    from InternPool import InternPool
+
+    pool = InternPool(max_entries=2)
+    first, second = pool.intern((1, 2)), pool.intern((3, 4))
+    assert (1, 2) in pool
+    pool.intern((5, 6))             # evicts (1, 2): the membership test did not refresh it
+    assert (1, 2) not in pool and (3, 4) in pool and second in pool
+    assert pool._table.hits == 0 and first == (1, 2)
@@ -0,0 +1,118 @@
+import copy
+import gc
+import random
+
+from CowList import CowList, _Node
+
+
+def _paths(data, prefix=()):
+    """Every index path that leads to a list inside 'data'."""
+    yield prefix
+    for i, item in enumerate(data):
+        if isinstance(item, list):
+            yield from _paths(item, prefix + (i,))
+
+
+def _at(root, path):
+    for i in path:
+        root = root[i]
+    return root
+
+
+def test_copies_stay_independent():
+    rnd = random.Random(8)
+    cows = [CowList([[1, [2, 3]], [4], 5])]
+    refs = [[[1, [2, 3]], [4], 5]]
+    for _ in range(1500):
+        k = rnd.randrange(len(cows))
+        cow, ref = cows[k], refs[k]
+        path = rnd.choice(list(_paths(ref)))
+        target, model = _at(cow, path), _at(ref, path)
+        op = rnd.random()
+        if op < 0.15:
+            cows.append(cow.deepcopy())
+            refs.append(copy.deepcopy(ref))
+        elif op < 0.25 and model:
+            cows.append(target[1:])
+            refs.append(copy.deepcopy(model[1:]))
+        elif op < 0.5 and model:
+            i = rnd.randrange(len(model))
+            target[i] = model[i] = rnd.randrange(100)
+        elif op < 0.7:
+            value = rnd.randrange(100)
+            target.append([value])
+            model.append([value])
+        elif op < 0.8 and model:
+            value = target.pop()
+            popped = model.pop()
+            assert (value.to_list() if isinstance(value, CowList) else value) == popped
+        elif len(cows) > 1:
+            j = rnd.choice([j for j in range(len(cows)) if j != k])
+            target.append(cows[j])
+            model.append(copy.deepcopy(refs[j]))
+        if len(cows) > 8:
+            del cows[0], refs[0]
+            gc.collect()
+        for c, r in zip(cows, refs):
+            assert c.to_list() == r
+
+
+def test_copy_churn_keeps_nothing_alive():
+    config = CowList([[i, i + 1] for i in range(100)])
+
+    def nodes():
+        gc.collect()
+        return sum(isinstance(o, _Node) for o in gc.get_objects())
+
+    def churn():
+        for i in range(1000):
+            request = config.deepcopy()
+            request[i % 100][0] = -1
+            config[i % 100][1] = i
+
+    churn()                     # config now holds its own copied rows
+    before = nodes()
+    churn()
+    assert nodes() <= before + 2
+
+
+def test_aliased_row_views_share_writes():
+    a = CowList([[1, 2], [3]])
+    row = a[0]
+    a[0][0] = 9
+    row[1] = 8
+    assert a == [[9, 8], [3]] and row == [9, 8]
+
+    a = CowList([[1, 2], [3]])
+    r1, r2 = a[0], a[0]
+    r1.append(5)
+    r2.append(6)
+    assert a == [[1, 2, 5, 6], [3]] and r1 == r2 == [1, 2, 5, 6]
+
+
+def test_nested_aliased_views_share_writes():
+    a = CowList([[[1], [2]]])
+    x, y = a[0][0], a[0][0]
+    x.append(2)
+    y.append(3)
+    assert a == [[[1, 2, 3], [2]]]
+
+    middle, inner = a[0], a[0][0]
+    middle[1] = 7
+    inner.append(4)
+    assert a == [[[1, 2, 3, 4], 7]] and inner == [1, 2, 3, 4]
+
+
+def test_aliased_views_after_deepcopy_and_reassignment():
+    a = CowList([[1, 2], [3]])
+    row = a[0]
+    b = copy.deepcopy(a)
+    b[0].append(4)
+    row.append(5)
+    a[0].append(6)
+    assert a == [[1, 2, 5, 6], [3]] and b == [[1, 2, 4], [3]]
+
+    row = a[0]
+    a[0] = [7]                 # 'row' is now detached, like a plain list
+    row.append(8)
+    assert a == [[7], [3]] and row == [1, 2, 5, 6, 8]
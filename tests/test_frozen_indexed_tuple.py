@@ -0,0 +1,45 @@
+import pickle
+import random
+
+import pytest
+
+from FrozenIndexedTuple import FrozenIndexedTuple
+
+NAN = float("nan")
+VALUES = [0, 1, 1.0, True, False, 2, "a", "b", None, (1, 2), NAN]
+
+
+def _answers(seq, value, start, stop):
+    def call(method, *args):
+        try:
+            return method(*args)
+        except ValueError as e:
+            return ValueError, str(e)
+    return (call(seq.count, value), value in seq, call(seq.index, value),
+            call(seq.index, value, start), call(seq.index, value, start, stop))
+
+
+@pytest.mark.parametrize("unhashable", [False, True])
+def test_queries_match_tuple(unhashable):
+    rnd = random.Random(18)
+    items = [rnd.choice(VALUES) for _ in range(300)]
+    if unhashable:
+        items[150] = [1, 2]
+    plain, frozen = tuple(items), FrozenIndexedTuple(items)
+    for value in VALUES + [[1, 2], 99, {"x": 1}]:
+        for _ in range(5):
+            start = rnd.randint(-350, 350)
+            stop = rnd.randint(-350, 350)
+            assert _answers(frozen, value, start, stop) == _answers(plain, value, start, stop)
+        expected = tuple(i for i, x in enumerate(plain) if x is value or x == value)
+        assert frozen.positions(value) == expected
+
+
+def test_still_a_tuple():
+    t = FrozenIndexedTuple((1, 2, 3, 2))
+    assert t.count(2) == 2 and t.positions(2) == (1, 3)
+    assert isinstance(t, tuple) and t == (1, 2, 3, 2) and hash(t) == hash((1, 2, 3, 2))
+    assert type(t[1:]) is tuple and t + (5,) == (1, 2, 3, 2, 5)
+    copy = pickle.loads(pickle.dumps(t))
+    assert type(copy) is FrozenIndexedTuple and copy == t and copy.index(3) == 2
+    assert repr(t) == "FrozenIndexedTuple((1, 2, 3, 2))"
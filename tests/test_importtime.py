@@ -0,0 +1,34 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "benchmarks"))
+
+import importtime  # noqa: E402
+
+BUDGET_MS = 1000        # generous: this test guards laziness and silence, not speed
+
+
+def test_packages_load_no_submodules_on_import():
+    results = {name: importtime.measure(name, runs=1) for name in ("src", "Basic_Program")}
+    assert "src.Cache" not in results["src"]["imports"]
+    assert importtime.check(results, BUDGET_MS) == []
+
+
+def test_every_module_imports_quietly():
+    modules = importtime.discover_modules()
+    results = {name: importtime.measure(name, runs=1) for name in modules}
+    assert importtime.check(results, BUDGET_MS) == []
+
+
+def test_check_reports_an_eager_import():
+    result = {"us": 100, "stdout": "", "error": None, "imports": ["Cache", "src.Cache", "src"]}
+    assert importtime.check({"src": result}, BUDGET_MS) == ["src: eagerly imports src.Cache"]
+
+
+def test_help_describes_the_check(capsys):
+    try:
+        importtime.main(["--help"])
+    except SystemExit:
+        pass
+    assert "imports quietly" in capsys.readouterr().out
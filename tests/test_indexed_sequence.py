@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from IndexedSequence import HASH, NONE, SORTED, IndexedSequence
+
+
+def _probe(seq, queries):
+    answers = [q in seq for q in queries]
+    assert answers == [q in list(seq) for q in queries]
+    return answers
+
+
+def test_sets_are_scanned_not_bisected():
+    sets = [{i} for i in range(5)]
+    seq = IndexedSequence(list(sets), threshold=1)
+    assert _probe(seq, sets) == [True] * 5
+    assert seq.stats["kind"] == NONE
+    assert {7} not in seq
+
+
+@pytest.mark.parametrize("value", [{1}, [{1}], float("nan"), [float("nan")], frozenset()])
+def test_unordered_values_fall_back_to_scan(value):
+    seq = IndexedSequence([[3], [1, 2]], threshold=1)
+    assert [1, 2] in seq and seq.stats["kind"] == SORTED
+    seq.append(value)
+    assert _probe(seq, [value, [1, 2], [3], [4]])
+    assert seq.stats["kind"] != SORTED
+
+
+def test_sorted_index_matches_scan():
+    rnd = random.Random(10)
+    data = [[rnd.randrange(5), rnd.choice("ab")] for _ in range(50)]
+    seq = IndexedSequence(data, threshold=1)
+    queries = [[rnd.randrange(6), rnd.choice("abc")] for _ in range(100)]
+    _probe(seq, queries + [(1, "a"), 3, "a", None])
+    assert seq.stats["kind"] == SORTED
+    for _ in range(50):
+        seq[rnd.randrange(len(seq))] = [rnd.randrange(6), rnd.choice("abc")]
+        seq.append([rnd.randrange(6), "c"])
+        _probe(seq, queries)
+    assert seq.stats["kind"] == SORTED
+
+
+def test_hashable_values_use_hash_index():
+    seq = IndexedSequence(tuple(range(100)), threshold=2)
+    _probe(seq, range(-5, 105))
+    assert seq.stats["kind"] == HASH
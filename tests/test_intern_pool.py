@@ -0,0 +1,50 @@
+import pytest
+
+from InternPool import InternPool
+
+
+@pytest.mark.parametrize("max_entries", [None, 1000])
+def test_equal_rows_share_one_object(max_entries):
+    pool = InternPool(max_entries)
+    rows = [tuple([i % 7, str(i % 7)]) for i in range(100)]
+    canonical = pool.intern_many(rows)
+    assert canonical == rows
+    assert len({id(row) for row in canonical}) == 7
+    assert all(pool.intern(tuple(list(row))) is row for row in canonical[:7])
+    stats = pool.stats()
+    assert (stats["entries"], stats["misses"], stats["hits"]) == (7, 7, 100)
+    assert stats["bytes_saved"] > 0 and (3, "3") in pool and (3, "4") not in pool
+
+
+@pytest.mark.parametrize("max_entries", [None, 1000])
+def test_equal_rows_of_other_types_stay_separate(max_entries):
+    pool = InternPool(max_entries)
+    ints, floats, bools = (1, 2), (1.0, 2.0), (True, 2)
+    assert pool.intern(ints) is ints
+    assert pool.intern(floats) is floats
+    assert pool.intern_many([(1, 2), (1.0, 2.0), (True, 2)]) == [ints, floats, bools]
+    assert [type(x) for row in pool.intern_many([(1.0, 2.0)]) for x in row] == [float, float]
+    assert pool.intern((True, 2)) is not ints
+    assert (1.0, 2.0) in pool and (1, 2.0) not in pool
+
+
+def _row(*values):
+    return tuple(list(values))      # a new object, never a shared constant
+
+
+def test_bounded_pool_evicts_least_recently_used():
+    pool = InternPool(max_entries=2)
+    a, b = pool.intern(_row(1)), pool.intern(_row(2))
+    assert pool.intern(_row(1)) is a        # refreshes (1,)
+    pool.intern(_row(3))                    # evicts (2,)
+    assert (2,) not in pool and pool.intern(_row(1)) is a
+    assert pool.intern(_row(2)) is not b and pool.stats()["evictions"] == 2
+
+
+def test_rejects_non_tuples():
+    pool = InternPool()
+    with pytest.raises(TypeError):
+        pool.intern([1, 2])
+    with pytest.raises(TypeError):
+        pool.intern_many([(1,), [2]])
+    assert len(pool) == 0 and [1] not in pool
@@ -0,0 +1,83 @@
+from array import array
+
+import pytest
+
+from Matrix import Matrix, _NUMPY_MIN
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure"])
+def use_numpy(request, monkeypatch):
+    if request.param:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(Matrix, "use_numpy", request.param)
+    return request.param
+
+
+def _outcome(compute):
+    """(typecode, values) of the result, or the exception type raised."""
+    try:
+        result = compute()
+    except Exception as e:
+        return type(e)
+    return result.typecode, result.tolist()
+
+
+def test_flatten_and_reshape_share_the_buffer():
+    values = array("q", range(12))
+    mat = Matrix.from_flat(values, 3, 4)
+    flat, wide = mat.flatten(), mat.reshape(2, 6)
+    flat[5] = -5
+    wide[1, 0] = -6
+    assert mat[1, 1] == -5 and mat[1, 2] == -6 and values[6] == -6
+    assert mat[1].tolist() == [4, -5, -6, 7]
+    with pytest.raises(ValueError):
+        mat.reshape(5, 2)
+    with pytest.raises(ValueError):
+        Matrix.from_flat(values, 5, 5)
+
+
+@pytest.mark.parametrize("shape", [(0, 0), (1, 1), (3, 5), (2000, 3), (70, 90)])
+def test_transpose_matches_zip(use_numpy, shape):
+    rows, cols = shape
+    nested = [[i * cols + j for j in range(cols)] for i in range(rows)]
+    mat = Matrix(nested)
+    expected = [list(column) for column in zip(*nested)]
+    assert mat.T.tolist() == expected
+    assert mat.transpose().shape == (cols, rows)
+    floats = Matrix.from_flat([v / 2 for row in nested for v in row], rows, cols)
+    assert floats.T.tolist() == [[v / 2 for v in row] for row in expected]
+
+
+BIG = _NUMPY_MIN + 904          # on the NumPy path when it is enabled
+INTS = [i % 101 - 50 for i in range(BIG)]
+# No huge int exponents: the pure path would really compute 50 ** 2**62.
+EXPONENTS = [2, 3, -1, 0, 40, 2.5, -3.0, 0.0, 1e300]
+MODULI = [2, 3, -7, 0, 2**62, 2**63, 2**70, -2**70, 2.5, -3.0, 0.0,
+          Matrix.from_flat([i % 7 - 3 for i in range(BIG)], 1, BIG),
+          Matrix.from_flat([i % 7 + 1.5 for i in range(BIG)], 1, BIG)]
+
+
+@pytest.mark.parametrize("values", [INTS, [v * 0.75 for v in INTS], [0] * BIG],
+                         ids=["ints", "floats", "zeros"])
+@pytest.mark.parametrize("op, other", [("pow", k) for k in EXPONENTS]
+                         + [("mod", k) for k in MODULI], ids=repr)
+def test_numpy_path_matches_pure_path(monkeypatch, values, op, other):
+    pytest.importorskip("numpy")
+    mat = Matrix.from_flat(values, 1, BIG)
+    compute = (lambda: mat ** other) if op == "pow" else (lambda: mat % other)
+    fast = _outcome(compute)
+    monkeypatch.setattr(Matrix, "use_numpy", False)
+    pure = _outcome(compute)
+    if isinstance(pure, tuple) and pure[0] == "d":
+        assert fast[0] == "d" and fast[1] == [pytest.approx(row, rel=1e-12) for row in pure[1]]
+    else:
+        assert fast == pure
+
+
+def test_big_int_operands_stay_exact(use_numpy):
+    mat = Matrix.from_flat(range(5000), 50, 100)
+    assert (mat % 2**70) == mat
+    with pytest.raises(OverflowError):
+        mat % -2**70                # 1 % -2**70 == 1 - 2**70: not an int64
+    signs = Matrix.from_flat([1, 0, -1, 1] * 1250, 50, 100)
+    assert (signs ** 2**70) == (signs ** 2)
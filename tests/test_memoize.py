@@ -0,0 +1,202 @@
+import pickle
+import random
+import threading
+import time
+
+import pytest
+
+from Memoize import LFUCache, memoize
+
+
+def test_lfu_evicts_least_used_then_oldest():
+    rnd = random.Random(24)
+    for _ in range(200):
+        capacity = rnd.randint(1, 6)
+        cache, uses, last = LFUCache(capacity), {}, {}
+        for clock in range(200):
+            key = rnd.randint(0, 10)
+            if rnd.random() < 0.5:
+                assert cache.get(key) == (("v", key) if key in uses else None)
+                if key in uses:
+                    uses[key] += 1
+                    last[key] = clock
+                continue
+            if key in uses:
+                uses[key] += 1
+            else:
+                if len(uses) >= capacity:
+                    victim = min(uses, key=lambda k: (uses[k], last[k]))
+                    del uses[victim], last[victim]
+                uses[key] = 1
+            last[key] = clock
+            cache.set(key, ("v", key))
+            assert set(cache._values) == set(uses)
+
+
+def test_lfu_restored_counts():
+    cache = LFUCache(3)
+    for key, uses in (("a", 5), ("b", 2), ("c", 9)):
+        cache.set(key, key, uses=uses)
+    cache.set("d", "d", uses=7)         # evicts b (2 uses); fewest is now 5
+    assert sorted(cache._values) == ["a", "c", "d"]
+    cache.set("e", "e", uses=8)         # evicts a
+    assert sorted(cache._values) == ["c", "d", "e"]
+
+
+def test_lfu_misses_never_search_the_buckets(monkeypatch):
+    import Memoize
+
+    searches = []
+    monkeypatch.setattr(Memoize, "min", lambda *a, **k: searches.append(a) or min(*a, **k),
+                        raising=False)
+    cache = LFUCache(1024)
+    for i in range(1024):
+        cache.set(i, i, uses=i + 1)     # 1024 distinct counts
+    searches.clear()
+    for i in range(2000):
+        cache.set(-i - 1, i)            # every miss evicts one key
+        cache.get(-i - 1)
+        assert cache._fewest == min(cache._buckets)
+    assert searches == []
+
+
+@pytest.mark.parametrize("options", [{"maxsize": 2}, {"maxsize": 2, "policy": "lfu"},
+                                     {"maxsize": 2, "policy": "ttl", "ttl": 60}])
+def test_cache_clear_resets_every_counter(options):
+    @memoize(**options)
+    def square(n):
+        return n * n
+
+    for n in (1, 2, 3, 4, 1, 1):
+        square(n)
+    assert square.cache_stats()["evictions"] > 0
+    square.cache_clear()
+    stats = square.cache_stats()
+    assert stats["hits"] == stats["misses"] == stats["evictions"] == stats["entries"] == 0
+
+
+def test_single_flight_runs_one_call():
+    release, calls = threading.Event(), []
+
+    @memoize
+    def slow_square(n):
+        calls.append(n)
+        release.wait(10)
+        if n < 0:
+            raise ValueError(n)
+        return n * n
+
+    for rounds, (n, expected) in enumerate(((7, 49), (-1, ValueError)), 1):
+        results = []
+
+        def call():
+            try:
+                results.append(slow_square(n))
+            except ValueError as error:
+                results.append(type(error))
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 10    # until 7 threads wait for the first one
+        while slow_square.cache_stats()["coalesced"] < 7 * rounds:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+        release.clear()
+        assert results == [expected] * 8
+    assert calls == [7, -1]             # the failed call was not cached ...
+    release.set()
+    with pytest.raises(ValueError):
+        slow_square(-1)
+    assert calls == [7, -1, -1]         # ... so it runs again
+
+
+def test_typed_keys():
+    @memoize
+    def add(a, b=0):
+        return a + b
+
+    assert [type(add(*args)) for args in [(1, 2), (1.0, 2), (True, 2), (1, 2)]] \
+        == [int, float, int, int]
+    assert add.cache_stats()["misses"] == 3
+    assert add("a", b="b") == "ab" and add(1, b=2) == 3 and add(1, b=2.0) == 3.0
+
+    @memoize
+    def same(a):                        # one int / str argument is its own key
+        return a
+
+    assert [type(same(a)) for a in (3, "3", 3.0, True, 3, "3")] == [int, str, float, bool, int, str]
+    assert same.cache_stats()["hits"] == 2
+
+    @memoize(typed=False)
+    def loose(a, b=0):
+        return a + b
+
+    assert type(loose(1, 2)) is int and type(loose(1.0, 2)) is int
+    assert loose.cache_stats()["hits"] == 1
+
+
+@pytest.mark.parametrize("saved", [{}, {"policy": "lfu", "maxsize": 8},
+                                   {"policy": "ttl", "ttl": 60}, {"maxsize": None}])
+@pytest.mark.parametrize("loaded", [{}, {"policy": "lfu", "maxsize": 8},
+                                    {"policy": "ttl", "ttl": 60}, {"maxsize": None}])
+def test_persist_round_trip_across_policies(tmp_path, saved, loaded):
+    path = str(tmp_path / "cache.pickle")
+
+    def square(n):
+        return n * n
+
+    first = memoize(persist=path, **saved)(square)
+    for n in (1, 2, 3, 3, 3):
+        first(n)
+    first.cache_save()
+    again = memoize(persist=path, **loaded)(square)
+    assert [again(n) for n in (1, 2, 3)] == [1, 4, 9]
+    assert again.cache_stats()["hits"] == 3 and again.cache_stats()["misses"] == 0
+
+
+@pytest.mark.parametrize("entries", [
+    [(1, 1, None)],                     # saved without a policy (old layout)
+    "not a list",
+])
+def test_persist_ignores_unknown_layouts(tmp_path, entries):
+    path = tmp_path / "cache.pickle"
+
+    def square(n):
+        return n * n
+
+    name = f"{square.__module__}.{square.__qualname__}"
+    path.write_bytes(pickle.dumps({"function": name, "saved_at": time.time(), "entries": entries}))
+    with pytest.warns(UserWarning):
+        cached = memoize(persist=str(path), policy="lfu", maxsize=4)(square)
+    assert cached(1) == 1 and cached.cache_stats()["misses"] == 1
+
+
+def test_persist_skips_bad_entries(tmp_path):
+    path = tmp_path / "cache.pickle"
+
+    def square(n):
+        return n * n
+
+    name = f"{square.__module__}.{square.__qualname__}"
+    entries = [(1, "one", None), (2, "two", 5), ([3], "unhashable", 1), (4, "four", "x"),
+               (5, "five", 1, 1), (6, "six", True)]
+    data = {"function": name, "policy": "lfu", "saved_at": time.time(), "entries": entries}
+    path.write_bytes(pickle.dumps(data))
+    cached = memoize(persist=str(path), policy="lfu", maxsize=8)(square)
+    assert [cached(n) for n in range(1, 7)] == [1, "two", 9, 16, 25, 36]
+
+
+def test_positional_maxsize():
+    @memoize(2)
+    def square(n):
+        return n * n
+
+    for n in (1, 2, 3):
+        square(n)
+    assert square.cache_stats()["evictions"] == 1
+    with pytest.raises(TypeError):
+        memoize("lru")
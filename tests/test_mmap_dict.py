@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from MmapDict import MmapDict
+
+LAYOUT = {"a": "q", "s": "8s"}
+
+
+class Crash(Exception):
+    pass
+
+
+def _fill(path):
+    ref = {}
+    with MmapDict(path, LAYOUT, capacity=4) as d:
+        for i in range(50):
+            d[f"k{i}"] = ref[f"k{i}"] = {"a": i, "s": "x" * (i % 8)}
+        for i in range(0, 50, 3):
+            del d[f"k{i}"], ref[f"k{i}"]
+        d["k1"] = ref["k1"] = {"a": -1, "s": "new"}
+    return ref
+
+
+def test_crash_between_data_and_index_replace(tmp_path, monkeypatch):
+    path = tmp_path / "people"
+    ref = _fill(path)
+    write_index = MmapDict._write_index
+
+    def crash_during_compact(index_path, generation, *args):
+        if generation > 0:
+            raise Crash             # new data file is in place, old index is not replaced
+        return write_index(index_path, generation, *args)
+
+    d = MmapDict(path, LAYOUT)
+    monkeypatch.setattr(MmapDict, "_write_index", staticmethod(crash_during_compact))
+    with pytest.raises(Crash):
+        d.compact()
+    monkeypatch.undo()
+
+    with MmapDict(path, LAYOUT) as d:
+        assert dict(d.items()) == ref
+        assert d.garbage_bytes == 0
+        d["k2"] = ref["k2"] = {"a": 2, "s": "again"}
+    with MmapDict(path, LAYOUT) as d:
+        assert dict(d.items()) == ref
+
+
+def test_random_operations_match_a_dict(tmp_path):
+    rnd = random.Random(15)
+    path = tmp_path / "x"
+    ref = {}
+    d = MmapDict(path, LAYOUT, capacity=4)
+    for _ in range(3000):
+        op, key = rnd.random(), f"k{rnd.randrange(200)}"
+        if op < 0.5:
+            d[key] = ref[key] = {"a": rnd.randint(-5, 5), "s": "é" * rnd.randint(0, 4)}
+        elif op < 0.7:
+            assert (d.pop(key) if key in ref else None) == ref.pop(key, None)
+        elif op < 0.72:
+            d.compact()
+            assert d.garbage_bytes == 0
+        elif op < 0.74:
+            d.close()
+            d = MmapDict(path, LAYOUT)
+        assert len(d) == len(ref)
+    assert dict(d.items()) == ref
+    d.close()
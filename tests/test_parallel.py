@@ -0,0 +1,109 @@
+import operator
+import os
+from array import array
+from functools import reduce
+
+import pytest
+
+from Parallel import parallel_filter, parallel_map, parallel_reduce
+
+BACKENDS = ["serial", "thread", "process"]
+
+
+def _square(x):
+    return x * x
+
+
+def _is_even(x):
+    return x % 2 == 0
+
+
+def _shift(x):
+    return x << 55                  # fits in int64 below 256, overflows above
+
+
+def _mixed(x):
+    return x / 2 if x % 1000 == 999 else x
+
+
+def _pid(x):
+    return os.getpid()
+
+
+def _then(f, g):
+    """Affine maps x → a*x + b, applied f first: associative, NOT commutative."""
+    return f[0] * g[0] % 1_000_003, (g[0] * f[1] + g[1]) % 1_000_003
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("function", [_square, _shift, _mixed, str])
+def test_map_keeps_order_and_values(backend, function):
+    items = list(range(3000))
+    expected = list(map(function, items))
+    for chunk_size in (None, 7):
+        result = parallel_map(function, items, workers=2, chunk_size=chunk_size, backend=backend)
+        assert result == expected
+        assert list(map(type, result)) == list(map(type, expected))
+
+
+def test_map_reads_arrays_from_shared_memory():
+    items = array("q", range(-1500, 1500))
+    assert parallel_map(_square, items, workers=2, chunk_size=100, backend="process") \
+        == [x * x for x in items]
+    floats = array("d", [0.5 * i for i in range(1000)])
+    assert parallel_map(_square, floats, workers=2,
+                        chunk_size=50, backend="process") == [x * x for x in floats]
+
+
+def test_lambdas_fall_back_to_threads():
+    main = os.getpid()
+    pids = parallel_map(lambda x: os.getpid(), range(500), workers=2, chunk_size=10,
+                        backend="process")
+    assert set(pids) == {main}
+    pids = parallel_map(_pid, range(500), workers=2, chunk_size=10, backend="process")
+    assert set(pids[256:]) - {main}           # items after the sample ran elsewhere
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_filter_keeps_order(backend):
+    items = list(range(-2000, 2000))
+    assert parallel_filter(_is_even, items, workers=2, chunk_size=33, backend=backend) \
+        == [x for x in items if x % 2 == 0]
+    assert parallel_filter(None, [0, 1, "", "a", None, [1]], backend=backend) == [1, "a", [1]]
+
+
+def test_bad_arguments():
+    with pytest.raises(ValueError):
+        parallel_map(_square, [1], backend="gpu")
+    with pytest.raises(ValueError):
+        parallel_map(_square, [1], chunk_size=0)
+    with pytest.raises(ZeroDivisionError):
+        parallel_map(lambda x: 1 // x, range(-500, 500), workers=2, chunk_size=50,
+                     backend="thread")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("op, items", [
+    (_then, [(i % 7 + 1, i) for i in range(3000)]),
+    (operator.add, [str(i % 10) for i in range(3000)]),
+    (operator.add, [[i] for i in range(1000)]),
+    (lambda x, y: x + y, list(range(3000))),
+    (operator.mul, [i % 5 + 1 for i in range(1000)]),
+    (min, list(range(3000, 0, -1))),
+])
+def test_reduce_keeps_left_to_right_order(backend, op, items):
+    expected = reduce(op, items)
+    for chunk_size in (None, 7):
+        assert parallel_reduce(op, items, workers=2, chunk_size=chunk_size,
+                               backend=backend) == expected
+
+
+def test_reduce_identity_and_errors():
+    assert parallel_reduce(operator.add, [], identity=0) == 0
+    assert parallel_reduce(operator.sub, [10, 1, 2], associative=False) == 7
+    assert parallel_reduce(operator.sub, [1, 2], 10, associative=False) == 7
+    assert parallel_reduce(_then, [(2, 1)], identity=(3, 0)) == _then((3, 0), (2, 1))
+    with pytest.raises(TypeError):
+        parallel_reduce(operator.add, [])
+    with pytest.raises(ValueError):
+        parallel_reduce(operator.add, [1], workers=0)
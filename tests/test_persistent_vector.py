@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from PersistentVector import EMPTY, PersistentVector
+
+
+def test_every_version_stays_unchanged():
+    rnd = random.Random(9)
+    versions = [(PersistentVector(range(1500)), list(range(1500)))]
+    for step in range(3000):
+        vec, ref = versions[rnd.randrange(len(versions))]
+        ref = list(ref)
+        op = rnd.randrange(5)
+        if op == 0:
+            vec = vec.append(step)
+            ref.append(step)
+        elif op == 1 and ref:
+            i = rnd.randrange(-len(ref), len(ref))
+            vec = vec.set(i, -step)
+            ref[i] = -step
+        elif op == 2:
+            i = rnd.randrange(-len(ref) - 3, len(ref) + 3)
+            vec = vec.insert(i, step)
+            ref.insert(i, step)
+        elif op == 3 and ref:
+            i = rnd.randrange(-len(ref), len(ref))
+            vec = vec.pop(i)
+            ref.pop(i)
+        elif ref:
+            vec = vec.pop()
+            ref.pop()
+        versions.append((vec, ref))
+    for vec, ref in versions:
+        assert len(vec) == len(ref)
+        assert vec.tolist() == ref
+    vec, ref = versions[-1]
+    assert [vec[i] for i in range(-len(ref), len(ref))] == ref + ref
+
+
+def test_grows_and_shrinks_through_tree_levels():
+    n = 32 * 32 * 2 + 5
+    vec = EMPTY.extend(range(n))
+    assert vec == list(range(n))
+    for size in range(n, 0, -1):
+        assert vec[-1] == size - 1
+        vec = vec.pop()
+    assert vec == [] and len(vec) == 0
+    assert EMPTY == []
+
+
+def test_slicing_and_list_methods():
+    vec = PersistentVector(range(100))
+    ref = list(range(100))
+    for s in [slice(10, 90), slice(None, None, -3), slice(5, 5), slice(-40, None, 2)]:
+        assert vec[s] == ref[s]
+        assert isinstance(vec[s], PersistentVector)
+    assert vec.index(42) == 42 and vec.count(7) == 1 and 99 in vec
+    assert vec.remove(0).tolist() == ref[1:]
+    assert vec.clear() == [] and vec + [1] == ref + [1]
+    assert hash(vec) == hash(tuple(ref))
+    with pytest.raises(IndexError):
+        vec[100]
+    with pytest.raises(ValueError):
+        vec.remove(-1)
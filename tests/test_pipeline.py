@@ -0,0 +1,74 @@
+import random
+from array import array
+from functools import reduce
+
+import pytest
+
+from Pipeline import Pipeline
+
+pytest.importorskip("numpy")
+
+REDUCERS = [lambda x, y: x + y, lambda x, y: x * y, min, max]
+INITIALS = [None, 0, 1, -3, 0.0, 1.0, 2.5, -0.0]
+STAGES = [
+    lambda p: p,
+    lambda p: p.filter(lambda x: x > 100),          # nothing left
+    lambda p: p.filter(lambda x: x > 0.9),          # one value left (or few)
+    lambda p: p.map(lambda x: x * 2).filter(lambda x: x >= 0),
+]
+
+
+def _inputs(rnd):
+    n = 3000
+    yield array("d", [1.0] * n)
+    yield array("d", [rnd.uniform(-1, 1) for _ in range(n)])
+    yield array("q", [rnd.randrange(-1, 2) for _ in range(n)])
+    yield [rnd.random() < 0.5 for _ in range(n)]
+    yield array("d", [0.0, -0.0] * (n // 2))
+
+
+def test_vectorized_reduce_matches_reduce():
+    rnd = random.Random(22)
+    for values in _inputs(rnd):
+        for stages in STAGES:
+            for function in REDUCERS:
+                for initial in INITIALS:
+                    args = () if initial is None else (initial,)
+                    pipeline = stages(Pipeline()).reduce(function, *args)
+                    loop = stages(Pipeline())
+                    items = [x for x in loop(values)] if loop._stages else list(values)
+                    try:
+                        expected = repr(reduce(function, items, *args))
+                    except TypeError:
+                        continue    # empty without initial: both raise
+                    assert repr(pipeline(values)) == expected, (stages, function, initial)
+
+
+def test_empty_filter_keeps_int_initial():
+    values = array("d", [1.0] * 3000)
+    pipeline = Pipeline().filter(lambda x: x > 100)
+    assert pipeline.reduce(lambda x, y: x * y, 1)(values) == 1
+    assert type(pipeline.reduce(lambda x, y: x * y, 1)(values)) is int
+    assert type(pipeline.reduce(lambda x, y: x + y, 0)(values)) is int
+
+
+BOOL_AND_EDGE_MAPS = [
+    lambda x: abs(not x),
+    lambda x: -(not x),
+    lambda x: (x > 1) + (x > 2),
+    lambda x: (x > 0) * 3 - (x < 0),
+    lambda x: abs(x > 1),
+    lambda x: abs(x),
+    lambda x: -x,
+]
+
+
+@pytest.mark.parametrize("function", BOOL_AND_EDGE_MAPS)
+@pytest.mark.parametrize("values", [range(-2500, 2500), array("q", [-2**63, 5] * 2500),
+                                    array("q", [-2**62, 0] * 2500)])
+def test_vectorized_map_matches_python(function, values):
+    pipeline = Pipeline().map(function)
+    assert "inlined" in pipeline.explain()
+    result, expected = pipeline(values), list(map(function, values))
+    assert result == expected
+    assert list(map(type, result)) == list(map(type, expected))
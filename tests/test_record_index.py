@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from RecordIndex import IndexedRecords, between
+
+VALUES = [1, 2, 2.5, True, 0, -3, "a", "b", "", None, (1, 2), (1, "x")]
+BOUNDS = [None, 0, 1, 2.5, 10, "a", "z", "", (1,), None]
+
+
+def _scan(records, conditions):
+    """find() computed the slow way, over plain dicts."""
+    def match(record, field, condition):
+        if field not in record:
+            return False
+        if isinstance(condition, between):
+            return record[field] in condition
+        return record[field] == condition
+    return [r for r in records if all(match(r, f, c) for f, c in conditions.items())]
+
+
+def _random_record(rnd, i):
+    record = {"id": i}
+    for field in ("city", "age", "score"):
+        if rnd.random() < 0.9:
+            record[field] = rnd.choice(VALUES)
+    return record
+
+
+def _random_condition(rnd):
+    if rnd.random() < 0.5:
+        return rnd.choice(VALUES)
+    return between(rnd.choice(BOUNDS), rnd.choice(BOUNDS))
+
+
+def test_find_matches_a_scan():
+    rnd = random.Random(13)
+    people = IndexedRecords(hash_index=("city",), sorted_index=("age",))
+    model = {}
+    for step in range(1500):
+        action = rnd.random()
+        if action < 0.5 or not model:
+            rec = people.add(_random_record(rnd, step))
+            model[rec.id] = dict(rec)
+        elif action < 0.8:
+            rid = rnd.choice(list(model))
+            field = rnd.choice(["city", "age", "score"])
+            if rnd.random() < 0.7:
+                people[rid][field] = model[rid][field] = rnd.choice(VALUES)
+            elif field in model[rid]:
+                del people[rid][field]
+                del model[rid][field]
+        else:
+            rid = rnd.choice(list(model))
+            assert people.remove(rid) == model.pop(rid)
+        fields = rnd.sample(["city", "age", "score"], rnd.randint(1, 3))
+        conditions = {field: _random_condition(rnd) for field in fields}
+        expected = _scan(model.values(), conditions)
+        assert [r.to_dict() for r in people.find(**conditions)] == expected
+        assert people.count(**conditions) == len(expected)
+
+
+def test_between_with_bounds_of_another_type():
+    people = IndexedRecords(
+        [{"age": 25}, {"age": 31}, {"age": "unknown"}, {"age": None}, {"age": float("nan")}],
+        sorted_index=("age",),
+    )
+    assert people.count(age=between("a", "z")) == 1
+    assert people.count(age=between(30, "z")) == 0
+    assert people.count(age=between(lo=30)) == 1
+    assert people.count(age=between(lo="")) == 1
+    assert people.count(age=between()) == 3       # None and NaN are never in range
+    assert [r["age"] for r in people.find(age=between(20, 40))] == [25, 31]
+
+
+def test_record_proxy_keeps_indexes_in_sync():
+    people = IndexedRecords(
+        [{"name": "Vinay", "age": 25, "city": "Delhi"},
+         {"name": "Asha", "age": 31, "city": "Mumbai"}],
+        hash_index=("city",), sorted_index=("age",),
+    )
+    vinay = people.find(name="Vinay")[0]
+    vinay.update({"city": "Mumbai", "age": 32})
+    assert people.count(city="Mumbai", age=between(30, 40)) == 2
+    assert vinay.pop("city") == "Mumbai"
+    assert people.count(city="Mumbai") == 1 and people.count(city="Delhi") == 0
+    with pytest.raises(TypeError):
+        vinay["city"] = ["not", "hashable"]
+    assert "city" not in vinay
+    del people[vinay.id]
+    assert len(people) == 1 and people.count(age=between(lo=30)) == 1
+    with pytest.raises(KeyError):
+        people[vinay.id]
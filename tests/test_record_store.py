@@ -0,0 +1,40 @@
+import pytest
+
+from RecordStore import CATEGORY, RecordStore
+
+
+def test_rows_read_and_write_the_columns():
+    people = RecordStore()
+    people.extend([{"name": "Vinay", "age": 25, "city": "Delhi"},
+                   {"name": "Asha", "age": 31, "city": "Mumbai"}])
+    person = people[0]
+    assert person.to_dict() == {"name": "Vinay", "age": 25, "city": "Delhi"}
+    assert person.get("salary", 0) == 0 and "salary" not in person
+    person.update({"city": "Mumbai"}, age=26)
+    assert people[-2] == {"name": "Vinay", "age": 26, "city": "Mumbai"}
+    assert people.column("city") == ["Mumbai", "Mumbai"]
+    assert [row["name"] for row in people] == ["Vinay", "Asha"]
+    with pytest.raises(KeyError):
+        person["salary"] = 1000
+    with pytest.raises(IndexError):
+        people[2]
+
+
+def test_bad_records_leave_the_store_unchanged():
+    store = RecordStore({"n": int, "x": float, "tag": CATEGORY, "note": object})
+    store.append({"n": 1, "x": 1.5, "tag": "a", "note": None})
+    for bad in [{"n": 2, "x": 1.0}, {"n": 2, "x": 1.0, "tag": "a", "note": 1, "extra": 0},
+                {"n": 2, "x": "nope", "tag": "a", "note": 1}, {"n": 2**64, "x": 1.0, "tag": "a", "note": 1}]:
+        with pytest.raises((ValueError, TypeError, OverflowError)):
+            store.append(bad)
+    assert len(store) == 1
+    assert [store.column(name) for name in store.fields] == [[1], [1.5], ["a"], [None]]
+
+
+def test_category_codes_widen_with_more_values():
+    store = RecordStore({"tag": CATEGORY})
+    store.extend({"tag": f"t{i % 300}"} for i in range(900))
+    assert store._columns["tag"].codes.typecode == "H"
+    assert store.column("tag") == [f"t{i % 300}" for i in range(900)]
+    store[0]["tag"] = "new"
+    assert store[0]["tag"] == "new" and store[300]["tag"] == "t0"
@@ -0,0 +1,54 @@
+import itertools
+
+import pytest
+
+from Rope import Rope
+
+PARTS = [[1, 2, 3], (4, 5), [6], range(7, 11)]
+
+
+def _ropes():
+    """Pairs of (rope, equal list) built from concatenation and repetition."""
+    flat = [x for part in PARTS for x in part]
+    yield Rope(*PARTS), flat
+    yield Rope(*PARTS) * 3, flat * 3
+    yield Rope(PARTS[0]) * 4 + Rope(PARTS[1]) * 2, [1, 2, 3] * 4 + [4, 5] * 2
+    yield 2 * (Rope([0]) + Rope([1, 2]) * 3), ([0] + [1, 2] * 3) * 2
+    yield Rope(), []
+
+
+@pytest.mark.parametrize("rope, ref", list(_ropes()))
+def test_indexing_and_slicing_match_list(rope, ref):
+    assert len(rope) == len(ref) and list(rope) == ref
+    assert [rope[i] for i in range(-len(ref), len(ref))] == ref + ref
+    bounds = [None, 0, 1, 2, 5, 9, -1, -4, len(ref), len(ref) + 3]
+    for start, stop, step in itertools.product(bounds, bounds, [None, 1, 2, -1, -3]):
+        s = slice(start, stop, step)
+        assert rope[s].tolist() == ref[s]
+    with pytest.raises(IndexError):
+        rope[len(ref)]
+
+
+def test_repetition_does_not_copy():
+    batch = list(range(1000))
+    huge = Rope(batch) * 10**9 + [-1]
+    assert len(huge) == 10**12 + 1
+    assert huge[-1] == -1 and huge[123_456_789] == 789
+    assert huge.count(5) == 10**9 and 999 in huge and -2 not in huge
+    assert (Rope([1]) * 0).tolist() == [] and (Rope([1]) * -2) == []
+    window = huge[10**12 - 2:]
+    assert window.tolist() == [998, 999, -1]
+
+
+def test_equality():
+    assert Rope([1, 2]) + [3] == [1, 2, 3] == Rope([1], (2, 3))
+    assert Rope([1, 2]) != [1, 2, 3] and Rope([1, 2]) != [2, 1]
+    assert Rope("Ha") * 3 == "HaHaHa" and (Rope("Ha") * 3)[1:5] == "aHaH"
+    assert Rope("abc")[::2] == "ac" and Rope("ab") == Rope("a", "b")
+    assert Rope("ab") != "abc" and Rope("ab") != "ba"
+    # Like "ab" != ["a", "b"] and [1, 2] != "ab"
+    assert Rope("ab") != ["a", "b"] and ["a", "b"] != Rope("ab")
+    assert Rope([1, 2]) != "ab" and "ab" != Rope([1, 2])
+    assert Rope(["a", "b"]) == ["a", "b"] and Rope(["a"], "b") != "ab"
+    assert Rope() == [] and Rope() == ""
+    assert Rope([1]) != 1 and Rope(b"ab") != b"ab"
@@ -0,0 +1,90 @@
+import random
+import time
+
+import pytest
+
+from SafeEval import FUNCTIONS, SafeExpression, safe_eval
+
+
+def test_sum_of_lists_is_rejected_quickly():
+    start = time.perf_counter()
+    with pytest.raises(TypeError):
+        safe_eval("len(sum([[0]*3000]*3000, []))")
+    with pytest.raises(TypeError):
+        safe_eval("sum([[0], [1]])")
+    with pytest.raises(TypeError):
+        safe_eval("sum(['a', 'b'])")
+    assert time.perf_counter() - start < 1
+
+
+def test_sum_of_numbers():
+    assert safe_eval("sum([1, 2.5, True])") == 4.5
+    assert safe_eval("sum(xs)", {"xs": range(5)}) == 10
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("(-1) ** 10**6", 1), ("1 ** 100000", 1), ("0 ** 10**9", 0),
+    ("(-1) ** 10**9 + 1", 2), ("2 ** 100", 2 ** 100), ("2 ** -2", 0.25),
+])
+def test_cheap_powers_are_allowed(text, expected):
+    assert safe_eval(text, {"d": {"a": 1}}) == expected
+
+
+@pytest.mark.parametrize("text, bindings", [(text, None) for text in [
+    "9 ** 9 ** 9", "2 ** 10**6", "'a' * 10**9", "[1] * 10**8", "10**10 * 'ab'",
+    "[0]*9999 + [0]*9999", "'a'*6000 + 'b'*6000", "'%0999999999d' % 1",
+    "'%.90000000f' % 1.5", "b'%999999999s' % b'x'", "'%*d' % (10**9, 1)",
+    "'%s %.*f' % ('a', -10**9, 1.0)",
+]] + [("s * n", {"s": "ab", "n": 10**9}), ("n * s", {"s": [1], "n": 10**9}),
+      ("s + s", {"s": "a" * 6000}), ("s % n", {"s": "%099999999d", "n": 1}),
+      ("'%(a)99999999999999999999s' % d", {"d": {"a": 1}})])
+def test_huge_results_raise_overflow(text, bindings):
+    with pytest.raises(OverflowError):
+        safe_eval(text, bindings)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("'%5.2f|%-4d|%%|%*d' % (3.14159, 7, 3, 1)", " 3.14|7   |%|  1"),
+    ("b'%03d' % 5", b"005"), ("'%(a)s!' % d", "1!"), ("7 % 3", 1), ("'%s' % 'x'", "x"),
+])
+def test_small_formats_are_allowed(text, expected):
+    assert safe_eval(text, {"d": {"a": 1}}) == expected
+
+
+@pytest.mark.parametrize("text", [
+    '__import__("os")', "().__class__", "x[0]", "lambda: 1", "[i for i in a]",
+    "f'{a}'", "open('x')", "a.b", "_x", "(a := 1)", "pow(2, 3)", "abs(**a)",
+    "abs(*a)", "a << 2", "a is b", "{1: 2}", "{1}", "x" * 10_001, "type(a)",
+])
+def test_unsafe_expressions_are_rejected(text):
+    with pytest.raises((ValueError, SyntaxError)):
+        safe_eval(text, {"a": 1, "b": 2})
+
+
+def test_missing_binding_raises_name_error():
+    with pytest.raises(NameError):
+        safe_eval("a + z", {"a": 1})
+    with pytest.raises(NameError):
+        SafeExpression("a + z").evaluate_many([{"a": 1, "z": 2}, {"a": 1}])
+
+
+def test_matches_eval_on_random_formulas():
+    rnd = random.Random(25)
+
+    def formula(depth=0):
+        if depth > 3 or rnd.random() < 0.3:
+            return rnd.choice(["a", "b", str(rnd.randint(-5, 9)), "2.5"])
+        op = rnd.choice(["+", "-", "*", "/", "%", "<", "==", "and", "or"])
+        return f"({formula(depth + 1)} {op} {formula(depth + 1)})"
+
+    namespace = {"__builtins__": {}, **FUNCTIONS}
+    for _ in range(500):
+        text = formula()
+        rows = [{"a": rnd.randint(-3, 5), "b": rnd.uniform(-2, 2)} for _ in range(4)]
+        try:
+            expected = [eval(text, namespace, row) for row in rows]
+        except ZeroDivisionError:
+            continue
+        expression = SafeExpression(text)
+        assert [expression.evaluate(row) for row in rows] == expected
+        assert expression.evaluate_many(rows) == expected
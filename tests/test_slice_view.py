@@ -0,0 +1,28 @@
+from array import array
+
+import pytest
+
+from SliceView import SliceView
+
+SLICES = [slice(None), slice(5, None), slice(None, 0), slice(2, 2), slice(None, None, -1),
+          slice(None, None, -2), slice(3, 0, -1), slice(0, 3, -1), slice(-2, None, -1),
+          slice(1, -1, 2), slice(10, 20)]
+
+
+@pytest.mark.parametrize("outer", SLICES)
+@pytest.mark.parametrize("inner", SLICES)
+@pytest.mark.parametrize("base", [[1, 2, 3, 4, 5], (1, 2, 3, 4, 5), array("q", [1, 2, 3, 4, 5])])
+def test_matches_list_slicing(base, outer, inner):
+    expected = list(base)[outer][inner]
+    view = SliceView(base, outer)[inner]
+    assert len(view) == len(expected)
+    assert list(view) == expected
+    assert list(view.tolist()) == expected
+    assert list(view.materialize()) == expected
+
+
+def test_empty_view_of_reversed_list():
+    view = SliceView([1, 2, 3, 4, 5])[::-1][5:]
+    assert len(view) == 0
+    assert view.tolist() == []
+    assert list(view.materialize()) == []
@@ -0,0 +1,37 @@
+import pytest
+
+import Stream as stream_module
+from Stream import Stream
+
+
+def test_expression_with_comment():
+    assert Stream([1, 2]).map("x * 2  # double").to_list() == [2, 4]
+    assert Stream(range(6)).filter("x % 2 # even?").map("(x\n + 1)").sum() == 12
+
+
+def test_compiled_loops_are_bounded():
+    for i in range(stream_module._MAX_COMPILED + 50):
+        assert Stream([1]).map(f"x + {i}").to_list() == [1 + i]
+    assert len(stream_module._COMPILED) <= stream_module._MAX_COMPILED
+
+
+def test_stages_match_builtins():
+    data = list(range(20))
+    stream = Stream(data).map(lambda x: x * 3).filter("x % 2 == 0").flat_map("(x, -x)").take(7)
+    expected = [y for x in data if (x * 3) % 2 == 0 for y in (x * 3, -x * 3)][:7]
+    assert stream.to_list() == expected
+    assert stream.sum() == sum(expected)
+    assert stream.count() == len(expected)
+
+
+@pytest.mark.parametrize("stage", ["map", "filter"])
+@pytest.mark.parametrize("text", ["(n := x * 2)", "(total := x) >= 0", "[acc := y for y in [x]]",
+                                  "(x := x + 1)", "(out := 1)"])
+def test_walrus_cannot_reach_the_generated_loop(stage, text):
+    with pytest.raises(SyntaxError):
+        getattr(Stream(range(5)), stage)(text)
+
+
+def test_lambda_stages_may_assign():
+    assert Stream(range(5)).map(lambda x: (n := x * 2) + n).count() == 5
+    assert Stream(range(5)).filter(lambda x: (total := x) >= 0).sum() == 10
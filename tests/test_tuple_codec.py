@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from TupleCodec import TupleCodec
+
+SCHEMA = (str, int, float, bool, bytes, "h", "B", "f")
+
+
+def _rows(n, rnd):
+    titles = ["Developer", "Tester", "", "Ünïcode ✓"]
+    for i in range(n):
+        yield (f"user{i}" if i % 3 else rnd.choice(titles), rnd.randint(-2**63, 2**63 - 1),
+               rnd.random() * 1e6, bool(i % 2), bytes([i % 256, 0, 7][: i % 4]),
+               rnd.randint(-2**15, 2**15 - 1), i % 256, 0.5 * (i % 100))
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 63, 500])
+def test_round_trip(n):
+    rows = list(_rows(n, random.Random(n)))
+    codec = TupleCodec(SCHEMA)
+    buffer = codec.encode_many(rows)
+    assert codec.decode_many(buffer) == rows
+    table = codec.view(buffer)
+    assert len(table) == n and list(table) == rows
+    if rows:
+        assert codec.decode(codec.encode(rows[-1])) == rows[-1]
+        assert table[-1] == rows[-1] and table.field(0, 4) == rows[0][4]
+        assert list(table.column(0)) == [row[0] for row in rows]
+
+
+@pytest.mark.parametrize("names", [
+    [f"name{i}" for i in range(100)],                # distinct: one joined block
+    ["Developer", "Tester"] * 50,                    # repeated: stored once each
+    [f"a\0b{i}" for i in range(100)],                # NUL inside values
+])
+def test_text_column_layouts(names):
+    rows = [(name, name.encode()) for name in names]
+    codec = TupleCodec((str, bytes))
+    buffer = codec.encode_many(rows)
+    assert codec.decode_many(buffer) == rows
+    assert codec.view(buffer)[57] == rows[57]
+
+
+@pytest.mark.parametrize("kind", ["s", "p", "x", "P", "n", "N", "ii", "", list, None])
+def test_rejects_non_scalar_field_types(kind):
+    with pytest.raises(TypeError):
+        TupleCodec((int, kind))
+
+
+def test_rejects_bad_rows_and_buffers():
+    codec = TupleCodec((str, int))
+    with pytest.raises(ValueError):
+        codec.encode_many([("a", 1), ("b",)])
+    with pytest.raises(ValueError):
+        codec.decode_many(b"XXXX" + bytes(20))
+    buffer = codec.encode_many([("a", 1), ("b", 2)])
+    with pytest.raises(ValueError):
+        codec.decode_many(buffer[:20])
@@ -0,0 +1,62 @@
+import copy
+import pickle
+from array import array
+
+import pytest
+
+from TypedList import TypedList
+
+
+def test_type_checks():
+    ints = TypedList[int]([1, 2])
+    ints.append(3)
+    ints[0] = 10
+    ints.insert(0, -1)
+    assert ints == [-1, 10, 2, 3]
+    for bad in (1.5, "2", True, None):
+        with pytest.raises(TypeError):
+            ints.append(bad)
+    floats = TypedList[float]([1, 2.5])
+    assert floats == [1.0, 2.5] and type(floats[0]) is float
+    with pytest.raises(TypeError):
+        floats.append(False)
+    flags = TypedList[bool]([True])
+    with pytest.raises(TypeError):
+        flags.append(1)
+    assert TypedList[int] is TypedList[int]
+    with pytest.raises(TypeError):
+        TypedList[str]
+
+
+def test_bool_list_rejects_raw_int_arrays():
+    flags = TypedList[bool]([True, False])
+    with pytest.raises(TypeError):
+        flags.extend(array("B", [5]))
+    with pytest.raises(TypeError):
+        flags[0:1] = array("B", [5])
+    with pytest.raises(TypeError):
+        flags.extend(TypedList[int]([5], typecode="B"))
+    with pytest.raises(TypeError):
+        flags[:] = TypedList[int]([5], typecode="B")
+    flags.extend(TypedList[bool]([True]))
+    assert flags == [True, False, True] and all(type(x) is bool for x in flags)
+
+
+def test_same_layout_arrays_are_copied():
+    ints = TypedList[int]([1])
+    ints.extend(array("q", [2, 3]))
+    ints[1:2] = array("q", [7, 8])
+    assert ints == [1, 7, 8, 3]
+    with pytest.raises(TypeError):
+        ints.extend(array("d", [1.5]))
+
+
+def test_typecode_limits_and_copies():
+    small = TypedList[int]([1, 2], typecode="i")
+    assert small.itemsize == 4 and small.nbytes == 8
+    with pytest.raises(ValueError):
+        TypedList[int](typecode="d")
+    for clone in (small.copy(), copy.copy(small), pickle.loads(pickle.dumps(small))):
+        assert clone == small and clone.typecode == "i"
+        clone.append(3)
+        assert len(small) == 2